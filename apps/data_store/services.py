@@ -3,6 +3,7 @@ from core.db import get_collection
 
 JOBS = 'jobs'
 SCRAPING_RUNS = 'scraping_runs'
+RUN_HISTORY = 5
 
 
 def upsert_job(job_data):
@@ -111,7 +112,7 @@ def get_company_stats():
     return list(coll.aggregate(pipeline))
 
 
-def create_scraping_run(company_name, jobs_scraped, status, error_message=None):
+def create_scraping_run(company_name, jobs_scraped, status, error_message=None, duration=None):
     coll = get_collection(SCRAPING_RUNS)
     doc = {
         'company_name': company_name,
@@ -120,14 +121,26 @@ def create_scraping_run(company_name, jobs_scraped, status, error_message=None):
         'status': status,
         'error_message': error_message,
     }
+    update = {'$set': doc}
+    if duration is not None:
+        doc['duration'] = round(duration, 1)
+        # Recent durations feed the scheduler's per-company estimate
+        update['$push'] = {'durations': {'$each': [doc['duration']], '$slice': -RUN_HISTORY}}
     coll.update_one(
         {'company_name': company_name},
-        {'$set': doc},
+        update,
         upsert=True,
     )
     return doc
 
 
+def get_run_durations():
+    """{company name: recent scrape durations in seconds, oldest first}."""
+    coll = get_collection(SCRAPING_RUNS)
+    return {r['company_name']: r['durations']
+            for r in coll.find({'durations': {'$exists': True}}, {'company_name': 1, 'durations': 1})}
+
+
 def get_scraping_history(limit=50):
     coll = get_collection(SCRAPING_RUNS)
     runs = list(coll.find().sort('run_date', -1).limit(limit))
@@ -145,6 +158,10 @@ def delete_jobs_by_ids(job_ids):
     return result.deleted_count
 
 
+def count_company_jobs(company_name):
+    return get_collection(JOBS).count_documents({'company_name': company_name})
+
+
 def delete_company_jobs(company_name):
     """Delete all jobs for a specific company before re-scraping."""
     result = get_collection(JOBS).delete_many({'company_name': company_name})
@@ -5,3 +5,8 @@ class ScraperManagerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.scraper_manager'
     label = 'scraper_manager'
+
+    def ready(self):
+        # Kill Chrome left behind by a previous crashed run and start the memory watchdog
+        from core.supervisor import get_supervisor
+        get_supervisor()
@@ -0,0 +1,197 @@
+"""
+Process-wide scrape dispatcher.
+
+Every scrape task submits its companies to the one ``ScrapeDispatcher``
+instead of starting executors of its own.  The server has a single browser
+pool and a single HTTP pool.  Two "Scrape all" tasks therefore share
+MAX_BROWSER_WORKERS / MAX_HTTP_WORKERS instead of doubling the Chromes.
+While tasks are active, each pool's ceiling is the largest ``max_workers``
+(``http_workers``) among them, never above the global limit.  With
+AUTO_SCALE the admission controller moves the browser pool below that
+ceiling.
+
+A company that is already queued or running is not scraped twice.  The new
+task joins the in-flight scrape, and the result goes to every task waiting
+on it, so two workers never delete and re-insert the same company's jobs at
+once.  A queued company is scraped with the deepest ``max_pages`` its tasks
+asked for.  A task that joins a running scrape takes it as it is.
+
+Releasing a task (it finished or was cancelled) drops its queued companies
+that no other task wants.  Scrapes already running finish either way.
+"""
+import threading
+from collections import deque
+
+from apps.data_store import services as job_service
+from apps.scraper_manager import services as scraping_service
+from core.admission import AdmissionController
+from core.executor import ScrapeExecutor, browser_workers, http_executor, pools_browser_stats
+from core.logging import setup_logger
+from config.scraper import AUTO_SCALE, COMPANY_TIMEOUT, MAX_BROWSER_WORKERS, MAX_HTTP_WORKERS
+
+logger = setup_logger('scrape_dispatcher')
+
+
+def _deeper(pages, other):
+    # 0 means every page
+    return 0 if 0 in (pages, other) else max(pages, other)
+
+
+class _Task:
+    def __init__(self, on_result, workers):
+        self.on_result = on_result
+        self.workers = workers
+        self.remaining = set()
+        self.done = threading.Event()
+
+
+class ScrapeDispatcher:
+    def __init__(self, target, timeout=COMPANY_TIMEOUT, max_browser_workers=MAX_BROWSER_WORKERS,
+                 max_http_workers=MAX_HTTP_WORKERS):
+        self.limits = {'browser': max_browser_workers, 'http': max_http_workers}
+        self._lock = threading.RLock()
+        self._wake = threading.Condition(self._lock)
+        self._tasks = {}
+        # company -> {'tasks': task ids waiting on it, 'max_pages', 'mode'} while queued or running
+        self._in_flight = {}
+        self._queues = {'browser': deque(), 'http': deque()}
+        self.executors = {
+            'browser': ScrapeExecutor(target, max_workers=max_browser_workers, timeout=timeout),
+            'http': http_executor(target, workers=max_http_workers, timeout=timeout),
+        }
+        self._resize()
+        for mode in self.executors:
+            threading.Thread(target=self._run_pool, args=(mode,), name=f'scrape-{mode}', daemon=True).start()
+
+    def submit(self, task_id, pools, max_pages, workers, on_result):
+        """Queue ``pools`` ({mode: companies in order}) for ``task_id``.
+
+        ``workers`` is the task's requested {mode: workers}.  Returns an Event
+        that is set once every company's result has gone to ``on_result``
+        (or the task is released).
+        """
+        task = _Task(on_result, workers)
+        joined = []
+        with self._wake:
+            self._tasks[task_id] = task
+            for mode, companies in pools.items():
+                queue = self._queues[mode]
+                for company in companies:
+                    task.remaining.add(company)
+                    entry = self._in_flight.get(company)
+                    if entry is None:
+                        self._in_flight[company] = {'tasks': {task_id}, 'max_pages': max_pages, 'mode': mode}
+                        queue.append(company)
+                        continue
+                    entry['tasks'].add(task_id)
+                    joined.append(company)
+                    if company in queue:
+                        entry['max_pages'] = _deeper(entry['max_pages'], max_pages)
+            if not task.remaining:
+                task.done.set()
+            self._resize()
+            self._wake.notify_all()
+
+        if joined:
+            logger.info(f"Task {task_id} joined in-flight scrapes of {', '.join(joined)}")
+            scraping_service.update_task(task_id, coalesced=joined)
+        controller = self.executors['browser'].controller
+        if controller:
+            scraping_service.update_task(task_id, concurrency=controller.limit,
+                                         concurrency_history=controller.history)
+        return task.done
+
+    def release(self, task_id):
+        """Forget ``task_id``; its queued companies no other task wants are dropped."""
+        with self._lock:
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                return False
+            dropped = 0
+            for company in task.remaining:
+                entry = self._in_flight.get(company)
+                if entry is None:
+                    continue
+                entry['tasks'].discard(task_id)
+                if entry['tasks']:
+                    continue
+                try:
+                    self._queues[entry['mode']].remove(company)
+                except ValueError:
+                    # Already running; its result is still stored, just not reported to a task
+                    continue
+                del self._in_flight[company]
+                dropped += 1
+            self._resize()
+        task.done.set()
+        if dropped:
+            logger.info(f"Task {task_id} released, dropped {dropped} queued companies")
+        return True
+
+    def browser_stats(self):
+        return pools_browser_stats(self.executors.values())
+
+    def _resize(self):
+        # Called with the lock held
+        for mode, executor in self.executors.items():
+            requested = [task.workers[mode] for task in self._tasks.values() if task.workers.get(mode)]
+            ceiling = min(self.limits[mode], max(requested, default=self.limits[mode]))
+            if mode == 'browser':
+                executor.resize(browser_workers(ceiling))
+            else:
+                executor.resize(-(-ceiling // executor.threads))
+
+    def _args_for(self, company):
+        with self._lock:
+            return (self._in_flight[company]['max_pages'],)
+
+    def _concurrency_changed(self, controller):
+        with self._lock:
+            task_ids = list(self._tasks)
+        for task_id in task_ids:
+            scraping_service.update_task(task_id, concurrency=controller.limit,
+                                         concurrency_history=controller.history)
+
+    def _run_pool(self, mode):
+        executor, queue = self.executors[mode], self._queues[mode]
+        while True:
+            with self._wake:
+                while not queue:
+                    self._wake.wait()
+            if mode == 'browser' and AUTO_SCALE:
+                # A fresh controller per busy period, so idle time does not count against throughput
+                executor.controller = AdmissionController(executor.max_workers, on_change=self._concurrency_changed)
+                self._concurrency_changed(executor.controller)
+            try:
+                executor.map(queue, on_result=self._finish, args_for=self._args_for)
+            except Exception as e:
+                logger.error(f"{mode} pool failed: {str(e)}")
+                with self._lock:
+                    lost = [company for company, entry in self._in_flight.items() if entry['mode'] == mode]
+                    queue.clear()
+                for company in lost:
+                    self._finish({'company': company, 'success': False, 'jobs_count': 0,
+                                  'error': f"{mode} pool failed: {str(e)}", 'duration': 0})
+            finally:
+                executor.controller = None
+
+    def _finish(self, result):
+        company = result['company']
+        if result.get('timed_out'):
+            job_service.create_scraping_run(
+                company_name=company, jobs_scraped=0,
+                status='timeout', error_message=result['error'],
+                duration=result['duration'],
+            )
+        with self._lock:
+            entry = self._in_flight.pop(company, None)
+            waiting = [self._tasks[task_id] for task_id in (entry['tasks'] if entry else ()) if task_id in self._tasks]
+        for task in waiting:
+            try:
+                task.on_result(result)
+            except Exception as e:
+                logger.error(f"Reporting {company} failed: {str(e)}")
+            with self._lock:
+                task.remaining.discard(company)
+                if not task.remaining:
+                    task.done.set()
@@ -1,68 +1,61 @@
 import threading
 import time
-from datetime import datetime, timezone
-from queue import Queue
+from datetime import datetime, timedelta, timezone
 
 from apps.data_store import services as job_service
 from apps.scraper_manager import services as scraping_service
+from apps.scraper_manager.dispatcher import ScrapeDispatcher
+from apps.scraper_manager.scheduling import plan_scrape
 from core.logging import setup_logger
+from config.scraper import BROWSER_WORKERS, HTTP_WORKERS
 
 logger = setup_logger(__name__)
 
-_active_tasks = {}
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
 
 
-def run_scrape_task(task_id, companies, max_workers=10, max_pages=1):
-    scraping_service.update_task(task_id, status='running', total_companies=len(companies))
+def get_dispatcher():
+    """The process-wide dispatcher every scrape task submits into."""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = ScrapeDispatcher(_scrape_single)
+    return _dispatcher
 
-    cancel_event = threading.Event()
-    _active_tasks[task_id] = cancel_event
 
-    result_queue = Queue()
-    semaphore = threading.Semaphore(max_workers)
+def run_scrape_task(task_id, companies, max_workers=BROWSER_WORKERS, max_pages=1, http_workers=HTTP_WORKERS):
+    scraping_service.update_task(task_id, status='running', total_companies=len(companies))
+    dispatcher = get_dispatcher()
 
-    def worker(company):
-        try:
-            if cancel_event.is_set():
-                result_queue.put({
-                    'company': company, 'success': False,
-                    'jobs_count': 0, 'error': 'Cancelled', 'duration': 0,
-                })
-                return
-            result = _scrape_single(company, max_pages)
-            result_queue.put(result)
-        except Exception as e:
-            result_queue.put({
-                'company': company, 'success': False,
-                'jobs_count': 0, 'error': str(e), 'duration': 0,
-            })
-        finally:
-            semaphore.release()
+    def on_result(result):
+        task = scraping_service.get_task(task_id)
+        if task and task.get('status') == 'cancelled':
+            dispatcher.release(task_id)
+            return
+
+        scraping_service.increment_task_progress(
+            task_id, result.get('jobs_count', 0), result
+        )
+        scraping_service.update_task(task_id, browsers=dispatcher.browser_stats())
 
     try:
-        threads = []
-        for company in companies:
-            if cancel_event.is_set():
-                break
-            semaphore.acquire()
-            t = threading.Thread(target=worker, args=(company,), daemon=True)
-            t.start()
-            threads.append(t)
-
-        completed = 0
-        total = len(threads)
-        while completed < total:
-            result = result_queue.get()
-            completed += 1
-
-            task = scraping_service.get_task(task_id)
-            if task and task.get('status') == 'cancelled':
-                cancel_event.set()
-                break
-
-            scraping_service.increment_task_progress(
-                task_id, result.get('jobs_count', 0), result
-            )
+        # Longest expected first within the shared pools; the prediction assumes this task has them
+        # to itself, so another running task pushes the real finish later
+        workers = {'browser': min(max_workers, dispatcher.limits['browser']),
+                   'http': min(http_workers, dispatcher.limits['http'])}
+        # A busy browser pool has already ramped up part of the way
+        controller = dispatcher.executors['browser'].controller
+        schedule = plan_scrape(companies, workers['browser'], workers['http'],
+                               browser_start=controller.limit if controller else None)
+        scraping_service.update_task(
+            task_id, expected_duration=schedule['makespan'],
+            expected_finish_at=datetime.now(timezone.utc) + timedelta(seconds=schedule['makespan']),
+        )
+        done = dispatcher.submit(task_id, {mode: pool['order'] for mode, pool in schedule['pools'].items()},
+                                 max_pages, workers, on_result)
+        done.wait()
 
         task = scraping_service.get_task(task_id)
         if task and task.get('status') != 'cancelled':
@@ -81,11 +74,15 @@ def run_scrape_task(task_id, companies, max_workers=10, max_pages=1):
             finished_at=datetime.now(timezone.utc),
         )
     finally:
-        _active_tasks.pop(task_id, None)
+        dispatcher.release(task_id)
+        scraping_service.update_task(task_id, browsers=dispatcher.browser_stats())
 
 
 def _scrape_single(company_name, max_pages=1):
-    from scrapers.registry import SCRAPER_MAP
+    from scrapers.registry import resolve_scraper
+    from core.waits import reset_scroll_stats, get_scroll_stats
+    from core.http_cache import reset_cache_stats, get_cache_stats, ListingUnchanged
+    from core.http_client import reset_session
 
     effective_pages = 999 if max_pages == 0 else max_pages
     logger.info(f"_scrape_single: {company_name} max_pages={max_pages} effective={effective_pages}")
@@ -100,13 +97,31 @@ def _scrape_single(company_name, max_pages=1):
     }
 
     try:
-        scraper_class = SCRAPER_MAP.get(company_name.lower())
+        scraper_class = resolve_scraper(company_name)
         if not scraper_class:
             result['error'] = 'Unknown company'
             return result
 
         scraper = scraper_class()
-        jobs = scraper.scrape(max_pages=effective_pages)
+        stored = job_service.count_company_jobs(company_name)
+        reset_scroll_stats()
+        reset_cache_stats(check_listing=stored > 0)
+        reset_session()
+        try:
+            jobs = scraper.scrape(max_pages=effective_pages)
+        except ListingUnchanged:
+            # The first listing page came back 304/fresh: the stored jobs are still current
+            result.update(get_cache_stats())
+            logger.info(f"{company_name}: listing unchanged, keeping {stored} stored jobs")
+            job_service.create_scraping_run(
+                company_name=company_name, jobs_scraped=stored, status='success',
+                duration=time.time() - start_time,
+            )
+            result.update(success=True, unchanged=True, jobs_count=stored)
+            result['duration'] = round(time.time() - start_time, 1)
+            return result
+        result.update(get_scroll_stats())
+        result.update(get_cache_stats())
 
         if jobs:
             job_service.delete_company_jobs(company_name)
@@ -136,6 +151,7 @@ def _scrape_single(company_name, max_pages=1):
             jobs_scraped=len(jobs) if jobs else 0,
             status='success',
             error_message='No jobs found' if not jobs else None,
+            duration=time.time() - start_time,
         )
 
         result['success'] = True
@@ -147,19 +163,21 @@ def _scrape_single(company_name, max_pages=1):
             jobs_scraped=0,
             status='failed',
             error_message=str(e),
+            duration=time.time() - start_time,
         )
 
     result['duration'] = round(time.time() - start_time, 1)
     return result
 
 
-def start_scrape(companies=None, max_workers=10, max_pages=1, **kwargs):
+def start_scrape(companies=None, max_workers=BROWSER_WORKERS, max_pages=1, http_workers=HTTP_WORKERS, **kwargs):
     from scrapers.registry import ALL_COMPANY_CHOICES
 
     if companies is None:
         companies = ALL_COMPANY_CHOICES
 
-    logger.info(f"start_scrape: {len(companies)} companies, max_workers={max_workers}, max_pages={max_pages}")
+    logger.info(f"start_scrape: {len(companies)} companies, max_workers={max_workers}, "
+                f"http_workers={http_workers}, max_pages={max_pages}")
 
     company_name = companies[0] if len(companies) == 1 else ''
     task = scraping_service.create_task(
@@ -170,7 +188,7 @@ def start_scrape(companies=None, max_workers=10, max_pages=1, **kwargs):
 
     thread = threading.Thread(
         target=run_scrape_task,
-        args=(task['task_id'], companies, max_workers, max_pages),
+        args=(task['task_id'], companies, max_workers, max_pages, http_workers),
         daemon=True,
     )
     thread.start()
@@ -185,8 +203,7 @@ def cancel_scrape(task_id):
             task_id, status='cancelled',
             finished_at=datetime.now(timezone.utc),
         )
-        cancel_event = _active_tasks.get(task_id)
-        if cancel_event:
-            cancel_event.set()
+        # Its queued companies are dropped unless another task is waiting on them
+        get_dispatcher().release(task_id)
         return True
     return False
@@ -0,0 +1,143 @@
+"""
+Longest-expected-first scheduling for scrape runs.
+
+The executor hands the next company to whichever worker frees up first, so
+the submission order decides the makespan.  List order leaves slow scrapers
+like Amazon or IBM for the end, where they run alone while the other workers
+sit idle.  ``plan`` orders companies by expected duration, longest first (LPT
+list scheduling).  It simulates the workers to predict the makespan.
+
+``plan_scrape`` plans the browser and HTTP pools (see
+``scrapers.registry.execution_mode``) separately.  A company's expected
+duration is the median of its recent scrape durations
+(``scraping_runs.durations``).  Companies without history get the median of
+companies on the same platform (Workday, Phenom, browser, ...).  If that
+platform has no history either, ``DEFAULT_ESTIMATES`` is used.
+
+With AUTO_SCALE the browser pool does not start at full width: the
+admission controller (``core.admission``) starts it at ``ADMISSION_START``
+workers and adds at most one every ``ADMISSION_INTERVAL`` seconds.  The
+simulation opens browser worker slots on that schedule.  The controller
+also holds or shrinks the pool under memory, load or latency pressure, so
+the predicted makespan is a best case: the run cannot finish sooner at that
+concurrency, but it can finish later.
+"""
+import heapq
+from statistics import median
+
+from core.logging import setup_logger
+from config.scraper import ADMISSION_INTERVAL, ADMISSION_START, AUTO_SCALE
+
+logger = setup_logger('scrape_scheduler')
+
+# Seconds, for platforms with no recorded runs at all
+DEFAULT_ESTIMATES = {
+    'browser': 90.0,
+    'spec': 60.0,
+    # Learned endpoints may need a browser to re-learn
+    'darwinbox': 30.0,
+    'peoplestrong': 30.0,
+}
+DEFAULT_ENGINE_ESTIMATE = 15.0
+
+
+def ramp_slots(workers, ramp=None):
+    """When each of ``workers`` slots opens: all at 0, or with ``ramp=(start, interval)``
+    ``start`` at 0 and one more every ``interval`` seconds."""
+    workers = max(1, workers)
+    if not ramp:
+        return [0.0] * workers
+    start, interval = ramp
+    start = max(1, min(start, workers))
+    return [0.0] * start + [float(step * interval) for step in range(1, workers - start + 1)]
+
+
+def simulate(order, durations, workers, ramp=None):
+    """(makespan, {company: (start, finish)}) for list scheduling ``order`` on ``workers``
+    (opened as ``ramp_slots`` says)."""
+    free_at = ramp_slots(workers, ramp)
+    slots = {}
+    for company in order:
+        start = heapq.heappop(free_at)
+        finish = start + durations[company]
+        slots[company] = (start, finish)
+        heapq.heappush(free_at, finish)
+    return max((finish for _, finish in slots.values()), default=0.0), slots
+
+
+def estimate_durations(companies, history, platforms):
+    """{company: expected seconds} from ``history`` ({company: [durations]}) and
+    ``platforms`` ({company: platform}) for companies without history."""
+    known = {company: median(runs) for company, runs in history.items() if runs}
+    by_platform = {}
+    for company, seconds in known.items():
+        if company in platforms:
+            by_platform.setdefault(platforms[company], []).append(seconds)
+
+    estimates = {}
+    for company in companies:
+        if company in known:
+            estimates[company] = known[company]
+            continue
+        platform = platforms.get(company, 'browser')
+        peers = by_platform.get(platform)
+        estimates[company] = median(peers) if peers else DEFAULT_ESTIMATES.get(platform, DEFAULT_ENGINE_ESTIMATE)
+    return estimates
+
+
+def plan(companies, workers, estimates, ramp=None):
+    """Companies longest-expected-first, with the predicted makespan.
+
+    Returns {'order', 'expected', 'makespan', 'list_makespan'}; ``list_makespan``
+    is what the given order would have been predicted to take.  ``ramp`` is
+    passed to ``simulate``.
+    """
+    order = sorted(companies, key=lambda company: estimates[company], reverse=True)
+    makespan, _ = simulate(order, estimates, workers, ramp)
+    list_makespan, _ = simulate(companies, estimates, workers, ramp)
+    return {
+        'order': order,
+        'expected': {company: round(estimates[company], 1) for company in companies},
+        'makespan': round(makespan, 1),
+        'list_makespan': round(list_makespan, 1),
+    }
+
+
+def plan_scrape(companies, browser_workers, http_workers, browser_start=None):
+    """``plan`` for each execution pool of a scrape run, with estimates from the stored scraping runs.
+
+    Returns {'pools': {'browser': plan, 'http': plan}, 'expected', 'makespan',
+    'list_makespan'}; the pools run side by side, so the run takes as long as
+    the slower one.  With AUTO_SCALE the browser pool ramps up from
+    ``browser_start`` workers (default ``ADMISSION_START``) to ``browser_workers``.
+    """
+    from apps.data_store import services as job_service
+    from scrapers.registry import HTTP_PLATFORMS, scraper_platform
+
+    companies = list(companies)
+    try:
+        history = job_service.get_run_durations()
+    except Exception as e:
+        logger.warning(f"No run history, scheduling from platform estimates: {str(e)}")
+        history = {}
+
+    # Companies with history set the per-platform estimates for those without
+    platforms = {company: scraper_platform(company) for company in set(history) | set(companies)}
+    estimates = estimate_durations(companies, history, platforms)
+    http = [company for company in companies if platforms[company] in HTTP_PLATFORMS]
+    browser = [company for company in companies if platforms[company] not in HTTP_PLATFORMS]
+    ramp = (browser_start or ADMISSION_START, ADMISSION_INTERVAL) if AUTO_SCALE else None
+    pools = {'browser': plan(browser, browser_workers, estimates, ramp), 'http': plan(http, http_workers, estimates)}
+    pools['browser']['ramp'] = ramp
+
+    schedule = {
+        'pools': pools,
+        'expected': {company: round(estimates[company], 1) for company in companies},
+        'makespan': max(pool['makespan'] for pool in pools.values()),
+        'list_makespan': max(pool['list_makespan'] for pool in pools.values()),
+    }
+    ramping = f" ramping up from {ramp[0]}" if ramp else ''
+    logger.info(f"Scheduled {len(browser)} browser companies on {browser_workers} workers{ramping} "
+                f"(expected {pools['browser']['makespan']:.0f}s) and {len(http)} HTTP companies on "
+                f"{http_workers} (expected {pools['http']['makespan']:.0f}s)")
+    return schedule
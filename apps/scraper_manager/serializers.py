@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from config.scraper import BROWSER_WORKERS, HTTP_WORKERS, MAX_BROWSER_WORKERS, MAX_HTTP_WORKERS
+
 
 class ScrapeTaskSerializer(serializers.Serializer):
     id = serializers.CharField(read_only=True)
@@ -14,6 +16,12 @@ class ScrapeTaskSerializer(serializers.Serializer):
     results = serializers.DictField()
     error_message = serializers.CharField(allow_blank=True)
     progress_percent = serializers.FloatField(read_only=True)
+    browsers = serializers.DictField(required=False)
+    expected_duration = serializers.FloatField(required=False)
+    expected_finish_at = serializers.DateTimeField(required=False)
+    concurrency = serializers.IntegerField(required=False)
+    concurrency_history = serializers.ListField(child=serializers.DictField(), required=False)
+    coalesced = serializers.ListField(child=serializers.CharField(), required=False)
 
 
 class StartScrapeSerializer(serializers.Serializer):
@@ -29,10 +37,18 @@ class StartScrapeSerializer(serializers.Serializer):
     )
     max_workers = serializers.IntegerField(
         required=False,
-        default=10,
+        default=BROWSER_WORKERS,
+        min_value=1,
+        max_value=MAX_BROWSER_WORKERS,
+        help_text=f"Browser scrapers run in parallel, capped by free memory (default: {BROWSER_WORKERS})"
+    )
+    http_workers = serializers.IntegerField(
+        required=False,
+        default=HTTP_WORKERS,
         min_value=1,
-        max_value=20,
-        help_text="Number of parallel workers (default: 10)"
+        max_value=MAX_HTTP_WORKERS,
+        help_text=f"HTTP-only platform scrapers (Workday, Oracle HCM, Eightfold, ...) run in parallel, "
+                  f"alongside the browser scrapers (default: {HTTP_WORKERS})"
     )
     max_pages = serializers.IntegerField(
         required=False,
@@ -8,7 +8,8 @@ from drf_spectacular.utils import extend_schema
 from . import services
 from .serializers import ScrapeTaskSerializer, StartScrapeSerializer
 from .engine import start_scrape, cancel_scrape
-from scrapers.registry import ALL_COMPANY_CHOICES, SCRAPER_MAP
+from scrapers.registry import ALL_COMPANY_CHOICES, has_scraper, resolve_scraper, scraper_platform
+from config.scraper import BROWSER_WORKERS, HTTP_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -26,20 +27,22 @@ def start_scrape_view(request):
 
     companies = data.get('companies', [])
     scrape_all = data.get('all', False)
-    max_workers = data.get('max_workers', 10)
+    max_workers = data.get('max_workers', BROWSER_WORKERS)
+    http_workers = data.get('http_workers', HTTP_WORKERS)
     max_pages = data.get('max_pages', 1)
 
     if scrape_all or not companies:
         companies = ALL_COMPANY_CHOICES
     else:
-        invalid = [c for c in companies if c.lower() not in SCRAPER_MAP]
+        invalid = [c for c in companies if not has_scraper(c)]
         if invalid:
             return Response(
                 {'error': f'Unknown companies: {", ".join(invalid)}'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-    task = start_scrape(companies=companies, max_workers=max_workers, max_pages=max_pages)
+    task = start_scrape(companies=companies, max_workers=max_workers, max_pages=max_pages,
+                        http_workers=http_workers)
     return Response(task, status=status.HTTP_201_CREATED)
 
 
@@ -49,7 +52,7 @@ def start_scrape_view(request):
 )
 @api_view(['POST'])
 def start_single_scrape_view(request, company_name):
-    if company_name.lower() not in SCRAPER_MAP:
+    if not has_scraper(company_name):
         return Response(
             {'error': f'Unknown company: {company_name}'},
             status=status.HTTP_400_BAD_REQUEST
@@ -116,7 +119,8 @@ def scraper_list_view(request):
 @extend_schema(description="Get scraper info (URL, class name) for a company")
 @api_view(['GET'])
 def scraper_info_view(request, company_name):
-    scraper_class = SCRAPER_MAP.get(company_name.lower())
+    # Read-only: uses cached fingerprints, never fetches the careers page
+    scraper_class = resolve_scraper(company_name, fetch=False)
     if not scraper_class:
         return Response({'error': 'Unknown company'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -136,4 +140,5 @@ def scraper_info_view(request, company_name):
         'company': display_name,
         'url': url,
         'scraper_class': scraper_class.__name__,
+        'platform': scraper_platform(company_name),
     })
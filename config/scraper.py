@@ -14,6 +14,82 @@ HEADLESS_MODE = True
 MAX_PAGES_TO_SCRAPE = 15
 FETCH_FULL_JOB_DETAILS = False
 
+# Browser pool settings
+BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', 4))
+BROWSER_MAX_USES = int(os.getenv('BROWSER_MAX_USES', 20))
+# A browser whose process tree (chromedriver + Chrome + renderers) exceeds this is recycled;
+# a leased one fails its next driver.get(). Past BROWSER_KILL_RSS_MB it is killed outright.
+BROWSER_MAX_RSS_MB = int(os.getenv('BROWSER_MAX_RSS_MB', 1024))
+BROWSER_KILL_RSS_MB = int(os.getenv('BROWSER_KILL_RSS_MB', 2 * BROWSER_MAX_RSS_MB))
+BROWSER_WATCHDOG_INTERVAL = int(os.getenv('BROWSER_WATCHDOG_INTERVAL', 30))
+
+# Scrape executor (core/executor.py). Each company runs in a worker process that is
+# killed, browsers included, once the company has run for COMPANY_TIMEOUT seconds.
+COMPANY_TIMEOUT = int(os.getenv('COMPANY_TIMEOUT', 600))
+# Companies are split into two pools that run side by side. Browser scrapers get one
+# worker process each, at most BROWSER_WORKERS and no more than free memory allows at
+# BROWSER_MAX_RSS_MB per browser. HTTP-only platform engines run as threads,
+# HTTP_THREADS_PER_WORKER to a worker process, HTTP_WORKERS at a time.
+BROWSER_WORKERS = int(os.getenv('BROWSER_WORKERS', 6))
+HTTP_WORKERS = int(os.getenv('HTTP_WORKERS', 50))
+HTTP_THREADS_PER_WORKER = int(os.getenv('HTTP_THREADS_PER_WORKER', 25))
+# Process-wide limits shared by all running scrape tasks (apps/scraper_manager/dispatcher.py)
+MAX_BROWSER_WORKERS = int(os.getenv('MAX_BROWSER_WORKERS', 20))
+MAX_HTTP_WORKERS = int(os.getenv('MAX_HTTP_WORKERS', 200))
+# Admission control (core/admission.py): the browser pool starts at ADMISSION_START
+# workers and is re-sized every ADMISSION_INTERVAL seconds, up to the requested
+# max_workers. It backs off when free memory drops below ADMISSION_MIN_FREE_MB, load
+# per CPU passes ADMISSION_MAX_LOAD, or page loads get ADMISSION_LATENCY_FACTOR times
+# slower than the fastest interval so far.
+AUTO_SCALE = os.getenv('AUTO_SCALE', 'true').lower() == 'true'
+ADMISSION_START = int(os.getenv('ADMISSION_START', 2))
+ADMISSION_INTERVAL = int(os.getenv('ADMISSION_INTERVAL', 30))
+ADMISSION_MIN_FREE_MB = int(os.getenv('ADMISSION_MIN_FREE_MB', 1536))
+ADMISSION_MAX_LOAD = float(os.getenv('ADMISSION_MAX_LOAD', 1.5))
+ADMISSION_LATENCY_FACTOR = float(os.getenv('ADMISSION_LATENCY_FACTOR', 2.0))
+
+# Shared HTTP client (core/http_client.py) used by API-based scrapers
+HTTP_CONNECT_TIMEOUT = int(os.getenv('HTTP_CONNECT_TIMEOUT', 10))
+HTTP_READ_TIMEOUT = int(os.getenv('HTTP_READ_TIMEOUT', 30))
+HTTP_RETRIES = int(os.getenv('HTTP_RETRIES', 3))
+HTTP_BACKOFF = float(os.getenv('HTTP_BACKOFF', 0.5))
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 20))
+# Conditional-request cache (core/http_cache.py). Responses are revalidated with
+# ETag / Last-Modified once their TTL (seconds, per host suffix) has passed.
+HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'true').lower() == 'true'
+HTTP_CACHE_DIR = Path(os.getenv('HTTP_CACHE_DIR', BASE_DIR / 'cache' / 'http'))
+HTTP_CACHE_TTL = int(os.getenv('HTTP_CACHE_TTL', 0))
+HTTP_CACHE_TTLS = {
+    # 'myworkdayjobs.com': 600,
+}
+HTTP_CACHE_MAX_MB = int(os.getenv('HTTP_CACHE_MAX_MB', 500))
+# Requests in flight per host across all scrapers, and pages fetched in parallel per paginated API
+HTTP_HOST_CONCURRENCY = int(os.getenv('HTTP_HOST_CONCURRENCY', 6))
+PAGINATION_WORKERS = int(os.getenv('PAGINATION_WORKERS', 6))
+
+# Token-bucket limits per registrable domain as (requests per second, burst),
+# shared by every scraper across all worker processes (core/ratelimit.py)
+RATE_LIMIT_DEFAULT = (float(os.getenv('RATE_LIMIT_RPS', 5)), int(os.getenv('RATE_LIMIT_BURST', 10)))
+RATE_LIMITS = {
+    'myworkdayjobs.com': (8, 16),
+    'oraclecloud.com': (8, 16),
+    'darwinbox.in': (4, 8),
+    'peoplestrong.com': (4, 8),
+    'successfactors.com': (4, 8),
+    'eightfold.ai': (4, 8),
+}
+
+# Resource types dropped by pooled drivers (image, font, media, stylesheet, tracker).
+# Stylesheets stay on by default: many scrapers rely on is_displayed()/offsetParent
+# to detect the last page, which breaks once CSS is missing.
+BLOCK_RESOURCES = os.getenv('BLOCK_RESOURCES', 'true').lower() == 'true'
+BLOCKED_RESOURCE_TYPES = ['image', 'font', 'media', 'tracker']
+
+# Send companies whose careers URL fingerprints as a known platform to that platform's engine
+# instead of their browser scraper (scrapers/platforms/fingerprint.py, cached in cache/).
+# A COMPANIES entry with 'india_only': True makes the engine drop non-India postings.
+AUTO_ROUTE_PLATFORMS = os.getenv('AUTO_ROUTE_PLATFORMS', 'true').lower() == 'true'
+
 # Company URLs
 COMPANIES = {
     'Amazon': {
@@ -176,3 +252,257 @@ COMPANIES = {
     'Toyota Kirloskar': {'url': 'https://www.toyotabharat.com/careers/', 'scraper': 'toyotakirloskar'},
     'Yes Bank': {'url': 'https://yesforyou.darwinbox.in/ms/candidate/careers', 'scraper': 'yesbank'},
 }
+
+# Workday tenants scraped by scrapers/platforms/workday.py, keyed by scraper key.
+# Listings come from https://<tenant>.<datacenter>.myworkdayjobs.com/wday/cxs/<tenant>/<site>/jobs.
+#   applied_facets / search_text  POST body filters (facet ids are copied from the careers page URL)
+#   india_only        keep only postings whose location or URL names an Indian city
+#   default_country   country used when the location text does not name one
+#   locale            path prefix for apply URLs (e.g. 'en-US')
+#   bullet_id_prefix  take the job id from the bullet field starting with this (else externalPath)
+#   fetch_details     fetch each posting's detail JSON (defaults to FETCH_FULL_JOB_DETAILS)
+INDIA_COUNTRY_FACET = 'c4f78be1a8f14da0ab49ce1162348a5e'
+WORKDAY_SITES = {
+    'airbus': {
+        'company_name': 'Airbus', 'tenant': 'ag', 'datacenter': 'wd3', 'site': 'Airbus',
+        'applied_facets': {'locationCountry': [INDIA_COUNTRY_FACET]},
+    },
+    'shell': {
+        'company_name': 'Shell', 'tenant': 'shell', 'datacenter': 'wd3', 'site': 'shellcareers',
+        'applied_facets': {'locationCountry': [INDIA_COUNTRY_FACET]},
+    },
+    'agilent': {
+        'company_name': 'Agilent Technologies', 'tenant': 'agilent', 'datacenter': 'wd5', 'site': 'Agilent_Careers',
+        'applied_facets': {'locationCountry': [INDIA_COUNTRY_FACET]},
+    },
+    'cadence': {
+        'company_name': 'Cadence', 'tenant': 'cadence', 'datacenter': 'wd1', 'site': 'External_Careers',
+        'applied_facets': {'Location_Country': [INDIA_COUNTRY_FACET]},
+    },
+    'r1rcm': {
+        'company_name': 'R1 RCM', 'tenant': 'r1rcm', 'datacenter': 'wd1', 'site': 'R1RCM',
+        'applied_facets': {'Location_Country': [INDIA_COUNTRY_FACET]},
+    },
+    'samsung': {
+        'company_name': 'Samsung', 'tenant': 'sec', 'datacenter': 'wd3', 'site': 'Samsung_Careers',
+        'applied_facets': {'locations': ['0c974e8c1228010867596ab21b3c3469', '189767dd6c9201004b83aa89a5295a80']},
+    },
+    'suncor': {
+        'company_name': 'Suncor Energy', 'tenant': 'suncor', 'datacenter': 'wd1', 'site': 'Suncor_External',
+        'search_text': 'India', 'india_only': True,
+    },
+    'diageo': {
+        'company_name': 'Diageo', 'tenant': 'diageo', 'datacenter': 'wd3', 'site': 'Diageo_Careers',
+        'search_text': 'India',
+    },
+    'nissan': {
+        'company_name': 'Nissan', 'tenant': 'alliance', 'datacenter': 'wd3', 'site': 'nissanjobs',
+        'search_text': 'India',
+    },
+    'nvidia': {
+        'company_name': 'Nvidia', 'tenant': 'nvidia', 'datacenter': 'wd5', 'site': 'NVIDIAExternalCareerSite',
+        'search_text': 'India',
+    },
+    'salesforce': {
+        'company_name': 'Salesforce', 'tenant': 'salesforce', 'datacenter': 'wd12', 'site': 'External_Career_Site',
+        'locale': 'en-US', 'search_text': 'India', 'india_only': True,
+    },
+    'sony': {
+        'company_name': 'Sony', 'tenant': 'sonyglobal', 'datacenter': 'wd1', 'site': 'SonyGlobalCareers',
+        'url': 'https://www.sonyjobs.com/jobs.html', 'search_text': 'India', 'india_only': True,
+        'bullet_id_prefix': 'JR-',
+    },
+    'jll': {
+        'company_name': 'JLL', 'tenant': 'jll', 'datacenter': 'wd1', 'site': 'jllcareers',
+        'url': 'https://jll.wd1.myworkdayjobs.com/en-GB/jllcareers', 'default_country': '',
+        'bullet_id_prefix': 'REQ',
+    },
+}
+
+# Oracle HCM Candidate Experience sites scraped by scrapers/platforms/oracle_hcm.py, keyed by scraper key.
+# Listings come from <host>/hcmRestApi/resources/latest/recruitingCEJobRequisitions.
+#   site_number     CX site (the 'sites/CX_1' part of the careers URL)
+#   location_facet  ';'-separated location ids for selectedLocationsFacet ('' = LOCATIONS facet, no ids)
+#   keyword, sort_by  extra findReqs finder terms
+#   job_url         apply URL prefix (defaults to <host>/hcmUI/CandidateExperience/en/sites/<site_number>/job)
+ORACLE_HCM_SITES = {
+    'zensar': {
+        'company_name': 'Zensar Technologies', 'host': 'https://fa-etvl-saasfaprod1.fa.ocs.oraclecloud.com',
+        'site_number': 'CX_1',
+        'location_facet': '300000000435151;300000000389881;300000000435178;300000000435310;300000000435430',
+    },
+    'bergerpaints': {
+        'company_name': 'Berger Paints', 'host': 'https://iabiiz.fa.ocs.oraclecloud.com',
+        'site_number': 'CX_1', 'location_facet': '',
+    },
+    'blackbox': {
+        'company_name': 'Black Box', 'host': 'https://eoje.fa.us2.oraclecloud.com',
+        'site_number': 'CX_1001', 'location_facet': '300000000385390',
+    },
+    'croma': {
+        'company_name': 'Croma', 'host': 'https://fa-eryk-saasfaprod1.fa.ocs.oraclecloud.com',
+        'site_number': 'CX_1001', 'location_facet': '300000000446243',
+    },
+    'quesscorp': {
+        'company_name': 'Quess Corp', 'host': 'https://fa-eumz-saasfaprod1.fa.ocs.oraclecloud.com',
+        'site_number': 'CX_1', 'location_facet': '300000000433655',
+    },
+    'tatacapital': {
+        'company_name': 'Tata Capital', 'host': 'https://eofh.fa.em2.oraclecloud.com',
+        'site_number': 'CX_3001', 'location_facet': '300000000378365',
+    },
+    'tatachemicals': {
+        'company_name': 'Tata Chemicals', 'host': 'https://fa-eskj-saasfaprod1.fa.ocs.oraclecloud.com',
+        'site_number': 'CX_1001', 'location_facet': '',
+    },
+    'tataplay': {
+        'company_name': 'Tata Play', 'host': 'https://hcoe.fa.us2.oraclecloud.com',
+        'site_number': 'CX_1001', 'sort_by': 'POSTING_DATES_DESC',
+    },
+    'havells': {
+        'company_name': 'Havells', 'host': 'https://iabgcp.fa.ocs.oraclecloud.com',
+        'site_number': 'CX_1', 'location_facet': '300000000469485',
+    },
+    'honeywell': {
+        'company_name': 'Honeywell', 'host': 'https://ibqbjb.fa.ocs.oraclecloud.com',
+        'site_number': 'CX_1', 'location_facet': '300000000469485',
+        'url': 'https://careers.honeywell.com/us/en/search-results?keywords=&location=India',
+        'job_url': 'https://ibqbjb.fa.ocs.oraclecloud.com/hcmUI/CandidateExperience/en/sites/Honeywell/job',
+    },
+    'jpmorganchase': {
+        'company_name': 'JPMorgan Chase', 'host': 'https://jpmc.fa.oraclecloud.com',
+        'site_number': 'CX_1001', 'location_facet': '300000000289360',
+    },
+    'varunbeverages': {
+        'company_name': 'Varun Beverages', 'host': 'https://rjcorphcm-iacbiz.fa.ocs.oraclecloud.com',
+        'site_number': 'CX_1', 'location_facet': '300000000489931', 'sort_by': 'POSTING_DATES_DESC',
+    },
+    # Candidate Experience on the company's own domain; these keep a Selenium fallback
+    'hexaware': {
+        'company_name': 'Hexaware Technologies', 'host': 'https://jobs.hexaware.com',
+        'site_number': 'CX_1', 'job_url': 'https://jobs.hexaware.com/#en/sites/CX_1/job',
+    },
+    'adanienergy': {
+        'company_name': 'Adani Energy Solutions', 'host': 'https://www.adani.com',
+        'site_number': 'CX_2027', 'job_url': 'https://www.adani.com/opportunity/#en/sites/CX_2027/job',
+    },
+    'adaniports': {
+        'company_name': 'Adani Ports & SEZ', 'host': 'https://www.adani.com',
+        'site_number': 'CX_2021', 'job_url': 'https://www.adani.com/opportunity/#en/sites/CX_2021/job',
+    },
+    'americantower': {
+        'company_name': 'American Tower', 'host': 'https://careers.americantower.com',
+        'site_number': 'CX_1', 'job_url': 'https://careers.americantower.com/#en/sites/CX_1/job',
+    },
+}
+
+# DarwinBox candidate portals scraped by scrapers/platforms/darwinbox.py, keyed by scraper key.
+# Both portal generations are supported: /ms/candidate/careers and /ms/candidatev2/main/careers/allJobs.
+DARWINBOX_SITES = {
+    'vedanta': {'company_name': 'Vedanta Limited', 'url': 'https://vhr.darwinbox.in/ms/candidate/careers'},
+    'brigadegroup': {'company_name': 'Brigade Group', 'url': 'https://brigadegroup.darwinbox.in/ms/candidatev2/main/careers/allJobs'},
+    'asahiglass': {'company_name': 'Asahi India Glass', 'url': 'https://ais.darwinbox.in/ms/candidatev2/main/careers/allJobs'},
+    'nivabupa': {'company_name': 'Niva Bupa', 'url': 'https://disha.darwinbox.in/ms/candidatev2/main/careers/allJobs'},
+    'jindalsaw': {'company_name': 'Jindal Saw', 'url': 'https://jslhrms.darwinbox.in/ms/candidatev2/main/careers/allJobs'},
+    'skodavw': {'company_name': 'Skoda Auto Volkswagen India', 'url': 'https://skoda-vw.darwinbox.in/ms/candidate/careers'},
+    'polycab': {'company_name': 'Polycab India', 'url': 'https://polycab.darwinbox.in/ms/candidate/careers'},
+    'godigit': {'company_name': 'Go Digit Insurance', 'url': 'https://godigit.darwinbox.in/ms/candidatev2/main/careers/allJobs'},
+    'tvsmotor': {'company_name': 'TVS Motor Company', 'url': 'https://tvsmsampark.darwinbox.in/ms/candidatev2/main/careers/allJobs'},
+    'jswsteel': {'company_name': 'JSW Steel', 'url': 'https://myjsw.darwinbox.in/ms/candidatev2/main/careers/allJobs'},
+    'gmmco': {'company_name': 'GMMCO', 'url': 'https://gmmco.darwinbox.in/ms/candidate/careers'},
+    'piramalfinance': {'company_name': 'Piramal Finance', 'url': 'https://piramalgroup.darwinbox.in/ms/candidate/careers'},
+    'yesbank': {'company_name': 'Yes Bank', 'url': 'https://yesforyou.darwinbox.in/ms/candidate/careers'},
+}
+
+# PeopleStrong careers portals scraped by scrapers/platforms/peoplestrong.py, keyed by scraper key.
+# Each lives at https://<subdomain>.peoplestrong.com and is opened at /job/joblist unless 'path' says otherwise;
+# 'api' overrides the listing API path the engine posts to.
+PEOPLESTRONG_SITES = {
+    'amararaja': {'company_name': 'Amara Raja Group', 'subdomain': 'amararajacareers'},
+    'bajajfinserv': {'company_name': 'Bajaj Finserv', 'subdomain': 'bflcareers'},
+    'hdfcergo': {'company_name': 'HDFC Ergo', 'subdomain': 'hdfcergocareers'},
+    'rblbank': {'company_name': 'RBL Bank', 'subdomain': 'rblcareers'},
+    'starhealth': {'company_name': 'Star Health Insurance', 'subdomain': 'starhealthcareers'},
+    'maxhealthcare': {'company_name': 'Max Healthcare', 'subdomain': 'maxhealthcarecareers', 'path': '/'},
+    'pidilite': {'company_name': 'Pidilite Industries', 'subdomain': 'pidilitecareers', 'path': '/home'},
+}
+
+# SuccessFactors Recruiting Marketing career sites scraped by scrapers/platforms/successfactors.py,
+# keyed by scraper key. 'url' is the search (or /go/ category) page; 'page_size' only for tenants not on 25.
+SUCCESSFACTORS_SITES = {
+    'nestle': {'company_name': 'Nestle', 'url': 'https://jobdetails.nestle.com/job/search?q=&locationsearch=India', 'page_size': 10},
+    'wipro': {'company_name': 'Wipro', 'url': 'https://careers.wipro.com/search/?q=&locationsearch=India&searchResultView=LIST'},
+    'tataconsumer': {'company_name': 'Tata Consumer Products', 'url': 'https://careers.tataconsumer.com/search/?createNewAlert=false&q=&locationsearch=India&optionsFacetsDD_title='},
+    'mahindra': {'company_name': 'Mahindra', 'url': 'https://jobs.mahindracareers.com/search/?createNewAlert=false&q=&locationsearch='},
+    'airindia': {'company_name': 'Air India', 'url': 'https://careers.airindia.com/search/?createNewAlert=false&q=&locationsearch='},
+    'tataaig': {'company_name': 'Tata AIG Insurance', 'url': 'https://careers.tataaig.com/search/?createNewAlert=false&q=&locationsearch='},
+    'tatainternational': {'company_name': 'Tata International', 'url': 'https://careers.tatainternational.com/search/?createNewAlert=false&q=&locationsearch=India'},
+    'tataprojects': {'company_name': 'Tata Projects', 'url': 'https://careers.tataprojects.com/search/?createNewAlert=false&q=&optionsFacetsDD_location=&optionsFacetsDD_customfield3=&optionsFacetsDD_customfield4=&optionsFacetsDD_dept=&optionsFacetsDD_customfield1='},
+    'trent': {'company_name': 'Trent Limited', 'url': 'https://careers.trentlimited.com/search/?createNewAlert=false&q=&locationsearch=&optionsFacetsDD_dept=&optionsFacetsDD_customfield1='},
+    'bajajelectricals': {'company_name': 'Bajaj Electricals', 'url': 'https://careers.bajajelectricals.com/search/?createNewAlert=false&q=&locationsearch='},
+    'olam': {'company_name': 'Olam', 'url': 'https://careers.olamgroup.com/search/?createNewAlert=false&q=&locationsearch=India&optionsFacetsDD_customfield3=&optionsFacetsDD_customfield1='},
+    'tatapower': {'company_name': 'Tata Power', 'url': 'https://careers.tatapower.com/search/?createNewAlert=false&q=&locationsearch=India&optionsFacetsDD_dept=&optionsFacetsDD_customfield1=&optionsFacetsDD_customfield2='},
+    'anz': {'company_name': 'ANZ', 'url': 'https://careers.anz.com/search/?createNewAlert=false&q=&locationsearch=India'},
+    'birlasoft': {'company_name': 'Birlasoft', 'url': 'https://jobs.birlasoft.com/go/India/684744/'},
+    'mankindpharma': {'company_name': 'Mankind Pharma', 'url': 'https://careers.mankindpharma.com/search/?createNewAlert=false&q=&locationsearch=&optionsFacetsDD_title=&optionsFacetsDD_city=&optionsFacetsDD_department='},
+    'kirloskar': {'company_name': 'Kirloskar Oil Engines', 'url': 'https://mhicareers.com/search/?createNewAlert=false&q=&locationsearch=IND&optionsFacetsDD_title=&optionsFacetsDD_facility='},
+    'mitsubishi': {'company_name': 'Mitsubishi Heavy Industries', 'url': 'https://mhicareers.com/PrimetalsTechnologies/search/?createNewAlert=false&q=&locationsearch=India&optionsFacetsDD_title=&optionsFacetsDD_customfield3='},
+    'ey': {'company_name': 'EY', 'url': 'https://careers.ey.com/ey/search/?createNewAlert=false&q=&locationsearch=India'},
+    'metlife': {'company_name': 'MetLife', 'url': 'https://jobs.metlife.com/search/?q=&locationsearch=India'},
+    'hcltech': {'company_name': 'HCLTech', 'url': 'https://careers.hcltech.com/go/India/9553955/'},
+    'sap': {'company_name': 'SAP', 'url': 'https://jobs.sap.com/go/India/8807201/'},
+}
+
+# Phenom People career sites scraped by scrapers/platforms/phenom.py, keyed by scraper key.
+# 'url' is the /<country>/<lang>/search-results page. Optional: 'selected_fields' (search facets),
+# 'keywords', and 'india_only' to drop non-India jobs from tenants searched globally.
+PHENOM_SITES = {
+    'abb': {'company_name': 'ABB', 'url': 'https://careers.abb/global/en/search-results', 'india_only': True},
+    'abbott': {'company_name': 'Abbott', 'url': 'https://www.jobs.abbott/us/en/search-results?qcountry=India', 'selected_fields': {'country': ['India']}},
+    'adobe': {'company_name': 'Adobe', 'url': 'https://careers.adobe.com/us/en/search-results?location=India', 'selected_fields': {'country': ['India']}},
+    'allianz': {'company_name': 'Allianz', 'url': 'https://careers.allianz.com/global/en/search-results?location=India', 'selected_fields': {'country': ['India']}},
+    'bcg': {'company_name': 'BCG', 'url': 'https://careers.bcg.com/global/en/search-results', 'selected_fields': {'country': ['India']}},
+    'cognizant': {'company_name': 'Cognizant', 'url': 'https://careers.cognizant.com/global/en/search-results?qcountry=India', 'selected_fields': {'country': ['India']}},
+    'dhl': {'company_name': 'DHL Group', 'url': 'https://careers.dhl.com/global/en/search-results', 'selected_fields': {'businessUnit': ['eCommerce Solutions'], 'country': ['India']}},
+    'elililly': {'company_name': 'Eli Lilly', 'url': 'https://careers.lilly.com/us/en/search-results?qcountry=India', 'selected_fields': {'country': ['India']}},
+    'geaerospace': {'company_name': 'GE Aerospace', 'url': 'https://careers.geaerospace.com/global/en/search-results', 'india_only': True},
+    'ntt': {'company_name': 'NTT', 'url': 'https://careers.services.global.ntt/global/en/search-results', 'india_only': True},
+    'philips': {'company_name': 'Philips', 'url': 'https://www.careers.philips.com/in/en/search-results'},
+    'royalenfield': {'company_name': 'Royal Enfield', 'url': 'https://careers.royalenfield.com/us/en/search-results'},
+    'titan': {'company_name': 'Titan Company', 'url': 'https://careers.titan.in/in/en/search-results'},
+    'tranetechnologies': {'company_name': 'Trane Technologies', 'url': 'https://careers.tranetechnologies.com/global/en/search-results', 'india_only': True},
+    'unitedairlines': {'company_name': 'United Airlines', 'url': 'https://careers.united.com/us/en/search-results?keywords=India', 'keywords': 'India', 'india_only': True},
+    'warnerbros': {'company_name': 'Warner Bros. Discovery', 'url': 'https://careers.wbd.com/global/en/search-results', 'india_only': True},
+}
+
+# Eightfold career sites scraped by scrapers/platforms/eightfold.py, keyed by scraper key.
+# Listings come from <host>/api/apply/v2/jobs?domain=<domain>&location=<location>.
+#   params       extra query filters copied from the careers page URL (e.g. filter_brand)
+#   india_only   keep only positions whose location names an Indian city
+EIGHTFOLD_SITES = {
+    'morganstanley': {'company_name': 'Morgan Stanley', 'host': 'https://morganstanley.eightfold.ai', 'domain': 'morganstanley.eightfold.ai'},
+    'lgelectronics': {'company_name': 'LG Electronics', 'host': 'https://lgcns.eightfold.ai', 'domain': 'lgcns.com'},
+    'americanexpress': {'company_name': 'American Express', 'host': 'https://aexp.eightfold.ai', 'domain': 'aexp.com'},
+    'bayer': {'company_name': 'Bayer', 'host': 'https://talent.bayer.com', 'domain': 'bayer.com'},
+    'ericsson': {'company_name': 'Ericsson', 'host': 'https://jobs.ericsson.com', 'domain': 'ericsson.com'},
+    'vois': {'company_name': 'VOIS', 'host': 'https://jobs.vodafone.com', 'domain': 'vodafone.com',
+             'params': {'filter_brand': 'vois', 'filter_include_remote': 1}},
+}
+
+# SmartRecruiters companies scraped by scrapers/platforms/smartrecruiters.py, keyed by scraper key.
+# 'company_id' is the identifier in careers.smartrecruiters.com/<company_id>; 'country' an ISO code filter.
+SMARTRECRUITERS_SITES = {
+    'bosch': {'company_name': 'Bosch', 'company_id': 'BoschGroup', 'country': 'in'},
+    'oyo': {'company_name': 'OYO', 'company_id': 'OYO'},
+}
+
+# TalentBrew (Radancy) career sites scraped by scrapers/platforms/talentbrew.py, keyed by scraper key.
+# 'org_id' is the organization id from the search URL (/search-jobs/India/<org_id>/2/1269750/...);
+# 'location_id' defaults to India's GeoNames id 1269750.
+TALENTBREW_SITES = {
+    'astrazeneca': {'company_name': 'AstraZeneca', 'url': 'https://careers.astrazeneca.com/location/india-jobs/7684/1269750/2', 'org_id': 7684},
+    'barclays': {'company_name': 'Barclays', 'url': 'https://search.jobs.barclays/search-jobs/India/13015/2/1269750/22/79/50/2', 'org_id': 13015, 'india_only': True},
+    'mckesson': {'company_name': 'McKesson', 'url': 'https://careers.mckesson.com/en/search-jobs/India/733/2/1269750/22/79/50/2', 'org_id': 733},
+    'disney': {'company_name': 'Disney', 'url': 'https://www.disneycareers.com/en/location/india-jobs/391/1269750/2', 'org_id': 391},
+    'intuit': {'company_name': 'Intuit', 'url': 'https://jobs.intuit.com/location/india-jobs/27595/1269750/2', 'org_id': 27595},
+}
@@ -0,0 +1,128 @@
+"""
+Admission control for the browser pool.
+
+The requested ``max_workers`` is only an upper bound.  An
+``AdmissionController`` starts the pool at ``ADMISSION_START`` workers and
+re-sizes it once every ``ADMISSION_INTERVAL`` seconds from what the last
+interval looked like:
+
+    free memory < ADMISSION_MIN_FREE_MB         -> shrink by a quarter
+    load average per CPU > ADMISSION_MAX_LOAD   -> shrink by one
+    more browsers than twice the limit          -> shrink by one (leaked browsers)
+    page loads ADMISSION_LATENCY_FACTOR times
+      slower than the fastest interval so far   -> shrink by one
+    throughput fell after the last ramp-up      -> shrink by one
+    every slot busy and work waiting            -> grow by one, unless the last
+                                                   ramp-up lowered throughput
+
+Page-load times come from the pooled drivers' ``driver.get()`` (the workers
+report them with each result).  Free memory needs ``psutil``; without it
+only the other signals apply.  Every change is appended to ``history`` with
+the signals behind it, and ``on_change(controller)`` is called so the task's
+progress can record it.
+"""
+import os
+import time
+
+from core.logging import setup_logger
+from core.supervisor import available_memory_mb
+from config.scraper import (ADMISSION_START, ADMISSION_INTERVAL, ADMISSION_MIN_FREE_MB, ADMISSION_MAX_LOAD,
+                            ADMISSION_LATENCY_FACTOR)
+
+logger = setup_logger('admission')
+
+# A ramp-up whose interval completes this much less than the one before it is undone
+THROUGHPUT_DROP = 0.9
+
+
+def _load_per_cpu():
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+class AdmissionController:
+    """Concurrency limit for a ScrapeExecutor, between 1 and ``max_workers``."""
+
+    def __init__(self, max_workers, start=ADMISSION_START, interval=ADMISSION_INTERVAL, on_change=None):
+        self.max_workers = max(1, max_workers)
+        self.limit = max(1, min(start, self.max_workers))
+        self.interval = interval
+        self.on_change = on_change
+        self._started = time.time()
+        self._window_start = self._started
+        self._completed = 0
+        self._page_loads = 0
+        self._page_load_seconds = 0.0
+        self._best_latency = None
+        self._last_throughput = None
+        self._last_step = 0
+        self.history = [{'t': 0, 'limit': self.limit, 'reason': 'start'}]
+
+    def resize(self, max_workers):
+        """Move the ceiling, lowering the limit if it is now above it."""
+        self.max_workers = max(1, max_workers)
+        if self.limit > self.max_workers:
+            self.limit = self.max_workers
+            self.history.append({'t': round(time.time() - self._started), 'limit': self.limit, 'reason': 'ceiling'})
+            if self.on_change:
+                self.on_change(self)
+
+    def record(self, stats):
+        """Count a finished company and the page loads its worker reported for it."""
+        self._completed += 1
+        self._page_loads += stats.get('page_loads', 0)
+        self._page_load_seconds += stats.get('page_load_seconds', 0.0)
+
+    def update(self, saturated, browsers=0):
+        """The limit for the next interval; ``saturated`` means every slot is busy and work is waiting."""
+        now = time.time()
+        elapsed = now - self._window_start
+        if elapsed < self.interval:
+            return self.limit
+
+        throughput = self._completed * 60 / elapsed
+        latency = self._page_load_seconds / self._page_loads if self._page_loads else None
+        free = available_memory_mb()
+        load = _load_per_cpu()
+
+        if free is not None and free < ADMISSION_MIN_FREE_MB:
+            step, reason = -max(1, self.limit // 4), 'memory'
+        elif load is not None and load > ADMISSION_MAX_LOAD:
+            step, reason = -1, 'load'
+        elif browsers > 2 * self.limit + 2:
+            step, reason = -1, 'browsers'
+        elif latency and self._best_latency and latency > self._best_latency * ADMISSION_LATENCY_FACTOR:
+            step, reason = -1, 'latency'
+        elif self._last_step > 0 and self._last_throughput and throughput < self._last_throughput * THROUGHPUT_DROP:
+            step, reason = -1, 'throughput'
+        elif saturated and not (self._last_step > 0 and self._last_throughput and throughput < self._last_throughput):
+            step, reason = 1, 'ramp'
+        else:
+            step, reason = 0, None
+
+        if latency:
+            self._best_latency = min(self._best_latency or latency, latency)
+        self._last_throughput = throughput
+        self._window_start = now
+        self._completed = self._page_loads = 0
+        self._page_load_seconds = 0.0
+
+        limit = max(1, min(self.max_workers, self.limit + step))
+        self._last_step = limit - self.limit
+        if limit != self.limit:
+            self.limit = limit
+            self.history.append({
+                't': round(now - self._started), 'limit': limit, 'reason': reason,
+                'throughput_per_min': round(throughput, 2),
+                'page_load_s': round(latency, 2) if latency else None,
+                'free_mb': round(free) if free is not None else None,
+                'load': round(load, 2) if load is not None else None,
+                'browsers': browsers,
+            })
+            logger.info(f"Browser concurrency -> {limit} ({reason}: {throughput:.1f}/min, "
+                        f"page load {latency or 0:.1f}s, free {free or 0:.0f}MB, load {load or 0:.2f})")
+            if self.on_change:
+                self.on_change(self)
+        return self.limit
@@ -0,0 +1,409 @@
+"""
+Shared Chrome WebDriver pool.
+
+Scrapers lease a warm, pre-configured driver with ``acquire_driver()`` and
+hand it back with ``release_driver(driver)`` instead of launching and
+quitting their own Chrome.  Between leases the pool closes extra tabs and
+clears cookies and storage, and a driver is recycled (quit and replaced)
+after ``BROWSER_MAX_USES`` leases.
+
+Launched browsers are registered with ``core.supervisor``, which watches
+their memory; drivers over ``BROWSER_MAX_RSS_MB`` are recycled on the next
+acquire or release, a leased one raises ``BrowserOverLimit`` from its next
+``driver.get()``, and browsers the pool no longer knows about are reaped
+by ``reap_orphans()``.
+
+Pooled drivers take a token from ``core.ratelimit`` before every
+``driver.get()``, sharing the per-platform budget with the HTTP client.
+
+Leased drivers drop the resource types in ``BLOCKED_RESOURCE_TYPES`` (images,
+fonts, media, known analytics / chat-widget hosts) via CDP
+``Network.setBlockedURLs``.  Scrapers for sites that break without some of
+those pass ``allow=`` to ``acquire_driver()``.
+
+Sites that need Chrome switches of their own (certificate or site-isolation
+overrides) pass ``arguments=`` and get a dedicated driver launched with the
+shared options plus those switches.  Scrapers that read the page's XHR/fetch
+responses with ``core.network.NetworkCapture`` pass ``capture=True`` and
+likewise get a dedicated driver, the only kind launched with Chrome
+performance logging on.  Drivers a scraper launches some other
+way (``undetected_chromedriver``) are handed to ``adopt_driver()``.  Either
+kind is supervised and rate-limited like a pooled driver, but is quit on
+release instead of being reused.
+"""
+import atexit
+import os
+import threading
+import time
+from queue import Empty, Full, Queue
+from urllib.parse import urlparse
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
+
+from core.logging import setup_logger
+from core.ratelimit import wait_for_slot
+from core.supervisor import get_supervisor, owner_switch
+from core.waits import REQUEST_TRACKER_JS
+from config.scraper import (
+    HEADLESS_MODE, BROWSER_POOL_SIZE, BROWSER_MAX_USES, BLOCK_RESOURCES, BLOCKED_RESOURCE_TYPES,
+)
+
+logger = setup_logger('browser_pool')
+
+CHROMEDRIVER_PATH = os.getenv(
+    'CHROMEDRIVER_PATH',
+    '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver',
+)
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+
+
+def _extensions(*exts):
+    return [p for ext in exts for p in (f'*.{ext}', f'*.{ext}?*')]
+
+
+RESOURCE_BLOCK_PATTERNS = {
+    'image': _extensions('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'),
+    'font': _extensions('woff', 'woff2', 'ttf', 'otf', 'eot'),
+    'media': _extensions('mp4', 'webm', 'ogg', 'mp3', 'wav', 'm4a', 'mov', 'm3u8') + [
+        '*youtube.com/embed*', '*player.vimeo.com*',
+    ],
+    'stylesheet': _extensions('css'),
+    'tracker': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*googleadservices.com*', '*googlesyndication.com*', '*connect.facebook.net*',
+        '*bat.bing.com*', '*clarity.ms*', '*hotjar.com*', '*mouseflow.com*', '*fullstory.com*',
+        '*crazyegg.com*', '*quantserve.com*', '*scorecardresearch.com*', '*segment.io*',
+        '*cdn.segment.com*', '*mixpanel.com*', '*newrelic.com*', '*nr-data.net*',
+        '*adobedtm.com*', '*demdex.net*', '*omtrdc.net*', '*px.ads.linkedin.com*',
+        '*snap.licdn.com*', '*analytics.tiktok.com*', '*optimizely.com*', '*qualtrics.com*',
+        '*intercom.io*', '*intercomcdn.com*', '*js.driftt.com*', '*drift.com*',
+        '*zopim.com*', '*static.zdassets.com*', '*tawk.to*', '*livechatinc.com*',
+        '*freshchat.com*', '*cdn.cookielaw.org*', '*onetrust.com*', '*cookiebot.com*',
+    ],
+}
+
+
+def blocked_url_patterns(allow=()):
+    """URL patterns to block for the configured resource types minus ``allow``."""
+    if not BLOCK_RESOURCES:
+        return []
+    return [
+        pattern
+        for resource_type in BLOCKED_RESOURCE_TYPES if resource_type not in allow
+        for pattern in RESOURCE_BLOCK_PATTERNS.get(resource_type, [])
+    ]
+
+
+def apply_resource_blocking(driver, allow=()):
+    """Install the CDP block list on ``driver`` (replacing any previous one).
+
+    The CDP Network domain is only enabled when there is something to block.
+    """
+    patterns = blocked_url_patterns(allow)
+    if patterns:
+        driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+
+
+def build_chrome_options(capture=False):
+    """Chrome options shared by every pooled driver, plus performance logging when ``capture``."""
+    chrome_options = Options()
+    if HEADLESS_MODE:
+        chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_argument(owner_switch())
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
+    if capture:
+        # Network events for core.network.NetworkCapture
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+    return chrome_options
+
+
+def create_driver(arguments=(), capture=False):
+    """Launch a new Chrome instance with the shared options plus the Chrome switches in ``arguments``."""
+    chrome_options = build_chrome_options(capture)
+    for argument in arguments:
+        chrome_options.add_argument(argument)
+    try:
+        if os.path.exists(CHROMEDRIVER_PATH):
+            service = Service(CHROMEDRIVER_PATH)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        else:
+            driver = webdriver.Chrome(options=chrome_options)
+    except Exception as e:
+        logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
+        driver = webdriver.Chrome(options=chrome_options)
+    get_supervisor().register(driver)
+
+    driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": USER_AGENT})
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        'source': "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+    })
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': REQUEST_TRACKER_JS})
+    _rate_limit_navigation(driver)
+    return driver
+
+
+# Pooled driver.get() calls and their load time, for the admission controller (core/admission.py)
+_navigation = {'page_loads': 0, 'page_load_seconds': 0.0}
+_navigation_lock = threading.Lock()
+
+
+class BrowserOverLimit(WebDriverException):
+    """The supervisor found this driver's browser above ``BROWSER_MAX_RSS_MB`` while it was leased."""
+
+
+def _rate_limit_navigation(driver):
+    """Make ``driver.get()`` wait for the target platform's rate limit and time the load.
+
+    Raises ``BrowserOverLimit`` instead of navigating once the supervisor has
+    flagged the browser, so a bloated browser ends its scrape at the next page.
+    """
+    navigate = driver.get
+    supervisor = get_supervisor()
+
+    def get(url):
+        if supervisor.over_limit(driver):
+            raise BrowserOverLimit(f"browser exceeds {supervisor.max_rss_mb}MB, not loading {url[:100]}")
+        wait_for_slot(url)
+        start = time.time()
+        try:
+            return navigate(url)
+        finally:
+            with _navigation_lock:
+                _navigation['page_loads'] += 1
+                _navigation['page_load_seconds'] += time.time() - start
+
+    driver.get = get
+
+
+class DriverPool:
+    """Keeps up to ``size`` idle drivers warm and leases them to scrapers.
+
+    Leasing never blocks: when no idle driver is available a new one is
+    launched, and drivers released while the pool is already full are quit.
+    """
+
+    def __init__(self, size=BROWSER_POOL_SIZE, max_uses=BROWSER_MAX_USES):
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = Queue(maxsize=size)
+        self._uses = {}
+        self._leased = set()
+        # Drivers launched for one lease (``arguments=``, ``capture=True`` or adopted), quit on release
+        self._dedicated = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self, allow=(), arguments=(), capture=False):
+        if arguments or capture:
+            driver = create_driver(arguments, capture)
+            logger.info(f"Launched dedicated driver with {' '.join(arguments) or 'network capture'}")
+            with self._lock:
+                self._dedicated.add(driver.session_id)
+        else:
+            driver = self._take_idle()
+
+        try:
+            apply_resource_blocking(driver, allow)
+        except Exception as e:
+            logger.warning(f"Could not apply resource blocking: {str(e)}")
+
+        with self._lock:
+            self._uses[driver.session_id] = self._uses.get(driver.session_id, 0) + 1
+            self._leased.add(driver.session_id)
+        return driver
+
+    def _take_idle(self):
+        """A live idle driver under the RSS ceiling, or a newly launched one."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except Empty:
+                driver = create_driver()
+                logger.info("Launched new pooled driver")
+                return driver
+            if self._is_alive(driver) and not get_supervisor().over_limit(driver):
+                return driver
+            self._discard(driver)
+
+    def adopt(self, driver):
+        """Supervise and rate-limit a driver launched outside the pool, as a dedicated lease."""
+        get_supervisor().register(driver)
+        _rate_limit_navigation(driver)
+        with self._lock:
+            self._uses[driver.session_id] = 1
+            self._leased.add(driver.session_id)
+            self._dedicated.add(driver.session_id)
+        return driver
+
+    def release(self, driver, discard=False):
+        if driver is None:
+            return
+        with self._lock:
+            self._leased.discard(driver.session_id)
+            uses = self._uses.get(driver.session_id, 0)
+            discard = discard or driver.session_id in self._dedicated
+
+        over_limit = get_supervisor().over_limit(driver)
+        if discard or self._closed or over_limit or uses >= self.max_uses:
+            if uses >= self.max_uses:
+                logger.info(f"Recycling driver after {uses} uses")
+            self._discard(driver)
+            return
+
+        try:
+            self._reset(driver)
+        except Exception as e:
+            logger.warning(f"Driver reset failed, discarding: {str(e)}")
+            self._discard(driver)
+            return
+
+        try:
+            self._idle.put_nowait(driver)
+        except Full:
+            self._discard(driver)
+
+    def warm(self, count=None):
+        """Pre-launch drivers in the background until ``count`` are idle."""
+        count = min(count or self.size, self.size)
+
+        def _fill():
+            while not self._closed and self._idle.qsize() < count:
+                try:
+                    driver = create_driver()
+                except Exception as e:
+                    logger.warning(f"Could not warm driver: {str(e)}")
+                    return
+                with self._lock:
+                    self._uses.setdefault(driver.session_id, 0)
+                try:
+                    self._idle.put_nowait(driver)
+                except Full:
+                    self._discard(driver)
+                    return
+
+        threading.Thread(target=_fill, daemon=True).start()
+
+    def stats(self):
+        with self._lock:
+            return {'idle': self._idle.qsize(), 'leased': len(self._leased)}
+
+    def sessions(self):
+        """Session ids of every driver the pool currently owns (idle or leased)."""
+        with self._lock:
+            return set(self._uses)
+
+    def shutdown(self):
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(driver)
+
+    def _reset(self, driver):
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        origin = driver.execute_script("return window.location.origin")
+        if origin and urlparse(origin).scheme in ('http', 'https'):
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': origin,
+                'storageTypes': 'local_storage,session_storage,indexeddb,websql,service_workers,cache_storage',
+            })
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.set_script_timeout(30)
+        driver.get('about:blank')
+
+    def _is_alive(self, driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(driver.session_id, None)
+            self._leased.discard(driver.session_id)
+            self._dedicated.discard(driver.session_id)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        get_supervisor().unregister(driver)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = DriverPool()
+                atexit.register(_pool.shutdown)
+    return _pool
+
+
+def acquire_driver(allow=(), arguments=(), capture=False):
+    """Lease a warm Chrome driver from the process-wide pool.
+
+    ``allow`` lists resource types (e.g. ``('stylesheet',)``) the site needs
+    and that should therefore not be blocked for this lease.  ``arguments``
+    are extra Chrome switches and ``capture=True`` turns on the performance
+    log ``NetworkCapture`` reads; both need a fresh browser, which is launched
+    for this lease and quit when it is released.
+    """
+    start = time.time()
+    driver = get_pool().acquire(allow=allow, arguments=arguments, capture=capture)
+    logger.info(f"Leased driver in {time.time() - start:.2f}s")
+    return driver
+
+
+def adopt_driver(driver):
+    """Track a driver the scraper launched itself (release it with ``release_driver``).
+
+    Launch it with ``owner_switch()`` among its Chrome arguments so it is
+    reaped with this process's browsers if it is leaked.
+    """
+    return get_pool().adopt(driver)
+
+
+def release_driver(driver, discard=False):
+    """Return a leased driver; ``discard=True`` quits it instead of reusing it."""
+    get_pool().release(driver, discard=discard)
+
+
+def browser_stats():
+    """Pool and process stats for task progress: idle/leased drivers, browser count and RSS."""
+    return {**get_pool().stats(), **get_supervisor().snapshot()}
+
+
+def navigation_stats():
+    """Page loads by pooled drivers in this process so far, and their total load time."""
+    with _navigation_lock:
+        return dict(_navigation)
+
+
+def reap_orphans():
+    """Kill browser processes the pool no longer owns (leaked by failed or cancelled scrapes)."""
+    return get_supervisor().reap(get_pool().sessions())
@@ -0,0 +1,201 @@
+"""
+API discovery: profile career sites for JSON job endpoints.
+
+Each company page from ``config.scraper.COMPANIES`` is loaded once in a
+driver leased with network capture on.  Every JSON response is scored by how
+much it looks like a job list (an array of objects carrying title, location
+and URL/id fields), and the best candidates are reported together with the
+request that produced them, any pagination parameters and the total count
+the endpoint advertises.  The report is what we use to move browser
+scrapers onto the HTTP path.
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from urllib.parse import parse_qsl, urlparse
+
+from core.browser import acquire_driver, release_driver
+from core.logging import setup_logger
+from core.network import NetworkCapture
+from core.waits import wait_for_dom_stable
+from config.scraper import COMPANIES, LOGS_DIR
+
+logger = setup_logger('api_discovery')
+
+TITLE_KEYS = {'title', 'jobtitle', 'job_title', 'postingtitle', 'name', 'positiontitle', 'requisitiontitle'}
+LOCATION_KEYS = {'location', 'locations', 'locationstext', 'primarylocation', 'city', 'joblocation', 'locationname'}
+LINK_KEYS = {'url', 'applyurl', 'apply_url', 'externalpath', 'joburl', 'absolute_url', 'canonicalpositionurl',
+             'jobid', 'job_id', 'id', 'reqid', 'requisitionid', 'jobseqno', 'refnum'}
+TOTAL_KEYS = {'total', 'totalcount', 'total_count', 'totalhits', 'totaljobscount', 'totalresults',
+              'total_results', 'totalrecords', 'numfound', 'count', 'hits'}
+PAGINATION_KEYS = {'offset', 'limit', 'start', 'startrow', 'page', 'pagenumber', 'page_number', 'pageno', 'pagesize',
+                   'page_size', 'size', 'from', 'rows', 'num', 'per_page', 'perpage', 'skip', 'take', 'pgsz', 'pg'}
+
+MIN_ITEMS = 2
+
+
+def _job_arrays(node, path='$'):
+    """Yield (path, list) for every list of dicts inside ``node``."""
+    if isinstance(node, list):
+        if len(node) >= MIN_ITEMS and all(isinstance(item, dict) for item in node[:10]):
+            yield path, node
+        for index, item in enumerate(node[:3]):
+            yield from _job_arrays(item, f'{path}[{index}]')
+    elif isinstance(node, dict):
+        for key, value in node.items():
+            yield from _job_arrays(value, f'{path}.{key}')
+
+
+def score_array(items):
+    """0..1 job-likeness of a list of dicts: coverage of title/location/link fields."""
+    sample = items[:20]
+    hits = {'title': 0, 'location': 0, 'link': 0}
+    for item in sample:
+        keys = {k.lower() for k in item}
+        hits['title'] += bool(keys & TITLE_KEYS)
+        hits['location'] += bool(keys & LOCATION_KEYS)
+        hits['link'] += bool(keys & LINK_KEYS)
+    if not hits['title']:
+        return 0.0
+    n = len(sample)
+    return round(0.5 * hits['title'] / n + 0.25 * hits['location'] / n + 0.25 * hits['link'] / n, 3)
+
+
+def find_total(node, depth=0):
+    """First integer under a total-like key, checking each level before descending."""
+    if depth > 4 or not isinstance(node, (dict, list)):
+        return None
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key.lower() in TOTAL_KEYS and isinstance(value, int) and not isinstance(value, bool):
+                return value
+        children = node.values()
+    else:
+        children = node[:1]
+    for child in children:
+        total = find_total(child, depth + 1)
+        if total is not None:
+            return total
+    return None
+
+
+def pagination_params(response):
+    """Pagination-looking parameters from the query string, POST body or Oracle finder."""
+    params = {}
+    parsed = urlparse(response['url'])
+    for key, value in parse_qsl(parsed.query):
+        if key.lower() in PAGINATION_KEYS:
+            params[key] = value
+        elif key == 'finder':
+            for part in value.split(','):
+                name, _, finder_value = part.partition('=')
+                if name.split(';')[-1].lower() in PAGINATION_KEYS:
+                    params[name.split(';')[-1]] = finder_value
+    if response.get('post_data'):
+        try:
+            body = json.loads(response['post_data'])
+        except ValueError:
+            body = {}
+        if isinstance(body, dict):
+            for key, value in body.items():
+                if key.lower() in PAGINATION_KEYS:
+                    params[key] = value
+    return params
+
+
+def rank_response(response, payload):
+    """Best job-like array in ``payload`` as a candidate dict, or None."""
+    best = None
+    for path, items in _job_arrays(payload):
+        score = score_array(items)
+        if score and (best is None or (score, len(items)) > (best['score'], best['items'])):
+            best = {'score': score, 'path': path, 'items': len(items),
+                    'sample_fields': sorted(items[0].keys())[:25]}
+    if not best:
+        return None
+    return {
+        'url': response['url'],
+        'method': response.get('method', 'GET'),
+        'status': response.get('status'),
+        'post_data': response.get('post_data', '')[:2000],
+        'total': find_total(payload),
+        'pagination_params': pagination_params(response),
+        **best,
+    }
+
+
+def profile_company(company_name, url, settle_timeout=20):
+    """Load ``url`` once and return the ranked JSON endpoint candidates."""
+    driver = None
+    candidates = []
+    error = None
+    try:
+        driver = acquire_driver(capture=True)
+        capture = NetworkCapture(driver)
+        driver.get(url)
+        wait_for_dom_stable(driver, settle_timeout)
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        wait_for_dom_stable(driver, 5)
+
+        for response in capture.responses(json_only=True):
+            body = capture.body(response['request_id'])
+            if not body:
+                continue
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                continue
+            candidate = rank_response(response, payload)
+            if candidate:
+                candidates.append(candidate)
+    except Exception as e:
+        logger.error(f"Discovery failed for {company_name}: {str(e)}")
+        error = str(e)
+    finally:
+        if driver:
+            release_driver(driver)
+
+    candidates.sort(key=lambda c: (c['score'], c['items']), reverse=True)
+    return {'candidates': candidates[:5], 'error': error}
+
+
+def discover_apis(companies=None, max_workers=5, output_path=None):
+    """Profile ``companies`` (default: all of COMPANIES) and write a JSON report."""
+    from scrapers.registry import execution_mode, scraper_platform
+
+    names = companies or list(COMPANIES)
+    report = {'generated_at': datetime.now().isoformat(timespec='seconds'), 'companies': []}
+
+    def _run(name):
+        config = COMPANIES[name]
+        result = profile_company(name, config['url'])
+        return {
+            'company': name,
+            'scraper': config.get('scraper', ''),
+            'url': config['url'],
+            # How the company is scraped today, as the scrape run routes it (cached fingerprints only)
+            'platform': scraper_platform(name),
+            'mode': execution_mode(name),
+            **result,
+        }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_run, name): name for name in names}
+        for future in as_completed(futures):
+            entry = future.result()
+            top = entry['candidates'][0] if entry['candidates'] else None
+            logger.info(
+                f"{entry['company']}: {len(entry['candidates'])} candidates"
+                + (f", best {top['url'][:100]} (score {top['score']}, {top['items']} items, total {top['total']})" if top else '')
+            )
+            report['companies'].append(entry)
+
+    report['companies'].sort(
+        key=lambda e: (e['mode'] == 'browser', e['candidates'][0]['score'] if e['candidates'] else 0),
+        reverse=True,
+    )
+    output_path = output_path or LOGS_DIR / f'api_discovery_{datetime.now().strftime("%Y%m%d")}.json'
+    with open(output_path, 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+    logger.info(f"Wrote API discovery report for {len(names)} companies to {output_path}")
+    return report
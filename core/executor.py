@@ -0,0 +1,345 @@
+"""
+Process-isolated scrape executor.
+
+``ScrapeExecutor(target, args, max_workers, timeout).map(companies)`` runs
+``target(company, *args)`` for each company in a pool of worker processes
+and returns the result dicts in completion order.  Workers are started with
+``spawn`` (forking a threaded Django server is unsafe) and are reused from
+company to company, so a slow start-up is paid once per worker, not per
+company.  A worker runs up to ``threads`` companies at once.  Browser
+scrapers use one per process.  HTTP-only scrapers, which mostly wait on
+sockets, share a few processes.  Every worker takes its rate-limit tokens
+and host slots from one coordinator (``core.ratelimit.shared_limits``), so
+the per-platform budgets hold across all workers of all executors.
+
+Each company has a wall-clock deadline of ``timeout`` seconds.  When a
+company passes it, it gets a result with ``timed_out`` set and its worker is
+killed at once with its whole process tree (chromedriver and Chrome
+included).  The other companies that worker was running did nothing wrong,
+so they go back to the front of the queue and start over in another worker
+(at most ``MAX_REQUEUES`` times each).  A hung ``driver.get()`` or an
+endless pagination loop therefore costs one slot for ``timeout`` seconds
+instead of forever, and never holds a thread, its host slots or its
+siblings past the deadline.  Workers that crash fail only the companies
+they were running.
+
+Every worker has its own browser pool.  Each result carries that worker's
+browser stats, and ``browser_stats()`` adds them up for task progress.
+``map_pools`` runs several executors side by side.
+
+With a ``controller`` (``core.admission.AdmissionController``) the pool
+grows and shrinks between 1 and ``max_workers`` as the controller decides.
+Idle workers beyond a lowered limit are stopped.
+"""
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import wait
+
+from core.logging import setup_logger
+from core.ratelimit import shared_limits, use_shared_limits
+from core.supervisor import available_memory_mb, kill_process_tree
+from config.scraper import BROWSER_MAX_RSS_MB, COMPANY_TIMEOUT, HTTP_THREADS_PER_WORKER
+
+logger = setup_logger('scrape_executor')
+
+# How often the dispatcher wakes up to check deadlines and cancellation
+POLL_INTERVAL = 1.0
+# How often a company is restarted after its worker was killed for a sibling's timeout
+MAX_REQUEUES = 1
+
+
+def _failed(company, error, duration=0, **extra):
+    return {'company': company, 'success': False, 'jobs_count': 0, 'error': error,
+            'duration': round(duration, 1), **extra}
+
+
+def _sum_stats(stats):
+    return {
+        'count': sum(s.get('count', 0) for s in stats),
+        'rss_mb': round(sum(s.get('rss_mb', 0.0) for s in stats), 1),
+        'max_rss_mb': max((s.get('max_rss_mb', 0.0) for s in stats), default=0.0),
+    }
+
+
+def _setup_django():
+    if os.environ.get('DJANGO_SETTINGS_MODULE'):
+        import django
+        django.setup()
+
+
+def _worker_main(conn, target, args, threads, limits):
+    _setup_django()
+    if limits is not None:
+        use_shared_limits(limits)
+    send_lock = threading.Lock()
+
+    def navigation():
+        # Only report browsers if this worker has used one
+        if 'core.browser' not in sys.modules:
+            return {'page_loads': 0, 'page_load_seconds': 0.0}
+        from core.browser import navigation_stats
+        return navigation_stats()
+
+    def run(company, args):
+        start = time.time()
+        before = navigation()
+        try:
+            result = target(company, *args)
+        except Exception as e:
+            result = _failed(company, str(e), time.time() - start)
+        if 'core.browser' in sys.modules:
+            from core.browser import browser_stats, reap_orphans
+            # Browsers belong to the worker that launched them, so only the worker can tell which leaked
+            reap_orphans()
+            after = navigation()
+            result['browsers'] = {**browser_stats(), **{key: after[key] - before[key] for key in after}}
+        with send_lock:
+            conn.send(result)
+
+    # The dispatcher never sends more than ``threads`` companies at once, so nothing queues here
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        while True:
+            try:
+                item = conn.recv()
+            except EOFError:
+                break
+            if item is None:
+                break
+            pool.submit(run, *item)
+
+
+class _Worker:
+    def __init__(self, context, target, args, threads):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, target, args, threads, shared_limits()),
+                                       daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.running = {}
+
+    def submit(self, company, args):
+        self.running[company] = time.time()
+        self.conn.send((company, args))
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(5)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        if self.process.pid:
+            kill_process_tree(self.process.pid)
+        self.process.join(5)
+        self.conn.close()
+
+
+class ScrapeExecutor:
+    def __init__(self, target, args=(), max_workers=10, timeout=COMPANY_TIMEOUT, threads=1, controller=None):
+        self.target = target
+        self.args = tuple(args)
+        # An AdmissionController (core/admission.py) moves the worker limit within max_workers
+        self.controller = controller
+        self.max_workers = max(1, controller.max_workers if controller else max_workers)
+        self.threads = max(1, threads)
+        self.timeout = timeout
+        self._context = multiprocessing.get_context('spawn')
+        self._browsers = {}
+
+    def resize(self, max_workers):
+        """Change the worker ceiling; a running ``map`` picks it up on its next pass."""
+        self.max_workers = max(1, max_workers)
+        if self.controller:
+            self.controller.resize(self.max_workers)
+
+    def browser_stats(self):
+        """Browser count and memory summed over the workers' latest reports."""
+        return _sum_stats(list(self._browsers.values()))
+
+    def map(self, companies, on_result=None, cancel_event=None, args_for=None):
+        """Scrape ``companies`` in the given order and return their results;
+        ``on_result(result)`` is called in this thread as each one finishes.
+        Setting ``cancel_event`` stops dispatching and kills the companies
+        still running.
+
+        A deque is consumed in place, so companies appended to it while the
+        map runs are scraped too.  ``args_for(company)`` gives the arguments
+        for a company when it is dispatched (default: ``self.args``)."""
+        pending = companies if isinstance(companies, deque) else deque(companies)
+        args_for = args_for or (lambda company: self.args)
+        workers, results = [], []
+        requeues = {}
+
+        def limit():
+            return self.controller.limit if self.controller else self.max_workers
+
+        def finish(worker, result):
+            stats = result.pop('browsers', None)
+            if stats is not None:
+                self._browsers[worker.process.pid] = stats
+            if self.controller:
+                self.controller.record(stats or {})
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        def discard(worker):
+            worker.kill()
+            workers.remove(worker)
+            self._browsers.pop(worker.process.pid, None)
+
+        def free_worker():
+            if sum(len(w.running) for w in workers) >= limit() * self.threads:
+                return None
+            worker = next((w for w in workers if len(w.running) < self.threads), None)
+            if worker is None and len(workers) < limit():
+                worker = _Worker(self._context, self.target, self.args, self.threads)
+                workers.append(worker)
+            return worker
+
+        try:
+            while pending or any(w.running for w in workers):
+                if cancel_event is not None and cancel_event.is_set():
+                    logger.info(f"Cancelled with {len(pending)} companies pending and "
+                                f"{sum(len(w.running) for w in workers)} running")
+                    break
+
+                while pending:
+                    worker = free_worker()
+                    if worker is None:
+                        break
+                    try:
+                        company = pending.popleft()
+                    except IndexError:
+                        # Taken back out of a shared deque by its owner
+                        break
+                    worker.submit(company, tuple(args_for(company)))
+
+                if self.controller:
+                    # Sampled after dispatch: work still waiting means every slot is taken
+                    running = sum(len(w.running) for w in workers)
+                    self.controller.update(saturated=bool(pending) and running >= limit() * self.threads,
+                                           browsers=self.browser_stats()['count'])
+                    # Scaled down: stop idle workers (and their browsers) beyond the limit
+                    for worker in [w for w in workers if not w.running][:max(0, len(workers) - limit())]:
+                        worker.stop()
+                        workers.remove(worker)
+                        self._browsers.pop(worker.process.pid, None)
+
+                busy = {w.conn: w for w in workers if w.running}
+                if not busy:
+                    continue
+                next_deadline = min(started for w in busy.values() for started in w.running.values()) + self.timeout
+                ready = wait(list(busy), timeout=max(0.0, min(next_deadline - time.time(), POLL_INTERVAL)))
+                for conn in ready:
+                    worker = busy[conn]
+                    try:
+                        result = conn.recv()
+                    except (EOFError, OSError):
+                        worker.process.join(1)
+                        code = worker.process.exitcode
+                        logger.error(f"Worker {worker.process.pid} exited (code {code}) running "
+                                     f"{', '.join(worker.running)}")
+                        lost = dict(worker.running)
+                        discard(worker)
+                        for company, started in lost.items():
+                            finish(worker, _failed(company, f"Worker process exited (code {code})",
+                                                   time.time() - started))
+                        continue
+                    if worker.running.pop(result['company'], None) is not None:
+                        finish(worker, result)
+
+                now = time.time()
+                for worker in list(busy.values()):
+                    if worker not in workers:
+                        continue
+                    expired = [company for company, started in worker.running.items() if now - started >= self.timeout]
+                    if not expired:
+                        continue
+                    logger.error(f"{', '.join(expired)}: no result after {self.timeout}s, "
+                                 f"killing worker {worker.process.pid}")
+                    running = dict(worker.running)
+                    discard(worker)
+                    restart = []
+                    for company, started in running.items():
+                        if company in expired:
+                            finish(worker, _failed(company, f"Timeout ({self.timeout}s)", now - started, timed_out=True))
+                        elif requeues.get(company, 0) < MAX_REQUEUES:
+                            requeues[company] = requeues.get(company, 0) + 1
+                            restart.append(company)
+                        else:
+                            finish(worker, _failed(company, "Worker killed for another company's timeout",
+                                                   now - started))
+                    if restart:
+                        logger.warning(f"Requeueing {', '.join(restart)} from worker {worker.process.pid}")
+                        pending.extendleft(reversed(restart))
+        finally:
+            for worker in list(workers):
+                if worker.running:
+                    discard(worker)
+                else:
+                    worker.stop()
+                    self._browsers.pop(worker.process.pid, None)
+        return results
+
+
+def browser_workers(requested):
+    """``requested`` browser workers, fewer if free memory cannot hold that many browsers."""
+    available = available_memory_mb()
+    if available is None:
+        return max(1, requested)
+    fits = max(1, int(available // BROWSER_MAX_RSS_MB))
+    if fits < requested:
+        logger.warning(f"{available:.0f}MB free fits {fits} browsers, running {fits} browser workers, not {requested}")
+    return max(1, min(requested, fits))
+
+
+def http_executor(target, args=(), workers=50, timeout=COMPANY_TIMEOUT):
+    """Executor running ``workers`` HTTP-only companies at once as threads, HTTP_THREADS_PER_WORKER per process."""
+    threads = max(1, min(workers, HTTP_THREADS_PER_WORKER))
+    processes = -(-max(1, workers) // threads)
+    return ScrapeExecutor(target, args=args, max_workers=processes, timeout=timeout, threads=threads)
+
+
+def pools_browser_stats(executors):
+    """``browser_stats`` summed over several executors."""
+    return _sum_stats([executor.browser_stats() for executor in executors])
+
+
+def map_pools(pools, on_result=None, cancel_event=None):
+    """Run ``ScrapeExecutor.map`` for each (executor, companies) pair side by side.
+
+    Returns all results in completion order; ``on_result`` is serialised
+    across pools.
+    """
+    lock = threading.Lock()
+    results = []
+
+    def collect(result):
+        with lock:
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    def run(executor, companies):
+        try:
+            executor.map(companies, collect, cancel_event)
+        except Exception as e:
+            logger.error(f"Executor pool failed: {str(e)}")
+
+    threads = [threading.Thread(target=run, args=(executor, companies), daemon=True)
+               for executor, companies in pools if companies]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
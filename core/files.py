@@ -0,0 +1,78 @@
+"""
+Cache files shared by scrape worker processes.
+
+Workers run side by side (``core.executor``) and write the same cache files,
+so every write goes to a temp file that is ``os.replace``d into place.  A
+reader sees the old file or the new one, never a half-written one.
+``update_json`` holds an exclusive ``fcntl`` lock on ``<path>.lock`` around
+its read-modify-write, so one worker's save does not drop another's entries.
+Without ``fcntl`` (Windows) only threads in the same process are serialised.
+"""
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_locks = {}
+_locks_lock = threading.Lock()
+
+
+def write_atomic(path, data):
+    """Replace ``path`` with ``data`` (bytes or str) in one step."""
+    path = str(path)
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_json(path, default=None):
+    """Parsed contents of ``path``, or ``default`` ({} if not given) when missing or unreadable."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {} if default is None else default
+
+
+@contextmanager
+def file_lock(path):
+    """Hold the lock on ``path`` against other threads and, with ``fcntl``, other processes."""
+    path = str(path)
+    with _locks_lock:
+        lock = _locks.setdefault(path, threading.Lock())
+    with lock:
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path + '.lock', 'a') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def update_json(path, update):
+    """Read the JSON object at ``path``, apply ``update(data)`` in place and write it back, under the lock."""
+    with file_lock(path):
+        data = load_json(path)
+        update(data)
+        write_atomic(path, json.dumps(data, indent=2))
+        return data
@@ -0,0 +1,236 @@
+"""
+Disk-backed conditional-request cache for ``core.http_client``.
+
+Responses that carry an ``ETag`` or ``Last-Modified`` validator are stored
+under ``HTTP_CACHE_DIR`` (one ``.json`` metadata file and one ``.body`` file
+per request, keyed by method, URL, query and body).  The next identical
+request within the host's TTL (``HTTP_CACHE_TTL`` / ``HTTP_CACHE_TTLS``) is
+answered from disk; after that it is revalidated with ``If-None-Match`` /
+``If-Modified-Since`` and a 304 is answered from disk as well.  Total size is
+capped at ``HTTP_CACHE_MAX_MB`` with least-recently-used eviction.  Worker
+processes share the directory, so files are replaced atomically
+(``core.files.write_atomic``) and a reader never sees a half-written entry.
+
+Per-scrape counters (``reset_cache_stats`` / ``get_cache_stats``) report how
+many of a company's requests were answered unchanged.  Platform engines pass
+the first page of their listing to ``check_listing``: when the company
+already has stored jobs and that page came from the cache (fresh or 304),
+it raises ``ListingUnchanged`` before anything is parsed and the runner
+keeps the stored jobs as they are.
+"""
+import contextvars
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlencode, urlparse
+
+import requests
+
+from core.files import write_atomic
+from core.logging import setup_logger
+from config.scraper import (
+    HTTP_CACHE_ENABLED, HTTP_CACHE_DIR, HTTP_CACHE_TTL, HTTP_CACHE_TTLS, HTTP_CACHE_MAX_MB,
+)
+
+logger = setup_logger('http_cache')
+
+_lock = threading.Lock()
+_stats = contextvars.ContextVar('http_cache_stats', default=None)
+_listing_check = contextvars.ContextVar('http_cache_listing_check', default=None)
+
+
+class ListingUnchanged(Exception):
+    """The scrape's first listing page was served from the cache: the stored jobs are still current."""
+
+
+def cache_key(method, url, params=None, data=None, json_body=None):
+    """Stable key for a request: method, URL, query and body."""
+    parts = [method.upper(), url]
+    if params:
+        parts.append(urlencode(sorted(params.items()) if isinstance(params, dict) else params))
+    if json_body is not None:
+        parts.append(json.dumps(json_body, sort_keys=True, default=str))
+    elif data:
+        parts.append(data if isinstance(data, str) else repr(data))
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+def _ttl(url):
+    host = (urlparse(url).hostname or '').lower()
+    for suffix, ttl in HTTP_CACHE_TTLS.items():
+        if host == suffix or host.endswith('.' + suffix):
+            return ttl
+    return HTTP_CACHE_TTL
+
+
+def record(field):
+    """Count a request outcome against the current scrape."""
+    stats = _stats.get()
+    if stats is not None:
+        with _lock:
+            stats[field] += 1
+
+
+def reset_cache_stats(check_listing=False):
+    """Start counting requests for the current scrape (propagates to copied contexts).
+
+    ``check_listing`` arms ``check_listing()`` for this scrape; runners pass
+    True when the company has stored jobs to fall back on.
+    """
+    _stats.set({'http_requests': 0, 'http_not_modified': 0, 'http_cache_hits': 0})
+    _listing_check.set({'pending': check_listing})
+
+
+def get_cache_stats():
+    stats = _stats.get()
+    return dict(stats) if stats else {'http_requests': 0, 'http_not_modified': 0, 'http_cache_hits': 0}
+
+
+def check_listing(response):
+    """Raise ``ListingUnchanged`` if ``response``, the scrape's first listing page, came from the cache.
+
+    Only the first call in an armed scrape counts; later pages are never checked.
+    """
+    check = _listing_check.get()
+    if not check or not check['pending']:
+        return
+    with _lock:
+        pending, check['pending'] = check['pending'], False
+    if pending and getattr(response, 'from_cache', False):
+        raise ListingUnchanged(response.url)
+
+
+class HTTPCache:
+    def __init__(self, directory=HTTP_CACHE_DIR, max_bytes=HTTP_CACHE_MAX_MB * 1024 * 1024):
+        self.directory = str(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._size = sum(e[1] for e in self._entries())
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def lookup(self, key):
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(body_path):
+            return None
+        os.utime(meta_path)
+        return meta
+
+    def conditional_headers(self, meta):
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def is_fresh(self, meta, url):
+        return time.time() - meta['stored_at'] < _ttl(url)
+
+    def build_response(self, key, meta, request_url):
+        """A 200 ``requests.Response`` rebuilt from the cached body."""
+        _, body_path = self._paths(key)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.headers.update(meta.get('headers', {}))
+        response.url = meta.get('url', request_url)
+        response.encoding = meta.get('encoding')
+        response.from_cache = True
+        return response
+
+    def store(self, key, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code != 200 or not (etag or last_modified or _ttl(response.url) > 0):
+            return
+        meta = {
+            'url': response.url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time(),
+            'encoding': response.encoding,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() in ('content-type', 'etag', 'last-modified')},
+        }
+        meta_path, body_path = self._paths(key)
+        replaced = self._entry_size(meta_path, body_path)
+        meta_text = json.dumps(meta)
+        # Body first: a reader holding the old metadata then reads a newer body, never a missing one
+        write_atomic(body_path, response.content)
+        write_atomic(meta_path, meta_text)
+        with _lock:
+            self._size += len(response.content) + len(meta_text.encode()) - replaced
+            over = self._size > self.max_bytes
+        if over:
+            self._evict()
+
+    def refresh(self, key, meta):
+        """Restart the TTL after a 304."""
+        meta['stored_at'] = time.time()
+        meta_path, _ = self._paths(key)
+        write_atomic(meta_path, json.dumps(meta))
+
+    @staticmethod
+    def _entry_size(meta_path, body_path):
+        """Bytes an entry takes on disk, 0 if it is not cached."""
+        try:
+            return os.path.getsize(body_path) + os.path.getsize(meta_path)
+        except OSError:
+            return 0
+
+    def _entries(self):
+        """(last used, size, meta path, body path) for every cached response."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            body_path = meta_path[:-5] + '.body'
+            try:
+                size = os.path.getsize(body_path) + os.path.getsize(meta_path)
+                entries.append((os.path.getmtime(meta_path), size, meta_path, body_path))
+            except OSError:
+                continue
+        return entries
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is back under 90% of its cap."""
+        with _lock:
+            entries = self._entries()
+            total = sum(e[1] for e in entries)
+            for _, size, meta_path, body_path in sorted(entries):
+                if total <= self.max_bytes * 0.9:
+                    break
+                for path in (meta_path, body_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= size
+            self._size = total
+
+
+_cache = None
+
+
+def get_cache():
+    """The process-wide cache, or None when ``HTTP_CACHE_ENABLED`` is off."""
+    global _cache
+    if not HTTP_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _lock:
+            if _cache is None:
+                _cache = HTTPCache()
+    return _cache
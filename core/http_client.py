@@ -0,0 +1,168 @@
+"""
+Shared keep-alive HTTP client for API-based scrapers.
+
+Every thread gets its own ``requests.Session`` (sessions are not
+thread-safe), but all of them share one adapter.  The adapter keeps a
+connection pool per host, so consecutive pages (and different companies on
+the same ``*.myworkdayjobs.com`` / ``*.oraclecloud.com`` host) reuse TCP+TLS
+connections instead of handshaking on every request.  Cookies are kept per
+scrape: ``reset_session()`` at the start of a company gives it a fresh
+cookie jar, shared by the threads that fetch its pages.  One tenant's
+cookies therefore never reach another company.
+
+``http_get`` / ``http_post`` take the same arguments as ``requests.get`` /
+``requests.post``, apply a default ``(connect, read)`` timeout and retry
+connection errors, timeouts and 429/5xx responses with jittered exponential
+backoff (honouring ``Retry-After``).  Errors surface as the usual
+``requests.exceptions.RequestException`` subclasses.
+
+GET responses with ``ETag`` / ``Last-Modified`` go through the disk cache in
+``core.http_cache``; repeat requests are revalidated and a 304 is answered
+from disk.  Pass ``cache=False`` to bypass it, or ``cache=True`` for a POST
+that is a read-only search (Workday, Phenom).
+
+Every attempt takes a token from the per-platform bucket in
+``core.ratelimit``, and a 429 pauses that platform for all scrapers.  At
+most ``HTTP_HOST_CONCURRENCY`` requests are in flight per host across all
+scrape workers, so parallel pagination and concurrently running scrapers
+on a shared platform host cannot pile onto it.
+"""
+import contextvars
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.http_cache import get_cache, record, cache_key
+from core.logging import setup_logger
+from core.ratelimit import wait_for_slot, report_throttled, host_slot
+from config.scraper import (
+    HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT, HTTP_RETRIES, HTTP_BACKOFF, HTTP_POOL_MAXSIZE,
+    HTTP_HOST_CONCURRENCY,
+)
+
+logger = setup_logger('http_client')
+
+try:
+    import brotli  # noqa: F401  (lets urllib3 decode br responses)
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+DEFAULT_TIMEOUT = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_BACKOFF = 30
+
+_adapter = None
+_adapter_lock = threading.Lock()
+_local = threading.local()
+# The current scrape's cookie jar (RequestsCookieJar locks its own reads and writes)
+_cookies = contextvars.ContextVar('http_cookies', default=None)
+# A slot held longer than a request can take belongs to a dead worker
+SLOT_TTL = 2 * (HTTP_CONNECT_TIMEOUT + HTTP_READ_TIMEOUT)
+
+
+def _shared_adapter():
+    global _adapter
+    if _adapter is None:
+        with _adapter_lock:
+            if _adapter is None:
+                _adapter = HTTPAdapter(pool_connections=50, pool_maxsize=HTTP_POOL_MAXSIZE)
+    return _adapter
+
+
+def reset_session():
+    """Start a new cookie jar for the current scrape (propagates to copied contexts)."""
+    _cookies.set(requests.cookies.RequestsCookieJar())
+
+
+def get_session():
+    """This thread's session, on the shared adapter, using the current scrape's cookies."""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        adapter = _shared_adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        _local.session = session
+    jar = _cookies.get()
+    if jar is not None:
+        session.cookies = jar
+    return session
+
+
+def _backoff(attempt, response=None):
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(int(retry_after), MAX_BACKOFF)
+    return min(HTTP_BACKOFF * (2 ** attempt), MAX_BACKOFF) * random.uniform(0.5, 1.5)
+
+
+def http_request(method, url, retries=HTTP_RETRIES, cache=None, **kwargs):
+    """Send a request on this thread's session, retrying transient failures.
+
+    Returns the final response (callers still call ``raise_for_status()``);
+    raises the last connection/timeout error once retries are exhausted.
+    Only GETs are cached unless ``cache=True``.  Responses served from the
+    cache carry ``from_cache = True``.
+    """
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    record('http_requests')
+    if cache is None:
+        cache = method.upper() == 'GET'
+    store = get_cache() if cache else None
+    meta = None
+    if store:
+        key = cache_key(method, url, kwargs.get('params'), kwargs.get('data'), kwargs.get('json'))
+        meta = store.lookup(key)
+        if meta and store.is_fresh(meta, url):
+            record('http_cache_hits')
+            return store.build_response(key, meta, url)
+        if meta:
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), **store.conditional_headers(meta)}
+
+    response = _send(method, url, retries, kwargs)
+
+    if store:
+        if response.status_code == 304 and meta:
+            record('http_not_modified')
+            store.refresh(key, meta)
+            return store.build_response(key, meta, url)
+        try:
+            store.store(key, response)
+        except OSError as e:
+            logger.warning(f"Could not cache {url[:100]}: {str(e)}")
+    return response
+
+
+def _send(method, url, retries, kwargs):
+    session = get_session()
+    for attempt in range(retries + 1):
+        wait_for_slot(url)
+        try:
+            with host_slot(url, HTTP_HOST_CONCURRENCY, SLOT_TTL):
+                response = session.request(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if attempt >= retries:
+                raise
+            delay = _backoff(attempt)
+            logger.warning(f"{method} {url[:100]} failed ({type(e).__name__}), retrying in {delay:.1f}s")
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                return response
+            delay = _backoff(attempt, response)
+            if response.status_code == 429:
+                report_throttled(url, delay)
+            logger.warning(f"{method} {url[:100]} returned {response.status_code}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+
+def http_get(url, **kwargs):
+    return http_request('GET', url, **kwargs)
+
+
+def http_post(url, **kwargs):
+    return http_request('POST', url, **kwargs)
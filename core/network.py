@@ -0,0 +1,136 @@
+"""
+Network response capture for pooled Chrome drivers.
+
+Drivers leased with ``acquire_driver(capture=True)`` run with Chrome
+performance logging enabled (see ``core.browser``), so every XHR/fetch the
+page makes shows up as CDP ``Network.*`` events.  ``NetworkCapture`` follows those events and fetches
+bodies with ``Network.getResponseBody``, letting a scraper read the JSON an
+SPA loads its job list from instead of parsing the rendered DOM.
+
+    driver = acquire_driver(capture=True)
+    capture = NetworkCapture(driver)
+    driver.get(url)
+    payloads = capture.wait_for_json(r'/api/jobs', timeout=15)
+"""
+import base64
+import json
+import re
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from core.logging import setup_logger
+
+logger = setup_logger('network_capture')
+
+POLL_INTERVAL = 0.25
+
+
+class NetworkCapture:
+    """Collects network responses ``driver`` has received during the current lease."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._requests = {}
+        # The headers Chrome actually sent (cookies included), from requestWillBeSentExtraInfo
+        self._sent_headers = {}
+        self._responses = {}
+        self._finished = set()
+        self._bodies = {}
+
+    def poll(self):
+        """Drain the performance log and record response/finish events."""
+        try:
+            entries = self.driver.get_log('performance')
+        except WebDriverException as e:
+            logger.warning(f"Performance log unavailable: {str(e)}")
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                request = params.get('request', {})
+                self._requests[params.get('requestId')] = {
+                    'method': request.get('method', 'GET'),
+                    'post_data': request.get('postData', ''),
+                    'headers': request.get('headers', {}),
+                }
+            elif method == 'Network.requestWillBeSentExtraInfo':
+                self._sent_headers[params.get('requestId')] = params.get('headers', {})
+            elif method == 'Network.responseReceived':
+                response = params.get('response', {})
+                self._responses[params.get('requestId')] = {
+                    'request_id': params.get('requestId'),
+                    'url': response.get('url', ''),
+                    'status': response.get('status'),
+                    'mime_type': response.get('mimeType', ''),
+                    'resource_type': params.get('type', ''),
+                }
+            elif method == 'Network.loadingFinished':
+                self._finished.add(params.get('requestId'))
+
+    def responses(self, url_pattern=None, json_only=False):
+        """Finished responses, optionally filtered by URL regex and JSON mime type."""
+        self.poll()
+        matches = []
+        for request_id, response in self._responses.items():
+            if request_id not in self._finished:
+                continue
+            if url_pattern and not re.search(url_pattern, response['url']):
+                continue
+            if json_only and 'json' not in response['mime_type']:
+                continue
+            request = self._requests.get(request_id, {'method': 'GET', 'post_data': '', 'headers': {}})
+            headers = {**request['headers'], **self._sent_headers.get(request_id, {})}
+            matches.append(dict(response, **request, headers=headers))
+        return matches
+
+    def body(self, request_id):
+        """Raw response body for ``request_id`` (cached), or None if evicted."""
+        if request_id in self._bodies:
+            return self._bodies[request_id]
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except WebDriverException:
+            return None
+        body = result.get('body', '')
+        if result.get('base64Encoded'):
+            body = base64.b64decode(body).decode('utf-8', errors='replace')
+        self._bodies[request_id] = body
+        return body
+
+    def json_bodies(self, url_pattern):
+        """Parsed JSON bodies of every finished response matching ``url_pattern``."""
+        payloads = []
+        for response in self.responses(url_pattern):
+            body = self.body(response['request_id'])
+            if not body:
+                continue
+            try:
+                payloads.append(json.loads(body))
+            except ValueError:
+                continue
+        return payloads
+
+    def wait_for_json(self, url_pattern, timeout=15):
+        """Wait until at least one JSON response matches ``url_pattern`` and
+        return all matching payloads (empty list on timeout)."""
+        deadline = time.time() + timeout
+        while True:
+            payloads = self.json_bodies(url_pattern)
+            if payloads or time.time() >= deadline:
+                return payloads
+            time.sleep(POLL_INTERVAL)
+
+    def clear(self):
+        """Forget everything captured so far (e.g. before clicking to page 2)."""
+        self.poll()
+        self._requests.clear()
+        self._sent_headers.clear()
+        self._responses.clear()
+        self._finished.clear()
+        self._bodies.clear()
@@ -0,0 +1,124 @@
+"""
+Concurrent offset pagination for JSON job APIs.
+
+Workday (``offset``/``limit`` in the POST body) and Oracle HCM (``offset`` in
+the ``finder``) both report the total on the first page, so once page 1 is in
+every remaining offset is known.  ``fetch_offset_pages`` fetches page 1,
+then the rest in parallel, and merges the items back in offset order with
+duplicates dropped.  The per-host cap in ``core.http_client`` keeps the
+parallel pages from overloading a shared platform host.
+
+``fetch_concurrently`` does the same for per-item calls (job detail pages)
+once the listing is known.
+
+    def fetch_page(offset):
+        payload = {'limit': 20, 'offset': offset, 'searchText': ''}
+        response = http_post(api_url, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    postings = fetch_offset_pages(
+        fetch_page, 20,
+        items_of=lambda data: data.get('jobPostings', []),
+        total_of=lambda data: data.get('total', 0),
+        max_items=max_pages * 20,
+        key=lambda posting: posting.get('externalPath'),
+    )
+"""
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.logging import setup_logger
+from config.scraper import PAGINATION_WORKERS
+
+logger = setup_logger('pagination')
+
+
+def fetch_offset_pages(fetch_page, page_size, items_of, total_of, max_items=None, key=None,
+                       workers=PAGINATION_WORKERS):
+    """Fetch every page of an offset-paginated API and return the merged items.
+
+    ``fetch_page(offset)`` returns the parsed payload of one page, raising on
+    failure.  A failure on page 1 propagates; later pages that fail are
+    logged and skipped.  Without a usable total the pages are walked
+    sequentially until one comes back short.
+    """
+    start = time.time()
+    first = fetch_page(0)
+    items = list(items_of(first) or [])
+    total = total_of(first) or 0
+    limit = min(total, max_items) if max_items else total
+
+    pages = {0: items}
+    if total and 0 < len(items) < min(page_size, limit):
+        # The server capped the page below what we asked for; step by what it actually returns
+        logger.info(f"Server returned {len(items)} items for a page of {page_size}, paging by {len(items)}")
+        page_size = len(items)
+    if total and len(items) < limit:
+        offsets = list(range(page_size, limit, page_size))
+
+        def _fetch(offset):
+            try:
+                return offset, list(items_of(fetch_page(offset)) or [])
+            except Exception as e:
+                logger.warning(f"Page at offset {offset} failed: {str(e)}")
+                return offset, []
+
+        # Each page runs in a copy of the caller's context so per-scrape HTTP stats still count it
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(offsets)))) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, _fetch, offset) for offset in offsets]
+            for future in futures:
+                offset, page_items = future.result()
+                pages[offset] = page_items
+    elif not total and len(items) >= page_size:
+        offset = page_size
+        while not max_items or offset < max_items:
+            page_items = list(items_of(fetch_page(offset)) or [])
+            pages[offset] = page_items
+            if len(page_items) < page_size:
+                break
+            offset += page_size
+
+    merged = []
+    seen = set()
+    for offset in sorted(pages):
+        for item in pages[offset]:
+            if key is not None:
+                item_key = key(item)
+                if item_key is not None:
+                    if item_key in seen:
+                        continue
+                    seen.add(item_key)
+            merged.append(item)
+    if max_items:
+        merged = merged[:max_items]
+
+    logger.info(f"Fetched {len(merged)} items in {len(pages)} pages (total {total}) "
+                f"in {time.time() - start:.1f}s")
+    return merged
+
+
+def fetch_concurrently(fetch, items, workers=PAGINATION_WORKERS):
+    """Return ``[fetch(item) for item in items]``, computed in parallel.
+
+    Items whose call raises are logged and come back as None, so one bad
+    detail page does not lose the rest.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def _fetch(item):
+        try:
+            return fetch(item)
+        except Exception as e:
+            logger.warning(f"Fetch failed for {str(item)[:100]}: {str(e)}")
+            return None
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, _fetch, item) for item in items]
+        results = [future.result() for future in futures]
+    logger.info(f"Fetched {len(items)} items concurrently in {time.time() - start:.1f}s")
+    return results
@@ -0,0 +1,268 @@
+"""
+Token-bucket rate limiting per platform, shared by every scrape worker.
+
+Many companies share a platform host (Workday tenants on
+``wd1/wd3/wd5.myworkdayjobs.com``, ``*.darwinbox.in``, ``*.peoplestrong.com``,
+Oracle ``*.oraclecloud.com``), so requests are throttled per registrable
+domain rather than per company.  ``core.http_client`` takes a token before
+every request and pooled drivers take one before every ``driver.get()``, so
+concurrently running scrapers share one budget per platform instead of
+sleeping defensively between pages.
+
+A 429 from a platform pauses its bucket for the ``Retry-After`` interval
+for every caller at once.
+
+Scrapes run in worker processes (``core.executor``).  So that N workers
+still share one budget, the buckets and the per-host request slots live in a
+coordinator process that the parent starts with ``shared_limits()``.  Each
+worker installs the proxy with ``use_shared_limits``.  A worker only asks
+the coordinator for its turn and then sleeps locally.  A host slot is a
+lease that lapses after ``ttl`` seconds, so a worker killed mid-request
+cannot hold one forever.  A process that installs no proxy, such as a
+single ``run.py`` scrape, keeps its limits to itself.
+"""
+import atexit
+import itertools
+import multiprocessing
+import threading
+import time
+from contextlib import contextmanager
+from multiprocessing.managers import BaseManager
+from urllib.parse import urlparse
+
+from core.logging import setup_logger
+from config.scraper import RATE_LIMIT_DEFAULT, RATE_LIMITS
+
+logger = setup_logger('rate_limit')
+
+# Second-level suffixes where the registrable domain has three labels
+_MULTI_PART_SUFFIXES = {'co.in', 'co.uk', 'com.au', 'co.jp', 'com.sg', 'co.kr', 'com.cn', 'com.br', 'net.in', 'org.in'}
+
+# How often a worker retries for a host slot the other workers are holding
+SLOT_POLL_INTERVAL = 0.05
+
+
+def platform_key(url):
+    """Registrable domain of ``url`` (``wd3.myworkdayjobs.com`` -> ``myworkdayjobs.com``)."""
+    host = (urlparse(url).hostname or '').lower()
+    labels = host.split('.')
+    if len(labels) <= 2 or host.replace('.', '').isdigit():
+        return host
+    if '.'.join(labels[-2:]) in _MULTI_PART_SUFFIXES:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+class TokenBucket:
+    """``rate`` tokens per second, holding at most ``burst``.
+
+    Callers reserve the next token and sleep until it is theirs (GCRA), so
+    the bucket itself never blocks and can serve other processes.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = max(1, burst)
+        # When the bucket is next empty with no burst left ("theoretical arrival time")
+        self._tat = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take the next token. Returns the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._tat - (self.burst - 1) / self.rate, self._paused_until)
+            self._tat = max(self._tat, start) + 1 / self.rate
+            return start - now
+
+    def acquire(self):
+        """Block until a token is available. Returns the seconds waited."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def pause(self, seconds):
+        """Hold every caller for ``seconds`` (e.g. after a 429) and drop banked tokens."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tat = max(self._tat, self._paused_until + (self.burst - 1) / self.rate)
+
+
+class RateLimiter:
+    """One ``TokenBucket`` per platform, created on first use."""
+
+    def __init__(self, default=RATE_LIMIT_DEFAULT, overrides=None):
+        self.default = default
+        self.overrides = RATE_LIMITS if overrides is None else overrides
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url):
+        key = platform_key(url)
+        with self._lock:
+            if key not in self._buckets:
+                rate, burst = self.overrides.get(key, self.default)
+                self._buckets[key] = TokenBucket(rate, burst)
+            return self._buckets[key]
+
+    def reserve(self, url):
+        return self.bucket(url).reserve()
+
+    def throttled(self, url, seconds):
+        logger.warning(f"{platform_key(url)} throttled us, pausing it for {seconds:.1f}s")
+        self.bucket(url).pause(seconds)
+
+
+class HostSlots:
+    """At most ``limit`` leases per host; a lease not released within ``ttl`` seconds lapses."""
+
+    def __init__(self):
+        self._leases = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def try_acquire(self, host, limit, ttl):
+        """A lease id, or None if ``limit`` leases on ``host`` are live."""
+        with self._lock:
+            now = time.monotonic()
+            leases = {lease: expires for lease, expires in self._leases.get(host, {}).items() if expires > now}
+            self._leases[host] = leases
+            if len(leases) >= limit:
+                return None
+            lease = next(self._ids)
+            leases[lease] = now + ttl
+            return lease
+
+    def release(self, host, lease):
+        with self._lock:
+            self._leases.get(host, {}).pop(lease, None)
+
+
+class SharedLimits:
+    """The rate limiter and host slots of every worker, hosted in the coordinator process."""
+
+    def __init__(self):
+        self.limiter = RateLimiter()
+        self.slots = HostSlots()
+
+    def reserve(self, url):
+        return self.limiter.reserve(url)
+
+    def throttled(self, url, seconds):
+        self.limiter.throttled(url, seconds)
+
+    def try_acquire(self, host, limit, ttl):
+        return self.slots.try_acquire(host, limit, ttl)
+
+    def release(self, host, lease):
+        self.slots.release(host, lease)
+
+
+class _LimitsManager(BaseManager):
+    pass
+
+
+_LimitsManager.register('SharedLimits', SharedLimits)
+
+_limiter = RateLimiter()
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+# Proxy to the coordinator's SharedLimits in a worker, None where limits are per process
+_shared = None
+_coordinator = None
+_coordinator_lock = threading.Lock()
+
+
+def shared_limits():
+    """Proxy to the coordinator's limits for workers, starting it on first use.
+
+    Returns None (workers then limit themselves) if it cannot be started.
+    """
+    global _coordinator
+    with _coordinator_lock:
+        if _coordinator is None:
+            # Spawned, not forked, like the workers: the parent may be a threaded Django server
+            manager = _LimitsManager(ctx=multiprocessing.get_context('spawn'))
+            try:
+                manager.start()
+                _coordinator = (manager, manager.SharedLimits())
+            except (OSError, EOFError) as e:
+                logger.warning(f"Could not start the rate-limit coordinator, workers limit themselves: {str(e)}")
+                _coordinator = (None, None)
+                return None
+            atexit.register(manager.shutdown)
+        return _coordinator[1]
+
+
+def use_shared_limits(proxy):
+    """Take tokens and host slots from the coordinator behind ``proxy`` (called in each worker)."""
+    global _shared
+    _shared = proxy
+
+
+def _coordinator_lost(e):
+    global _shared
+    logger.warning(f"Lost the rate-limit coordinator, limiting this process alone: {str(e)}")
+    _shared = None
+
+
+def wait_for_slot(url):
+    """Take a token for ``url``'s platform, blocking as needed."""
+    if not url.startswith(('http://', 'https://')):
+        return
+    delay = None
+    if _shared is not None:
+        try:
+            delay = _shared.reserve(url)
+        except (OSError, EOFError) as e:
+            _coordinator_lost(e)
+    if delay is None:
+        delay = _limiter.reserve(url)
+    if delay > 0:
+        time.sleep(delay)
+    if delay > 1:
+        logger.info(f"Waited {delay:.1f}s for {platform_key(url)} rate limit")
+
+
+def report_throttled(url, seconds):
+    """Pause ``url``'s platform for all callers after a 429."""
+    if _shared is not None:
+        try:
+            return _shared.throttled(url, seconds)
+        except (OSError, EOFError) as e:
+            _coordinator_lost(e)
+    _limiter.throttled(url, seconds)
+
+
+@contextmanager
+def _leased_slot(host, limit, ttl):
+    lease = None
+    while lease is None:
+        lease = _shared.try_acquire(host, limit, ttl)
+        if lease is None:
+            time.sleep(SLOT_POLL_INTERVAL)
+    try:
+        yield
+    finally:
+        try:
+            _shared.release(host, lease)
+        except (OSError, EOFError):
+            # The lease lapses on its own
+            pass
+
+
+def host_slot(url, limit, ttl):
+    """Context manager holding one of ``limit`` concurrent request slots for ``url``'s host.
+
+    Shared by all workers when a coordinator is installed; ``ttl`` bounds how
+    long a slot stays taken if its holder dies.
+    """
+    host = urlparse(url).netloc.lower()
+    if _shared is not None:
+        return _leased_slot(host, limit, ttl)
+    with _host_slots_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(limit)
+        return _host_slots[host]
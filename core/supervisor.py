@@ -0,0 +1,248 @@
+"""
+Chrome process supervisor.
+
+Every driver the pool launches is registered here with its chromedriver PID.
+A background watchdog samples the resident memory of each browser's process
+tree (chromedriver, Chrome and its renderers) and flags browsers above
+``BROWSER_MAX_RSS_MB``; the pool recycles flagged drivers instead of handing
+them out again, and a flagged driver that is leased fails its next
+navigation (``core.browser.BrowserOverLimit``).  A scraper that keeps
+working one page without navigating never sees the flag, so a browser past
+``BROWSER_KILL_RSS_MB`` has its process tree killed at once, leased or not;
+the scraper's next command fails and the pool discards the driver.
+
+Pooled Chrome instances carry a ``--scraper-owner=<pid>`` switch, so
+browsers left behind by a crashed or killed run can be found and killed at
+process start.  Browsers no longer known to the pool are reaped by the scrape
+worker that launched them after each company.
+
+Memory sampling and reaping need ``psutil``; without it the supervisor only
+counts browsers.
+"""
+import os
+import signal
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from core.logging import setup_logger
+from config.scraper import BROWSER_KILL_RSS_MB, BROWSER_MAX_RSS_MB, BROWSER_WATCHDOG_INTERVAL
+
+logger = setup_logger('browser_supervisor')
+
+OWNER_SWITCH = '--scraper-owner='
+# Browsers younger than this may still be starting up and not yet known to the pool
+REAP_GRACE_SECONDS = 60
+
+
+def owner_switch():
+    """Chrome switch that tags a browser as launched by this process."""
+    return f'{OWNER_SWITCH}{os.getpid()}'
+
+
+def _is_child_process(cmdline):
+    """Renderer/GPU/utility processes are killed with their browser."""
+    return any(arg.startswith('--type=') for arg in cmdline)
+
+
+def _tree(pid):
+    """psutil.Process for ``pid`` and all its descendants (empty if gone)."""
+    try:
+        root = psutil.Process(pid)
+        return [root] + root.children(recursive=True)
+    except psutil.Error:
+        return []
+
+
+def _kill_tree(pid):
+    procs = _tree(pid)
+    for proc in reversed(procs):
+        try:
+            proc.kill()
+        except psutil.Error:
+            pass
+    psutil.wait_procs(procs, timeout=5)
+    return len(procs)
+
+
+def available_memory_mb():
+    """Memory the system can still hand out, in MB; None without psutil."""
+    if psutil is None:
+        return None
+    return psutil.virtual_memory().available / (1024 * 1024)
+
+
+def kill_process_tree(pid):
+    """Kill ``pid`` and its descendants; without psutil only ``pid`` itself."""
+    if psutil is not None:
+        return _kill_tree(pid)
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        return 0
+    return 1
+
+
+class BrowserSupervisor:
+    """Tracks pooled browser processes and enforces the RSS ceilings."""
+
+    def __init__(self, max_rss_mb=BROWSER_MAX_RSS_MB, interval=BROWSER_WATCHDOG_INTERVAL,
+                 kill_rss_mb=BROWSER_KILL_RSS_MB):
+        self.max_rss_mb = max_rss_mb
+        self.kill_rss_mb = max(kill_rss_mb, max_rss_mb)
+        self.interval = interval
+        self._browsers = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def register(self, driver):
+        try:
+            pid = driver.service.process.pid
+        except AttributeError:
+            pid = None
+        with self._lock:
+            self._browsers[driver.session_id] = {
+                'pid': pid, 'started': time.time(), 'rss_mb': 0.0, 'over_limit': False,
+            }
+
+    def unregister(self, driver):
+        """Forget ``driver`` and kill whatever is left of its process tree
+        (``driver.quit()`` can time out and leave Chrome running)."""
+        with self._lock:
+            info = self._browsers.pop(driver.session_id, None)
+        if psutil is not None and info and info['pid']:
+            _kill_tree(info['pid'])
+
+    def over_limit(self, driver):
+        """True if the last sample put ``driver`` above the RSS ceiling."""
+        with self._lock:
+            info = self._browsers.get(driver.session_id)
+        return bool(info and info['over_limit'])
+
+    def sample(self):
+        """Refresh per-browser RSS, flag browsers above the ceiling and kill those above the kill limit."""
+        if psutil is None:
+            return
+        with self._lock:
+            browsers = list(self._browsers.items())
+        for session_id, info in browsers:
+            if not info['pid']:
+                continue
+            rss = 0
+            for proc in _tree(info['pid']):
+                try:
+                    rss += proc.memory_info().rss
+                except psutil.Error:
+                    pass
+            rss_mb = round(rss / (1024 * 1024), 1)
+            over = rss_mb > self.max_rss_mb
+            if over and not info['over_limit']:
+                logger.warning(f"Browser {info['pid']} at {rss_mb}MB exceeds {self.max_rss_mb}MB, recycling")
+            with self._lock:
+                if session_id in self._browsers:
+                    self._browsers[session_id].update(rss_mb=rss_mb, over_limit=over)
+            if rss_mb > self.kill_rss_mb:
+                # Possibly leased: whatever the scraper does with it next fails, and release discards it
+                logger.warning(f"Browser {info['pid']} at {rss_mb}MB exceeds {self.kill_rss_mb}MB, killing it")
+                _kill_tree(info['pid'])
+
+    def start(self):
+        """Start the background watchdog (idempotent)."""
+        if psutil is None or (self._thread and self._thread.is_alive()):
+            return
+
+        def _watch():
+            while True:
+                time.sleep(self.interval)
+                try:
+                    self.sample()
+                except Exception as e:
+                    logger.warning(f"Browser watchdog sample failed: {str(e)}")
+
+        self._thread = threading.Thread(target=_watch, daemon=True)
+        self._thread.start()
+
+    def snapshot(self):
+        """Browser count and memory for task progress."""
+        with self._lock:
+            browsers = list(self._browsers.values())
+        return {
+            'count': len(browsers),
+            'rss_mb': round(sum(b['rss_mb'] for b in browsers), 1),
+            'max_rss_mb': max((b['rss_mb'] for b in browsers), default=0.0),
+        }
+
+    def reap(self, live_sessions):
+        """Kill tracked browsers whose session is not in ``live_sessions`` and
+        any browser tagged with our PID that was never tracked."""
+        if psutil is None:
+            return 0
+        cutoff = time.time() - REAP_GRACE_SECONDS
+        with self._lock:
+            stale = {sid: info for sid, info in self._browsers.items()
+                     if sid not in live_sessions and info['started'] < cutoff}
+            for sid in stale:
+                self._browsers.pop(sid)
+            tracked = {info['pid'] for info in self._browsers.values()}
+
+        killed = sum(_kill_tree(info['pid']) for info in stale.values() if info['pid'])
+        marker = owner_switch()
+        for proc in psutil.process_iter(['cmdline']):
+            try:
+                cmdline = proc.info['cmdline'] or []
+                if marker not in cmdline or _is_child_process(cmdline) or proc.create_time() > cutoff:
+                    continue
+                if any(parent.pid in tracked for parent in proc.parents()):
+                    continue
+                killed += _kill_tree(proc.pid)
+            except psutil.Error:
+                continue
+        if killed:
+            logger.info(f"Reaped {killed} orphaned browser processes")
+        return killed
+
+    def reap_stale(self):
+        """Kill browsers tagged by processes that no longer exist (crashed runs)."""
+        if psutil is None:
+            return 0
+        killed = 0
+        for proc in psutil.process_iter(['cmdline', 'ppid']):
+            try:
+                owner = next((arg[len(OWNER_SWITCH):] for arg in proc.info['cmdline'] or []
+                              if arg.startswith(OWNER_SWITCH)), None)
+                if not owner or not owner.isdigit() or psutil.pid_exists(int(owner)):
+                    continue
+                if _is_child_process(proc.info['cmdline']):
+                    continue
+                parent = psutil.Process(proc.info['ppid']) if proc.info['ppid'] else None
+                if parent and 'chromedriver' in parent.name().lower():
+                    killed += _kill_tree(parent.pid)
+                else:
+                    killed += _kill_tree(proc.pid)
+            except psutil.Error:
+                continue
+        if killed:
+            logger.info(f"Killed {killed} browser processes left by previous runs")
+        return killed
+
+
+_supervisor = None
+_supervisor_lock = threading.Lock()
+
+
+def get_supervisor():
+    global _supervisor
+    if _supervisor is None:
+        with _supervisor_lock:
+            if _supervisor is None:
+                _supervisor = BrowserSupervisor()
+                if psutil is None:
+                    logger.warning("psutil not installed; browser memory watchdog and orphan reaping disabled")
+                else:
+                    _supervisor.reap_stale()
+                    _supervisor.start()
+    return _supervisor
@@ -0,0 +1,290 @@
+"""
+Condition-based waits for Selenium scrapers.
+
+Every helper polls the page and returns as soon as its condition holds, with
+``timeout`` as a hard ceiling, so scrapers no longer pay a fixed
+``time.sleep()`` on pages that are already ready.
+
+``scroll_until_stable`` replaces fixed ``for _ in range(N): scroll; sleep``
+loops: it keeps scrolling (or clicking "load more") while the result list
+grows and stops once growth stalls.  Scrapers pass the job-card selectors
+their extraction code tries, so growth means more jobs rather than more
+links, and ``max_items=max_pages * SCROLL_PAGE_SIZE`` so a scrape asked for
+a few pages stops scrolling once it has that many cards.  Per-thread scroll
+statistics let the engine report how many rounds each company actually
+needed.
+"""
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+POLL_INTERVAL = 0.2
+DEFAULT_SETTLE = 0.5
+
+SCROLL_MAX_ROUNDS = 20
+SCROLL_SETTLE = 1.5
+SCROLL_TIME_BUDGET = 30
+# Jobs that count as one of ``max_pages`` pages on a scrolling or "load more" list
+SCROLL_PAGE_SIZE = 25
+
+# Injected into every pooled driver (see core.browser) so waits can tell when
+# the page's own XHR/fetch traffic has gone quiet.
+REQUEST_TRACKER_JS = """
+(function () {
+    if (window.__pendingRequests !== undefined) return;
+    window.__pendingRequests = 0;
+    var done = function () {
+        window.__pendingRequests = Math.max(0, window.__pendingRequests - 1);
+    };
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function () {
+            window.__pendingRequests++;
+            try {
+                return origFetch.apply(this, arguments).finally(done);
+            } catch (e) {
+                done();
+                throw e;
+            }
+        };
+    }
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        window.__pendingRequests++;
+        this.addEventListener('loadend', done);
+        try {
+            return origSend.apply(this, arguments);
+        } catch (e) {
+            done();
+            throw e;
+        }
+    };
+})();
+"""
+
+_PAGE_STATE_JS = """
+return [
+    document.readyState,
+    document.getElementsByTagName('*').length,
+    document.body ? document.body.textContent.length : 0,
+    window.__pendingRequests || 0
+];
+"""
+
+_SCROLL_STATE_JS = """
+var selectors = arguments[0], count = 0;
+if (!selectors || !selectors.length) {
+    count = document.links.length;
+} else {
+    for (var i = 0; i < selectors.length && !count; i++) {
+        try { count = document.querySelectorAll(selectors[i]).length; } catch (e) {}
+    }
+}
+return [count, document.body ? document.body.scrollHeight : 0];
+"""
+
+_SCROLL_STEP_JS = """
+var btn = arguments[0] ? document.querySelector(arguments[0]) : null;
+if (btn && btn.offsetParent !== null && !btn.disabled) {
+    btn.scrollIntoView({block: 'center'});
+    btn.click();
+    return 'click';
+}
+window.scrollTo(0, document.body.scrollHeight);
+return 'scroll';
+"""
+
+_PAGE_SIGNATURE_JS = """
+var nodes = document.querySelectorAll(arguments[0]);
+if (!nodes.length) return '';
+var first = (nodes[0].textContent || '').trim().substring(0, 80);
+var last = (nodes[nodes.length - 1].textContent || '').trim().substring(0, 80);
+return nodes.length + '|' + first + '|' + last;
+"""
+
+
+def _css_selectors(css_selector):
+    if not css_selector:
+        return []
+    if isinstance(css_selector, str):
+        return [css_selector]
+    selectors = []
+    for selector in css_selector:
+        if isinstance(selector, tuple):
+            by, selector = selector
+            if by == By.CLASS_NAME:
+                selector = '.' + selector
+            elif by not in (By.CSS_SELECTOR, By.TAG_NAME):
+                continue
+        selectors.append(selector)
+    return selectors
+
+
+def _css_group(css_selector):
+    """One selector matching any of ``css_selector``'s alternatives."""
+    return ', '.join(_css_selectors(css_selector))
+
+
+def _poll(condition, timeout):
+    deadline = time.time() + timeout
+    while True:
+        try:
+            result = condition()
+        except WebDriverException:
+            result = None
+        if result:
+            return result
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return None
+        time.sleep(min(POLL_INTERVAL, remaining))
+
+
+def wait_for_dom_stable(driver, timeout=10, settle=DEFAULT_SETTLE):
+    """Wait until the document is loaded, no XHR/fetch is in flight and the DOM
+    has not changed for ``settle`` seconds. Returns False if ``timeout`` hit."""
+    state = {'last': None, 'since': time.time()}
+
+    def _settled():
+        current = driver.execute_script(_PAGE_STATE_JS)
+        now = time.time()
+        if current != state['last']:
+            state['last'] = current
+            state['since'] = now
+            return False
+        return current[0] == 'complete' and current[3] == 0 and now - state['since'] >= settle
+
+    return bool(_poll(_settled, timeout))
+
+
+def wait_for_selector(driver, css_selector, timeout=10):
+    """Wait for at least one element matching ``css_selector`` (or any
+    selector of a fallback list, as ``scroll_until_stable`` takes)."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, _css_group(css_selector)))
+        )
+        return True
+    except (TimeoutException, WebDriverException):
+        return False
+
+
+def wait_for_count_stable(driver, css_selector, stable_ms=1000, timeout=15, min_count=1):
+    """Wait until the number of ``css_selector`` matches is at least
+    ``min_count`` and unchanged for ``stable_ms``. Returns the final count."""
+    state = {'count': -1, 'since': time.time()}
+
+    def _stable():
+        count = len(driver.find_elements(By.CSS_SELECTOR, _css_group(css_selector)))
+        now = time.time()
+        if count != state['count']:
+            state['count'] = count
+            state['since'] = now
+            return False
+        return count >= min_count and (now - state['since']) * 1000 >= stable_ms
+
+    _poll(_stable, timeout)
+    return max(state['count'], 0)
+
+
+def wait_for_url_change(driver, old_url, timeout=10):
+    """Wait until ``driver.current_url`` differs from ``old_url``."""
+    return bool(_poll(lambda: driver.current_url != old_url, timeout))
+
+
+def page_signature(driver, css_selector):
+    """Cheap fingerprint of the current result list (count, first and last card).
+    ``css_selector`` may be a fallback list; all its matches make up the list."""
+    try:
+        return driver.execute_script(_PAGE_SIGNATURE_JS, _css_group(css_selector)) or ''
+    except WebDriverException:
+        return ''
+
+
+def wait_for_page_change(driver, css_selector, previous_signature, timeout=10):
+    """Wait until the result list differs from ``previous_signature`` after a
+    pagination click. Returns False if it never changed."""
+    def _changed():
+        signature = page_signature(driver, css_selector)
+        return bool(signature) and signature != previous_signature
+
+    return bool(_poll(_changed, timeout))
+
+
+_scroll_stats = threading.local()
+
+
+def reset_scroll_stats():
+    """Start a fresh scroll tally for the current thread (one company)."""
+    _scroll_stats.calls = 0
+    _scroll_stats.rounds = 0
+    _scroll_stats.seconds = 0.0
+
+
+def get_scroll_stats():
+    """Scroll calls, rounds and seconds spent on the current thread since the last reset."""
+    return {
+        'scroll_calls': getattr(_scroll_stats, 'calls', 0),
+        'scroll_rounds': getattr(_scroll_stats, 'rounds', 0),
+        'scroll_seconds': round(getattr(_scroll_stats, 'seconds', 0.0), 1),
+    }
+
+
+def scroll_until_stable(driver, css_selector=None, load_more_selector=None, max_rounds=SCROLL_MAX_ROUNDS,
+                        settle=SCROLL_SETTLE, max_items=None, time_budget=SCROLL_TIME_BUDGET):
+    """Scroll to the bottom (or click ``load_more_selector``) until the number
+    of ``css_selector`` matches and the page height stop growing for
+    ``settle`` seconds, ``max_items`` matches are loaded, ``max_rounds``
+    rounds ran or ``time_budget`` seconds elapsed.
+
+    ``css_selector`` may also be a fallback list, tried in order like a
+    scraper's own card selectors: the first one that matches anything is
+    counted.  ``(By, value)`` locators are accepted too (XPath and link-text
+    ones are skipped), so a scraper's locator list can be passed as is.
+    Without ``css_selector`` the link count is used as the growth signal.
+    Returns ``{'rounds', 'count', 'stopped', 'elapsed'}``.
+    """
+    selectors = _css_selectors(css_selector)
+    start = time.time()
+    rounds = 0
+    stopped = 'max_rounds'
+    try:
+        count, height = driver.execute_script(_SCROLL_STATE_JS, selectors)
+    except WebDriverException:
+        count, height = 0, 0
+
+    while rounds < max_rounds:
+        if max_items and count >= max_items:
+            stopped = 'max_items'
+            break
+        if time.time() - start >= time_budget:
+            stopped = 'time_budget'
+            break
+        try:
+            driver.execute_script(_SCROLL_STEP_JS, load_more_selector)
+        except WebDriverException:
+            stopped = 'error'
+            break
+        rounds += 1
+
+        def _grew():
+            new_count, new_height = driver.execute_script(_SCROLL_STATE_JS, selectors)
+            if new_count > count or new_height > height:
+                return new_count, new_height
+            return None
+
+        grown = _poll(_grew, settle)
+        if not grown:
+            stopped = 'stalled'
+            break
+        count, height = grown
+
+    elapsed = time.time() - start
+    _scroll_stats.calls = getattr(_scroll_stats, 'calls', 0) + 1
+    _scroll_stats.rounds = getattr(_scroll_stats, 'rounds', 0) + rounds
+    _scroll_stats.seconds = getattr(_scroll_stats, 'seconds', 0.0) + elapsed
+    return {'rounds': rounds, 'count': count, 'stopped': stopped, 'elapsed': round(elapsed, 2)}
@@ -4,13 +4,12 @@ Main runner script for job scraping system.
 Can be used standalone (CLI) or through Django management.
 """
 import argparse
+import json
 import os
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
 
 sys.path.append(str(Path(__file__).resolve().parent))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
@@ -18,10 +17,16 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 import django
 django.setup()
 
-from scrapers.registry import SCRAPER_MAP, ALL_COMPANY_CHOICES
+from scrapers.registry import ALL_COMPANY_CHOICES, resolve_scraper
 from apps.data_store import services as job_service
+from apps.scraper_manager.scheduling import plan_scrape
 from core.logging import setup_logger
-from config.scraper import LOGS_DIR
+from core.admission import AdmissionController
+from core.executor import ScrapeExecutor, browser_workers, http_executor, map_pools, pools_browser_stats
+from core.waits import reset_scroll_stats, get_scroll_stats
+from core.http_cache import reset_cache_stats, get_cache_stats, ListingUnchanged
+from core.http_client import reset_session
+from config.scraper import LOGS_DIR, COMPANIES, AUTO_SCALE, BROWSER_WORKERS, HTTP_WORKERS
 
 log_file = LOGS_DIR / f'scraper_{datetime.now().strftime("%Y%m%d")}.log'
 logger = setup_logger('main', log_file)
@@ -40,7 +45,7 @@ def scrape_company(company_name):
     }
 
     try:
-        scraper_class = SCRAPER_MAP.get(company_name.lower())
+        scraper_class = resolve_scraper(company_name)
         if not scraper_class:
             logger.error(f"Unknown company: {company_name}")
             result['error'] = "Unknown company"
@@ -49,13 +54,35 @@ def scrape_company(company_name):
         scraper = scraper_class()
         logger.info(f"Starting scrape for {company_name}")
 
-        jobs = scraper.scrape()
+        stored = job_service.count_company_jobs(company_name)
+        reset_scroll_stats()
+        reset_cache_stats(check_listing=stored > 0)
+        reset_session()
+        try:
+            jobs = scraper.scrape()
+        except ListingUnchanged:
+            # The first listing page came back 304/fresh: the stored jobs are still current
+            result.update(get_cache_stats())
+            logger.info(f"{company_name}: listing unchanged, keeping {stored} stored jobs")
+            job_service.create_scraping_run(
+                company_name=company_name, jobs_scraped=stored, status='success',
+                duration=time.time() - start_time
+            )
+            result.update(success=True, unchanged=True, jobs_count=stored)
+            result['duration'] = time.time() - start_time
+            return result
+        result.update(get_scroll_stats())
+        result.update(get_cache_stats())
+        if result['scroll_calls']:
+            logger.info(f"{company_name}: {result['scroll_rounds']} scroll rounds in {result['scroll_calls']} "
+                        f"scroll passes ({result['scroll_seconds']}s)")
 
         if not jobs:
             logger.warning(f"No jobs found for {company_name}")
             job_service.create_scraping_run(
                 company_name=company_name, jobs_scraped=0,
-                status='success', error_message='No jobs found'
+                status='success', error_message='No jobs found',
+                duration=time.time() - start_time
             )
             result['success'] = True
             result['duration'] = time.time() - start_time
@@ -85,7 +112,8 @@ def scrape_company(company_name):
 
         logger.info(f"Saved {len(jobs)} jobs for {company_name}")
         job_service.create_scraping_run(
-            company_name=company_name, jobs_scraped=len(jobs), status='success'
+            company_name=company_name, jobs_scraped=len(jobs), status='success',
+            duration=time.time() - start_time
         )
 
         result['success'] = True
@@ -97,66 +125,104 @@ def scrape_company(company_name):
         logger.error(f"Error scraping {company_name}: {str(e)}")
         job_service.create_scraping_run(
             company_name=company_name, jobs_scraped=0,
-            status='failed', error_message=str(e)
+            status='failed', error_message=str(e),
+            duration=time.time() - start_time
         )
         result['error'] = str(e)
         result['duration'] = time.time() - start_time
         return result
 
 
-def scrape_all_parallel(max_workers=10, per_scraper_timeout=180):
-    """Scrape all companies using multithreading for maximum speed."""
+def scrape_all_parallel(max_workers=BROWSER_WORKERS, per_scraper_timeout=180, http_workers=HTTP_WORKERS):
+    """Scrape all companies in worker processes, killing any that run past the timeout.
+
+    Browser scrapers and HTTP-only engines run side by side in separate pools,
+    ``max_workers`` and ``http_workers`` wide.  With AUTO_SCALE the browser
+    pool starts smaller and ``max_workers`` is only its ceiling.
+    """
     total = len(ALL_COMPANY_CHOICES)
-    logger.info(f"Starting parallel scrape for all {total} companies with {max_workers} workers (timeout={per_scraper_timeout}s)")
+    max_workers = browser_workers(max_workers)
+    logger.info(f"Starting parallel scrape for all {total} companies with {max_workers} browser and "
+                f"{http_workers} HTTP workers (timeout={per_scraper_timeout}s)")
+
+    schedule = plan_scrape(ALL_COMPANY_CHOICES, max_workers, http_workers)
+    pools = schedule['pools']
+    print(f"Browser pool: {len(pools['browser']['order'])} companies, expected {pools['browser']['makespan']:.0f}s | "
+          f"HTTP pool: {len(pools['http']['order'])} companies, expected {pools['http']['makespan']:.0f}s")
+    print(f"Expected: {schedule['makespan']:.0f}s ({schedule['makespan']/60:.1f} min), finishing around "
+          f"{datetime.fromtimestamp(time.time() + schedule['makespan']):%H:%M} "
+          f"(list order: {schedule['list_makespan']:.0f}s)"
+          + (f", best case with the browser pool ramping up from {pools['browser']['ramp'][0]}"
+             if pools['browser']['ramp'] else '') + "\n")
 
     start_time = time.time()
-    results = []
-    print_lock = Lock()
+    controller = AdmissionController(max_workers) if AUTO_SCALE else None
+    browser_executor = ScrapeExecutor(scrape_company, max_workers=max_workers, timeout=per_scraper_timeout,
+                                      controller=controller)
+    http_pool = http_executor(scrape_company, workers=http_workers, timeout=per_scraper_timeout)
     completed_count = [0]
 
-    def scrape_with_progress(company):
-        result = scrape_company(company)
-        with print_lock:
-            completed_count[0] += 1
-            status = "+" if result['success'] else "x"
-            elapsed = time.time() - start_time
-            print(f"[{completed_count[0]}/{total}] {status} {result['company']}: {result['jobs_count']} jobs ({result['duration']:.1f}s) | elapsed {elapsed:.0f}s")
-        return result
+    def print_progress(result):
+        completed_count[0] += 1
+        elapsed = time.time() - start_time
+        result['finished'] = round(elapsed, 1)
+        browsers = pools_browser_stats([browser_executor, http_pool])
+        if result.get('timed_out'):
+            logger.error(f"Timeout scraping {result['company']} after {per_scraper_timeout}s")
+            job_service.create_scraping_run(
+                company_name=result['company'], jobs_scraped=0,
+                status='timeout', error_message=result['error'],
+                duration=result['duration']
+            )
+            print(f"[{completed_count[0]}/{total}] x {result['company']}: TIMEOUT ({per_scraper_timeout}s) | elapsed {elapsed:.0f}s")
+            return
+        status = "+" if result['success'] else "x"
+        print(f"[{completed_count[0]}/{total}] {status} {result['company']}: {result['jobs_count']} jobs{' (unchanged)' if result.get('unchanged') else ''} ({result['duration']:.1f}s) | elapsed {elapsed:.0f}s | browsers {browsers['count']} ({browsers['rss_mb']:.0f}MB){f' | concurrency {controller.limit}' if controller else ''}")
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_company = {
-            executor.submit(scrape_with_progress, company): company
-            for company in ALL_COMPANY_CHOICES
-        }
-
-        for future in as_completed(future_to_company):
-            company = future_to_company[future]
-            try:
-                result = future.result(timeout=per_scraper_timeout)
-                results.append(result)
-            except Exception as e:
-                error_msg = f"Timeout ({per_scraper_timeout}s)" if 'TimeoutError' in type(e).__name__ else str(e)
-                logger.error(f"Exception scraping {company}: {error_msg}")
-                with print_lock:
-                    completed_count[0] += 1
-                    print(f"[{completed_count[0]}/{total}] x {company}: TIMEOUT/ERROR ({error_msg[:80]})")
-                results.append({
-                    'company': company, 'success': False, 'jobs_count': 0,
-                    'error': error_msg, 'duration': per_scraper_timeout
-                })
+    # Longest expected first, so the slow tail starts early instead of running alone at the end
+    results = map_pools([(browser_executor, pools['browser']['order']), (http_pool, pools['http']['order'])],
+                        on_result=print_progress)
 
+    browsers = pools_browser_stats([browser_executor, http_pool])
     total_time = time.time() - start_time
     total_jobs = sum(r['jobs_count'] for r in results)
     passed = len([r for r in results if r['success']])
 
     print(f"\n{'='*60}")
     print(f"COMPLETED: {passed}/{total} companies | {total_jobs:,} total jobs | {total_time:.0f}s ({total_time/60:.1f} min)")
+    print(f"Expected {schedule['makespan']:.0f}s, took {total_time:.0f}s")
+    print(f"Browsers: {browsers['count']} running, {browsers['rss_mb']:.0f}MB RSS")
+    if controller:
+        print("Browser concurrency: " + ", ".join(f"{step['limit']} at {step['t']}s ({step['reason']})"
+                                                   for step in controller.history))
     print(f"{'='*60}\n")
 
+    record_run(schedule, results, {'browser': max_workers, 'http': http_workers}, total_time,
+               concurrency=controller.history if controller else None)
     logger.info(f"Scraping completed for all companies in {total_time:.2f} seconds")
     return results
 
 
+def record_run(schedule, results, workers, makespan, concurrency=None):
+    """Save a full run's expected and actual durations for scripts/benchmark_schedule.py."""
+    path = LOGS_DIR / f'scrape_run_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+    with open(path, 'w') as f:
+        json.dump({
+            'companies': list(ALL_COMPANY_CHOICES),
+            'pools': {mode: {'workers': workers[mode], 'order': pool['order']}
+                      for mode, pool in schedule['pools'].items()},
+            'expected_makespan': schedule['makespan'],
+            'makespan': round(makespan, 1),
+            'concurrency': concurrency,
+            'results': [{
+                'company': r['company'], 'success': r['success'], 'timed_out': bool(r.get('timed_out')),
+                'expected': schedule['expected'].get(r['company']), 'duration': round(r['duration'], 1),
+                'finished': r.get('finished'),
+            } for r in results],
+        }, f, indent=2)
+    logger.info(f"Run recorded in {path}")
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -164,21 +230,29 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python run.py scrape                    # Scrape all companies (10 workers)
-  python run.py scrape --workers 15       # Scrape all with 15 workers
+  python run.py scrape                    # Scrape all companies
+  python run.py scrape --workers 8        # 8 browser scrapers at once
+  python run.py scrape --http-workers 100 # 100 HTTP-only scrapers at once
   python run.py scrape --company Google   # Scrape single company
   python run.py scrape --timeout 120      # Custom per-scraper timeout
   python run.py server                    # Start Django server
+  python run.py discover                  # Profile all career sites for JSON job APIs
+  python run.py discover --company Titan  # Profile a single career site
         """
     )
-    parser.add_argument('action', choices=['scrape', 'server', 'clean'],
+    parser.add_argument('action', choices=['scrape', 'server', 'clean', 'discover'],
                        help='Action to perform')
     parser.add_argument('--company', choices=ALL_COMPANY_CHOICES,
                        help='Specific company to scrape')
-    parser.add_argument('--workers', type=int, default=10,
-                       help='Number of parallel workers (default: 10)')
+    parser.add_argument('--workers', type=int,
+                       help=f'Parallel browser scrapers, capped by free memory (default: {BROWSER_WORKERS}); '
+                            f'parallel sites for discover (default: 10)')
+    parser.add_argument('--http-workers', type=int, default=HTTP_WORKERS,
+                       help=f'Parallel HTTP-only platform scrapers (default: {HTTP_WORKERS})')
     parser.add_argument('--timeout', type=int, default=180,
                        help='Per-scraper timeout in seconds (default: 180)')
+    parser.add_argument('--output',
+                       help='Report path for discover (default: logs/api_discovery_<date>.json)')
 
     args = parser.parse_args()
 
@@ -196,9 +270,32 @@ Examples:
         else:
             print(f"\n{'='*60}")
             print(f"PARALLEL SCRAPING - {len(ALL_COMPANY_CHOICES)} COMPANIES")
-            print(f"Workers: {args.workers} | Timeout: {args.timeout}s per scraper")
+            print(f"Workers: {args.workers or BROWSER_WORKERS} browser, {args.http_workers} HTTP | "
+                  f"Timeout: {args.timeout}s per scraper")
             print(f"{'='*60}\n")
-            scrape_all_parallel(max_workers=args.workers, per_scraper_timeout=args.timeout)
+            scrape_all_parallel(max_workers=args.workers or BROWSER_WORKERS, per_scraper_timeout=args.timeout,
+                                http_workers=args.http_workers)
+
+    elif args.action == 'discover':
+        from core.discovery import discover_apis
+
+        companies = None
+        if args.company:
+            match = next((c for c in COMPANIES if c.lower() == args.company.lower()), None)
+            if not match:
+                print(f"{args.company} has no entry in config.scraper.COMPANIES")
+                sys.exit(1)
+            companies = [match]
+        report = discover_apis(companies=companies, max_workers=args.workers or 10,
+                              output_path=args.output)
+        found = [e for e in report['companies'] if e['candidates']]
+        print(f"\n{'='*60}")
+        print(f"API DISCOVERY: {len(found)}/{len(report['companies'])} companies expose job-like JSON")
+        for entry in found:
+            top = entry['candidates'][0]
+            print(f"  [{entry['mode']:7s}] {entry['company']}: {top['method']} {top['url'][:90]} "
+                  f"(score {top['score']}, {top['items']} items, total {top['total']})")
+        print(f"{'='*60}\n")
 
     elif args.action == 'clean':
         job_service.delete_all_jobs()
@@ -1,47 +1,24 @@
 from .amazon_scraper import AmazonScraper
 from .aws_scraper import AWSScraper
 from .accenture_scraper import AccentureScraper
-from .jll_scraper import JLLScraper
 from .bain_scraper import BainScraper
-from .bcg_scraper import BCGScraper
 from .infosys_scraper import InfosysScraper
 from .loreal_scraper import LorealScraper
-from .mahindra_scraper import MahindraScraper
 from .marico_scraper import MaricoScraper
 from .meta_scraper import MetaScraper
 from .microsoft_scraper import MicrosoftScraper
-from .morganstanley_scraper import MorganStanleyScraper
-from .nestle_scraper import NestleScraper
-from .nvidia_scraper import NvidiaScraper
-from .samsung_scraper import SamsungScraper
 from .swiggy_scraper import SwiggyScraper
 from .tcs_scraper import TCSScraper
-from .tataconsumer_scraper import TataConsumerScraper
 from .techmahindra_scraper import TechMahindraScraper
 from .varunbeverages_scraper import VarunBeveragesScraper
-from .wipro_scraper import WiproScraper
 from .pepsico_scraper import PepsiCoScraper
 from .bookmyshow_scraper import BookMyShowScraper
-from .abbott_scraper import AbbottScraper
 
 # Batch 3 - New scrapers (25 more)
-from .airindia_scraper import AirIndiaScraper
-from .tataaig_scraper import TataAIGScraper
-from .tatainternational_scraper import TataInternationalScraper
-from .tataprojects_scraper import TataProjectsScraper
-from .trent_scraper import TrentScraper
-from .bajajelectricals_scraper import BajajElectricalsScraper
-from .olam_scraper import OlamScraper
 from .unitedbreweries_scraper import UnitedBreweriesScraper
-from .tatapower_scraper import TataPowerScraper
 from .natwestgroup_scraper import NatWestGroupScraper
 from .hitachi_scraper import HitachiScraper
-from .mckesson_scraper import McKessonScraper
-from .birlasoft_scraper import BirlasoftScraper
 from .coforge_scraper import CoforgeScraper
-from .dhl_scraper import DHLScraper
-from .ericsson_scraper import EricssonScraper
-from .vois_scraper import VOISScraper
 from .schneiderelectric_scraper import SchneiderElectricScraper
 from .siemens_scraper import SiemensScraper
 from .deutschebank_scraper import DeutscheBankScraper
@@ -55,18 +32,13 @@ from .novartis_scraper import NovartisScraper
 from .adanienergy_scraper import AdaniEnergyScraper
 from .adaniports_scraper import AdaniPortsScraper
 from .americantower_scraper import AmericanTowerScraper
-from .anz_scraper import ANZScraper
 from .axa_scraper import AXAScraper
 from .basf_scraper import BASFScraper
-from .bayer_scraper import BayerScraper
-from .disney_scraper import DisneyScraper
 from .emiratesgroup_scraper import EmiratesGroupScraper
 from .gsk_scraper import GSKScraper
 from .hyundai_scraper import HyundaiScraper
 from .ihg_scraper import IHGScraper
-from .intuit_scraper import IntuitScraper
 from .lenovo_scraper import LenovoScraper
-from .lgelectronics_scraper import LGElectronicsScraper
 from .mercedesbenz_scraper import MercedesBenzScraper
 from .munichre_scraper import MunichReScraper
 from .panasonic_scraper import PanasonicScraper
@@ -82,9 +54,7 @@ from .whirlpool_scraper import WhirlpoolScraper
 from .britannia_scraper import BritanniaScraper
 from .bmwgroup_scraper import BMWGroupScraper
 from .crompton_scraper import CromptonScraper
-from .diageo_scraper import DiageoScraper
 from .dlf_scraper import DLFScraper
-from .havells_scraper import HavellsScraper
 from .hdfclife_scraper import HDFCLifeScraper
 from .hal_scraper import HALScraper
 from .honda_scraper import HondaScraper
@@ -93,17 +63,65 @@ from .indusindbank_scraper import IndusIndBankScraper
 from .iocl_scraper import IOCLScraper
 from .kajaria_scraper import KajariaScraper
 from .kiaindia_scraper import KiaIndiaScraper
-from .mankindpharma_scraper import MankindPharmaScraper
-from .maxhealthcare_scraper import MaxHealthcareScraper
 from .ntpc_scraper import NTPCScraper
-from .nissan_scraper import NissanScraper
-from .oyo_scraper import OyoScraper
-from .pidilite_scraper import PidiliteScraper
 from .saintgobain_scraper import SaintGobainScraper
 from .siemensenergy_scraper import SiemensEnergyScraper
 from .tatacommunications_scraper import TataCommunicationsScraper
 from .toyotakirloskar_scraper import ToyotaKirloskarScraper
-from .yesbank_scraper import YesBankScraper
+
+from .platforms.workday import workday_scraper
+DiageoScraper = workday_scraper('diageo')
+NissanScraper = workday_scraper('nissan')
+NvidiaScraper = workday_scraper('nvidia')
+SamsungScraper = workday_scraper('samsung')
+JLLScraper = workday_scraper('jll')
+
+from .platforms.oracle_hcm import oracle_hcm_scraper
+HavellsScraper = oracle_hcm_scraper('havells')
+
+from .platforms.darwinbox import darwinbox_scraper
+YesBankScraper = darwinbox_scraper('yesbank')
+
+from .platforms.peoplestrong import peoplestrong_scraper
+MaxHealthcareScraper = peoplestrong_scraper('maxhealthcare')
+PidiliteScraper = peoplestrong_scraper('pidilite')
+
+from .platforms.successfactors import successfactors_scraper
+NestleScraper = successfactors_scraper('nestle')
+WiproScraper = successfactors_scraper('wipro')
+TataConsumerScraper = successfactors_scraper('tataconsumer')
+MahindraScraper = successfactors_scraper('mahindra')
+AirIndiaScraper = successfactors_scraper('airindia')
+TataAIGScraper = successfactors_scraper('tataaig')
+TataInternationalScraper = successfactors_scraper('tatainternational')
+TataProjectsScraper = successfactors_scraper('tataprojects')
+TrentScraper = successfactors_scraper('trent')
+BajajElectricalsScraper = successfactors_scraper('bajajelectricals')
+OlamScraper = successfactors_scraper('olam')
+TataPowerScraper = successfactors_scraper('tatapower')
+ANZScraper = successfactors_scraper('anz')
+BirlasoftScraper = successfactors_scraper('birlasoft')
+MankindPharmaScraper = successfactors_scraper('mankindpharma')
+
+from .platforms.phenom import phenom_scraper
+AbbottScraper = phenom_scraper('abbott')
+BCGScraper = phenom_scraper('bcg')
+DHLScraper = phenom_scraper('dhl')
+
+from .platforms.eightfold import eightfold_scraper
+MorganStanleyScraper = eightfold_scraper('morganstanley')
+LGElectronicsScraper = eightfold_scraper('lgelectronics')
+BayerScraper = eightfold_scraper('bayer')
+EricssonScraper = eightfold_scraper('ericsson')
+VOISScraper = eightfold_scraper('vois')
+
+from .platforms.smartrecruiters import smartrecruiters_scraper
+OyoScraper = smartrecruiters_scraper('oyo')
+
+from .platforms.talentbrew import talentbrew_scraper
+McKessonScraper = talentbrew_scraper('mckesson')
+DisneyScraper = talentbrew_scraper('disney')
+IntuitScraper = talentbrew_scraper('intuit')
 
 __all__ = [
     'AmazonScraper', 'AWSScraper', 'AccentureScraper', 'JLLScraper',
@@ -1,68 +1,23 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, MAX_PAGES_TO_SCRAPE, FETCH_FULL_JOB_DETAILS
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change
+from config.scraper import SCRAPE_TIMEOUT, MAX_PAGES_TO_SCRAPE, FETCH_FULL_JOB_DETAILS
 
 logger = setup_logger('accenture_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class AccentureScraper:
     def __init__(self):
         self.company_name = 'Accenture'
         self.url = 'https://www.accenture.com/in-en/careers/jobsearch?ct=Ahmedabad%7CBengaluru%7CBhubaneswar%7CChennai%7CCoimbatore%7CGandhinagar%7CGurugram%7CHyderabad%7CIndore%7CJaipur%7CKochi%7CKolkata%7CMumbai%7CNagpur%7CNavi%20Mumbai%7CNew%20Delhi%7CNoida%7CPune%7CThiruvananthapuram'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        try:
-            # Install and get the correct chromedriver path
-            driver_path = CHROMEDRIVER_PATH
-            logger.info(f"ChromeDriver installed at: {driver_path}")
-            
-            # Fix for macOS ARM - ensure we use the actual chromedriver binary
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-                    logger.info(f"Using corrected path: {driver_path}")
-            
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            })
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            # Fallback: try without service specification
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -75,7 +30,7 @@ class AccentureScraper:
         
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
             
             # Smart wait for job cards instead of blind sleep
@@ -86,7 +41,7 @@ class AccentureScraper:
                 logger.info("Job cards loaded")
             except:
                 logger.warning("Timeout waiting for job cards, using fallback wait")
-                time.sleep(5)
+                wait_for_dom_stable(driver, 5)
             
             current_page = 1
             
@@ -116,7 +71,7 @@ class AccentureScraper:
         
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         
         return jobs
     
@@ -130,10 +85,7 @@ class AccentureScraper:
             time.sleep(0.5)
 
             # Capture current state for change detection
-            old_first = driver.execute_script("""
-                var card = document.querySelector('div.rad-filters-vertical__job-card');
-                return card ? card.innerText.substring(0, 50) : '';
-            """)
+            signature = page_signature(driver, 'div.rad-filters-vertical__job-card')
 
             # Try to find and click next page button
             next_page_selectors = [
@@ -154,15 +106,7 @@ class AccentureScraper:
                     logger.info(f"Clicked next page button")
 
                     # Poll for content change
-                    for _ in range(20):
-                        time.sleep(0.2)
-                        new_first = driver.execute_script("""
-                            var card = document.querySelector('div.rad-filters-vertical__job-card');
-                            return card ? card.innerText.substring(0, 50) : '';
-                        """)
-                        if new_first and new_first != old_first:
-                            break
-                    time.sleep(0.5)
+                    wait_for_page_change(driver, 'div.rad-filters-vertical__job-card', signature, 4)
                     return True
                 except:
                     continue
@@ -321,7 +265,7 @@ class AccentureScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(4)
+            wait_for_dom_stable(driver, 4)
             
             # Try to click the accordion/read more button for job description
             try:
@@ -337,9 +281,9 @@ class AccentureScraper:
                     try:
                         accordion_button = driver.find_element(selector_type, selector_value)
                         driver.execute_script("arguments[0].scrollIntoView();", accordion_button)
-                        time.sleep(1)
+                        wait_for_dom_stable(driver, 1)
                         driver.execute_script("arguments[0].click();", accordion_button)
-                        time.sleep(2)
+                        wait_for_dom_stable(driver, 2)
                         logger.info("Clicked accordion/read more button")
                         break
                     except:
@@ -396,7 +340,7 @@ class AccentureScraper:
             # Close tab and return to search results
             driver.close()
             driver.switch_to.window(original_window)
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             
         except Exception as e:
             logger.error(f"Error fetching job details: {str(e)}")
@@ -1,21 +1,34 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 import os
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.http_cache import ListingUnchanged
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, page_signature, wait_for_page_change, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from scrapers.platforms.oracle_hcm import oracle_hcm_scraper
 
 logger = setup_logger('adaniports_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _extract_jobs looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    'div[class*="job-card"], div[class*="jobCard"], div[class*="job-list-item"]',
+    'a[href*="/job/"], a[href*="/requisition/"]',
+    '[class*="job-card"] h2, [class*="job-card"] h3, [class*="title"]',
+    'li[data-ph-at-id="job-listing"], div[data-ph-at-id="job-listing"]',
+    'a[data-ph-at-id="job-link"]',
+    'li[data-job-id]',
+    '[class*="job-card"], [class*="jobCard"], [class*="search-result"], [class*="searchResult"]',
+    '[class*="job-listing"], [class*="jobListing"], [class*="position-card"]',
+    'li[class*="job"], div[class*="job-item"], article[class*="job"]',
+    'a[href*="/job/"], a[href*="/job-"], a[href*="/jobs/"], a[href*="/jb/"], a[href*="/position/"], a[href*="/vacancy/"], a[href*="/career/"], a[href*="/opening/"], a[href*="/requisition/"]',
+    'table tbody tr, table tr.dataRow, table tr[class*="job"]',
+]
 
 
 class AdaniPortsScraper:
@@ -24,80 +37,67 @@ class AdaniPortsScraper:
         self.url = 'https://www.adani.com/opportunity/#en/sites/CX_2021/jobs'
         self.base_url = 'https://www.adani.com'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
 
     def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        # Primary method: Candidate Experience REST API
+        try:
+            api_jobs = oracle_hcm_scraper('adaniports')().scrape(max_pages)
+            if api_jobs:
+                logger.info(f"API method returned {len(api_jobs)} jobs")
+                return api_jobs
+            logger.warning("API method returned 0 jobs, falling back to Selenium")
+        except ListingUnchanged:
+            raise
+        except Exception as e:
+            logger.warning(f"API method failed: {str(e)}, falling back to Selenium")
+
+        # Fallback: Selenium-based scraping
+        return self._scrape_via_selenium(max_pages)
+
+    def _scrape_via_selenium(self, max_pages=MAX_PAGES_TO_SCRAPE):
         driver = None
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
             driver.get(self.url)
-            time.sleep(15)
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 15)
 
-            for _ in range(5):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             for page in range(max_pages):
-                page_jobs = self._extract_jobs(driver)
+                page_jobs = self._extract_jobs(driver, max_pages=max_pages)
                 if not page_jobs:
                     break
                 all_jobs.extend(page_jobs)
                 logger.info(f"Page {page + 1}: {len(page_jobs)} jobs (total: {len(all_jobs)})")
 
+                signature = page_signature(driver, JOB_CARD_SELECTORS)
                 if not self._go_to_next_page(driver):
                     break
-                time.sleep(5)
+                wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 5)
 
             logger.info(f"Total jobs scraped: {len(all_jobs)}")
         except Exception as e:
             logger.error(f"Error: {str(e)}")
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         return all_jobs
 
-    def _extract_jobs(self, driver):
+    def _extract_jobs(self, driver, max_pages=MAX_PAGES_TO_SCRAPE):
         jobs = []
 
         try:
-            for _ in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             js_jobs = driver.execute_script("""
                 var results = [];
@@ -271,7 +271,7 @@ class AdaniPortsScraper:
     def _go_to_next_page(self, driver):
         try:
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             for sel_type, sel_val in [
                 (By.CSS_SELECTOR, 'button[data-ph-at-id="load-more-jobs-button"]'),
@@ -1,55 +1,22 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, scroll_until_stable, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('adityabirla_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class AdityaBirlaScraper:
     def __init__(self):
         self.company_name = 'Aditya Birla Group'
         self.url = 'https://careers.adityabirla.com/job-search'
 
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver_path = CHROMEDRIVER_PATH
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -62,18 +29,16 @@ class AdityaBirlaScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
 
             # Wait for page to load
-            time.sleep(15)
+            wait_for_selector(driver, 'a[href*="/job-search/job-details/"]', 15)
 
             # Scroll to trigger lazy-loaded content (with null checks for document.body)
-            for scroll_i in range(5):
-                driver.execute_script("var b=document.body; var h=document.documentElement; if(b&&h){var m=Math.max(b.scrollHeight||0,h.scrollHeight||0);window.scrollTo(0,m*%s);}" % str((scroll_i + 1) / 5))
-                time.sleep(2)
+            scroll_until_stable(driver, 'a[href*="/job-search/job-details/"]', max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             current_page = 1
 
@@ -88,16 +53,15 @@ class AdityaBirlaScraper:
 
                 # Try to navigate to next page
                 if current_page < max_pages:
+                    signature = page_signature(driver, 'a[href*="/job-search/job-details/"]')
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(5)
+                    wait_for_page_change(driver, 'a[href*="/job-search/job-details/"]', signature, 5)
                     # Scroll again after page change (with null checks)
-                    for scroll_i in range(3):
-                        driver.execute_script("var b=document.body; var h=document.documentElement; if(b&&h){var m=Math.max(b.scrollHeight||0,h.scrollHeight||0);window.scrollTo(0,m*%s);}" % str((scroll_i + 1) / 3))
-                        time.sleep(1)
+                    scroll_until_stable(driver, 'a[href*="/job-search/job-details/"]', max_items=max_pages * SCROLL_PAGE_SIZE)
                     driver.execute_script("window.scrollTo(0, 0);")
-                    time.sleep(1)
+                    wait_for_dom_stable(driver, 1)
 
                 current_page += 1
 
@@ -109,7 +73,7 @@ class AdityaBirlaScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -118,7 +82,7 @@ class AdityaBirlaScraper:
         try:
             # Scroll to bottom where pagination is (with null check)
             driver.execute_script("var b=document.body; var h=document.documentElement; if(b&&h){var m=Math.max(b.scrollHeight||0,h.scrollHeight||0);window.scrollTo(0,m);}")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             # Try clicking next page - the site uses numbered pagination and next buttons
             next_clicked = driver.execute_script("""
@@ -159,7 +123,7 @@ class AdityaBirlaScraper:
     def _scrape_page_js(self, driver):
         """Scrape jobs from current page using JavaScript extraction"""
         jobs = []
-        time.sleep(3)
+        wait_for_dom_stable(driver, 3)
 
         try:
             # Extract job data using JavaScript - the page has links like
@@ -1,68 +1,23 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('amazon_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class AmazonScraper:
     def __init__(self):
         self.company_name = 'Amazon'
         self.url = 'https://www.amazon.jobs/en/search?base_query=&loc_query=India'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        try:
-            # Install and get the correct chromedriver path
-            driver_path = CHROMEDRIVER_PATH
-            logger.info(f"ChromeDriver installed at: {driver_path}")
-            
-            # Fix for macOS ARM - ensure we use the actual chromedriver binary
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-                    logger.info(f"Using corrected path: {driver_path}")
-            
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            })
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            # Fallback: try without service specification
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         # Use job ID + company name for stable external ID
@@ -77,7 +32,7 @@ class AmazonScraper:
         
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
             
             # Wait for page to load — smart wait instead of blind sleep
@@ -88,11 +43,11 @@ class AmazonScraper:
                 logger.info("Page content loaded")
             except:
                 logger.warning("Timeout waiting for page content, using fallback wait")
-                time.sleep(5)
+                wait_for_dom_stable(driver, 5)
 
             # Quick scroll to trigger lazy loading
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
             
@@ -147,7 +102,7 @@ class AmazonScraper:
         
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         
         return jobs
     
@@ -159,7 +114,7 @@ class AmazonScraper:
             
             # Quick scroll to bottom to find the button
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             
             # Get all buttons on the page
             all_buttons = driver.find_elements(By.TAG_NAME, 'button')
@@ -230,8 +185,8 @@ class AmazonScraper:
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", load_more_button)
             time.sleep(0.5)
 
-            # Capture current job count for change detection
-            old_count = len(driver.find_elements(By.CSS_SELECTOR, 'a[href*="/jobs/"]'))
+            # Capture current job list for change detection
+            signature = page_signature(driver, 'a[href*="/jobs/"]')
 
             # Click the button
             try:
@@ -242,12 +197,7 @@ class AmazonScraper:
                 logger.info("Clicked 'Load more jobs' button using JavaScript")
 
             # Poll until new jobs appear (max 6s, usually <2s)
-            for _ in range(30):
-                time.sleep(0.2)
-                new_count = len(driver.find_elements(By.CSS_SELECTOR, 'a[href*="/jobs/"]'))
-                if new_count > old_count:
-                    break
-            time.sleep(0.5)
+            wait_for_page_change(driver, 'a[href*="/jobs/"]', signature, 6)
             
             logger.info(f"Successfully loaded more jobs for page {current_page + 1}")
             return True
@@ -280,7 +230,7 @@ class AmazonScraper:
                     EC.presence_of_element_located((By.CSS_SELECTOR, 'a[href*="/jobs/"]'))
                 )
             except:
-                time.sleep(3)
+                wait_for_dom_stable(driver, 3)
 
             # Quick scroll to trigger lazy loading
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
@@ -698,7 +648,7 @@ class AmazonScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
             
             # Extract description - try multiple selectors
             try:
@@ -1,63 +1,31 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('angelone_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job card locators _scrape_page tries, in order
+JOB_CARD_SELECTORS = [
+    (By.CSS_SELECTOR, 'div.job-card'),
+    (By.CSS_SELECTOR, 'div[class*="job"]'),
+    (By.CSS_SELECTOR, 'div.search-result'),
+    (By.XPATH, '//div[contains(@class, "result")]'),
+]
 
 class AngelOneScraper:
     def __init__(self):
         self.company_name = 'Angel One'
         self.url = 'https://www.angelone.in/careers'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        
-        try:
-            # Install and get the correct chromedriver path
-            driver_path = CHROMEDRIVER_PATH
-            logger.info(f"ChromeDriver installed at: {driver_path}")
-            
-            # Fix for macOS ARM - ensure we use the actual chromedriver binary
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-                    logger.info(f"Using corrected path: {driver_path}")
-            
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            # Fallback: try without service specification
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -70,11 +38,11 @@ class AngelOneScraper:
         
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
             
             # Wait for page to load
-            time.sleep(5)
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 5)
             
             current_page = 1
             
@@ -89,10 +57,11 @@ class AngelOneScraper:
                 
                 # Try to navigate to next page
                 if current_page < max_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(4)  # Wait for next page to load
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 4)  # Wait for next page to load
                 
                 current_page += 1
             
@@ -104,7 +73,7 @@ class AngelOneScraper:
         
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         
         return jobs
     
@@ -115,7 +84,7 @@ class AngelOneScraper:
             
             # Scroll to pagination area
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             
             # Try to find and click next page button
             next_page_selectors = [
@@ -148,18 +117,12 @@ class AngelOneScraper:
     def _scrape_page(self, driver):
         """Scrape jobs from current page"""
         jobs = []
-        time.sleep(3)  # Wait for page content to load
+        wait_for_selector(driver, JOB_CARD_SELECTORS, 3)  # Wait for page content to load
         
         # Look for job cards
         job_cards = []
-        selectors = [
-            (By.CSS_SELECTOR, 'div.job-card'),
-            (By.CSS_SELECTOR, 'div[class*="job"]'),
-            (By.CSS_SELECTOR, 'div.search-result'),
-            (By.XPATH, '//div[contains(@class, "result")]'),
-        ]
         
-        for selector_type, selector_value in selectors:
+        for selector_type, selector_value in JOB_CARD_SELECTORS:
             try:
                 job_cards = driver.find_elements(selector_type, selector_value)
                 if job_cards and len(job_cards) > 0:
@@ -255,7 +218,6 @@ class AngelOneScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(4)
             
             # Extract description
             try:
@@ -264,6 +226,7 @@ class AngelOneScraper:
                     (By.CSS_SELECTOR, 'div[class*="description"]'),
                     (By.XPATH, '//div[contains(@class, "description")]'),
                 ]
+                wait_for_selector(driver, desc_selectors, 4)
                 
                 for selector_type, selector_value in desc_selectors:
                     try:
@@ -279,7 +242,7 @@ class AngelOneScraper:
             # Close tab and return to search results
             driver.close()
             driver.switch_to.window(original_window)
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             
         except Exception as e:
             logger.error(f"Error fetching job details: {str(e)}")
@@ -1,21 +1,18 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('apple_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class AppleScraper:
     def __init__(self):
         self.company_name = 'Apple'
@@ -24,35 +21,6 @@ class AppleScraper:
         # Apple's internal location IDs and returns 0 results.
         self.url = 'https://jobs.apple.com/en-in/search'
 
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver_path = CHROMEDRIVER_PATH
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -67,7 +35,7 @@ class AppleScraper:
             logger.info(f"Starting scrape for {self.company_name}")
             logger.info(f"Target URL: {self.url}")
 
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
 
             wait = WebDriverWait(driver, 15)
@@ -86,7 +54,7 @@ class AppleScraper:
                 logger.info("Job links found via fallback selector")
 
             # Short wait for rendering to complete
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Log current URL and total results
             current_url = driver.current_url
@@ -120,7 +88,7 @@ class AppleScraper:
                         logger.info("No more pages available")
                         break
                     # Wait for the job list to update after page change
-                    time.sleep(2)
+                    wait_for_dom_stable(driver, 2)
                     try:
                         wait.until(EC.presence_of_element_located((
                             By.CSS_SELECTOR, '#search-job-list > li'
@@ -140,7 +108,7 @@ class AppleScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -158,14 +126,8 @@ class AppleScraper:
                 logger.info("Next page button is disabled - no more pages")
                 return False
 
-            # Record current first job title to detect page change
-            try:
-                first_job = driver.find_element(
-                    By.CSS_SELECTOR, '#search-job-list > li:first-child a.link-inline'
-                )
-                old_title = first_job.text.strip()
-            except Exception:
-                old_title = None
+            # Record the current result list to detect page change
+            signature = page_signature(driver, '#search-job-list > li')
 
             # Click the next page button
             driver.execute_script(
@@ -182,21 +144,11 @@ class AppleScraper:
             logger.info("Clicked next page button")
 
             # Poll for page content to change (faster than blind sleep)
-            if old_title:
-                for _ in range(20):
-                    time.sleep(0.3)
-                    try:
-                        new_first = driver.find_element(
-                            By.CSS_SELECTOR,
-                            '#search-job-list > li:first-child a.link-inline'
-                        )
-                        if new_first.text.strip() != old_title:
-                            logger.info("Page content changed - new page loaded")
-                            break
-                    except Exception:
-                        continue
+            if signature:
+                if wait_for_page_change(driver, '#search-job-list > li', signature, 6):
+                    logger.info("Page content changed - new page loaded")
             else:
-                time.sleep(3)
+                wait_for_dom_stable(driver, 3)
 
             return True
 
@@ -393,7 +345,6 @@ class AppleScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
 
             # Extract description
             try:
@@ -403,6 +354,7 @@ class AppleScraper:
                     (By.CSS_SELECTOR, '[class*="description"]'),
                     (By.CSS_SELECTOR, '[role="article"]'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
 
                 for selector_type, selector_value in desc_selectors:
                     try:
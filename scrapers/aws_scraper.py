@@ -1,68 +1,23 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('aws_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class AWSScraper:
     def __init__(self):
         self.company_name = 'AWS'
         self.url = 'https://www.amazon.jobs/en/search?offset=0&result_limit=10&sort=relevant&business_category%5B%5D=amazon-web-services&distanceType=Mi&radius=24km&latitude=&longitude=&loc_group_id=&loc_query=India&base_query=&city=&country=IND&region=&county=&query_options=&'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        try:
-            # Install and get the correct chromedriver path
-            driver_path = CHROMEDRIVER_PATH
-            logger.info(f"ChromeDriver installed at: {driver_path}")
-            
-            # Fix for macOS ARM - ensure we use the actual chromedriver binary
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-                    logger.info(f"Using corrected path: {driver_path}")
-            
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            })
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            # Fallback: try without service specification
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         # Use job ID + company name for stable external ID
@@ -76,7 +31,7 @@ class AWSScraper:
         
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
             
             # Smart wait for job content instead of blind sleep
@@ -86,7 +41,7 @@ class AWSScraper:
                 logger.info("Job content loaded")
             except:
                 logger.warning("Timeout waiting for job tiles, using fallback wait")
-                time.sleep(3)
+                wait_for_dom_stable(driver, 3)
             
             current_page = 1
             
@@ -116,7 +71,7 @@ class AWSScraper:
         
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         
         return jobs
     
@@ -140,24 +95,13 @@ class AWSScraper:
                     time.sleep(0.5)
 
                     # Capture current state for change detection
-                    old_first = driver.execute_script("""
-                        var card = document.querySelector('div.job-tile');
-                        return card ? card.innerText.substring(0, 50) : '';
-                    """)
+                    signature = page_signature(driver, 'div.job-tile')
 
                     next_button.click()
                     logger.info(f"Clicked next page button using selector: {selector_value}")
 
                     # Poll for content change
-                    for _ in range(20):
-                        time.sleep(0.2)
-                        new_first = driver.execute_script("""
-                            var card = document.querySelector('div.job-tile');
-                            return card ? card.innerText.substring(0, 50) : '';
-                        """)
-                        if new_first and new_first != old_first:
-                            break
-                    time.sleep(0.5)
+                    wait_for_page_change(driver, 'div.job-tile', signature, 4)
                     return True
                 except:
                     continue
@@ -182,7 +126,7 @@ class AWSScraper:
                     EC.presence_of_element_located((By.CSS_SELECTOR, 'div.job-tile'))
                 )
             except:
-                time.sleep(3)
+                wait_for_dom_stable(driver, 3)
             return True
                 
         except Exception as e:
@@ -359,7 +303,7 @@ class AWSScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
             
             # Extract description
             try:
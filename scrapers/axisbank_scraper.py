@@ -1,21 +1,36 @@
 # STATUS: PLATFORM_DOWN - Skillate platform (axisbank.skillate.com) timing out (tested 2026-02-22)
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, page_signature, wait_for_page_change, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('axisbank_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Skillate platform priority selectors, tried in order by _scrape_page
+JOB_CARD_SELECTORS = [
+    (By.CSS_SELECTOR, 'div.job-card'),
+    (By.CSS_SELECTOR, 'div[class*="job-listing"]'),
+    (By.CSS_SELECTOR, 'a[href*="/jobs/"]'),
+    (By.CSS_SELECTOR, 'div.job-title'),
+    (By.CSS_SELECTOR, 'div.job-details'),
+    (By.CSS_SELECTOR, '[class*="job-card"]'),
+    (By.CSS_SELECTOR, '[class*="jobCard"]'),
+    (By.CSS_SELECTOR, '[class*="job-listing"]'),
+    (By.CSS_SELECTOR, 'div[class*="job"]'),
+    (By.CSS_SELECTOR, 'div[class*="opening"]'),
+    (By.CSS_SELECTOR, 'div[class*="position"]'),
+    (By.CSS_SELECTOR, 'div[class*="vacancy"]'),
+    (By.CSS_SELECTOR, 'div[class*="result"]'),
+    (By.XPATH, '//div[contains(@class, "listing")]'),
+    (By.TAG_NAME, 'article'),
+]
 
 class AxisBankScraper:
     def __init__(self):
@@ -23,40 +38,6 @@ class AxisBankScraper:
         # Point to actual job listings, not the careers landing page
         self.url = 'https://axisbank.skillate.com/'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-        
-        driver = None
-        try:
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            logger.info(f"ChromeDriver started with: {CHROMEDRIVER_PATH}")
-        except Exception as e:
-            logger.warning(f"ChromeDriver with service failed: {e}")
-            try:
-                driver = webdriver.Chrome(options=chrome_options)
-                logger.info("Using default ChromeDriver")
-            except Exception as e2:
-                logger.error(f"All ChromeDriver attempts failed: {e2}")
-                raise
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -71,22 +52,22 @@ class AxisBankScraper:
         for attempt in range(max_retries):
           try:
             logger.info(f"Starting scrape for {self.company_name} (attempt {attempt + 1}/{max_retries})")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             try:
                 driver.get(self.url)
             except Exception as nav_err:
                 logger.warning(f"Navigation error: {nav_err}")
-                if driver:
-                    driver.quit()
+                # A slow load can still render its job cards; retry only if they never show up
+                if not wait_for_selector(driver, JOB_CARD_SELECTORS, 10):
+                    release_driver(driver)
                     driver = None
-                if attempt < max_retries - 1:
-                    time.sleep(5)
-                    continue
-                raise
+                    if attempt < max_retries - 1:
+                        continue
+                    raise
 
             short_wait = WebDriverWait(driver, 5)
-            time.sleep(15)  # Wait for Skillate SPA to load
+            wait_for_dom_stable(driver, 15)  # Wait for Skillate SPA to load
 
             try:
                 WebDriverWait(driver, 10).until(EC.presence_of_element_located((
@@ -101,16 +82,17 @@ class AxisBankScraper:
             while current_page <= max_pages:
                 logger.info(f"Scraping page {current_page} of {max_pages}")
 
-                page_jobs = self._scrape_page(driver, short_wait)
+                page_jobs = self._scrape_page(driver, short_wait, max_pages=max_pages)
                 jobs.extend(page_jobs)
                 
                 logger.info(f"Scraped {len(page_jobs)} jobs from page {current_page}")
                 
                 if current_page < max_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(3)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 3)
                 
                 current_page += 1
             
@@ -120,17 +102,17 @@ class AxisBankScraper:
           except Exception as e:
             logger.error(f"Error scraping {self.company_name} (attempt {attempt + 1}): {str(e)}")
             if driver:
-                driver.quit()
+                release_driver(driver)
                 driver = None
             if attempt < max_retries - 1:
-                logger.info("Retrying in 5 seconds...")
-                time.sleep(5)
+                # The next attempt's load waits on the job cards, so no fixed pause is needed
+                logger.info("Retrying with a fresh browser...")
             else:
                 raise
 
           finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 driver = None
 
         return jobs
@@ -151,7 +133,7 @@ class AxisBankScraper:
                 try:
                     next_button = driver.find_element(selector_type, selector_value)
                     driver.execute_script("arguments[0].scrollIntoView();", next_button)
-                    time.sleep(1)
+                    wait_for_dom_stable(driver, 1)
                     next_button.click()
                     logger.info(f"Clicked next page button")
                     return True
@@ -164,39 +146,18 @@ class AxisBankScraper:
             logger.error(f"Error navigating to next page: {str(e)}")
             return False
     
-    def _scrape_page(self, driver, wait):
+    def _scrape_page(self, driver, wait, max_pages=MAX_PAGES_TO_SCRAPE):
         """Scrape jobs from current page"""
         jobs = []
-        time.sleep(3)
+        wait_for_selector(driver, JOB_CARD_SELECTORS, 3)
 
         # Scroll to load dynamic content
-        for scroll_i in range(5):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+        scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        wait_for_dom_stable(driver, 2)
 
         job_cards = []
-        # Skillate platform priority selectors
-        selectors = [
-            (By.CSS_SELECTOR, 'div.job-card'),
-            (By.CSS_SELECTOR, 'div[class*="job-listing"]'),
-            (By.CSS_SELECTOR, 'a[href*="/jobs/"]'),
-            (By.CSS_SELECTOR, 'div.job-title'),
-            (By.CSS_SELECTOR, 'div.job-details'),
-            (By.CSS_SELECTOR, '[class*="job-card"]'),
-            (By.CSS_SELECTOR, '[class*="jobCard"]'),
-            (By.CSS_SELECTOR, '[class*="job-listing"]'),
-            (By.CSS_SELECTOR, 'div[class*="job"]'),
-            (By.CSS_SELECTOR, 'div[class*="opening"]'),
-            (By.CSS_SELECTOR, 'div[class*="position"]'),
-            (By.CSS_SELECTOR, 'div[class*="vacancy"]'),
-            (By.CSS_SELECTOR, 'div[class*="result"]'),
-            (By.XPATH, '//div[contains(@class, "listing")]'),
-            (By.TAG_NAME, 'article'),
-        ]
-
-        for selector_type, selector_value in selectors:
+        for selector_type, selector_value in JOB_CARD_SELECTORS:
             try:
                 elements = driver.find_elements(selector_type, selector_value)
                 if elements and len(elements) >= 1:
@@ -357,7 +318,6 @@ class AxisBankScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(3)
             
             try:
                 desc_selectors = [
@@ -365,6 +325,7 @@ class AxisBankScraper:
                     (By.XPATH, "//div[contains(@class, 'job-description')]"),
                     (By.CSS_SELECTOR, 'div.description'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
                 
                 for selector_type, selector_value in desc_selectors:
                     try:
@@ -1,60 +1,36 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, page_signature, wait_for_page_change, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('bajajauto_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job card locators _scrape_page tries, in order
+JOB_CARD_SELECTORS = [
+    (By.CSS_SELECTOR, 'div.job-card'),
+    (By.CSS_SELECTOR, 'div[class*="job"]'),
+    (By.CSS_SELECTOR, 'div[class*="career"]'),
+    (By.CSS_SELECTOR, 'div[class*="opening"]'),
+    (By.CSS_SELECTOR, 'div[class*="vacancy"]'),
+    (By.CSS_SELECTOR, 'div[class*="position"]'),
+    (By.XPATH, '//div[contains(@class, "listing")]'),
+    (By.CSS_SELECTOR, 'tr[class*="job"]'),
+    (By.CSS_SELECTOR, 'li[class*="job"]'),
+    (By.TAG_NAME, 'article'),
+]
 
 class BajajAutoScraper:
     def __init__(self):
         self.company_name = 'Bajaj Auto'
         self.url = 'https://www.bajajauto.com/career'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        
-        try:
-            driver_path = CHROMEDRIVER_PATH
-            logger.info(f"ChromeDriver installed at: {driver_path}")
-            
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-                    logger.info(f"Using corrected path: {driver_path}")
-            
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -67,27 +43,28 @@ class BajajAutoScraper:
         
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
             
             wait = WebDriverWait(driver, SCRAPE_TIMEOUT)
-            time.sleep(10)
+            wait_for_dom_stable(driver, 10)
 
             current_page = 1
             
             while current_page <= max_pages:
                 logger.info(f"Scraping page {current_page} of {max_pages}")
                 
-                page_jobs = self._scrape_page(driver, wait)
+                page_jobs = self._scrape_page(driver, wait, max_pages=max_pages)
                 jobs.extend(page_jobs)
                 
                 logger.info(f"Scraped {len(page_jobs)} jobs from page {current_page}")
                 
                 if current_page < max_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(3)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 3)
                 
                 current_page += 1
             
@@ -99,7 +76,7 @@ class BajajAutoScraper:
         
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         
         return jobs
     
@@ -119,7 +96,7 @@ class BajajAutoScraper:
                 try:
                     next_button = driver.find_element(selector_type, selector_value)
                     driver.execute_script("arguments[0].scrollIntoView();", next_button)
-                    time.sleep(1)
+                    wait_for_dom_stable(driver, 1)
                     next_button.click()
                     logger.info(f"Clicked next page button")
                     return True
@@ -132,33 +109,19 @@ class BajajAutoScraper:
             logger.error(f"Error navigating to next page: {str(e)}")
             return False
     
-    def _scrape_page(self, driver, wait):
+    def _scrape_page(self, driver, wait, max_pages=MAX_PAGES_TO_SCRAPE):
         """Scrape jobs from current page"""
         jobs = []
-        time.sleep(3)
+        wait_for_selector(driver, JOB_CARD_SELECTORS, 3)
 
         # Scroll to load dynamic content
-        for scroll_i in range(5):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+        scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        wait_for_dom_stable(driver, 2)
 
         job_cards = []
-        selectors = [
-            (By.CSS_SELECTOR, 'div.job-card'),
-            (By.CSS_SELECTOR, 'div[class*="job"]'),
-            (By.CSS_SELECTOR, 'div[class*="career"]'),
-            (By.CSS_SELECTOR, 'div[class*="opening"]'),
-            (By.CSS_SELECTOR, 'div[class*="vacancy"]'),
-            (By.CSS_SELECTOR, 'div[class*="position"]'),
-            (By.XPATH, '//div[contains(@class, "listing")]'),
-            (By.CSS_SELECTOR, 'tr[class*="job"]'),
-            (By.CSS_SELECTOR, 'li[class*="job"]'),
-            (By.TAG_NAME, 'article'),
-        ]
 
-        for selector_type, selector_value in selectors:
+        for selector_type, selector_value in JOB_CARD_SELECTORS:
             try:
                 wait.until(EC.presence_of_element_located((selector_type, selector_value)))
                 job_cards = driver.find_elements(selector_type, selector_value)
@@ -289,7 +252,6 @@ class BajajAutoScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(3)
             
             try:
                 desc_selectors = [
@@ -297,6 +259,7 @@ class BajajAutoScraper:
                     (By.XPATH, "//div[contains(@class, 'job-description')]"),
                     (By.CSS_SELECTOR, 'div.description'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
                 
                 for selector_type, selector_value in desc_selectors:
                     try:
@@ -1,9 +1,6 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from pathlib import Path
@@ -12,7 +9,9 @@ import stat
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('bookmyshow_scraper')
 
@@ -23,31 +22,6 @@ class BookMyShowScraper:
         # Trakstar Hire platform
         self.url = 'https://bookmyshow.hire.trakstar.com/'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        driver_path = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
-        try:
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -57,7 +31,7 @@ class BookMyShowScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
             driver.get(self.url)
 
@@ -68,8 +42,8 @@ class BookMyShowScraper:
                 )
                 logger.info("Found openings list container")
             except:
-                logger.warning("Timeout waiting for div.js-openings-list, falling back to short sleep")
-                time.sleep(5)
+                logger.warning("Timeout waiting for div.js-openings-list, falling back to DOM-idle wait")
+                wait_for_dom_stable(driver, 5)
 
             jobs = self._scrape_page(driver)
             all_jobs.extend(jobs)
@@ -81,7 +55,7 @@ class BookMyShowScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
     def _scrape_page(self, driver):
         jobs = []
@@ -359,7 +333,7 @@ class BookMyShowScraper:
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".job-description, [class*='description'], [class*='detail'], main"))
                 )
             except:
-                time.sleep(2)
+                wait_for_dom_stable(driver, 2)
 
             for sel in [".job-description", "[class*='description']", "[class*='detail']", "main"]:
                 try:
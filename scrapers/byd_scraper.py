@@ -1,22 +1,25 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 import re
 import os
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, page_signature, wait_for_page_change, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('byd_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _extract_jobs looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    'div[class*="job"], div[class*="career"], div[class*="opening"], div[class*="vacancy"], div[class*="position"], div.card, article',
+    'a[href*="/career"], a[href*="/job"], a[href*="/position"], a[href*="/opening"], a[href*="/vacancy"]',
+    'table tbody tr, table tr',
+]
 
 
 class BYDScraper:
@@ -25,32 +28,6 @@ class BYDScraper:
         self.url = 'https://bydautoindia.com/careers'
         self.base_url = 'https://bydautoindia.com'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -60,11 +37,11 @@ class BYDScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             short_wait = WebDriverWait(driver, 5)
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
             driver.get(self.url)
-            time.sleep(15)
+            wait_for_dom_stable(driver, 15)
 
             # Handle cookie consent if present
             try:
@@ -81,16 +58,14 @@ class BYDScraper:
                 """)
                 if cookie_btn:
                     logger.info("Accepted cookie consent")
-                    time.sleep(3)
+                    wait_for_dom_stable(driver, 3)
             except:
                 pass
 
             # Scroll to load lazy content
-            for i in range(5):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Check for iframes that might contain job listings
             iframes = driver.find_elements(By.TAG_NAME, 'iframe')
@@ -104,31 +79,30 @@ class BYDScraper:
                         if 'career' in src.lower() or 'job' in src.lower() or 'talent' in src.lower() or 'recruit' in src.lower():
                             driver.switch_to.frame(iframe)
                             logger.info("Switched to career iframe")
-                            time.sleep(5)
-                            for _ in range(3):
-                                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                time.sleep(2)
+                            wait_for_selector(driver, JOB_CARD_SELECTORS, 5)
+                            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
                             break
                     except:
                         continue
 
             for page in range(max_pages):
-                page_jobs = self._extract_jobs(driver)
+                page_jobs = self._extract_jobs(driver, max_pages=max_pages)
                 if not page_jobs:
                     break
                 all_jobs.extend(page_jobs)
                 logger.info(f"Page {page + 1}: {len(page_jobs)} jobs (total: {len(all_jobs)})")
 
+                signature = page_signature(driver, JOB_CARD_SELECTORS)
                 if not self._go_to_next_page(driver):
                     break
-                time.sleep(5)
+                wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 5)
 
             # If no jobs found in iframe, switch back and try main page
             if not all_jobs and iframes:
                 try:
                     driver.switch_to.default_content()
                     logger.info("Switched back to default content to retry")
-                    page_jobs = self._extract_jobs(driver)
+                    page_jobs = self._extract_jobs(driver, max_pages=max_pages)
                     if page_jobs:
                         all_jobs.extend(page_jobs)
                 except:
@@ -139,19 +113,17 @@ class BYDScraper:
             logger.error(f"Error: {str(e)}")
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         return all_jobs
 
-    def _extract_jobs(self, driver):
+    def _extract_jobs(self, driver, max_pages=MAX_PAGES_TO_SCRAPE):
         jobs = []
 
         try:
             # Scroll to ensure content is loaded
-            for _ in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             js_jobs = driver.execute_script("""
                 var results = [];
@@ -379,7 +351,7 @@ class BYDScraper:
     def _go_to_next_page(self, driver):
         try:
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             next_selectors = [
                 (By.CSS_SELECTOR, 'a[aria-label="Next"]'),
@@ -1,57 +1,22 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, page_signature, wait_for_page_change, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('colgatepalmolive_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class ColgatePalmoliveScraper:
     def __init__(self):
         self.company_name = 'Colgate-Palmolive'
         self.url = 'https://jobs.colgate.com/search-jobs'
     
-    def setup_driver(self):
-        """Set up Chrome driver with anti-detection options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            import os
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -64,9 +29,9 @@ class ColgatePalmoliveScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
-            time.sleep(10)
+            wait_for_dom_stable(driver, 10)
 
             current_url = driver.current_url
             logger.info(f"Landed on: {current_url}")
@@ -76,27 +41,28 @@ class ColgatePalmoliveScraper:
             if not has_nas:
                 logger.info("NAS container not found, navigating to View All Jobs page")
                 driver.get('https://jobs.colgate.com/go/View-All-Jobs/8506400/')
-                time.sleep(10)
+                wait_for_dom_stable(driver, 10)
                 logger.info(f"Redirected to: {driver.current_url}")
 
             wait = WebDriverWait(driver, SCRAPE_TIMEOUT)
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
 
             current_page = 1
             
             while current_page <= max_pages:
                 logger.info(f"Scraping page {current_page} of {max_pages}")
                 
-                page_jobs = self._scrape_page(driver, wait)
+                page_jobs = self._scrape_page(driver, wait, max_pages=max_pages)
                 jobs.extend(page_jobs)
                 
                 logger.info(f"Scraped {len(page_jobs)} jobs from page {current_page}")
                 
                 if current_page < max_pages:
+                    signature = page_signature(driver, 'a[href*="/job/"]')
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(3)
+                    wait_for_page_change(driver, 'a[href*="/job/"]', signature, 3)
                 
                 current_page += 1
             
@@ -108,7 +74,7 @@ class ColgatePalmoliveScraper:
         
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         
         return jobs
     
@@ -128,7 +94,7 @@ class ColgatePalmoliveScraper:
                 try:
                     next_button = driver.find_element(selector_type, selector_value)
                     driver.execute_script("arguments[0].scrollIntoView();", next_button)
-                    time.sleep(1)
+                    wait_for_dom_stable(driver, 1)
                     next_button.click()
                     logger.info(f"Clicked next page button")
                     return True
@@ -141,17 +107,15 @@ class ColgatePalmoliveScraper:
             logger.error(f"Error navigating to next page: {str(e)}")
             return False
     
-    def _scrape_page(self, driver, wait):
+    def _scrape_page(self, driver, wait, max_pages=MAX_PAGES_TO_SCRAPE):
         """Scrape jobs - tries NAS/Radancy first, then generic job link extraction"""
         jobs = []
-        time.sleep(3)
+        wait_for_selector(driver, 'a[href*="/job/"]', 3)
 
         # Scroll to load dynamic content
-        for scroll_i in range(3):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+        scroll_until_stable(driver, 'a[href*="/job/"]', max_items=max_pages * SCROLL_PAGE_SIZE)
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        wait_for_dom_stable(driver, 2)
 
         # Strategy 1: NAS/Radancy JS extraction
         js_jobs = driver.execute_script("""
@@ -264,7 +228,6 @@ class ColgatePalmoliveScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(3)
             
             try:
                 desc_selectors = [
@@ -272,6 +235,7 @@ class ColgatePalmoliveScraper:
                     (By.XPATH, "//div[contains(@class, 'job-description')]"),
                     (By.CSS_SELECTOR, 'div.description'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
                 
                 for selector_type, selector_value in desc_selectors:
                     try:
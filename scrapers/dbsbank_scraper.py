@@ -1,22 +1,18 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 import os
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, wait_for_selector, scroll_until_stable, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('dbsbank_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 
 class DBSBankScraper:
     def __init__(self):
@@ -24,32 +20,6 @@ class DBSBankScraper:
         self.url = 'https://www.dbs.com/careers/jobs.page?market=India'
         self.base_url = 'https://www.dbs.com'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -59,12 +29,12 @@ class DBSBankScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             # Step 1: Visit the main jobs page to get category links
             driver.get(self.url)
-            time.sleep(15)
+            wait_for_dom_stable(driver, 15)
 
             # Extract category page URLs from the main page
             # Each category has 3 links: empty (image), category name, "N Jobs" text
@@ -105,29 +75,18 @@ class DBSBankScraper:
                     logger.info(f"Scraping category: {cat_name} - {cat_url}")
                     try:
                         driver.get(cat_url)
-                        time.sleep(10)
-
-                        # Click "Load More" button repeatedly to load all jobs
-                        for load_attempt in range(50):  # Safety limit
-                            try:
-                                load_more_clicked = driver.execute_script("""
-                                    var btn = document.querySelector('button.loadmore, button[class*="loadmore"]');
-                                    if (btn && btn.offsetParent !== null) {
-                                        btn.scrollIntoView();
-                                        btn.click();
-                                        return true;
-                                    }
-                                    return false;
-                                """)
-                                if not load_more_clicked:
-                                    break
-                                time.sleep(3)
-                            except Exception:
-                                break
+                        wait_for_selector(driver, 'div.job', 10)
+
+                        # Click "Load More" until the category's job cards stop growing
+                        scroll_until_stable(
+                            driver, 'div.job',
+                            load_more_selector='button.loadmore, button[class*="loadmore"]', max_rounds=50,
+                            max_items=max_pages * SCROLL_PAGE_SIZE,
+                        )
 
                         # Scroll to ensure all content is visible
                         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(1)
+                        wait_for_dom_stable(driver, 1)
 
                         page_jobs = self._extract_jobs_from_page(driver, department=cat_name)
 
@@ -150,7 +109,7 @@ class DBSBankScraper:
             logger.error(f"Error: {str(e)}")
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         return all_jobs
 
     def _extract_jobs_from_page(self, driver, department=''):
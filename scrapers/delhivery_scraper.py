@@ -1,57 +1,22 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
-import os
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('delhivery_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class DelhiveryScraper:
     def __init__(self):
         self.company_name = 'Delhivery'
         self.url = 'https://www.delhivery.com/careers/'
 
-    def setup_driver(self):
-        """Set up Chrome driver with anti-detection options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -72,18 +37,18 @@ class DelhiveryScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # Strategy 1: Navigate to the careers landing page
             logger.info(f"Navigating to: {self.url}")
             driver.get(self.url)
-            time.sleep(12)
+            wait_for_dom_stable(driver, 12)
 
             # Check if we got a 404 or error page
             if self._check_if_error_page(driver):
                 logger.warning(f"Careers page at {self.url} returns 404/error - trying without trailing slash")
                 driver.get('https://www.delhivery.com/careers')
-                time.sleep(8)
+                wait_for_dom_stable(driver, 8)
 
             # Strategy 2: Look for the Darwinbox jobs link on the careers page
             darwinbox_url = None
@@ -104,7 +69,7 @@ class DelhiveryScraper:
             if darwinbox_url:
                 logger.info(f"Found Darwinbox careers link: {darwinbox_url}")
                 driver.get(darwinbox_url)
-                time.sleep(12)
+                wait_for_dom_stable(driver, 12)
 
                 # Check if we're on the careers home page and navigate to allJobs
                 current_url = driver.current_url
@@ -128,19 +93,17 @@ class DelhiveryScraper:
                     if all_jobs_url:
                         logger.info(f"Navigating to all jobs page: {all_jobs_url}")
                         driver.get(all_jobs_url)
-                        time.sleep(12)
+                        wait_for_dom_stable(driver, 12)
             else:
                 # Fallback: go directly to known Darwinbox URL
                 logger.info("No Darwinbox link found on careers page, trying direct URL")
                 driver.get('https://delhivery.darwinbox.in/ms/candidatev2/main/careers/allJobs')
-                time.sleep(12)
+                wait_for_selector(driver, 'div.job-tile, div.jobs-section', 12)
 
             # Scroll to load all job tiles
-            for i in range(5):
-                driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
-                time.sleep(2)
+            scroll_until_stable(driver, 'div.job-tile, div.jobs-section', max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script('window.scrollTo(0, 0);')
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Extract jobs from the Darwinbox page
             page_jobs = self._scrape_darwinbox_jobs(driver)
@@ -154,7 +117,7 @@ class DelhiveryScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -295,7 +258,7 @@ class DelhiveryScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
+            wait_for_selector(driver, 'div[class*="description"]', 3)
 
             try:
                 desc_elem = driver.find_element(By.CSS_SELECTOR, 'div[class*="description"]')
@@ -1,71 +1,22 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('deloitte_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class DeloitteScraper:
     def __init__(self):
         self.company_name = 'Deloitte'
         self.url = 'https://apply.deloitte.com/careers/SearchJobs/india'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        try:
-            # Install and get the correct chromedriver path
-            driver_path = CHROMEDRIVER_PATH
-            logger.info(f"ChromeDriver installed at: {driver_path}")
-            
-            # Fix for macOS ARM - ensure we use the actual chromedriver binary
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-                    logger.info(f"Using corrected path: {driver_path}")
-            
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-            # Hide automation indicators
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            # Fallback: try without service specification
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -78,7 +29,7 @@ class DeloitteScraper:
         
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
             
             # Wait for page to load - Deloitte page has dynamic loading
@@ -86,7 +37,7 @@ class DeloitteScraper:
             
             # Handle potential cookie consent or privacy popups
             try:
-                time.sleep(3)  # Wait for any popups to appear
+                wait_for_dom_stable(driver, 3)  # Wait for any popups to appear
                 # Try to close cookie/privacy popups
                 popup_close_selectors = [
                     'button[id*="accept"]',
@@ -101,7 +52,7 @@ class DeloitteScraper:
                         popup_btn = driver.find_element(By.CSS_SELECTOR, selector)
                         popup_btn.click()
                         logger.info(f"Closed popup using selector: {selector}")
-                        time.sleep(1)
+                        wait_for_dom_stable(driver, 1)
                         break
                     except:
                         continue
@@ -124,13 +75,13 @@ class DeloitteScraper:
             except:
                 logger.warning("Could not find job count indicator, but continuing...")
             
-            time.sleep(5)  # Additional wait for dynamic content to render
+            wait_for_dom_stable(driver, 5)  # Additional wait for dynamic content to render
             
             # Scroll page to trigger any lazy loading
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
             
             current_page = 1
             
@@ -145,10 +96,11 @@ class DeloitteScraper:
                 
                 # Try to navigate to next page
                 if current_page < max_pages:
+                    signature = page_signature(driver, 'article.article--result')
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(3)  # Wait for next page to load
+                    wait_for_page_change(driver, 'article.article--result', signature, 5)  # Wait for next page to load
                 
                 current_page += 1
             
@@ -160,7 +112,7 @@ class DeloitteScraper:
         
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         
         return jobs
     
@@ -183,14 +135,13 @@ class DeloitteScraper:
                     next_button = driver.find_element(selector_type, selector_value)
                     # Scroll to element
                     driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", next_button)
-                    time.sleep(1)
+                    wait_for_dom_stable(driver, 1)
                     # Try clicking with JavaScript if regular click fails
                     try:
                         next_button.click()
                     except:
                         driver.execute_script("arguments[0].click();", next_button)
                     logger.info(f"Clicked next page button using selector: {selector_value}")
-                    time.sleep(2)  # Wait for page to load
                     return True
                 except Exception as e:
                     logger.debug(f"Could not click with selector {selector_value}: {e}")
@@ -206,7 +157,7 @@ class DeloitteScraper:
     def _scrape_page(self, driver, wait):
         """Scrape jobs from current page"""
         jobs = []
-        time.sleep(3)  # Wait for page content to load
+        wait_for_dom_stable(driver, 3)  # Wait for page content to load
         
         try:
             # Wait for job results to appear - Deloitte uses article--result class
@@ -356,7 +307,6 @@ class DeloitteScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(3)
             
             # Extract description
             try:
@@ -365,6 +315,7 @@ class DeloitteScraper:
                     (By.XPATH, "//h2[contains(text(), 'Description')]/following-sibling::div"),
                     (By.CSS_SELECTOR, 'div.job-description'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
                 
                 for selector_type, selector_value in desc_selectors:
                     try:
@@ -1,21 +1,18 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('flipkart_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class FlipkartScraper:
     def __init__(self):
         self.company_name = 'Flipkart'
@@ -23,43 +20,6 @@ class FlipkartScraper:
         self.url = 'https://www.flipkartcareers.com/#!/job-listing'
         self.base_url = 'https://www.flipkartcareers.com'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        
-        try:
-            # Install and get the correct chromedriver path
-            driver_path = CHROMEDRIVER_PATH
-            logger.info(f"ChromeDriver installed at: {driver_path}")
-            
-            # Fix for macOS ARM - ensure we use the actual chromedriver binary
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-                    logger.info(f"Using corrected path: {driver_path}")
-            
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            # Fallback: try without service specification
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -72,7 +32,7 @@ class FlipkartScraper:
         
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             
             # Navigate to jobs page using direct URL (bypasses hash routing)
             logger.info(f"Navigating to {self.url}")
@@ -81,7 +41,7 @@ class FlipkartScraper:
             # Wait for page to load - Flipkart uses Angular SPA
             wait = WebDriverWait(driver, SCRAPE_TIMEOUT)
             logger.info("Waiting for Angular app to initialize...")
-            time.sleep(20)  # Angular SPA needs extra time for API calls
+            wait_for_dom_stable(driver, 20)  # Angular SPA needs extra time for API calls
             
             # Check current URL
             current_url = driver.current_url
@@ -92,7 +52,7 @@ class FlipkartScraper:
                 logger.info("Navigating to job listing view...")
                 try:
                     driver.execute_script("window.location.hash = '#!/job-listing'")
-                    time.sleep(5)
+                    wait_for_dom_stable(driver, 5)
                     current_url = driver.current_url
                     logger.info(f"URL after hash: {current_url}")
                 except Exception as e:
@@ -100,18 +60,14 @@ class FlipkartScraper:
             
             # Wait for Angular to finish loading and making API calls
             logger.info("Waiting for Angular to load jobs data (25 seconds)...")
-            time.sleep(25)  # Angular apps often need more time for API calls
+            wait_for_dom_stable(driver, 25)  # Angular apps often need more time for API calls
             
-            # Scroll to trigger any lazy loading - more aggressive
+            # Scroll to trigger any lazy loading (Flipkart's jobs are read from all links)
             logger.info("Scrolling to trigger content loading...")
-            for i in range(6):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                driver.execute_script(f"window.scrollTo(0, {i * 300});")
-                time.sleep(1)
+            scroll_until_stable(driver, max_items=max_pages * SCROLL_PAGE_SIZE)
             
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
             
             # Try clicking "View All" or "Show More" buttons
             try:
@@ -120,7 +76,7 @@ class FlipkartScraper:
                     try:
                         if btn.is_displayed():
                             btn.click()
-                            time.sleep(3)
+                            wait_for_dom_stable(driver, 3)
                             break
                     except:
                         pass
@@ -149,7 +105,7 @@ class FlipkartScraper:
                     # Scroll down to load more jobs
                     prev_height = driver.execute_script("return document.body.scrollHeight")
                     driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(3)
+                    wait_for_dom_stable(driver, 3)
                     new_height = driver.execute_script("return document.body.scrollHeight")
                     
                     # If height didn't change, try pagination
@@ -157,7 +113,7 @@ class FlipkartScraper:
                         if not self._go_to_next_page(driver, current_page):
                             logger.info("No more pages/content available")
                             break
-                        time.sleep(3)
+                        wait_for_dom_stable(driver, 3)
                 elif len(new_jobs) == 0:
                     logger.info("No new jobs found, ending scrape")
                     break
@@ -173,7 +129,7 @@ class FlipkartScraper:
         
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         
         return jobs
     
@@ -193,7 +149,7 @@ class FlipkartScraper:
                 try:
                     next_button = driver.find_element(selector_type, selector_value)
                     driver.execute_script("arguments[0].scrollIntoView();", next_button)
-                    time.sleep(1)
+                    wait_for_dom_stable(driver, 1)
                     next_button.click()
                     logger.info(f"Clicked next page button using selector: {selector_value}")
                     return True
@@ -215,7 +171,7 @@ class FlipkartScraper:
             logger.info(f"Current URL: {driver.current_url}")
             logger.info(f"Page title: {driver.title}")
             
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
             
             # STRATEGY 1: Extract from Angular/React data
             logger.info("Trying to extract from page data...")
@@ -584,7 +540,7 @@ class FlipkartScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(3)
+            wait_for_selector(driver, 'div[class*="description"]', 3)
             
             # Extract description
             try:
@@ -1,307 +0,0 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-import hashlib
-import time
-import os
-from datetime import datetime
-from pathlib import Path
-
-from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
-
-logger = setup_logger('godigit_scraper')
-
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
-
-class GoDigitScraper:
-    def __init__(self):
-        self.company_name = 'Go Digit Insurance'
-        self.url = 'https://godigit.darwinbox.in/ms/candidatev2/main/careers/allJobs'
-
-    def setup_driver(self):
-        """Set up Chrome driver with anti-detection options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
-    def generate_external_id(self, job_id, company):
-        """Generate stable external ID"""
-        unique_string = f"{company}_{job_id}"
-        return hashlib.md5(unique_string.encode()).hexdigest()
-
-    def _wait_for_angular_jobs(self, driver, timeout=30):
-        """Poll-based wait for DarwinBox v2 Angular app to render job elements"""
-        logger.info("Waiting for Angular app to render job elements...")
-        start = time.time()
-        while time.time() - start < timeout:
-            count = driver.execute_script("""
-                var links = document.querySelectorAll('a[href*="jobDetails"]');
-                if (links.length > 0) return links.length;
-                // Also check for any job-related containers
-                var tiles = document.querySelectorAll('div.job-tile, div[class*="job-card"], div[class*="job-item"], div[class*="job-listing"]');
-                if (tiles.length > 0) return tiles.length;
-                return 0;
-            """)
-            if count and count > 0:
-                logger.info(f"Found {count} job elements after {time.time() - start:.1f}s")
-                return True
-            time.sleep(2)
-        logger.warning(f"No job elements found after {timeout}s polling")
-        return False
-
-    def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
-        """Scrape jobs from Go Digit Insurance DarwinBox careers page"""
-        jobs = []
-        driver = None
-
-        try:
-            logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
-
-            # Load the allJobs page directly
-            logger.info(f"Navigating to: {self.url}")
-            driver.get(self.url)
-
-            # Wait for document.readyState to be complete
-            for _ in range(10):
-                ready = driver.execute_script("return document.readyState")
-                if ready == 'complete':
-                    break
-                time.sleep(1)
-
-            # Initial sleep for Angular bootstrap
-            time.sleep(8)
-
-            # Poll-based wait for job elements to render
-            self._wait_for_angular_jobs(driver, timeout=30)
-
-            # Scroll to load all job tiles
-            for i in range(5):
-                driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
-                time.sleep(2)
-            driver.execute_script('window.scrollTo(0, 0);')
-            time.sleep(2)
-
-            # Extract jobs
-            page_jobs = self._scrape_darwinbox_jobs(driver)
-            jobs.extend(page_jobs)
-
-            logger.info(f"Successfully scraped {len(jobs)} total jobs from {self.company_name}")
-
-        except Exception as e:
-            logger.error(f"Error scraping {self.company_name}: {str(e)}")
-            raise
-
-        finally:
-            if driver:
-                driver.quit()
-
-        return jobs
-
-    def _scrape_darwinbox_jobs(self, driver):
-        """Extract jobs from the DarwinBox allJobs page using JavaScript"""
-        jobs = []
-
-        try:
-            js_jobs = driver.execute_script("""
-                var results = [];
-                var seen = {};
-
-                // DarwinBox v2: find all a[href*="jobDetails"] links
-                var jobLinks = document.querySelectorAll('a[href*="jobDetails"]');
-                for (var i = 0; i < jobLinks.length; i++) {
-                    var link = jobLinks[i];
-                    var href = link.href || '';
-                    if (seen[href]) continue;
-                    seen[href] = true;
-
-                    // Get the closest container for context
-                    var container = link.closest('div[class]') || link.parentElement;
-                    var text = (container ? container.innerText : link.innerText || '').trim();
-                    var lines = text.split('\\n');
-                    var title = lines[0].trim();
-
-                    if (title.length < 3 || title === 'View and Apply' || title === 'Apply') continue;
-
-                    var location = '';
-                    var experience = '';
-                    var employment_type = '';
-                    for (var j = 0; j < lines.length; j++) {
-                        var line = lines[j].trim();
-                        if (line.match(/India|Haryana|Gujarat|Maharashtra|Karnataka|Goa|Delhi|Tamil Nadu|Rajasthan|Odisha|Jharkhand|Chhattisgarh|Andhra Pradesh|Telangana|Kerala|Punjab|West Bengal|Uttar Pradesh|Bengaluru|Bangalore|Mumbai|Chennai|Hyderabad|Pune|Gurgaon|Noida|Kolkata/i)) {
-                            location = line;
-                        }
-                        if (line.match(/\\d+.*[Yy]ears?/) || line.match(/[Yy]ears?.*\\d+/)) {
-                            experience = line;
-                        }
-                        if (line === 'Permanent' || line === 'Contract' || line === 'Probation' || line === 'Intern' || line === 'Full Time' || line === 'Part Time') {
-                            employment_type = line;
-                        }
-                    }
-
-                    results.push({
-                        title: title,
-                        url: href,
-                        location: location,
-                        experience: experience,
-                        employment_type: employment_type
-                    });
-                }
-
-                // Fallback: try tile-based selectors
-                if (results.length === 0) {
-                    var tiles = document.querySelectorAll('div.job-tile, div[class*="job-card"], div[class*="job-item"], div[class*="job-listing"]');
-                    for (var i = 0; i < tiles.length; i++) {
-                        var tile = tiles[i];
-                        var text = (tile.innerText || '').trim();
-                        if (text.length < 5) continue;
-                        var titleEl = tile.querySelector('span.job-title, .title-section, h3, h4, [class*="title"]');
-                        var title = titleEl ? titleEl.innerText.trim() : text.split('\\n')[0].trim();
-                        var linkEl = tile.querySelector('a[href*="jobDetails"]');
-                        var url = linkEl ? linkEl.href : '';
-                        if (title.length >= 3 && title !== 'View and Apply' && !seen[url || title]) {
-                            seen[url || title] = true;
-                            results.push({title: title, url: url, location: '', experience: '', employment_type: ''});
-                        }
-                    }
-                }
-
-                // Fallback 2: v1 pattern - /ms/candidate/careers/{hash}
-                if (results.length === 0) {
-                    var allLinks = document.querySelectorAll('a[href]');
-                    for (var i = 0; i < allLinks.length; i++) {
-                        var link = allLinks[i];
-                        var href = link.href || '';
-                        var match = href.match(/\\/ms\\/candidate\\/careers\\/([a-f0-9]{10,})/);
-                        if (!match) continue;
-                        if (href.includes('/others')) continue;
-                        var title = (link.innerText || '').trim().split('\\n')[0].trim();
-                        if (title.length < 3 || title === 'View and Apply' || title === 'Apply') continue;
-                        if (seen[href]) continue;
-                        seen[href] = true;
-                        results.push({title: title, url: href, location: '', experience: '', employment_type: ''});
-                    }
-                }
-
-                return results;
-            """)
-
-            if js_jobs:
-                logger.info(f"DarwinBox extraction found {len(js_jobs)} jobs")
-                seen_urls = set()
-                for idx, job_data in enumerate(js_jobs):
-                    title = job_data.get('title', '')
-                    url = job_data.get('url', '')
-                    location = job_data.get('location', '')
-                    experience = job_data.get('experience', '')
-                    employment_type = job_data.get('employment_type', '')
-
-                    if not title:
-                        continue
-                    if url and url in seen_urls:
-                        continue
-                    if url:
-                        seen_urls.add(url)
-
-                    city, state, _ = self.parse_location(location)
-
-                    job_id = f"godigit_{idx}"
-                    if url and 'jobDetails/' in url:
-                        job_id = url.split('jobDetails/')[-1].split('?')[0]
-                    elif url:
-                        job_id = hashlib.md5(url.encode()).hexdigest()[:12]
-
-                    jobs.append({
-                        'external_id': self.generate_external_id(job_id, self.company_name),
-                        'company_name': self.company_name,
-                        'title': title,
-                        'description': '',
-                        'location': location,
-                        'city': city,
-                        'state': state,
-                        'country': 'India',
-                        'employment_type': employment_type,
-                        'department': '',
-                        'apply_url': url if url else self.url,
-                        'posted_date': '',
-                        'job_function': '',
-                        'experience_level': experience,
-                        'salary_range': '',
-                        'remote_type': '',
-                        'status': 'active'
-                    })
-            else:
-                logger.warning("No job tiles found on DarwinBox page")
-                try:
-                    body_text = driver.execute_script('return document.body ? document.body.innerText.substring(0, 500) : ""')
-                    logger.info(f"Page body preview: {body_text}")
-                except:
-                    pass
-
-        except Exception as e:
-            logger.error(f"DarwinBox extraction error: {str(e)}")
-
-        return jobs
-
-    def parse_location(self, location_str):
-        """Parse location string into city, state, country"""
-        if not location_str:
-            return '', '', 'India'
-
-        parts = [p.strip() for p in location_str.split(',')]
-
-        city = ''
-        state = ''
-        for part in parts:
-            part_clean = part.strip()
-            if part_clean == 'India':
-                continue
-            if '#' in part_clean or '_' in part_clean:
-                if '(' in part_clean and ')' in part_clean:
-                    state = part_clean.split('(')[-1].split(')')[0].strip()
-                continue
-            if '..+' in part_clean:
-                continue
-            if not city:
-                city = part_clean
-            elif not state:
-                state = part_clean
-
-        return city, state, 'India'
-
-
-if __name__ == '__main__':
-    scraper = GoDigitScraper()
-    results = scraper.scrape()
-    print(f"Scraped {len(results)} jobs from {scraper.company_name}")
-    for job in results[:5]:
-        print(f"  - {job['title']} | {job['location']} | {job['apply_url']}")
@@ -1,54 +1,22 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('godrejgroup_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class GodrejGroupScraper:
     def __init__(self):
         self.company_name = 'Godrej Group'
         self.url = 'https://www.godrej.com/careers'
 
-    def setup_driver(self):
-        """Set up Chrome driver with anti-detection"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -66,12 +34,12 @@ class GodrejGroupScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # The godrej.com/careers page links to godrejenterprises.com which has actual job listings
             # Navigate directly to the openings page
             driver.get(self.url)
-            time.sleep(12)
+            wait_for_dom_stable(driver, 12)
 
             # Look for link to Godrej Enterprises (where actual jobs are)
             enterprises_url = 'https://www.godrejenterprises.com/about-us/careers/openings'
@@ -87,14 +55,12 @@ class GodrejGroupScraper:
 
             logger.info(f"Navigating to job listings: {enterprises_url}")
             driver.get(enterprises_url)
-            time.sleep(15)
+            wait_for_selector(driver, 'table tr', 15)
 
             # Scroll to load all content
-            for i in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, 'table tr', max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Try clicking "See all" button to load all jobs
             try:
@@ -102,7 +68,7 @@ class GodrejGroupScraper:
                 if see_all:
                     driver.execute_script("arguments[0].click();", see_all[0])
                     logger.info("Clicked 'See all' button")
-                    time.sleep(3)
+                    wait_for_dom_stable(driver, 3)
             except Exception as e:
                 logger.debug(f"No 'See all' button: {e}")
 
@@ -117,7 +83,7 @@ class GodrejGroupScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
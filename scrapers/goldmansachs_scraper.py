@@ -4,6 +4,7 @@ from pathlib import Path
 
 
 from core.logging import setup_logger
+from core.http_client import http_post
 from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('goldmansachs_scraper')
@@ -96,7 +97,7 @@ class GoldmanSachsScraper:
                     }
 
                     try:
-                        response = requests.post(
+                        response = http_post(
                             self._api_url,
                             headers=headers,
                             json={
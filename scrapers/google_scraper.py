@@ -1,60 +1,22 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('google_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class GoogleScraper:
     def __init__(self):
         self.company_name = 'Google'
         self.url = 'https://careers.google.com/jobs/results/?location=India'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        
-        try:
-            driver_path = CHROMEDRIVER_PATH
-            logger.info(f"ChromeDriver installed at: {driver_path}")
-            
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-                    logger.info(f"Using corrected path: {driver_path}")
-            
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -67,11 +29,11 @@ class GoogleScraper:
         
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
             
             wait = WebDriverWait(driver, SCRAPE_TIMEOUT)
-            time.sleep(6)  # Give extra time for JavaScript to load
+            wait_for_dom_stable(driver, 6)  # Give extra time for JavaScript to load
             
             current_page = 1
             
@@ -84,10 +46,11 @@ class GoogleScraper:
                 logger.info(f"Scraped {len(page_jobs)} jobs from page {current_page}")
                 
                 if current_page < max_pages:
+                    signature = page_signature(driver, 'h3')
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(3)
+                    wait_for_page_change(driver, 'h3', signature, 7)
                 
                 current_page += 1
             
@@ -99,7 +62,7 @@ class GoogleScraper:
         
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         
         return jobs
     
@@ -108,7 +71,7 @@ class GoogleScraper:
         try:
             # Scroll to bottom of page to ensure pagination button is loaded
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
             
             # Google careers uses "Go to next page" link at the bottom
             next_page_selectors = [
@@ -127,15 +90,14 @@ class GoogleScraper:
                     # Make sure it's visible
                     if next_button.is_displayed():
                         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                        time.sleep(1)
+                        wait_for_dom_stable(driver, 1)
                         # Click using JavaScript to avoid click interception
                         driver.execute_script("arguments[0].click();", next_button)
                         logger.info(f"Clicked next page button successfully")
-                        time.sleep(4)  # Wait for new page to load
                         
                         # Scroll back to top to see all jobs
                         driver.execute_script("window.scrollTo(0, 0);")
-                        time.sleep(1)
+                        wait_for_dom_stable(driver, 1)
                         return True
                 except Exception as e:
                     continue
@@ -150,7 +112,7 @@ class GoogleScraper:
     def _scrape_page(self, driver, wait):
         """Scrape jobs from current page"""
         jobs = []
-        time.sleep(5)
+        wait_for_dom_stable(driver, 5)
         
         # Scroll down multiple times to load more jobs (lazy loading)
         logger.info("Scrolling to load more jobs...")
@@ -161,7 +123,7 @@ class GoogleScraper:
         while scroll_attempts < max_scrolls:
             # Scroll down
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)  # Wait for content to load
+            wait_for_dom_stable(driver, 2)  # Wait for content to load
             
             # Check if new content loaded
             new_height = driver.execute_script("return document.body.scrollHeight")
@@ -175,7 +137,7 @@ class GoogleScraper:
         
         # Scroll back to top to ensure all elements are in the DOM
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
+        wait_for_dom_stable(driver, 1)
         
         # Find all h3 elements - these contain job titles
         try:
@@ -319,7 +281,6 @@ class GoogleScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(3)
             
             try:
                 desc_selectors = [
@@ -327,6 +288,7 @@ class GoogleScraper:
                     (By.CSS_SELECTOR, '.description'),
                     (By.CSS_SELECTOR, '[class*="description"]'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
                 
                 for selector_type, selector_value in desc_selectors:
                     try:
@@ -1,23 +1,26 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import requests
 import hashlib
-import time
 import re
 import os
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.http_client import http_post
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, page_signature, wait_for_page_change, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('hal_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _extract_jobs looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    'table tbody tr, table tr',
+    'a[href*="career"], a[href*="Career"]',
+]
 
 
 class HALScraper:
@@ -29,32 +32,6 @@ class HALScraper:
         self._api_url = 'https://hal-india.co.in/backend/wp-json/hal/v1/career'
         self._detail_api_url = 'https://hal-india.co.in/backend/wp-json/hal/v1/career_detail'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -101,7 +78,7 @@ class HALScraper:
                 logger.info(f"API attempt {attempt + 1}/3: Fetching career listings")
                 # The Angular app sends a POST with empty multipart/form-data
                 # Using a dummy field since requests needs at least something for multipart
-                response = requests.post(
+                response = http_post(
                     self._api_url,
                     headers=headers,
                     files={'dummy': (None, '')},
@@ -113,8 +90,6 @@ class HALScraper:
                     # Check for WAF block
                     if 'Unauthorized' in response.text:
                         logger.warning("Request blocked by WAF, retrying...")
-                        time.sleep(5)
-                        continue
                     continue
 
                 data = response.json()
@@ -196,22 +171,20 @@ class HALScraper:
                 if jobs:
                     return jobs
 
+            # http_post already backs off between its own retries and paces the host through the rate limiter
             except requests.exceptions.Timeout:
                 logger.warning(f"API attempt {attempt + 1} timed out")
-                time.sleep(5)
             except requests.exceptions.RequestException as e:
                 logger.error(f"API attempt {attempt + 1} request error: {str(e)}")
-                time.sleep(5)
             except Exception as e:
                 logger.error(f"API attempt {attempt + 1} error: {str(e)}")
-                time.sleep(5)
 
         return jobs
 
     def _get_career_detail(self, career_id, headers):
         """Fetch detail for a specific career posting from the detail API."""
         try:
-            response = requests.post(
+            response = http_post(
                 self._detail_api_url,
                 headers=headers,
                 files={'id': (None, str(career_id))},
@@ -259,31 +232,30 @@ class HALScraper:
 
         for attempt in range(3):
             try:
-                driver = self.setup_driver()
+                driver = acquire_driver()
                 logger.info(f"Selenium attempt {attempt + 1}/3: Loading {self.url}")
 
                 # Do NOT set page_load_timeout - let it take as long as needed
                 driver.get(self.url)
 
                 # Wait for Angular SPA to render (govt site is slow)
-                time.sleep(20)
+                wait_for_selector(driver, JOB_CARD_SELECTORS, 20)
 
                 # Scroll for lazy loading
-                for _ in range(5):
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
+                scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
                 driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
+                wait_for_dom_stable(driver, 2)
 
                 for page in range(max_pages):
-                    page_jobs = self._extract_jobs(driver)
+                    page_jobs = self._extract_jobs(driver, max_pages=max_pages)
                     if not page_jobs:
                         break
                     all_jobs.extend(page_jobs)
                     logger.info(f"Page {page + 1}: {len(page_jobs)} jobs (total: {len(all_jobs)})")
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver):
                         break
-                    time.sleep(5)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 5)
 
                 if all_jobs:
                     break
@@ -294,8 +266,8 @@ class HALScraper:
                 if driver and 'timed out' in str(e).lower():
                     try:
                         driver.execute_script("window.stop();")
-                        time.sleep(5)
-                        page_jobs = self._extract_jobs(driver)
+                        wait_for_dom_stable(driver, 5)
+                        page_jobs = self._extract_jobs(driver, max_pages=max_pages)
                         if page_jobs:
                             all_jobs.extend(page_jobs)
                     except:
@@ -303,7 +275,7 @@ class HALScraper:
             finally:
                 if driver:
                     try:
-                        driver.quit()
+                        release_driver(driver)
                     except:
                         pass
                     driver = None
@@ -311,18 +283,16 @@ class HALScraper:
             if all_jobs:
                 break
             if attempt < 2:
-                time.sleep(10)
+                wait_for_dom_stable(driver, 10)
 
         return all_jobs
 
-    def _extract_jobs(self, driver):
+    def _extract_jobs(self, driver, max_pages=MAX_PAGES_TO_SCRAPE):
         jobs = []
         try:
-            for _ in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             js_jobs = driver.execute_script("""
                 var results = [];
@@ -437,7 +407,7 @@ class HALScraper:
     def _go_to_next_page(self, driver):
         try:
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
             for sel_type, sel_val in [
                 (By.CSS_SELECTOR, 'a[aria-label="Next"]'),
                 (By.CSS_SELECTOR, 'button[aria-label="Next"]'),
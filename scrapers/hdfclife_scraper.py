@@ -1,21 +1,24 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 import os
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, wait_for_count_stable, page_signature, wait_for_page_change, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('hdfclife_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _extract_jobs looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    '.main-job-card-list',
+    '.fit-page-card > div, .job-card > div',
+    'a[href*="find-your-fit"], a[href*="career"], a[href*="job"]',
+]
 
 
 class HDFCLifeScraper:
@@ -24,32 +27,6 @@ class HDFCLifeScraper:
         self.url = 'https://www.hdfclife.com/hdfc-careers/'
         self.base_url = 'https://www.hdfclife.com'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -58,33 +35,24 @@ class HDFCLifeScraper:
         driver = None
         all_jobs = []
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             # The main careers page only has department categories (Sales, Operations, Technology, Support).
             # Actual job listings are loaded dynamically on the find-your-fit.html page via encrypted API calls.
             # We navigate directly to find-your-fit.html which triggers JS to load all open requisitions.
             fit_url = self.url.rstrip('/') + '/find-your-fit.html'
             logger.info(f"Starting {self.company_name} scraping from {fit_url}")
             driver.get(fit_url)
-            time.sleep(15)
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 15)
 
             # Scroll to trigger lazy loading and allow JS to fully render job cards
-            for _ in range(5):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
 
             # Wait for job cards to appear (the page loads them via encrypted API)
             # The JS renders .main-job-card-list divs for each job
-            for attempt in range(6):
-                card_count = driver.execute_script(
-                    "return document.querySelectorAll('.main-job-card-list').length;"
-                )
-                if card_count > 0:
-                    logger.info(f"Found {card_count} job cards after {(attempt+1)*3}s wait")
-                    break
-                logger.info(f"Waiting for job cards to load... attempt {attempt+1}")
-                time.sleep(3)
+            card_count = wait_for_count_stable(driver, '.main-job-card-list', timeout=18)
+            logger.info(f"Found {card_count} job cards")
 
             # Also try clicking each job role tab to load all categories
             try:
@@ -96,9 +64,10 @@ class HDFCLifeScraper:
                             tab_text = tab.text.strip()
                             if not tab_text or 'Front Line Sales' in tab_text:
                                 continue
+                            signature = page_signature(driver, JOB_CARD_SELECTORS)
                             driver.execute_script("arguments[0].click();", tab)
-                            time.sleep(5)
-                            page_jobs = self._extract_jobs(driver)
+                            wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 5)
+                            page_jobs = self._extract_jobs(driver, max_pages=max_pages)
                             if page_jobs:
                                 all_jobs.extend(page_jobs)
                                 logger.info(f"Tab '{tab_text}': {len(page_jobs)} jobs (total: {len(all_jobs)})")
@@ -110,7 +79,7 @@ class HDFCLifeScraper:
 
             # If no tabs found or tabs didn't work, extract from current page
             if not all_jobs:
-                page_jobs = self._extract_jobs(driver)
+                page_jobs = self._extract_jobs(driver, max_pages=max_pages)
                 if page_jobs:
                     all_jobs.extend(page_jobs)
                     logger.info(f"Extracted {len(page_jobs)} jobs from main page")
@@ -129,18 +98,16 @@ class HDFCLifeScraper:
             logger.error(f"Error: {str(e)}")
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         return all_jobs
 
-    def _extract_jobs(self, driver):
+    def _extract_jobs(self, driver, max_pages=MAX_PAGES_TO_SCRAPE):
         jobs = []
         try:
             # Scroll to load all lazy content
-            for _ in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             js_jobs = driver.execute_script("""
                 var results = [];
@@ -1,20 +1,30 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.http_cache import ListingUnchanged
+from core.waits import wait_for_dom_stable, scroll_until_stable, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from scrapers.platforms.oracle_hcm import oracle_hcm_scraper
 
 logger = setup_logger('hexaware_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job card locators _scrape_page tries, in order
+JOB_CARD_SELECTORS = [
+    "a[class*='job-card']",
+    "div[class*='job-card']",
+    "a[href*='/job/']",
+    "[data-route*='job']",
+    "[role='listitem']",
+    "li[class*='job-card']",
+    "[class*='requisition']",
+    "[class*='search-result']",
+]
 
 
 class HexawareTechnologiesScraper:
@@ -23,49 +33,39 @@ class HexawareTechnologiesScraper:
         self.url = 'https://jobs.hexaware.com/#en/sites/CX_1/jobs?mode=location'
         self.job_detail_base_url = 'https://jobs.hexaware.com/#en/sites/CX_1/job'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
 
     def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        # Primary method: Candidate Experience REST API
+        try:
+            api_jobs = oracle_hcm_scraper('hexaware')().scrape(max_pages)
+            if api_jobs:
+                logger.info(f"API method returned {len(api_jobs)} jobs")
+                return api_jobs
+            logger.warning("API method returned 0 jobs, falling back to Selenium")
+        except ListingUnchanged:
+            raise
+        except Exception as e:
+            logger.warning(f"API method failed: {str(e)}, falling back to Selenium")
+
+        # Fallback: Selenium-based scraping
+        return self._scrape_via_selenium(max_pages)
+
+    def _scrape_via_selenium(self, max_pages=MAX_PAGES_TO_SCRAPE):
         """Scrape jobs from Hexaware Technologies Oracle HCM Candidate Experience via Selenium"""
         driver = None
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
             driver.get(self.url)
 
             # Oracle HCM CX is a heavy SPA - needs generous initial wait
-            time.sleep(15)
+            wait_for_dom_stable(driver, 15)
 
             wait = WebDriverWait(driver, 10)
             short_wait = WebDriverWait(driver, 5)
@@ -83,7 +83,7 @@ class HexawareTechnologiesScraper:
                 logger.warning("Timeout waiting for Oracle HCM listings, proceeding anyway")
 
             # Scrape first page
-            jobs = self._scrape_page(driver, short_wait)
+            jobs = self._scrape_page(driver, short_wait, max_pages=max_pages)
             all_jobs.extend(jobs)
 
             # Pagination - Oracle HCM uses "Show More" or numbered pages
@@ -117,12 +117,12 @@ class HexawareTechnologiesScraper:
                             break
 
                         driver.execute_script("arguments[0].scrollIntoView();", show_more)
-                        time.sleep(1)
+                        wait_for_dom_stable(driver, 1)
                         driver.execute_script("arguments[0].click();", show_more)
                         logger.info(f"Clicked show more/next for page {page}")
-                        time.sleep(5)
+                        wait_for_dom_stable(driver, 5)
 
-                        new_jobs = self._scrape_page(driver, short_wait)
+                        new_jobs = self._scrape_page(driver, short_wait, max_pages=max_pages)
                         existing_ids = {j['external_id'] for j in all_jobs}
                         new_unique = [j for j in new_jobs if j['external_id'] not in existing_ids]
                         if not new_unique:
@@ -141,20 +141,18 @@ class HexawareTechnologiesScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
-    def _scrape_page(self, driver, wait):
+    def _scrape_page(self, driver, wait, max_pages=MAX_PAGES_TO_SCRAPE):
         """Extract jobs from the current page using multiple strategies"""
         jobs = []
         scraped_ids = set()
 
         try:
             # Scroll to load dynamic/lazy content
-            for _ in range(5):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Strategy 1: Oracle HCM - span.job-tile__title (primary selector)
             job_titles = []
@@ -329,17 +327,7 @@ class HexawareTechnologiesScraper:
 
             # Strategy 4: a[class*="job-card"] or div[class*="job-card"]
             job_cards = []
-            card_selectors = [
-                "a[class*='job-card']",
-                "div[class*='job-card']",
-                "a[href*='/job/']",
-                "[data-route*='job']",
-                "[role='listitem']",
-                "li[class*='job-card']",
-                "[class*='requisition']",
-                "[class*='search-result']",
-            ]
-            for selector in card_selectors:
+            for selector in JOB_CARD_SELECTORS:
                 try:
                     elements = driver.find_elements(By.CSS_SELECTOR, selector)
                     if elements:
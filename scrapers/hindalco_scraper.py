@@ -1,20 +1,19 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('hindalco_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _scrape_page_js looks for them, in its fallback order
+JOB_CARD_SELECTORS = ['.result-card', 'a[href*="/job-search/job-details/"]']
 
 class HindalcoScraper:
     def __init__(self):
@@ -22,35 +21,6 @@ class HindalcoScraper:
         # Hindalco jobs are listed on Aditya Birla Group's careers portal under Metals
         self.url = 'https://careers.adityabirla.com/nf-metals'
 
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver_path = CHROMEDRIVER_PATH
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -67,28 +37,26 @@ class HindalcoScraper:
         for attempt in range(max_retries):
           try:
             logger.info(f"Starting scrape for {self.company_name} (attempt {attempt + 1}/{max_retries})")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             try:
                 driver.get(self.url)
             except Exception as nav_err:
                 logger.warning(f"Navigation error: {nav_err}")
-                if driver:
-                    driver.quit()
+                # A slow load can still render its job cards; retry only if they never show up
+                if not wait_for_selector(driver, JOB_CARD_SELECTORS, 10):
+                    release_driver(driver)
                     driver = None
-                if attempt < max_retries - 1:
-                    time.sleep(5)
-                    continue
-                raise
+                    if attempt < max_retries - 1:
+                        continue
+                    raise
 
-            time.sleep(15)
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 15)
 
             # Scroll to trigger lazy-loaded content
-            for scroll_i in range(5):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight * %s);" % str((scroll_i + 1) / 5))
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Scrape jobs from the Metals page
             page_jobs = self._scrape_page_js(driver)
@@ -98,12 +66,10 @@ class HindalcoScraper:
             if not jobs:
                 logger.info("No jobs on metals page, trying general job-search page")
                 driver.get(job_search_url)
-                time.sleep(15)
-                for scroll_i in range(3):
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight * %s);" % str((scroll_i + 1) / 3))
-                    time.sleep(2)
+                wait_for_selector(driver, JOB_CARD_SELECTORS, 15)
+                scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
                 driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
+                wait_for_dom_stable(driver, 2)
                 search_jobs = self._scrape_page_js(driver)
                 jobs.extend(search_jobs)
 
@@ -113,17 +79,17 @@ class HindalcoScraper:
           except Exception as e:
             logger.error(f"Error scraping {self.company_name} (attempt {attempt + 1}): {str(e)}")
             if driver:
-                driver.quit()
+                release_driver(driver)
                 driver = None
             if attempt < max_retries - 1:
-                logger.info("Retrying in 5 seconds...")
-                time.sleep(5)
+                # The next attempt's load waits on the job cards, so no fixed pause is needed
+                logger.info("Retrying with a fresh browser...")
             else:
                 raise
 
           finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 driver = None
 
         return jobs
@@ -131,7 +97,7 @@ class HindalcoScraper:
     def _scrape_page_js(self, driver):
         """Scrape jobs using JavaScript extraction - same pattern as Aditya Birla portal"""
         jobs = []
-        time.sleep(3)
+        wait_for_dom_stable(driver, 3)
 
         try:
             # Extract job data - links have pattern /job-search/job-details/ABG{ID}
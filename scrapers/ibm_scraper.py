@@ -1,14 +1,8 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 import traceback
-import os
-import stat
 from datetime import datetime
 from pathlib import Path
 
@@ -19,11 +13,22 @@ except ImportError:
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.http_client import http_post
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, page_signature, wait_for_page_change, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('ibm_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# IBM job card locators, tried in order by _scrape_page before its secondary selectors
+JOB_CARD_SELECTORS = [
+    (By.CSS_SELECTOR, 'a[href*="JobDetail"]'),
+    (By.CSS_SELECTOR, 'a[href*="jobId"]'),
+    (By.CSS_SELECTOR, 'a[href*="/job/"]'),
+    (By.CSS_SELECTOR, 'div.bx--card'),
+    (By.CSS_SELECTOR, 'div[class*="job-card"]'),
+    (By.CSS_SELECTOR, 'li[class*="result"]'),
+]
 
 
 class IBMScraper:
@@ -37,46 +42,6 @@ class IBMScraper:
         # Fallback URL for Selenium methods (the new IBM careers search page)
         self.selenium_url = 'https://www.ibm.com/careers/search?q=india'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        driver_path = CHROMEDRIVER_PATH
-        if not os.path.exists(driver_path):
-            logger.warning(f"Fresh chromedriver not found at {driver_path}, trying system chromedriver")
-            from webdriver_manager.chrome import ChromeDriverManager
-            driver_path = ChromeDriverManager().install()
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-
-        try:
-            current_permissions = os.stat(driver_path).st_mode
-            os.chmod(driver_path, current_permissions | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-        except Exception as e:
-            logger.warning(f"Could not set permissions on chromedriver: {str(e)}")
-
-        try:
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -159,7 +124,7 @@ class IBMScraper:
                 }
 
                 logger.info(f"Fetching IBM API page from={offset}, size={page_size}")
-                response = req_lib.post(
+                response = http_post(
                     self.api_url,
                     json=payload,
                     headers=headers,
@@ -261,7 +226,7 @@ class IBMScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # Set up XHR interception before loading the page
             driver.execute_cdp_cmd('Network.enable', {})
@@ -273,14 +238,12 @@ class IBMScraper:
             driver.get(self.selenium_url)
 
             # Wait for SPA to fully render and make XHR calls
-            time.sleep(20)
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 20)
 
             # Scroll to trigger lazy loading
-            for _ in range(5):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
 
             # Try to extract job data from the rendered page using JavaScript
             # The IBM page renders jobs even if we can't find the API - extract from DOM
@@ -435,7 +398,7 @@ class IBMScraper:
             logger.error(traceback.format_exc())
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         logger.info(f"Selenium XHR total: {len(all_jobs)}")
         return all_jobs
@@ -447,21 +410,19 @@ class IBMScraper:
 
         try:
             logger.info(f"Starting Selenium scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             driver.get(self.selenium_url)
 
             short_wait = WebDriverWait(driver, 5)
 
             # Extended SPA rendering wait - IBM pages need longer
-            time.sleep(15)
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 15)
 
             # Extended scrolling to trigger lazy loading
-            for _ in range(8):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
 
             # Short wait with IBM-specific selectors
             try:
@@ -482,10 +443,11 @@ class IBMScraper:
                 logger.info(f"Scraped {len(page_jobs)} jobs from page {current_page}")
 
                 if current_page < max_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(3)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 6)
 
                 current_page += 1
 
@@ -497,7 +459,7 @@ class IBMScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -519,13 +481,12 @@ class IBMScraper:
                 try:
                     next_button = driver.find_element(selector_type, selector_value)
                     driver.execute_script("arguments[0].scrollIntoView();", next_button)
-                    time.sleep(1)
+                    wait_for_dom_stable(driver, 1)
                     try:
                         next_button.click()
                     except:
                         driver.execute_script("arguments[0].click();", next_button)
                     logger.info(f"Clicked next page button")
-                    time.sleep(3)
                     return True
                 except:
                     continue
@@ -542,24 +503,16 @@ class IBMScraper:
 
         # Scroll to load dynamic content
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-        time.sleep(2)
+        wait_for_dom_stable(driver, 2)
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
+        wait_for_dom_stable(driver, 2)
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
+        wait_for_dom_stable(driver, 1)
 
         # PRIORITY: IBM-specific selectors
         job_links = []
-        ibm_priority_selectors = [
-            (By.CSS_SELECTOR, 'a[href*="JobDetail"]'),
-            (By.CSS_SELECTOR, 'a[href*="jobId"]'),
-            (By.CSS_SELECTOR, 'a[href*="/job/"]'),
-            (By.CSS_SELECTOR, 'div.bx--card'),
-            (By.CSS_SELECTOR, 'div[class*="job-card"]'),
-            (By.CSS_SELECTOR, 'li[class*="result"]'),
-        ]
-
-        for selector_type, selector_value in ibm_priority_selectors:
+
+        for selector_type, selector_value in JOB_CARD_SELECTORS:
             try:
                 found_links = driver.find_elements(selector_type, selector_value)
                 found_links = [e for e in found_links if e.get_attribute('href') and
@@ -772,7 +725,6 @@ class IBMScraper:
             driver.execute_script("window.open('');")
             driver.switch_to.window(driver.window_handles[-1])
             driver.get(job_url)
-            time.sleep(3)
 
             try:
                 desc_selectors = [
@@ -781,6 +733,7 @@ class IBMScraper:
                     (By.CSS_SELECTOR, '[itemprop="description"]'),
                     (By.CSS_SELECTOR, '[class*="job-details"]'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
                 for selector_type, selector_value in desc_selectors:
                     try:
                         desc_elem = driver.find_element(selector_type, selector_value)
@@ -1,20 +1,21 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, page_signature, wait_for_page_change, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('icicibank_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _extract_jobs_from_page looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    '.img__wrap, [class*="card-heightpx"]',
+]
 
 class ICICIBankScraper:
     def __init__(self):
@@ -22,51 +23,6 @@ class ICICIBankScraper:
         # Point to actual job search/listings page
         self.url = 'https://www.icicicareers.com/Find-A-Career'
 
-    def setup_driver(self):
-        """Set up Chrome driver with anti-detection"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        driver_paths = [
-            CHROMEDRIVER_PATH,
-            '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133/chromedriver-mac-arm64/chromedriver',
-            '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/143.0.7499.192/chromedriver-mac-arm64/chromedriver',
-        ]
-
-        driver = None
-        for dp in driver_paths:
-            try:
-                service = Service(dp)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-                logger.info(f"ChromeDriver started with: {dp}")
-                break
-            except Exception as e:
-                logger.warning(f"ChromeDriver {dp} failed: {e}")
-                continue
-
-        if not driver:
-            try:
-                driver = webdriver.Chrome(options=chrome_options)
-                logger.info("Using default ChromeDriver")
-            except Exception as e:
-                logger.error(f"All ChromeDriver attempts failed: {e}")
-                raise
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -86,7 +42,7 @@ class ICICIBankScraper:
         for attempt in range(max_retries):
           try:
             logger.info(f"Starting scrape for {self.company_name} (attempt {attempt + 1}/{max_retries})")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # The Find-A-Career URL tends to time out. Navigate to the working job listing URL.
             job_listing_url = 'https://www.icicicareers.com/CareerApplicant/Career/job-listing/'
@@ -94,7 +50,7 @@ class ICICIBankScraper:
             # First try the original URL with a shorter timeout
             try:
                 driver.get(self.url)
-                time.sleep(5)
+                wait_for_dom_stable(driver, 5)
                 current = driver.current_url
                 # If we got redirected to the home page or stuck, go to job listing
                 if 'Find-A-Career' not in current and 'job-listing' not in current:
@@ -110,13 +66,13 @@ class ICICIBankScraper:
                 logger.warning(f"Original URL failed ({e}), navigating to job listing page")
                 # Reset timeout and navigate to the working URL
                 try:
-                    driver.quit()
+                    release_driver(driver)
                 except:
                     pass
-                driver = self.setup_driver()
+                driver = acquire_driver()
                 driver.get(job_listing_url)
 
-            time.sleep(15)
+            wait_for_dom_stable(driver, 15)
 
             # Check we're on the right page
             current_url = driver.current_url
@@ -126,7 +82,7 @@ class ICICIBankScraper:
             if 'Home' in current_url and 'job-listing' not in current_url:
                 logger.info("On home page, navigating to job listing")
                 driver.get(job_listing_url)
-                time.sleep(15)
+                wait_for_selector(driver, JOB_CARD_SELECTORS, 15)
 
             # Scrape all pages
             current_page = 1
@@ -135,7 +91,7 @@ class ICICIBankScraper:
             while current_page <= max_actual_pages:
                 logger.info(f"Scraping page {current_page}")
 
-                page_jobs = self._extract_jobs_from_page(driver)
+                page_jobs = self._extract_jobs_from_page(driver, max_pages=max_pages)
                 jobs.extend(page_jobs)
                 logger.info(f"Found {len(page_jobs)} jobs on page {current_page}")
 
@@ -145,10 +101,11 @@ class ICICIBankScraper:
 
                 # Try to go to next page
                 if current_page < max_actual_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(5)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 8)
 
                 current_page += 1
 
@@ -158,31 +115,29 @@ class ICICIBankScraper:
           except Exception as e:
             logger.error(f"Error scraping {self.company_name} (attempt {attempt + 1}): {str(e)}")
             if driver:
-                driver.quit()
+                release_driver(driver)
                 driver = None
             if attempt < max_retries - 1:
-                logger.info("Retrying in 5 seconds...")
-                time.sleep(5)
+                # The next attempt's load waits on the job cards, so no fixed pause is needed
+                logger.info("Retrying with a fresh browser...")
             else:
                 raise
 
           finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 driver = None
 
         return jobs
 
-    def _extract_jobs_from_page(self, driver):
+    def _extract_jobs_from_page(self, driver, max_pages=MAX_PAGES_TO_SCRAPE):
         """Extract jobs from the current ICICI careers page using JavaScript"""
         jobs = []
 
         # Scroll to load content
-        for i in range(3):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+        scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        wait_for_dom_stable(driver, 2)
 
         # Primary: Extract from .img__wrap cards which contain job titles and links
         try:
@@ -349,10 +304,9 @@ class ICICIBankScraper:
                         if text == str(next_page_num):
                             # Scroll to pagination area
                             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", elem)
-                            time.sleep(1)
+                            wait_for_dom_stable(driver, 1)
                             driver.execute_script("arguments[0].click();", elem)
                             logger.info(f"Clicked page {next_page_num}")
-                            time.sleep(3)
                             return True
                 except:
                     continue
@@ -371,7 +325,6 @@ class ICICIBankScraper:
                 """)
                 if clicked:
                     logger.info(f"JS clicked page {next_page_num}")
-                    time.sleep(3)
                     return True
             except:
                 pass
@@ -1,68 +1,45 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector, scroll_until_stable, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('iifl_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job card locators _scrape_page tries, in order
+JOB_CARD_SELECTORS = [
+    # Darwinbox platform selectors
+    (By.CSS_SELECTOR, 'div[class*="job-card"]'),
+    (By.CSS_SELECTOR, 'div[class*="job-listing"]'),
+    (By.CSS_SELECTOR, 'div[class*="career-card"]'),
+    (By.CSS_SELECTOR, 'div[class*="position-card"]'),
+    (By.CSS_SELECTOR, 'mat-card'),
+    (By.CSS_SELECTOR, 'app-job-card'),
+    (By.CSS_SELECTOR, 'div.job-listing'),
+    (By.CSS_SELECTOR, 'div[class*="job"]'),
+    (By.XPATH, '//div[contains(@class, "result")]'),
+    (By.CSS_SELECTOR, 'li.job-item'),
+    (By.CSS_SELECTOR, 'a[href*="/job"]'),
+    (By.CSS_SELECTOR, 'a[href*="/career"]'),
+    (By.CSS_SELECTOR, 'div[class*="opening"]'),
+    (By.CSS_SELECTOR, 'li[class*="job"]'),
+    (By.TAG_NAME, 'article'),
+    (By.CSS_SELECTOR, 'div[class*="position"]'),
+    (By.CSS_SELECTOR, 'div[class*="vacancy"]'),
+]
 
 class IIFLScraper:
     def __init__(self):
         self.company_name = 'India Infoline (IIFL)'
         self.url = 'https://www.iifl.com/careers'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-        
-        try:
-            # Install and get the correct chromedriver path
-            driver_path = CHROMEDRIVER_PATH
-            logger.info(f"ChromeDriver installed at: {driver_path}")
-            
-            # Fix for macOS ARM - ensure we use the actual chromedriver binary
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-                    logger.info(f"Using corrected path: {driver_path}")
-            
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            # Fallback: try without service specification
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -79,12 +56,12 @@ class IIFLScraper:
         for attempt in range(max_retries):
           try:
             logger.info(f"Starting scrape for {self.company_name} (attempt {attempt + 1}/{max_retries})")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # First try the landing page to see if it has direct job links
             try:
                 driver.get(self.url)
-                time.sleep(8)
+                wait_for_dom_stable(driver, 8)
             except Exception as nav_err:
                 logger.warning(f"Navigation to landing page failed: {nav_err}")
 
@@ -94,20 +71,18 @@ class IIFLScraper:
                 if 'Find Jobs' in body_text or 'darwinbox' in driver.page_source:
                     logger.info("Landing page loaded, navigating to Darwinbox portal for job listings")
                     driver.get(darwinbox_url)
-                    time.sleep(15)  # Darwinbox SPA needs time to load
+                    wait_for_selector(driver, JOB_CARD_SELECTORS, 15)  # Darwinbox SPA needs time to load
                 else:
                     logger.info("Landing page has content, checking for jobs first")
             except:
                 logger.info("Could not read landing page, navigating to Darwinbox")
                 driver.get(darwinbox_url)
-                time.sleep(15)
+                wait_for_selector(driver, JOB_CARD_SELECTORS, 15)
 
             # Scroll to trigger lazy-loaded content
-            for scroll_i in range(4):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight * %s);" % str((scroll_i + 1) / 4))
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             wait = WebDriverWait(driver, 5)
             current_page = 1
@@ -121,10 +96,11 @@ class IIFLScraper:
                 logger.info(f"Scraped {len(page_jobs)} jobs from page {current_page}")
 
                 if current_page < max_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(3)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 3)
 
                 current_page += 1
 
@@ -134,17 +110,17 @@ class IIFLScraper:
           except Exception as e:
             logger.error(f"Error scraping {self.company_name} (attempt {attempt + 1}): {str(e)}")
             if driver:
-                driver.quit()
+                release_driver(driver)
                 driver = None
             if attempt < max_retries - 1:
-                logger.info("Retrying in 5 seconds...")
-                time.sleep(5)
+                # The next attempt's load waits on the job cards, so no fixed pause is needed
+                logger.info("Retrying with a fresh browser...")
             else:
                 raise
 
           finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 driver = None
 
         return jobs
@@ -156,7 +132,7 @@ class IIFLScraper:
             
             # Scroll to pagination area
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             
             # Try to find and click next page button
             next_page_selectors = [
@@ -190,32 +166,12 @@ class IIFLScraper:
     def _scrape_page(self, driver, wait):
         """Scrape jobs from current page"""
         jobs = []
-        time.sleep(2)  # Wait for page content
+        wait_for_selector(driver, JOB_CARD_SELECTORS, 2)  # Wait for page content
         
         # Try multiple selectors for job listings
         job_cards = []
-        selectors = [
-            # Darwinbox platform selectors
-            (By.CSS_SELECTOR, 'div[class*="job-card"]'),
-            (By.CSS_SELECTOR, 'div[class*="job-listing"]'),
-            (By.CSS_SELECTOR, 'div[class*="career-card"]'),
-            (By.CSS_SELECTOR, 'div[class*="position-card"]'),
-            (By.CSS_SELECTOR, 'mat-card'),
-            (By.CSS_SELECTOR, 'app-job-card'),
-            (By.CSS_SELECTOR, 'div.job-listing'),
-            (By.CSS_SELECTOR, 'div[class*="job"]'),
-            (By.XPATH, '//div[contains(@class, "result")]'),
-            (By.CSS_SELECTOR, 'li.job-item'),
-            (By.CSS_SELECTOR, 'a[href*="/job"]'),
-            (By.CSS_SELECTOR, 'a[href*="/career"]'),
-            (By.CSS_SELECTOR, 'div[class*="opening"]'),
-            (By.CSS_SELECTOR, 'li[class*="job"]'),
-            (By.TAG_NAME, 'article'),
-            (By.CSS_SELECTOR, 'div[class*="position"]'),
-            (By.CSS_SELECTOR, 'div[class*="vacancy"]'),
-        ]
         
-        for selector_type, selector_value in selectors:
+        for selector_type, selector_value in JOB_CARD_SELECTORS:
             try:
                 elements = driver.find_elements(selector_type, selector_value)
                 if elements and len(elements) >= 1:
@@ -433,7 +389,6 @@ class IIFLScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
 
             # Extract description
             try:
@@ -442,6 +397,7 @@ class IIFLScraper:
                     (By.CSS_SELECTOR, 'div[class*="description"]'),
                     (By.XPATH, '//div[contains(@class, "content")]'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
 
                 for selector_type, selector_value in desc_selectors:
                     try:
@@ -1,62 +1,24 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from pathlib import Path
-import os
-import stat
 
 
 from core.logging import setup_logger
-from config.scraper import HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector
+from config.scraper import FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('infosys_scraper')
 
-CHROMEDRIVER_PATH = os.path.expanduser(
-    '~/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-)
-
 
 class InfosysScraper:
     def __init__(self):
         self.company_name = 'Infosys'
         self.url = 'https://career.infosys.com/jobs?companyhiringtype=IL&countrycode=IN'
 
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        driver_path = CHROMEDRIVER_PATH
-        try:
-            current_permissions = os.stat(driver_path).st_mode
-            os.chmod(driver_path, current_permissions | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-        except Exception as e:
-            logger.warning(f"Could not set permissions on chromedriver: {str(e)}")
-
-        try:
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external_id using MD5 hash"""
         unique_string = f"{company}_{job_id}"
@@ -68,7 +30,7 @@ class InfosysScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             driver.get(self.url)
@@ -84,11 +46,11 @@ class InfosysScraper:
                 logger.info("Job listings loaded")
             except Exception as e:
                 logger.warning(f"Timeout waiting for job listings: {str(e)}")
-                time.sleep(5)
+                wait_for_dom_stable(driver, 5)
 
             # Quick scroll for lazy loading
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
 
@@ -113,7 +75,7 @@ class InfosysScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def _go_to_next_page(self, driver, current_page):
@@ -123,10 +85,7 @@ class InfosysScraper:
             time.sleep(0.5)
 
             # Capture current state for change detection
-            old_first = driver.execute_script("""
-                var card = document.querySelector('mat-card.mat-mdc-card, div.jobContainer');
-                return card ? card.innerText.substring(0, 50) : '';
-            """)
+            signature = page_signature(driver, 'mat-card.mat-mdc-card, div.jobContainer')
 
             next_selectors = [
                 (By.CSS_SELECTOR, 'a[aria-label="Next"]'),
@@ -153,15 +112,7 @@ class InfosysScraper:
                     logger.info(f"Navigated to page {current_page + 1}")
 
                     # Poll for content change instead of blind sleep
-                    for _ in range(25):
-                        time.sleep(0.2)
-                        new_first = driver.execute_script("""
-                            var card = document.querySelector('mat-card.mat-mdc-card, div.jobContainer');
-                            return card ? card.innerText.substring(0, 50) : '';
-                        """)
-                        if new_first and new_first != old_first:
-                            break
-                    time.sleep(0.5)
+                    wait_for_page_change(driver, 'mat-card.mat-mdc-card, div.jobContainer', signature, 5)
                     return True
                 except:
                     continue
@@ -421,7 +372,6 @@ class InfosysScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
 
             # Description
             desc_selectors = [
@@ -432,6 +382,7 @@ class InfosysScraper:
                 ".jd-content",
                 "main"
             ]
+            wait_for_selector(driver, desc_selectors, 3)
             for selector in desc_selectors:
                 try:
                     desc_elem = driver.find_element(By.CSS_SELECTOR, selector)
@@ -1,21 +1,25 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 import os
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('iocl_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _extract_jobs looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    'ul.job-list li.liscreen',
+    'ul.job-list li',
+    '.divscreeen1',
+    'a[href*=".pdf"], a[href*="LatestJobOpening"], a[href*="recruitment"], a[href*="notification"]',
+]
 
 
 class IOCLScraper:
@@ -24,32 +28,6 @@ class IOCLScraper:
         self.url = 'https://iocl.com/latest-job-opening'
         self.base_url = 'https://iocl.com'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -59,37 +37,35 @@ class IOCLScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             # IOCL uses Sucuri WAF which requires JS execution for cookie challenge.
             # Selenium handles this automatically. We load the page and wait for
             # the redirect/challenge to complete.
             driver.get(self.url)
-            time.sleep(15)
+            wait_for_dom_stable(driver, 15)
 
             # Verify we got past the Sucuri challenge by checking for actual page content
             page_title = driver.title or ''
             if 'redirected' in page_title.lower() or 'sucuri' in page_title.lower():
                 logger.info("Sucuri challenge detected, waiting for redirect...")
-                time.sleep(10)
+                wait_for_dom_stable(driver, 10)
 
             # Check if we need to reload after cookie is set
             current_url = driver.current_url
             if 'iocl.com' not in current_url:
                 logger.info("Reloading page after Sucuri challenge...")
                 driver.get(self.url)
-                time.sleep(10)
+                wait_for_selector(driver, JOB_CARD_SELECTORS, 10)
 
             # Scroll to load all content
-            for _ in range(5):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Extract all recruitment notices from the page
-            page_jobs = self._extract_jobs(driver)
+            page_jobs = self._extract_jobs(driver, max_pages=max_pages)
             if page_jobs:
                 all_jobs.extend(page_jobs)
                 logger.info(f"Found {len(page_jobs)} recruitment notices")
@@ -99,13 +75,11 @@ class IOCLScraper:
                 apprentice_url = 'https://iocl.com/apprenticeships'
                 logger.info(f"Also checking apprenticeships page: {apprentice_url}")
                 driver.get(apprentice_url)
-                time.sleep(10)
-                for _ in range(3):
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
+                wait_for_selector(driver, JOB_CARD_SELECTORS, 10)
+                scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
                 driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(1)
-                apprentice_jobs = self._extract_jobs(driver)
+                wait_for_dom_stable(driver, 1)
+                apprentice_jobs = self._extract_jobs(driver, max_pages=max_pages)
                 if apprentice_jobs:
                     all_jobs.extend(apprentice_jobs)
                     logger.info(f"Found {len(apprentice_jobs)} apprenticeship notices")
@@ -126,19 +100,17 @@ class IOCLScraper:
             logger.error(f"Error: {str(e)}")
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         return all_jobs
 
-    def _extract_jobs(self, driver):
+    def _extract_jobs(self, driver, max_pages=MAX_PAGES_TO_SCRAPE):
         jobs = []
 
         try:
             # Scroll page to ensure all content is loaded
-            for _ in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             js_jobs = driver.execute_script("""
                 var results = [];
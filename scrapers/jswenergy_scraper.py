@@ -1,54 +1,37 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector, scroll_until_stable, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('jswenergy_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job card locators _scrape_turbohire_page tries, in order
+JOB_CARD_SELECTORS = [
+    (By.CSS_SELECTOR, 'div.job-card'),
+    (By.CSS_SELECTOR, 'div[class*="job-card"]'),
+    (By.CSS_SELECTOR, 'div[class*="jobCard"]'),
+    (By.CSS_SELECTOR, 'a[href*="/jobs/"]'),
+    (By.CSS_SELECTOR, 'a[href*="jobId"]'),
+    (By.CSS_SELECTOR, 'div[class*="card"]'),
+    (By.CSS_SELECTOR, 'div[class*="opening"]'),
+    (By.CSS_SELECTOR, 'li[class*="job"]'),
+    (By.CSS_SELECTOR, 'article'),
+    (By.CSS_SELECTOR, '[role="listitem"]'),
+]
 
 class JSWEnergyScraper:
     def __init__(self):
         self.company_name = 'JSW Energy'
         self.url = 'https://www.jsw.in/careers'
 
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -104,24 +87,22 @@ class JSWEnergyScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # Step 1: Load the main careers page to find TurboHire link
             driver.get(self.url)
-            time.sleep(8)
+            wait_for_dom_stable(driver, 8)
 
             # Step 2: Find and navigate to TurboHire portal
             portal_url = self._find_turbohire_portal_url(driver)
             logger.info(f"Navigating to TurboHire portal: {portal_url}")
             driver.get(portal_url)
-            time.sleep(12)  # Wait for SPA rendering
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 12)  # Wait for SPA rendering
 
             # Scroll to trigger lazy loading
-            for i in range(4):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight * %s);" % str((i + 1) / 4))
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             current_page = 1
 
@@ -141,12 +122,10 @@ class JSWEnergyScraper:
                         if alt_url != portal_url:
                             logger.info(f"Trying alternate URL: {alt_url}")
                             driver.get(alt_url)
-                            time.sleep(12)
-                            for i in range(3):
-                                driver.execute_script("window.scrollTo(0, document.body.scrollHeight * %s);" % str((i + 1) / 3))
-                                time.sleep(2)
+                            wait_for_selector(driver, JOB_CARD_SELECTORS, 12)
+                            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
                             driver.execute_script("window.scrollTo(0, 0);")
-                            time.sleep(2)
+                            wait_for_dom_stable(driver, 2)
                             page_jobs = self._scrape_turbohire_page(driver)
                             if page_jobs:
                                 break
@@ -160,10 +139,11 @@ class JSWEnergyScraper:
 
                 # Try to navigate to next page
                 if current_page < max_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(3)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 3)
 
                 current_page += 1
 
@@ -175,7 +155,7 @@ class JSWEnergyScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -185,7 +165,7 @@ class JSWEnergyScraper:
             next_page_num = current_page + 1
 
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             next_page_selectors = [
                 (By.XPATH, f'//a[text()="{next_page_num}"]'),
@@ -241,7 +221,7 @@ class JSWEnergyScraper:
     def _scrape_turbohire_page(self, driver):
         """Scrape jobs from TurboHire career portal using JS-first extraction"""
         jobs = []
-        time.sleep(2)
+        wait_for_selector(driver, JOB_CARD_SELECTORS, 2)
 
         # Strategy 1: JS-based extraction for TurboHire platform
         try:
@@ -442,20 +422,8 @@ class JSWEnergyScraper:
             logger.info("JS extraction found 0 jobs, trying Selenium selectors")
             wait = WebDriverWait(driver, 8)
             job_cards = []
-            selectors = [
-                (By.CSS_SELECTOR, 'div.job-card'),
-                (By.CSS_SELECTOR, 'div[class*="job-card"]'),
-                (By.CSS_SELECTOR, 'div[class*="jobCard"]'),
-                (By.CSS_SELECTOR, 'a[href*="/jobs/"]'),
-                (By.CSS_SELECTOR, 'a[href*="jobId"]'),
-                (By.CSS_SELECTOR, 'div[class*="card"]'),
-                (By.CSS_SELECTOR, 'div[class*="opening"]'),
-                (By.CSS_SELECTOR, 'li[class*="job"]'),
-                (By.CSS_SELECTOR, 'article'),
-                (By.CSS_SELECTOR, '[role="listitem"]'),
-            ]
 
-            for selector_type, selector_value in selectors:
+            for selector_type, selector_value in JOB_CARD_SELECTORS:
                 try:
                     wait.until(EC.presence_of_element_located((selector_type, selector_value)))
                     job_cards = driver.find_elements(selector_type, selector_value)
@@ -608,7 +576,6 @@ class JSWEnergyScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
 
             try:
                 desc_selectors = [
@@ -616,6 +583,7 @@ class JSWEnergyScraper:
                     (By.CSS_SELECTOR, 'div[class*="description"]'),
                     (By.XPATH, '//div[contains(@class, "description")]'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
 
                 for selector_type, selector_value in desc_selectors:
                     try:
@@ -1,21 +1,23 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
-import os
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('kotakmahindrabank_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _wait_for_angular_jobs looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    'a[href*="jobDetails"]',
+    'div.job-tile, div[class*="job-card"], div[class*="job-item"], div[class*="job-listing"]',
+]
 
 
 class KotakMahindraBankScraper:
@@ -23,36 +25,6 @@ class KotakMahindraBankScraper:
         self.company_name = 'Kotak Mahindra Bank'
         self.url = 'https://kotak.darwinbox.in/ms/candidate/careers'
 
-    def setup_driver(self):
-        """Set up Chrome driver with anti-detection options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -65,12 +37,12 @@ class KotakMahindraBankScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # Load the careers page
             logger.info(f"Navigating to: {self.url}")
             driver.get(self.url)
-            time.sleep(12)
+            wait_for_dom_stable(driver, 12)
 
             current_url = driver.current_url
             logger.info(f"Current URL after load: {current_url}")
@@ -86,7 +58,7 @@ class KotakMahindraBankScraper:
                 v2_url = f"{parsed.scheme}://{parsed.netloc}/ms/candidatev2/main/careers/allJobs"
                 logger.info(f"Trying v2 URL: {v2_url}")
                 driver.get(v2_url)
-                time.sleep(12)
+                wait_for_dom_stable(driver, 12)
 
                 # Poll-based wait for Angular v2 job elements
                 self._wait_for_angular_jobs(driver, timeout=20)
@@ -96,16 +68,14 @@ class KotakMahindraBankScraper:
                 if all_jobs_url:
                     logger.info(f"Navigating to all jobs page: {all_jobs_url}")
                     driver.get(all_jobs_url)
-                    time.sleep(12)
+                    wait_for_dom_stable(driver, 12)
                 else:
                     logger.info("No allJobs link found, scraping current page")
 
             # Scroll to load all job tiles
-            for i in range(5):
-                driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script('window.scrollTo(0, 0);')
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Extract jobs
             page_jobs = self._scrape_darwinbox_jobs(driver)
@@ -119,7 +89,7 @@ class KotakMahindraBankScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -138,7 +108,7 @@ class KotakMahindraBankScraper:
             if count and count > 0:
                 logger.info(f"Found {count} job elements after {time.time() - start:.1f}s")
                 return True
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
         logger.warning(f"No job elements found after {timeout}s polling")
         return False
 
@@ -1,61 +1,23 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 import re
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('kpmg_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class KPMGScraper:
     def __init__(self):
         self.company_name = 'KPMG'
         self.url = 'https://home.kpmg/in/en/home/careers/job-search.html'
     
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        
-        try:
-            driver_path = CHROMEDRIVER_PATH
-            logger.info(f"ChromeDriver installed at: {driver_path}")
-            
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                import os
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-                    logger.info(f"Using corrected path: {driver_path}")
-            
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -68,12 +30,12 @@ class KPMGScraper:
         
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
             
             wait = WebDriverWait(driver, SCRAPE_TIMEOUT)
             logger.info("Waiting for KPMG careers page to load...")
-            time.sleep(12)
+            wait_for_dom_stable(driver, 12)
             
             # Scroll to load lazy-loaded content
             logger.info("Scrolling page to load all content...")
@@ -83,7 +45,7 @@ class KPMGScraper:
             
             while scroll_attempts < max_scrolls:
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
+                wait_for_dom_stable(driver, 3)
                 new_height = driver.execute_script("return document.body.scrollHeight")
                 if new_height == last_height:
                     break
@@ -92,7 +54,7 @@ class KPMGScraper:
                 logger.info(f"Scrolled {scroll_attempts} times")
             
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
             
             # Check for iframes
             iframes = driver.find_elements(By.TAG_NAME, 'iframe')
@@ -103,7 +65,7 @@ class KPMGScraper:
                         src = iframe.get_attribute('src')
                         logger.info(f"Iframe {idx}: {src}")
                         driver.switch_to.frame(iframe)
-                        time.sleep(3)
+                        wait_for_dom_stable(driver, 3)
                         test_elements = driver.find_elements(By.CSS_SELECTOR, 'div[class*="job"], article, li[class*="job"]')
                         if test_elements and len(test_elements) > 5:
                             logger.info(f"Found {len(test_elements)} potential job elements in iframe {idx}")
@@ -127,14 +89,14 @@ class KPMGScraper:
         
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         
         return jobs
     
     def _scrape_page(self, driver, wait):
         """Scrape jobs from KPMG careers page"""
         jobs = []
-        time.sleep(3)
+        wait_for_dom_stable(driver, 3)
         
         job_elements = []
         selectors = [
@@ -311,7 +273,6 @@ class KPMGScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(4)
             
             try:
                 desc_selectors = [
@@ -321,6 +282,7 @@ class KPMGScraper:
                     (By.CSS_SELECTOR, 'span[class*="jobDescriptionText"]'),
                     (By.XPATH, "//h2[contains(text(), 'Description')]/following-sibling::div"),
                 ]
+                wait_for_selector(driver, desc_selectors, 4)
                 
                 for selector_type, selector_value in desc_selectors:
                     try:
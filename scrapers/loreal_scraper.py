@@ -1,10 +1,7 @@
 # STATUS: BLOCKED - Cloudflare WAF on careers.loreal.com (needs undetected-chromedriver) (tested 2026-02-22)
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from pathlib import Path
@@ -13,7 +10,9 @@ import stat
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('loreal_scraper')
 
@@ -24,31 +23,6 @@ class LorealScraper:
         # India filter: 3_110_3=18031
         self.url = 'https://careers.loreal.com/en_US/jobs/SearchJobs/?3_110_3=18031'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        driver_path = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
-        try:
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -58,7 +32,7 @@ class LorealScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             driver.get(self.url)
@@ -71,11 +45,11 @@ class LorealScraper:
                 logger.info("Job listings loaded")
             except Exception as e:
                 logger.warning(f"Timeout waiting for job listings: {str(e)}")
-                time.sleep(5)
+                wait_for_dom_stable(driver, 5)
 
             # Quick scroll for lazy loading
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
 
@@ -100,7 +74,7 @@ class LorealScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def _load_more(self, driver):
@@ -110,7 +84,7 @@ class LorealScraper:
             time.sleep(0.5)
 
             # Capture current count for change detection
-            old_count = len(driver.find_elements(By.CSS_SELECTOR, "a[href*='JobDetail']"))
+            signature = page_signature(driver, "a[href*='JobDetail']")
 
             load_more_selectors = [
                 (By.CSS_SELECTOR, "a[class*='viewMoreResults']"),
@@ -130,12 +104,7 @@ class LorealScraper:
                     logger.info("Clicked 'View more results'")
 
                     # Poll for new content
-                    for _ in range(25):
-                        time.sleep(0.2)
-                        new_count = len(driver.find_elements(By.CSS_SELECTOR, "a[href*='JobDetail']"))
-                        if new_count > old_count:
-                            break
-                    time.sleep(0.5)
+                    wait_for_page_change(driver, "a[href*='JobDetail']", signature, 5)
                     return True
                 except:
                     continue
@@ -571,7 +540,6 @@ class LorealScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
 
             desc_selectors = [
                 ".job-description",
@@ -581,6 +549,7 @@ class LorealScraper:
                 "[class*='description']",
                 "main"
             ]
+            wait_for_selector(driver, desc_selectors, 3)
             for selector in desc_selectors:
                 try:
                     desc_elem = driver.find_element(By.CSS_SELECTOR, selector)
@@ -1,9 +1,6 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from pathlib import Path
@@ -12,7 +9,9 @@ import stat
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('marico_scraper')
 
@@ -22,32 +21,6 @@ class MaricoScraper:
         self.company_name = 'Marico'
         self.url = 'https://marico.sensehq.com/careers'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-        chrome_options.page_load_strategy = 'eager'  # Don't wait for all resources; WebDriverWait handles content detection
-
-        driver_path = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
-        try:
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -57,7 +30,7 @@ class MaricoScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             driver.get(self.url)
@@ -75,11 +48,11 @@ class MaricoScraper:
                     """)
                 )
             except:
-                time.sleep(5)  # Fallback if View Job buttons not found
+                wait_for_dom_stable(driver, 5)  # Fallback if View Job buttons not found
 
             # Single quick scroll to trigger lazy loading (instead of 5 slow scrolls)
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
 
@@ -95,8 +68,7 @@ class MaricoScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
-                logger.info("Browser closed")
+                release_driver(driver)
 
     def _scrape_page(self, driver):
         jobs = []
@@ -452,7 +424,6 @@ class MaricoScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
 
             desc_selectors = [
                 ".job-description",
@@ -461,6 +432,7 @@ class MaricoScraper:
                 "[class*='detail']",
                 "main"
             ]
+            wait_for_selector(driver, desc_selectors, 3)
             for selector in desc_selectors:
                 try:
                     desc_elem = driver.find_element(By.CSS_SELECTOR, selector)
@@ -1,57 +1,22 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
-import os
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, scroll_until_stable, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('meesho_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class MeeshoScraper:
     def __init__(self):
         self.company_name = 'Meesho'
         self.url = 'https://careers.meesho.com/'
 
-    def setup_driver(self):
-        """Set up Chrome driver with anti-detection options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -70,18 +35,18 @@ class MeeshoScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # Strategy 1: Try the main careers URL
             logger.info(f"Navigating to: {self.url}")
             driver.get(self.url)
-            time.sleep(15)
+            wait_for_dom_stable(driver, 15)
 
             # Check if we got an error page (check multiple times as CDN errors can be slow)
             is_error = self._check_if_error_page(driver)
             if not is_error:
                 # Wait a bit more and check again - Akamai errors can take time to render
-                time.sleep(5)
+                wait_for_dom_stable(driver, 5)
                 is_error = self._check_if_error_page(driver)
 
             if is_error:
@@ -90,13 +55,13 @@ class MeeshoScraper:
                 # Strategy 2: Try Lever jobs page (Meesho uses Lever for job listings)
                 logger.info("Trying Lever jobs page for Meesho")
                 driver.get('https://jobs.lever.co/meesho')
-                time.sleep(12)
+                wait_for_dom_stable(driver, 12)
 
                 if self._check_if_error_page(driver):
                     # Strategy 3: Try meesho.io/jobs
                     logger.info("Trying meesho.io/jobs")
                     driver.get('https://www.meesho.io/jobs')
-                    time.sleep(12)
+                    wait_for_dom_stable(driver, 12)
 
                     if self._check_if_error_page(driver):
                         logger.error(
@@ -108,11 +73,9 @@ class MeeshoScraper:
 
             # If we reach here, we have a working page - try to extract jobs
             # Scroll to trigger lazy loading
-            for i in range(4):
-                driver.execute_script(f"window.scrollTo(0, document.body.scrollHeight * {(i + 1) / 4});")
-                time.sleep(2)
+            scroll_until_stable(driver, '.posting', max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             current_page = 1
 
@@ -125,10 +88,11 @@ class MeeshoScraper:
                 logger.info(f"Scraped {len(page_jobs)} jobs from page {current_page}")
 
                 if current_page < max_pages:
+                    signature = page_signature(driver, '.posting')
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(4)
+                    wait_for_page_change(driver, '.posting', signature, 4)
 
                 current_page += 1
 
@@ -140,7 +104,7 @@ class MeeshoScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -184,7 +148,7 @@ class MeeshoScraper:
             next_page_num = current_page + 1
 
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             next_page_selectors = [
                 (By.XPATH, f'//a[text()="{next_page_num}"]'),
@@ -198,7 +162,7 @@ class MeeshoScraper:
                 try:
                     next_button = driver.find_element(selector_type, selector_value)
                     driver.execute_script("arguments[0].scrollIntoView();", next_button)
-                    time.sleep(1)
+                    wait_for_dom_stable(driver, 1)
                     next_button.click()
                     logger.info("Clicked next page button")
                     return True
@@ -214,7 +178,7 @@ class MeeshoScraper:
     def _scrape_page(self, driver):
         """Scrape jobs from current page using JavaScript-first extraction"""
         jobs = []
-        time.sleep(2)
+        wait_for_dom_stable(driver, 2)
 
         # JavaScript-first extraction
         try:
@@ -411,7 +375,7 @@ class MeeshoScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
+            wait_for_selector(driver, 'div[class*="description"]', 3)
 
             try:
                 desc_elem = driver.find_element(By.CSS_SELECTOR, 'div[class*="description"]')
@@ -1,61 +1,27 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from pathlib import Path
-import os
-import stat
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('meta_scraper')
 
+# Job links by href, which survives Meta's generated class names
+JOB_LINK_SELECTOR = 'a[href*="/jobs/"], a[href*="/job_details/"]'
+
 
 class MetaScraper:
     def __init__(self):
         self.company_name = 'Meta'
         self.url = 'https://www.metacareers.com/jobs?offices[0]=Mumbai%2C%20India&offices[1]=Gurgaon%2C%20India&offices[2]=Bangalore%2C%20India'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        driver_path = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
-        try:
-            if os.path.exists(driver_path):
-                try:
-                    current_permissions = os.stat(driver_path).st_mode
-                    os.chmod(driver_path, current_permissions | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-                except Exception as e:
-                    logger.warning(f"Could not set permissions on chromedriver: {str(e)}")
-                service = Service(driver_path)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -65,7 +31,7 @@ class MetaScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             driver.get(self.url)
@@ -88,8 +54,8 @@ class MetaScraper:
                 )
                 logger.info("Job links detected on page")
             except:
-                logger.warning("WebDriverWait timed out, falling back to 5s sleep")
-                time.sleep(5)
+                logger.warning("WebDriverWait timed out, falling back to DOM-idle wait")
+                wait_for_dom_stable(driver, 5)
 
             # Log page state for debugging
             page_title = driver.title
@@ -98,7 +64,7 @@ class MetaScraper:
 
             # Quick scroll to trigger lazy loading (replaces 8-step aggressive scroll)
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
 
@@ -114,19 +80,8 @@ class MetaScraper:
                 logger.info(f"Scroll {current_page}: found {len(new_jobs)} new jobs (total: {len(all_jobs)})")
 
                 if current_page < max_pages:
-                    # Count current job links before scrolling (broader patterns)
-                    prev_count = driver.execute_script("""
-                        var count = 0;
-                        var links = document.querySelectorAll('a[href]');
-                        for (var i = 0; i < links.length; i++) {
-                            var href = links[i].href || '';
-                            if (href.indexOf('/jobs/') !== -1 || href.indexOf('/job_details/') !== -1 ||
-                                href.indexOf('/profile/job_details/') !== -1 || href.indexOf('/v2/jobs/') !== -1) {
-                                count++;
-                            }
-                        }
-                        return count;
-                    """)
+                    # Snapshot the job links before scrolling
+                    signature = page_signature(driver, JOB_LINK_SELECTOR)
                     # Scroll down for more results
                     driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                     time.sleep(0.5)
@@ -147,26 +102,7 @@ class MetaScraper:
                         pass
 
                     # Poll-based change detection: wait for new jobs to load (max 5s)
-                    new_count = prev_count
-                    for _ in range(25):
-                        time.sleep(0.2)
-                        new_count = driver.execute_script("""
-                            var count = 0;
-                            var links = document.querySelectorAll('a[href]');
-                            for (var i = 0; i < links.length; i++) {
-                                var href = links[i].href || '';
-                                if (href.indexOf('/jobs/') !== -1 || href.indexOf('/job_details/') !== -1 ||
-                                    href.indexOf('/profile/job_details/') !== -1 || href.indexOf('/v2/jobs/') !== -1) {
-                                    count++;
-                                }
-                            }
-                            return count;
-                        """)
-                        if new_count != prev_count:
-                            break
-                    time.sleep(0.5)  # Brief settle after change detected
-
-                    if new_count == prev_count:
+                    if not wait_for_page_change(driver, JOB_LINK_SELECTOR, signature, 5):
                         logger.info("No more jobs to load after scrolling")
                         break
 
@@ -180,7 +116,7 @@ class MetaScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def _extract_jobs_via_js(self, driver):
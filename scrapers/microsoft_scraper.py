@@ -1,25 +1,19 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 import traceback
-from pathlib import Path
 from datetime import datetime
-import os
-import stat
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('microsoft_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 
 class MicrosoftScraper:
     def __init__(self):
@@ -30,52 +24,6 @@ class MicrosoftScraper:
         self.pcsx_api_path = '/api/pcsx/search?domain=microsoft.com&query=&location=India&start={start}&hl=en'
         self.base_job_url = 'https://apply.careers.microsoft.com/careers/job'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        driver_path = CHROMEDRIVER_PATH
-        if not os.path.exists(driver_path):
-            logger.warning(f"Fresh chromedriver not found at {driver_path}, trying system chromedriver")
-            from webdriver_manager.chrome import ChromeDriverManager
-            driver_path = ChromeDriverManager().install()
-            driver_path_obj = Path(driver_path)
-            if driver_path_obj.name != 'chromedriver':
-                parent = driver_path_obj.parent
-                actual_driver = parent / 'chromedriver'
-                if actual_driver.exists():
-                    driver_path = str(actual_driver)
-                else:
-                    for file in parent.rglob('chromedriver'):
-                        if file.is_file() and not file.name.endswith('.zip'):
-                            driver_path = str(file)
-                            break
-
-        try:
-            current_permissions = os.stat(driver_path).st_mode
-            os.chmod(driver_path, current_permissions | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-        except Exception as e:
-            logger.warning(f"Could not set permissions on chromedriver: {str(e)}")
-
-        try:
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -104,7 +52,7 @@ class MicrosoftScraper:
         page_size = 10  # PCSX API returns 10 per page
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # Visit the Eightfold-powered careers search page to establish session
             logger.info(f"Loading Microsoft PCSX careers page: {self.search_url}")
@@ -114,9 +62,9 @@ class MicrosoftScraper:
                 WebDriverWait(driver, 15).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, 'a[class*="card-"], div[class*="position-card"], [class*="job"]'))
                 )
-                time.sleep(1)  # Brief settle for SPA to finish rendering
+                wait_for_dom_stable(driver, 1)  # Brief settle for SPA to finish rendering
             except Exception:
-                time.sleep(5)  # Fallback if selectors not found
+                wait_for_dom_stable(driver, 5)  # Fallback if selectors not found
 
             logger.info(f"Page loaded: {driver.current_url}, title: {driver.title}")
 
@@ -191,7 +139,7 @@ class MicrosoftScraper:
             logger.error(traceback.format_exc())
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         logger.info(f"PCSX API total: {len(all_jobs)}")
         return all_jobs
@@ -267,7 +215,7 @@ class MicrosoftScraper:
         page_size = 20  # DOM shows ~20 cards per page
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} Selenium DOM scraping")
 
             for page in range(max_pages):
@@ -282,9 +230,9 @@ class MicrosoftScraper:
                     WebDriverWait(driver, 15).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, 'a[class*="card-"], a[href*="/careers/job/"], div[class*="position-card"]'))
                     )
-                    time.sleep(1)  # Brief settle for SPA rendering
+                    wait_for_dom_stable(driver, 1)  # Brief settle for SPA rendering
                 except Exception:
-                    time.sleep(5)  # Fallback if selectors not found
+                    wait_for_dom_stable(driver, 5)  # Fallback if selectors not found
 
                 # Quick scroll to trigger lazy loading (single scroll instead of 3)
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
@@ -404,7 +352,7 @@ class MicrosoftScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def parse_location(self, location_str):
@@ -1,20 +1,29 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
-import os
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, page_signature, wait_for_page_change, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('motilaloswal_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job card locators _scrape_page tries, in order
+JOB_CARD_SELECTORS = [
+    "div[class*='job']",
+    "div[class*='card']",
+    "div[class*='Card']",
+    "a[href*='/job']",
+    "div[class*='listing']",
+    "div[class*='position']",
+    "div[class*='requisition']",
+    "table tr",
+    "li[class*='job']",
+    "article",
+]
 
 
 class MotilalOswalScraper:
@@ -22,33 +31,6 @@ class MotilalOswalScraper:
         self.company_name = 'Motilal Oswal'
         self.url = 'https://motilaloswal.turbohire.co/dashboardv2?orgId=0f6e3a76-85ff-4b66-8bfa-4cd4fede4ffa&type=0'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -58,22 +40,20 @@ class MotilalOswalScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             driver.get(self.url)
 
             # Wait 15s for TurboHire SPA to render
-            time.sleep(15)
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 15)
 
             logger.info(f"Current URL after load: {driver.current_url}")
 
             # Scroll multiple times to load lazy content
-            for _ in range(5):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Try pagination - scrape multiple pages
             page = 1
@@ -88,10 +68,11 @@ class MotilalOswalScraper:
                     break
 
                 # Try to click next page / load more
+                signature = page_signature(driver, JOB_CARD_SELECTORS)
                 if not self._go_to_next_page(driver):
                     break
                 page += 1
-                time.sleep(3)
+                wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 6)
 
             logger.info(f"Total jobs scraped: {len(all_jobs)}")
             return all_jobs
@@ -101,7 +82,7 @@ class MotilalOswalScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def _go_to_next_page(self, driver):
@@ -127,7 +108,6 @@ class MotilalOswalScraper:
                     next_btn = driver.find_element(By.CSS_SELECTOR, selector)
                     if next_btn.is_displayed() and next_btn.is_enabled():
                         next_btn.click()
-                        time.sleep(3)
                         return True
                 except:
                     continue
@@ -147,7 +127,6 @@ class MotilalOswalScraper:
                 return false;
             """)
             if clicked:
-                time.sleep(3)
                 return True
 
             return False
@@ -369,21 +348,9 @@ class MotilalOswalScraper:
             # --- Strategy 2: Selenium CSS selector-based extraction ---
             logger.info("JS extraction returned 0, trying Selenium selectors")
             job_elements = []
-            selectors = [
-                "div[class*='job']",
-                "div[class*='card']",
-                "div[class*='Card']",
-                "a[href*='/job']",
-                "div[class*='listing']",
-                "div[class*='position']",
-                "div[class*='requisition']",
-                "table tr",
-                "li[class*='job']",
-                "article",
-            ]
 
             short_wait = WebDriverWait(driver, 5)
-            for selector in selectors:
+            for selector in JOB_CARD_SELECTORS:
                 try:
                     short_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
                     elements = driver.find_elements(By.CSS_SELECTOR, selector)
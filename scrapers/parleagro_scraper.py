@@ -1,57 +1,41 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector, scroll_until_stable, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('parleagro_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job card locators _scrape_darwinbox_page tries, in order
+JOB_CARD_SELECTORS = [
+    (By.CSS_SELECTOR, 'div[class*="job-card"]'),
+    (By.CSS_SELECTOR, 'div[class*="jobCard"]'),
+    (By.CSS_SELECTOR, 'div[class*="job-listing"]'),
+    (By.CSS_SELECTOR, 'a[href*="/jobs/"]'),
+    (By.CSS_SELECTOR, 'a[href*="/careers/"]'),
+    (By.CSS_SELECTOR, 'div[class*="card"]'),
+    (By.CSS_SELECTOR, 'div[class*="vacancy"]'),
+    (By.CSS_SELECTOR, 'div[class*="opening"]'),
+    (By.CSS_SELECTOR, 'li[class*="job"]'),
+    (By.CSS_SELECTOR, 'article'),
+    (By.CSS_SELECTOR, '[role="listitem"]'),
+    (By.CSS_SELECTOR, 'tr[class*="data"]'),
+    (By.CSS_SELECTOR, 'div[class*="result"]'),
+]
+
 
 class ParleAgroScraper:
     def __init__(self):
         self.company_name = 'Parle Agro'
         self.url = 'https://www.parleagro.com/careers'
 
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--ignore-certificate-errors')
-        chrome_options.add_argument('--ignore-ssl-errors=yes')
-        chrome_options.add_argument('--disable-web-security')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"})
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -109,7 +93,7 @@ class ParleAgroScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver(arguments=['--ignore-certificate-errors', '--ignore-ssl-errors=yes', '--disable-web-security'])
 
             # Step 1: Load the main careers page to find Darwinbox link
             # Retry page load up to 3 times to handle 'Max retries exceeded' errors
@@ -122,11 +106,11 @@ class ParleAgroScraper:
                     break
                 except Exception as e:
                     logger.warning(f"Page load attempt {attempt + 1} failed: {str(e)}")
-                    if attempt < 2:
-                        time.sleep(5)
-                    else:
+                    if attempt == 2:
                         raise
-            time.sleep(8)
+                    # Let whatever did load settle before navigating again
+                    wait_for_dom_stable(driver, 5)
+            wait_for_dom_stable(driver, 8)
 
             # Step 2: Find and navigate to Darwinbox portal
             portal_url = self._find_darwinbox_portal_url(driver)
@@ -137,18 +121,17 @@ class ParleAgroScraper:
                     break
                 except Exception as e:
                     logger.warning(f"Portal load attempt {attempt + 1} failed: {str(e)}")
-                    if attempt < 2:
-                        time.sleep(5)
-                    else:
+                    # A slow load can still render its job cards; navigate again only if they never show up
+                    if wait_for_selector(driver, JOB_CARD_SELECTORS, 10):
+                        break
+                    if attempt == 2:
                         raise
-            time.sleep(12)  # Wait for SPA rendering
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 12)  # Wait for SPA rendering
 
             # Scroll to trigger lazy loading
-            for i in range(4):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight * %s);" % str((i + 1) / 4))
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             current_page = 1
 
@@ -169,12 +152,10 @@ class ParleAgroScraper:
                         if alt_url != portal_url:
                             logger.info(f"Trying alternate URL: {alt_url}")
                             driver.get(alt_url)
-                            time.sleep(12)
-                            for i in range(3):
-                                driver.execute_script("window.scrollTo(0, document.body.scrollHeight * %s);" % str((i + 1) / 3))
-                                time.sleep(2)
+                            wait_for_selector(driver, JOB_CARD_SELECTORS, 12)
+                            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
                             driver.execute_script("window.scrollTo(0, 0);")
-                            time.sleep(2)
+                            wait_for_dom_stable(driver, 2)
                             page_jobs = self._scrape_darwinbox_page(driver)
                             if page_jobs:
                                 break
@@ -188,10 +169,11 @@ class ParleAgroScraper:
 
                 # Try to navigate to next page
                 if current_page < max_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(4)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 4)
 
                 current_page += 1
 
@@ -203,7 +185,7 @@ class ParleAgroScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -213,7 +195,7 @@ class ParleAgroScraper:
             next_page_num = current_page + 1
 
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             next_page_selectors = [
                 (By.XPATH, f'//button[text()="{next_page_num}"]'),
@@ -271,7 +253,7 @@ class ParleAgroScraper:
     def _scrape_darwinbox_page(self, driver):
         """Scrape jobs from Darwinbox career portal using JS-first extraction"""
         jobs = []
-        time.sleep(2)
+        wait_for_selector(driver, JOB_CARD_SELECTORS, 2)
 
         # Strategy 1: JS-based extraction for Darwinbox platform
         try:
@@ -490,23 +472,8 @@ class ParleAgroScraper:
             logger.info("JS extraction found 0 jobs, trying Selenium selectors")
             wait = WebDriverWait(driver, 8)
             job_cards = []
-            selectors = [
-                (By.CSS_SELECTOR, 'div[class*="job-card"]'),
-                (By.CSS_SELECTOR, 'div[class*="jobCard"]'),
-                (By.CSS_SELECTOR, 'div[class*="job-listing"]'),
-                (By.CSS_SELECTOR, 'a[href*="/jobs/"]'),
-                (By.CSS_SELECTOR, 'a[href*="/careers/"]'),
-                (By.CSS_SELECTOR, 'div[class*="card"]'),
-                (By.CSS_SELECTOR, 'div[class*="vacancy"]'),
-                (By.CSS_SELECTOR, 'div[class*="opening"]'),
-                (By.CSS_SELECTOR, 'li[class*="job"]'),
-                (By.CSS_SELECTOR, 'article'),
-                (By.CSS_SELECTOR, '[role="listitem"]'),
-                (By.CSS_SELECTOR, 'tr[class*="data"]'),
-                (By.CSS_SELECTOR, 'div[class*="result"]'),
-            ]
 
-            for selector_type, selector_value in selectors:
+            for selector_type, selector_value in JOB_CARD_SELECTORS:
                 try:
                     wait.until(EC.presence_of_element_located((selector_type, selector_value)))
                     job_cards = driver.find_elements(selector_type, selector_value)
@@ -657,7 +624,6 @@ class ParleAgroScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(4)
 
             try:
                 desc_selectors = [
@@ -665,6 +631,7 @@ class ParleAgroScraper:
                     (By.CSS_SELECTOR, 'div[class*="description"]'),
                     (By.XPATH, '//div[contains(@class, "description")]'),
                 ]
+                wait_for_selector(driver, desc_selectors, 4)
 
                 for selector_type, selector_value in desc_selectors:
                     try:
@@ -679,7 +646,7 @@ class ParleAgroScraper:
 
             driver.close()
             driver.switch_to.window(original_window)
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
         except Exception as e:
             logger.error(f"Error fetching job details: {str(e)}")
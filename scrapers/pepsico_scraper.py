@@ -1,14 +1,8 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
-from pathlib import Path
-import os
-import stat
 
 try:
     import requests as req_lib
@@ -17,12 +11,13 @@ except ImportError:
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.http_client import http_get
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('pepsico_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 
 class PepsiCoScraper:
     def __init__(self):
@@ -30,44 +25,6 @@ class PepsiCoScraper:
         self.url = 'https://www.pepsicojobs.com/main/jobs?stretchUnit=MILES&stretch=10&location=India&woe=12&regionCode=IN'
         self.api_url = 'https://www.pepsicojobs.com/api/jobs'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        driver_path = CHROMEDRIVER_PATH
-        driver_path_obj = Path(driver_path)
-        if driver_path_obj.name != 'chromedriver':
-            parent = driver_path_obj.parent
-            actual_driver = parent / 'chromedriver'
-            if actual_driver.exists():
-                driver_path = str(actual_driver)
-            else:
-                for file in parent.rglob('chromedriver'):
-                    if file.is_file() and not file.name.endswith('.zip'):
-                        driver_path = str(file)
-                        break
-
-        try:
-            current_permissions = os.stat(driver_path).st_mode
-            os.chmod(driver_path, current_permissions | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-        except Exception as e:
-            logger.warning(f"Could not set permissions: {str(e)}")
-
-        service = Service(driver_path)
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -102,7 +59,7 @@ class PepsiCoScraper:
             try:
                 params = {'location': 'India', 'page': page, 'limit': limit, 'locale': 'en'}
                 logger.info(f"Fetching API page {page}")
-                response = req_lib.get(self.api_url, params=params, headers=headers, timeout=30)
+                response = http_get(self.api_url, params=params, headers=headers, timeout=30)
                 response.raise_for_status()
                 data = response.json()
 
@@ -172,7 +129,7 @@ class PepsiCoScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} Selenium scraping from {self.url}")
             driver.get(self.url)
             wait = WebDriverWait(driver, SCRAPE_TIMEOUT)
@@ -190,7 +147,7 @@ class PepsiCoScraper:
                     )))
                 except:
                     logger.warning("Timeout waiting for listings")
-                    time.sleep(5)
+                    wait_for_dom_stable(driver, 5)
 
             current_page = 1
             while current_page <= max_pages:
@@ -211,7 +168,7 @@ class PepsiCoScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
     def _go_to_next_page(self, driver):
         try:
@@ -219,10 +176,7 @@ class PepsiCoScraper:
             time.sleep(0.5)
 
             # Capture current first job text for change detection
-            old_first = driver.execute_script("""
-                var card = document.querySelector('[data-ph-at-id="jobs-list-item"]');
-                return card ? card.innerText.substring(0, 50) : '';
-            """)
+            signature = page_signature(driver, '[data-ph-at-id="jobs-list-item"]')
 
             # Phenom-specific selectors first, then generic fallbacks
             for sel_type, sel_val in [
@@ -241,15 +195,7 @@ class PepsiCoScraper:
                     driver.execute_script("arguments[0].click();", btn)
 
                     # Poll for page change instead of blind sleep (max 4s)
-                    for _ in range(20):
-                        time.sleep(0.2)
-                        new_first = driver.execute_script("""
-                            var card = document.querySelector('[data-ph-at-id="jobs-list-item"]');
-                            return card ? card.innerText.substring(0, 50) : '';
-                        """)
-                        if new_first and new_first != old_first:
-                            break
-                    time.sleep(0.5)  # Brief settle after change detected
+                    wait_for_page_change(driver, '[data-ph-at-id="jobs-list-item"]', signature, 4)
                     return True
                 except:
                     continue
@@ -392,7 +338,7 @@ class PepsiCoScraper:
             driver.execute_script("window.open('');")
             driver.switch_to.window(driver.window_handles[-1])
             driver.get(job_url)
-            time.sleep(3)
+            wait_for_selector(driver, ".job-description, [class*='description']", 3)
 
             for sel in [".job-description", "[class*='description']", "[class*='detail']", "main"]:
                 try:
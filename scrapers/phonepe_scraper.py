@@ -1,11 +1,7 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
@@ -15,45 +11,19 @@ except ImportError:
     req_lib = None
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.http_client import http_get
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('phonepe_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class PhonePeScraper:
     def __init__(self):
         self.company_name = 'PhonePe'
         self.url = 'https://www.phonepe.com/careers/'
         self.api_url = 'https://boards-api.greenhouse.io/v1/boards/phonepe/jobs'
 
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -89,7 +59,7 @@ class PhonePeScraper:
 
         try:
             logger.info(f"Fetching all PhonePe postings from Greenhouse API: {self.api_url}")
-            response = req_lib.get(self.api_url, headers=headers, timeout=30)
+            response = http_get(self.api_url, headers=headers, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -204,12 +174,12 @@ class PhonePeScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             greenhouse_url = 'https://boards.greenhouse.io/phonepe'
             logger.info(f"Starting {self.company_name} Selenium scraping from {greenhouse_url}")
 
             driver.get(greenhouse_url)
-            time.sleep(10)
+            wait_for_selector(driver, '.opening a', 10)
 
             # Extract jobs from Greenhouse board page
             js_jobs = driver.execute_script("""
@@ -302,7 +272,7 @@ class PhonePeScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def parse_location(self, location_str):
@@ -1,71 +1,22 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('piramalgroup_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class PiramalGroupScraper:
     def __init__(self):
         self.company_name = 'Piramal Group'
         self.url = 'https://www.piramal.com/careers'
 
-    def setup_driver(self):
-        """Set up Chrome driver with anti-detection"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        driver_paths = [
-            CHROMEDRIVER_PATH,
-            '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133/chromedriver-mac-arm64/chromedriver',
-            '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/143.0.7499.192/chromedriver-mac-arm64/chromedriver',
-        ]
-
-        driver = None
-        for dp in driver_paths:
-            try:
-                service = Service(dp)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-                logger.info(f"ChromeDriver started with: {dp}")
-                break
-            except Exception as e:
-                logger.warning(f"ChromeDriver {dp} failed: {e}")
-                continue
-
-        if not driver:
-            try:
-                driver = webdriver.Chrome(options=chrome_options)
-                logger.info("Using default ChromeDriver")
-            except Exception as e:
-                logger.error(f"All ChromeDriver attempts failed: {e}")
-                raise
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -83,7 +34,7 @@ class PiramalGroupScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # piramal.com/careers returns 404, navigate through main site
             # The main piramal.com links to subsidiary career pages which use Darwinbox
@@ -91,7 +42,7 @@ class PiramalGroupScraper:
 
             # First try the original URL, if it 404s go to the Darwinbox page
             driver.get(self.url)
-            time.sleep(8)
+            wait_for_dom_stable(driver, 8)
 
             # Check if page loaded properly or is a 404
             body_text = driver.find_element(By.TAG_NAME, 'body').text
@@ -100,7 +51,7 @@ class PiramalGroupScraper:
             if is_404:
                 logger.info("Careers page returned 404, navigating to main site to find careers link")
                 driver.get('https://www.piramal.com')
-                time.sleep(12)
+                wait_for_dom_stable(driver, 12)
 
                 # Look for career links that lead to Darwinbox
                 try:
@@ -123,7 +74,7 @@ class PiramalGroupScraper:
                 # If we found a piramalfinance link, follow it to find the Darwinbox link
                 if 'piramalfinance' in darwinbox_url:
                     driver.get(darwinbox_url)
-                    time.sleep(10)
+                    wait_for_dom_stable(driver, 10)
                     try:
                         db_links = driver.execute_script("""
                             var results = [];
@@ -142,14 +93,12 @@ class PiramalGroupScraper:
 
             logger.info(f"Navigating to Darwinbox careers: {darwinbox_url}")
             driver.get(darwinbox_url)
-            time.sleep(15)
+            wait_for_selector(driver, 'a[href*="/ms/candidate/careers/"]', 15)
 
             # Scroll to load
-            for i in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, 'a[href*="/ms/candidate/careers/"]', max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Extract jobs from Darwinbox
             jobs = self._extract_darwinbox_jobs(driver)
@@ -162,7 +111,7 @@ class PiramalGroupScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -0,0 +1,5 @@
+"""
+Platform engines: one scraper per applicant-tracking platform, configured per
+company instead of copied per company.  Each engine builds zero-argument
+scraper classes so ``scrapers.registry`` can map them like any other scraper.
+"""
@@ -0,0 +1,58 @@
+"""
+Helpers shared by the platform engines.
+"""
+import hashlib
+import html
+import re
+
+INDIA_CITIES = ['india', 'mumbai', 'bangalore', 'bengaluru', 'delhi', 'hyderabad', 'chennai', 'pune',
+                'kolkata', 'gurgaon', 'gurugram', 'noida', 'ahmedabad', 'jaipur', 'lucknow', 'kochi',
+                'chandigarh', 'indore', 'nagpur', 'coimbatore', 'thiruvananthapuram', 'visakhapatnam',
+                'bhubaneswar', 'mangalore', 'mysore', 'vadodara', 'surat', 'rajkot', 'goa']
+
+_INDIA_PATTERN = re.compile(r'\b(' + '|'.join(re.escape(city) for city in INDIA_CITIES) + r')\b')
+_BLOCK_TAGS = re.compile(r'<\s*(br|/p|/div|/li|/h\d|/tr)\b[^>]*>', re.IGNORECASE)
+_TAGS = re.compile(r'<[^>]+>')
+
+
+def generate_external_id(job_id, company):
+    unique_string = f"{company}_{job_id}"
+    return hashlib.md5(unique_string.encode()).hexdigest()
+
+
+def parse_location(location_str, default_country='India'):
+    """Split ``City, State, Country`` / ``City, Country`` into its parts."""
+    result = {'city': '', 'state': '', 'country': default_country}
+    if not location_str:
+        return result
+    location_str = location_str.strip()
+    parts = [p.strip() for p in location_str.split(',')]
+    if len(parts) >= 1:
+        result['city'] = parts[0]
+    if len(parts) == 3:
+        result['state'] = parts[1]
+        result['country'] = parts[2]
+    elif len(parts) == 2:
+        result['country'] = parts[1]
+    if 'India' in location_str or 'IND' in location_str:
+        result['country'] = 'India'
+    return result
+
+
+def is_india_location(*texts):
+    """True when any of ``texts`` names India or an Indian city.
+
+    Word boundaries keep 'Indiana' from matching, and URL slugs such as
+    'India---Hyderabad' are split on dashes first.
+    """
+    combined = ' '.join((t or '').lower().replace('-', ' ') for t in texts)
+    return bool(_INDIA_PATTERN.search(combined))
+
+
+def html_to_text(value, limit=3000):
+    """Plain text from an HTML fragment, one line per block element."""
+    if not value:
+        return ''
+    text = html.unescape(_TAGS.sub('', _BLOCK_TAGS.sub('\n', value)))
+    lines = [' '.join(line.split()) for line in text.splitlines()]
+    return '\n'.join(line for line in lines if line)[:limit]
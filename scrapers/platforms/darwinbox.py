@@ -0,0 +1,240 @@
+"""
+Generic DarwinBox engine.
+
+DarwinBox candidate portals (``<tenant>.darwinbox.in/ms/candidate/careers``
+and the Angular ``/ms/candidatev2/main/careers/allJobs``) render their job
+list from a JSON call the SPA makes on load.  The engine sends that call
+itself over the shared HTTP client (``JOB_LIST_APIS``, one per variant) and
+pages it on the server through ``scrapers.platforms.learned``.  Only when
+the direct call yields no jobs is the call learned in the browser; there
+classic portals are first navigated to their "all jobs" page, and the
+rendered-page extraction handles both layouts.
+
+``darwinbox_scraper(key)`` returns a zero-argument scraper class for the
+registry.
+"""
+import hashlib
+from urllib.parse import urlparse
+
+from core.logging import setup_logger
+from config.scraper import DARWINBOX_SITES
+from scrapers.platforms.common import generate_external_id
+from scrapers.platforms.learned import HEADERS, LearnedEndpointScraper, field, text
+
+logger = setup_logger('darwinbox_scraper')
+
+# Job-list calls of classic (False) and candidatev2 (True) portals, relative to the tenant origin
+JOB_LIST_APIS = {
+    False: '/ms/candidate/careers/allJobs',
+    True: '/ms/candidatev2/main/careers/allJobs',
+}
+PAGE_SIZE = 50
+# DarwinBox answers its own XHRs with JSON and page loads with the SPA shell
+API_HEADERS = {**HEADERS, 'X-Requested-With': 'XMLHttpRequest'}
+
+TITLE_FIELDS = ('title', 'job_title', 'jobtitle', 'designation', 'position', 'name')
+ID_FIELDS = ('id', 'job_id', 'jobid', '_id')
+LOCATION_FIELDS = ('location', 'job_location', 'joblocation', 'locations', 'office_location', 'officelocation', 'city')
+EMPLOYMENT_FIELDS = ('employee_type', 'employment_type', 'employmenttype', 'job_type', 'jobtype', 'emp_type')
+EXPERIENCE_FIELDS = ('experience', 'experience_range', 'exp')
+DEPARTMENT_FIELDS = ('department', 'department_name', 'departmentname', 'dept', 'function')
+
+FIND_ALL_JOBS_JS = """
+    var links = document.querySelectorAll('a[href]');
+    for (var i = 0; i < links.length; i++) {
+        var href = links[i].href || '';
+        if (href.includes('allJobs') || href.includes('all-jobs') || href.includes('openJobs')) {
+            return href;
+        }
+    }
+    var allElements = document.querySelectorAll('a, button, span');
+    for (var i = 0; i < allElements.length; i++) {
+        var text = (allElements[i].innerText || '').trim().toLowerCase();
+        if (text === 'open jobs' || text === 'view all jobs' || text === 'all jobs' || text === 'view all') {
+            if (allElements[i].href) return allElements[i].href;
+        }
+    }
+    return null;
+"""
+
+# arguments[0]: true for candidatev2 portals (job tiles), false for v1 (job links / table rows)
+EXTRACT_JOBS_JS = """
+    var v2 = arguments[0];
+    var locationPattern = /India|Haryana|Gujarat|Maharashtra|Karnataka|Goa|Delhi|Tamil Nadu|Rajasthan|Odisha|Jharkhand|Chhattisgarh|Andhra Pradesh|Telangana|Kerala|Punjab|West Bengal|Uttar Pradesh|Bengaluru|Bangalore|Mumbai|Chennai|Hyderabad|Pune|Gurgaon|Noida/;
+    var skip = ['View and Apply', 'Apply', 'apply here'];
+
+    function fromTiles() {
+        var results = [];
+        var seen = {};
+        var tiles = document.querySelectorAll('div.job-tile, div.jobs-section, div[class*="job-card"], div[class*="job-item"], div[class*="job-listing"]');
+        for (var i = 0; i < tiles.length; i++) {
+            var text = (tiles[i].innerText || '').trim();
+            if (text.length < 5) continue;
+            var titleEl = tiles[i].querySelector('span.job-title, .title-section, h3, h4, [class*="title"]');
+            var title = titleEl ? titleEl.innerText.trim() : text.split('\\n')[0].trim();
+            var linkEl = tiles[i].querySelector('a[href*="jobDetails"], a[href*="/careers/"]');
+            var url = linkEl ? linkEl.href : '';
+            if (title.length < 3 || skip.indexOf(title) >= 0 || seen[url || title]) continue;
+            seen[url || title] = true;
+            var location = '', experience = '', employment_type = '';
+            var lines = text.split('\\n');
+            for (var j = 0; j < lines.length; j++) {
+                var line = lines[j].trim();
+                if (locationPattern.test(line)) location = line;
+                if (/years/i.test(line)) experience = line;
+                if (['Permanent', 'Contract', 'Probation', 'Intern', 'Full Time', 'Part Time'].indexOf(line) >= 0) employment_type = line;
+            }
+            results.push({title: title, url: url, location: location, experience: experience, employment_type: employment_type});
+        }
+        return results;
+    }
+
+    function fromLinks() {
+        var results = [];
+        var seen = {};
+        var links = document.querySelectorAll('a[href]');
+        for (var i = 0; i < links.length; i++) {
+            var href = links[i].href || '';
+            if (!/\\/ms\\/candidate\\/careers\\/[a-f0-9]{10,}/.test(href) && !href.includes('jobDetails')) continue;
+            if (href.includes('/others') || seen[href]) continue;
+            var title = (links[i].innerText || '').trim().split('\\n')[0].trim();
+            if (title.length < 3 || skip.indexOf(title) >= 0) continue;
+            seen[href] = true;
+            var location = '';
+            var row = links[i].closest('tr, div.job-row, div[class*="result"]');
+            if (row) {
+                var cells = row.querySelectorAll('td');
+                for (var c = 1; c < cells.length; c++) {
+                    var cellText = (cells[c].innerText || '').trim();
+                    if (locationPattern.test(cellText)) location = cellText;
+                }
+            }
+            results.push({title: title, url: href, location: location, experience: '', employment_type: ''});
+        }
+        return results;
+    }
+
+    var results = v2 ? fromTiles() : fromLinks();
+    return results.length ? results : (v2 ? fromLinks() : fromTiles());
+"""
+
+def _parse_location(location_str):
+    """(city, state) from DarwinBox location text, skipping internal office codes."""
+    city = ''
+    state = ''
+    for part in (p.strip() for p in (location_str or '').split(',')):
+        if part == 'India' or '..+' in part:
+            continue
+        if '#' in part or '_' in part:
+            if '(' in part and ')' in part:
+                state = part.split('(')[-1].split(')')[0].strip()
+            continue
+        if not city:
+            city = part
+        elif not state:
+            state = part
+    return city, state
+
+
+class DarwinBoxScraper(LearnedEndpointScraper):
+    headers = API_HEADERS
+    card_selectors = ['div.job-tile, div.jobs-section, div[class*="job-card"], div[class*="job-item"], div[class*="job-listing"]',
+                      'a[href*="jobDetails"], a[href*="/ms/candidate/careers/"]']
+
+    def __init__(self):
+        site = DARWINBOX_SITES[self.site_key]
+        self.company_name = site['company_name']
+        self.url = site['url']
+        parsed = urlparse(self.url)
+        self.origin = f"{parsed.scheme}://{parsed.netloc}"
+        self.v2 = '/candidatev2/' in parsed.path
+
+    def list_requests(self):
+        # The portal's own variant first; tenants migrating between the two often serve both
+        return [{'url': f"{self.origin}{JOB_LIST_APIS[v2]}?page=1&limit={PAGE_SIZE}"}
+                for v2 in (self.v2, not self.v2)]
+
+    def _open(self, driver):
+        from core.waits import wait_for_dom_stable
+
+        if self.v2:
+            return
+        all_jobs_url = driver.execute_script(FIND_ALL_JOBS_JS)
+        if all_jobs_url:
+            logger.info(f"Navigating to all jobs page: {all_jobs_url}")
+            driver.get(all_jobs_url)
+            wait_for_dom_stable(driver, 12)
+
+    def _job_url(self, job_id):
+        if self.v2:
+            return f"{self.origin}/ms/candidatev2/main/careers/jobDetails/{job_id}"
+        return f"{self.origin}/ms/candidate/careers/{job_id}"
+
+    def _jobs_from_items(self, items):
+        jobs = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            title = text(field(item, TITLE_FIELDS))
+            job_id = text(field(item, ID_FIELDS))
+            if not title or not job_id:
+                continue
+            experience = text(field(item, EXPERIENCE_FIELDS))
+            if not experience:
+                low, high = item.get('min_experience'), item.get('max_experience')
+                if low is not None and high is not None:
+                    experience = f"{low} - {high} Years"
+            jobs.append(self._to_job(
+                title, self._job_url(job_id), text(field(item, LOCATION_FIELDS)),
+                experience=experience,
+                employment_type=text(field(item, EMPLOYMENT_FIELDS)),
+                department=text(field(item, DEPARTMENT_FIELDS)),
+            ))
+        return jobs
+
+    def _jobs_from_dom(self, driver):
+        rows = driver.execute_script(EXTRACT_JOBS_JS, self.v2) or []
+        jobs = []
+        seen = set()
+        for row in rows:
+            title = (row.get('title') or '').strip()
+            url = row.get('url') or ''
+            if not title or (url and url in seen):
+                continue
+            seen.add(url)
+            jobs.append(self._to_job(title, url, row.get('location', ''),
+                                     experience=row.get('experience', ''),
+                                     employment_type=row.get('employment_type', '')))
+        return jobs
+
+    def _to_job(self, title, url, location, experience='', employment_type='', department=''):
+        if url and 'jobDetails/' in url:
+            job_id = url.split('jobDetails/')[-1].split('?')[0]
+        else:
+            job_id = hashlib.md5((url or title).encode()).hexdigest()[:12]
+        city, state = _parse_location(location)
+        return {
+            'external_id': generate_external_id(job_id, self.company_name),
+            'company_name': self.company_name,
+            'title': title,
+            'description': '',
+            'location': location,
+            'city': city,
+            'state': state,
+            'country': 'India',
+            'employment_type': employment_type,
+            'department': department,
+            'apply_url': url or self.url,
+            'posted_date': '',
+            'job_function': '',
+            'experience_level': experience,
+            'salary_range': '',
+            'remote_type': '',
+            'status': 'active'
+        }
+
+
+def darwinbox_scraper(site_key):
+    """Scraper class for the ``DARWINBOX_SITES`` entry ``site_key``."""
+    name = ''.join(ch for ch in DARWINBOX_SITES[site_key]['company_name'].title() if ch.isalnum())
+    return type(f'{name}Scraper', (DarwinBoxScraper,), {'site_key': site_key, '__module__': __name__})
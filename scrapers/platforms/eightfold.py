@@ -0,0 +1,138 @@
+"""
+Generic Eightfold engine.
+
+Eightfold career sites (``<tenant>.eightfold.ai/careers`` or a custom host
+such as ``jobs.ericsson.com/careers``) list positions from one JSON API:
+
+    GET <host>/api/apply/v2/jobs?domain=<domain>&location=India&start=0&num=10
+        -> {"count": N, "positions": [...]}
+
+so a company only needs an entry in ``config.scraper.EIGHTFOLD_SITES``.  The
+listing is paginated concurrently with ``fetch_offset_pages``.
+
+``eightfold_scraper(key)`` returns a zero-argument scraper class for the
+registry.
+"""
+from datetime import datetime, timezone
+
+from core.http_cache import check_listing
+from core.http_client import http_get
+from core.logging import setup_logger
+from core.pagination import fetch_offset_pages
+from config.scraper import MAX_PAGES_TO_SCRAPE, EIGHTFOLD_SITES
+from scrapers.platforms.common import generate_external_id, parse_location, is_india_location, html_to_text
+
+logger = setup_logger('eightfold_scraper')
+
+# Eightfold returns at most 10 positions per call whatever ``num`` asks for
+PAGE_SIZE = 10
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'application/json',
+}
+
+
+def _first(value):
+    if isinstance(value, list):
+        return str(value[0]) if value else ''
+    return str(value or '')
+
+
+def _posted_date(value):
+    """ISO date from Eightfold's epoch-seconds ``t_create``."""
+    if isinstance(value, (int, float)) and value > 0:
+        return datetime.fromtimestamp(value, tz=timezone.utc).date().isoformat()
+    return str(value or '')
+
+
+class EightfoldScraper:
+    site_key = None
+
+    def __init__(self):
+        site = EIGHTFOLD_SITES[self.site_key]
+        self.site = site
+        self.company_name = site['company_name']
+        self.host = site['host']
+        self.domain = site['domain']
+        self.api_url = f"{self.host}/api/apply/v2/jobs"
+        self.url = site.get('url', f"{self.host}/careers")
+
+    def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        params = {
+            'domain': self.domain,
+            'location': self.site.get('location', 'India'),
+            'sort_by': 'relevance',
+            **self.site.get('params', {}),
+        }
+        headers = {**HEADERS, 'Referer': self.url}
+
+        def fetch_page(offset):
+            response = http_get(self.api_url, params={**params, 'start': offset, 'num': PAGE_SIZE},
+                                headers=headers)
+            response.raise_for_status()
+            if not offset:
+                check_listing(response)
+            return response.json()
+
+        positions = fetch_offset_pages(
+            fetch_page, PAGE_SIZE,
+            items_of=lambda data: data.get('positions', []),
+            total_of=lambda data: data.get('count', 0),
+            max_items=max_pages * PAGE_SIZE,
+            key=lambda position: position.get('id'),
+        )
+        logger.info(f"{self.company_name}: API returned {len(positions)} positions")
+
+        jobs = []
+        for position in positions:
+            try:
+                job = self._to_job(position)
+            except Exception as e:
+                logger.error(f"Error processing position: {str(e)}")
+                continue
+            if job:
+                jobs.append(job)
+
+        logger.info(f"{self.company_name}: {len(jobs)} jobs")
+        return jobs
+
+    def _to_job(self, position):
+        title = (position.get('name') or '').strip()
+        job_id = str(position.get('id') or '')
+        if not title or not job_id:
+            return None
+
+        location = _first(position.get('location') or position.get('locations'))
+        if self.site.get('india_only') and not is_india_location(location, *map(str, position.get('locations') or [])):
+            logger.debug(f"Filtered non-India job: {title} | {location}")
+            return None
+
+        apply_url = (position.get('canonicalPositionUrl')
+                     or f"{self.host}/careers?pid={job_id}&domain={self.domain}")
+        location_parts = parse_location(location)
+        return {
+            'external_id': generate_external_id(job_id, self.company_name),
+            'company_name': self.company_name,
+            'title': title,
+            'description': html_to_text(position.get('job_description') or ''),
+            'location': location,
+            'city': location_parts['city'],
+            'state': location_parts['state'],
+            'country': location_parts['country'],
+            'employment_type': _first(position.get('type') or position.get('employment_type')),
+            'department': _first(position.get('department') or position.get('business_unit')),
+            'apply_url': apply_url,
+            'posted_date': _posted_date(position.get('t_create')),
+            'job_function': '',
+            'experience_level': _first(position.get('experience_level')),
+            'salary_range': '',
+            'remote_type': _first(position.get('work_location_option')),
+            'status': 'active'
+        }
+
+
+def eightfold_scraper(site_key):
+    """Scraper class for the ``EIGHTFOLD_SITES`` entry ``site_key``."""
+    name = ''.join(ch for ch in EIGHTFOLD_SITES[site_key]['company_name'].title() if ch.isalnum())
+    return type(f'{name}Scraper', (EightfoldScraper,), {'site_key': site_key})
@@ -0,0 +1,203 @@
+"""
+Platform fingerprinting: route a careers URL to a platform engine.
+
+``detect(company_name, url)`` looks at the URL and, when the
+URL alone does not tell, at the page it returns over plain HTTP (no
+browser).  Hostnames identify Workday (``*.myworkdayjobs.com``), DarwinBox,
+PeopleStrong, Eightfold and SmartRecruiters.  Paths identify Oracle HCM
+(``/hcmUI/CandidateExperience/``).  Markup identifies Phenom (the ``phApp``
+globals), TalentBrew and SuccessFactors RMK.  A match is returned as
+``(platform, site)``, where ``site`` is the entry that platform's
+``*_SITES`` dict would hold for the company.  The engines are tried from
+the fastest (one JSON API) to the slowest (learned endpoints that may need
+a browser on their first run).
+
+Results, including "no platform", are cached per company and URL in
+``FINGERPRINTS_FILE``, so detection costs one request per company ever.
+Worker processes share the file, so saves are locked and atomic
+(``core.files.update_json``).
+``platform_scraper`` turns a match into a scraper class by adding the site
+to the platform's config dict under the scraper key.
+"""
+import re
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs, unquote
+
+from core.files import load_json, update_json
+from core.http_client import http_get
+from core.logging import setup_logger
+from config.scraper import (HTTP_CACHE_DIR, WORKDAY_SITES, ORACLE_HCM_SITES, DARWINBOX_SITES, PEOPLESTRONG_SITES,
+                            SUCCESSFACTORS_SITES, PHENOM_SITES, EIGHTFOLD_SITES, SMARTRECRUITERS_SITES,
+                            TALENTBREW_SITES)
+from scrapers.platforms.workday import WorkdayScraper, workday_scraper
+from scrapers.platforms.oracle_hcm import OracleHCMScraper, oracle_hcm_scraper
+from scrapers.platforms.darwinbox import DarwinBoxScraper, darwinbox_scraper
+from scrapers.platforms.peoplestrong import PeopleStrongScraper, peoplestrong_scraper
+from scrapers.platforms.successfactors import SuccessFactorsScraper, successfactors_scraper
+from scrapers.platforms.phenom import PhenomScraper, phenom_scraper
+from scrapers.platforms.eightfold import EightfoldScraper, eightfold_scraper
+from scrapers.platforms.smartrecruiters import SmartRecruitersScraper, smartrecruiters_scraper
+from scrapers.platforms.talentbrew import TalentBrewScraper, talentbrew_scraper, find_org_id
+
+logger = setup_logger('platform_fingerprint')
+
+FINGERPRINTS_FILE = HTTP_CACHE_DIR.parent / 'platform_fingerprints.json'
+
+# platform -> (config dict, scraper factory, engine class)
+PLATFORMS = {
+    'workday': (WORKDAY_SITES, workday_scraper, WorkdayScraper),
+    'oracle_hcm': (ORACLE_HCM_SITES, oracle_hcm_scraper, OracleHCMScraper),
+    'eightfold': (EIGHTFOLD_SITES, eightfold_scraper, EightfoldScraper),
+    'smartrecruiters': (SMARTRECRUITERS_SITES, smartrecruiters_scraper, SmartRecruitersScraper),
+    'phenom': (PHENOM_SITES, phenom_scraper, PhenomScraper),
+    'talentbrew': (TALENTBREW_SITES, talentbrew_scraper, TalentBrewScraper),
+    'successfactors': (SUCCESSFACTORS_SITES, successfactors_scraper, SuccessFactorsScraper),
+    'darwinbox': (DARWINBOX_SITES, darwinbox_scraper, DarwinBoxScraper),
+    'peoplestrong': (PEOPLESTRONG_SITES, peoplestrong_scraper, PeopleStrongScraper),
+}
+ENGINE_CLASSES = tuple(engine for _, _, engine in PLATFORMS.values())
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+}
+
+_WORKDAY_HOST = re.compile(r'^([\w-]+)\.(wd\d+)\.myworkdayjobs\.com$')
+_WORKDAY_PATH = re.compile(r'^/(?:([a-z]{2}-[A-Z]{2})/)?([\w-]+)')
+_ORACLE_SITE = re.compile(r'/hcmUI/CandidateExperience/[\w-]+/sites/([\w-]+)')
+_PHENOM_LOCALE = re.compile(r'"locale"\s*:\s*"([a-z]{2})_([a-z]+)"')
+_EIGHTFOLD_DOMAIN = re.compile(r'_EF_GROUP_ID\s*=\s*["\']([^"\']+)')
+
+
+def _load_cache():
+    return load_json(FINGERPRINTS_FILE)
+
+
+def _save(company_name, entry):
+    update_json(FINGERPRINTS_FILE, lambda cache: cache.update({company_name: entry}))
+
+
+def _from_url(company_name, url):
+    """(platform, site) that the URL alone identifies, or None."""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    query = parse_qs(parts.query)
+
+    workday = _WORKDAY_HOST.match(host)
+    if workday:
+        path = _WORKDAY_PATH.match(parts.path)
+        if path:
+            site = {'company_name': company_name, 'tenant': workday.group(1), 'datacenter': workday.group(2),
+                    'site': path.group(2), 'url': url}
+            if path.group(1):
+                site['locale'] = path.group(1)
+            return 'workday', site
+
+    oracle = _ORACLE_SITE.search(parts.path)
+    if oracle:
+        site = {'company_name': company_name, 'host': f"{parts.scheme}://{parts.netloc}",
+                'site_number': oracle.group(1), 'url': url}
+        facet = query.get('selectedLocationsFacet') or query.get('locationId')
+        if facet:
+            site['location_facet'] = unquote(facet[0])
+        return 'oracle_hcm', site
+
+    if host.endswith('.eightfold.ai'):
+        domain = (query.get('domain') or [host])[0]
+        return 'eightfold', {'company_name': company_name, 'host': f"https://{host}", 'domain': domain}
+
+    if host in ('careers.smartrecruiters.com', 'jobs.smartrecruiters.com'):
+        segments = [s for s in parts.path.split('/') if s]
+        if segments:
+            site = {'company_name': company_name, 'company_id': segments[0], 'url': url}
+            if 'india' in url.lower():
+                site['country'] = 'in'
+            return 'smartrecruiters', site
+
+    if host.endswith('.darwinbox.in'):
+        return 'darwinbox', {'company_name': company_name, 'url': url}
+
+    if host.endswith('.peoplestrong.com'):
+        return 'peoplestrong', {'company_name': company_name, 'subdomain': host.split('.')[0],
+                                'path': parts.path or '/'}
+    return None
+
+
+def _from_page(company_name, url, page):
+    """(platform, site) identified by the markup of the page at ``url``, or None."""
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+
+    if 'phApp' in page and '"refNum"' in page:
+        if '/search-results' in parts.path:
+            search_url = url
+        else:
+            locale = _PHENOM_LOCALE.search(page)
+            if not locale:
+                return None
+            search_url = f"{origin}/{locale.group(2)}/{locale.group(1)}/search-results"
+        return 'phenom', {'company_name': company_name, 'url': search_url}
+
+    domain = _EIGHTFOLD_DOMAIN.search(page)
+    if domain and '/careers' in parts.path:
+        return 'eightfold', {'company_name': company_name, 'host': origin, 'domain': domain.group(1)}
+
+    if 'tbcdn.talentbrew.com' in page or 'search-results-list' in page:
+        org_id = find_org_id(url, page)
+        if org_id:
+            return 'talentbrew', {'company_name': company_name, 'url': url, 'org_id': org_id}
+
+    if 'jobTitle-link' in page or 'rmkcdn.successfactors.com' in page:
+        return 'successfactors', {'company_name': company_name, 'url': url}
+    return None
+
+
+def detect(company_name, url):
+    """(platform, site) for a careers URL, or (None, None) when no engine fits.
+
+    Raises when the page is needed but cannot be fetched.
+    """
+    match = _from_url(company_name, url)
+    if not match:
+        response = http_get(url, headers=HEADERS)
+        response.raise_for_status()
+        match = _from_page(company_name, response.url or url, response.text)
+    return match or (None, None)
+
+
+def fingerprint(company_name, url, refresh=False):
+    """Cached ``detect``: (platform, site), or (None, None) when no engine fits."""
+    entry = None if refresh else _load_cache().get(company_name)
+    if entry and entry.get('url') == url:
+        return entry['platform'], entry.get('site')
+
+    try:
+        platform, site = detect(company_name, url)
+    except Exception as e:
+        # Not cached: a failed fetch says nothing about the platform
+        logger.warning(f"{company_name}: could not fetch {url[:100]}: {str(e)}")
+        return None, None
+    logger.info(f"{company_name}: {platform or 'no platform'} ({url[:100]})")
+    _save(company_name, {'url': url, 'platform': platform, 'site': site,
+                         'detected_at': datetime.now().isoformat(timespec='seconds')})
+    return platform, site
+
+
+def cached_fingerprint(company_name, url):
+    """(platform, site) from an earlier ``fingerprint`` of this URL, without fetching; (None, None) if unknown."""
+    entry = _load_cache().get(company_name)
+    if entry and entry.get('url') == url:
+        return entry['platform'], entry.get('site')
+    return None, None
+
+
+def cached_platform(company_name, url):
+    """Platform from an earlier ``fingerprint`` of this URL, without fetching; None if unknown."""
+    return cached_fingerprint(company_name, url)[0]
+
+
+def platform_scraper(platform, site, site_key):
+    """Scraper class for a detected site, registered in its platform's config under ``site_key``."""
+    sites, factory, _ = PLATFORMS[platform]
+    sites.setdefault(site_key, site)
+    return factory(site_key)
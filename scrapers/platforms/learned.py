@@ -0,0 +1,342 @@
+"""
+Learned job-list endpoints for platforms that do not document their API.
+
+DarwinBox and PeopleStrong portals are SPAs that render their job list
+from one JSON call made on load.  Engines first build that call
+themselves from config (``LearnedEndpointScraper.list_requests``) and
+send it over the shared HTTP client; ``core.discovery.rank_response``
+locates the item array in whatever comes back.  Only when no direct
+request yields jobs is the site opened in a driver leased with
+``NetworkCapture`` on.  The JSON response that ranks best as a job list is
+kept and the request behind it is stored in ``ENDPOINTS_FILE`` under the
+scraper key: url, method, body, the path to the item array, and any
+offset/page parameters.  Headers the page sent (cookies, CSRF and auth
+tokens) are never written: they page the captured endpoint for the rest of
+that lease and are then dropped.  Later scrapes replay the stored request
+with the engine's own headers; a 401 or 403 means it needs a session, so
+the endpoint is dropped and learned again in the browser.
+When the request carries an offset or page parameter and the response
+reports a total, ``fetch_pages`` lets the server do the paging through
+``fetch_offset_pages``.  Jobs are read from the rendered page only when no
+JSON job list is captured at all.
+
+Engines subclass ``LearnedEndpointScraper`` and turn items or DOM rows into
+job dicts.
+"""
+import json
+import re
+from abc import ABC, abstractmethod
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+from core.files import load_json, update_json
+from core.http_cache import ListingUnchanged, check_listing
+from core.http_client import http_request
+from core.logging import setup_logger
+from core.pagination import fetch_offset_pages
+from config.scraper import HTTP_CACHE_DIR, MAX_PAGES_TO_SCRAPE
+
+logger = setup_logger('learned_endpoints')
+
+ENDPOINTS_FILE = HTTP_CACHE_DIR.parent / 'learned_endpoints.json'
+# Minimum core.discovery.score_array score for a captured array to count as the job list
+MIN_SCORE = 0.5
+
+OFFSET_KEYS = {'offset', 'start', 'startrow', 'from', 'skip'}
+PAGE_KEYS = {'page', 'pagenumber', 'page_number', 'pageno', 'pg'}
+SIZE_KEYS = {'limit', 'pagesize', 'page_size', 'size', 'rows', 'num', 'per_page', 'perpage', 'take', 'pgsz'}
+# Captured headers the HTTP client sets itself, or that would pin a replay to the captured response
+SKIPPED_HEADERS = {'host', 'content-length', 'connection', 'accept-encoding', 'if-none-match', 'if-modified-since'}
+
+# What ``save_endpoint`` writes: the request's shape, never the session headers it was captured with
+PERSISTED_KEYS = ('url', 'method', 'post_data', 'path', 'pagination_params', 'total', 'items')
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+}
+
+
+def _persisted(endpoint):
+    return {key: endpoint[key] for key in PERSISTED_KEYS if key in endpoint}
+
+
+def load_endpoint(site_key):
+    # Entries written before headers were left out may still carry them; never replay those
+    endpoint = load_json(ENDPOINTS_FILE).get(site_key)
+    return _persisted(endpoint) if endpoint else None
+
+
+def save_endpoint(site_key, endpoint):
+    # Worker processes share the file: locked read-modify-write, atomic replace
+    stored = _persisted(endpoint)
+    update_json(ENDPOINTS_FILE, lambda endpoints: endpoints.update({site_key: stored}))
+
+
+def forget_endpoint(site_key):
+    update_json(ENDPOINTS_FILE, lambda endpoints: endpoints.pop(site_key, None))
+
+
+class EndpointExpired(Exception):
+    """The learned request was refused (401/403): the session it was captured with has expired."""
+
+
+def replay_headers(headers):
+    """Captured request headers worth sending again, with lower-case names."""
+    return {name.lower(): value for name, value in headers.items()
+            if not name.startswith(':') and name.lower() not in SKIPPED_HEADERS}
+
+
+def items_at(payload, path):
+    """Follow a ``core.discovery`` path such as ``$.data.jobs`` or ``$[0].list``."""
+    node = payload
+    for key, index in re.findall(r'\.([^.\[]+)|\[(\d+)\]', path):
+        node = node[key] if key else node[int(index)]
+    return node
+
+
+def field(item, names):
+    """First non-empty value of ``item`` under any of ``names`` (case-insensitive)."""
+    lowered = {k.lower(): v for k, v in item.items()}
+    for name in names:
+        value = lowered.get(name)
+        if value not in (None, '', []):
+            return value
+    return ''
+
+
+def text(value):
+    """Flatten a string / list / dict field (e.g. a list of location objects) to text."""
+    if isinstance(value, list):
+        return ', '.join(filter(None, (text(v) for v in value)))
+    if isinstance(value, dict):
+        return str(field(value, ('name', 'location', 'city', 'title', 'value')))
+    return str(value).strip() if value is not None else ''
+
+
+def capture_job_list(capture, min_score=MIN_SCORE):
+    """(endpoint, payload) for the best job-like JSON response captured so far, or (None, None)."""
+    from core.discovery import rank_response
+
+    best = None
+    for response in capture.responses(json_only=True):
+        body = capture.body(response['request_id'])
+        if not body:
+            continue
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            continue
+        candidate = rank_response(response, payload)
+        if candidate and candidate['score'] >= min_score and (
+                best is None or (candidate['score'], candidate['items']) > (best[0]['score'], best[0]['items'])):
+            best = (candidate, payload, response)
+    if not best:
+        return None, None
+    candidate, payload, response = best
+    endpoint = {k: candidate[k] for k in ('url', 'method', 'path', 'pagination_params', 'total', 'items')}
+    # The whole body (rank_response truncates it), and the page's headers for paging auth-gated
+    # APIs within this lease; save_endpoint leaves the headers out
+    endpoint['post_data'] = response.get('post_data', '')
+    endpoint['headers'] = replay_headers(response.get('headers', {}))
+    return endpoint, payload
+
+
+def probe_endpoint(request, headers=HEADERS, min_score=MIN_SCORE):
+    """(endpoint, payload) for a job-list request built from config, or (None, None).
+
+    ``request`` has the url, method and post_data of an endpoint; the item
+    array, total and paging parameters are read off the response.
+    """
+    from core.discovery import rank_response
+
+    request = {'method': 'GET', 'post_data': '', **request}
+    payload = _request(request, headers)
+    candidate = rank_response(request, payload)
+    if not candidate or candidate['score'] < min_score:
+        return None, None
+    endpoint = {k: candidate[k] for k in ('path', 'pagination_params', 'total', 'items')}
+    return {**request, **endpoint}, payload
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _request(endpoint, headers, overrides=None):
+    """Replay ``endpoint`` with ``overrides`` applied to its query string or JSON body.
+
+    Headers captured in this lease win over ``headers``.  Raises ``EndpointExpired`` on 401/403.
+    """
+    url = endpoint['url']
+    kwargs = {'headers': {**{name.lower(): value for name, value in headers.items()}, **endpoint.get('headers', {})}}
+    body = None
+    if endpoint.get('post_data'):
+        try:
+            body = json.loads(endpoint['post_data'])
+        except ValueError:
+            kwargs['data'] = endpoint['post_data']
+    if overrides:
+        parsed = urlparse(url)
+        query = parse_qsl(parsed.query, keep_blank_values=True)
+        if any(key in overrides for key, _ in query):
+            query = [(key, str(overrides.get(key, value))) for key, value in query]
+            url = urlunparse(parsed._replace(query=urlencode(query)))
+        if isinstance(body, dict):
+            body = {key: overrides.get(key, value) for key, value in body.items()}
+    if body is not None:
+        kwargs['json'] = body
+    # Job-list calls are read-only even when POSTed: cache and revalidate them like GETs
+    response = http_request(endpoint.get('method', 'GET'), url, cache=True, **kwargs)
+    if response.status_code in (401, 403):
+        raise EndpointExpired(f"{response.status_code} from {url[:100]}")
+    response.raise_for_status()
+    check_listing(response)
+    return response.json()
+
+
+def fetch_pages(endpoint, headers=HEADERS, max_pages=MAX_PAGES_TO_SCRAPE):
+    """Items from every page of a learned endpoint (just the one response if it is not paged)."""
+    from core.discovery import find_total
+
+    path = endpoint['path']
+    params = endpoint.get('pagination_params') or {}
+    offset_key = next((k for k in params if k.lower() in OFFSET_KEYS), None)
+    page_key = next((k for k in params if k.lower() in PAGE_KEYS), None)
+    size_key = next((k for k in params if k.lower() in SIZE_KEYS), None)
+    # Without a size parameter the captured page's length is the server's page size
+    page_size = _as_int(params.get(size_key)) or endpoint.get('items')
+    first_offset = _as_int(params.get(offset_key)) or 0
+    first_page = _as_int(params.get(page_key)) or 0
+
+    if not page_size or not (offset_key or page_key):
+        return list(items_at(_request(endpoint, headers), path) or [])
+
+    def fetch_page(offset):
+        # Keep the captured value's type: query strings want text, JSON bodies usually numbers
+        if offset_key:
+            key, value = offset_key, first_offset + offset
+        else:
+            key, value = page_key, first_page + offset // page_size
+        original = params[key]
+        return _request(endpoint, headers, {key: str(value) if isinstance(original, str) else value})
+
+    return fetch_offset_pages(
+        fetch_page, page_size,
+        items_of=lambda data: items_at(data, path),
+        total_of=find_total,
+        max_items=max_pages * page_size,
+    )
+
+
+class LearnedEndpointScraper(ABC):
+    """Scraper that requests a site's job-list API directly and falls back to the browser.
+
+    Subclasses set ``site_key``, ``company_name`` and ``url`` and implement
+    ``_jobs_from_items`` (JSON items to job dicts) and ``_jobs_from_dom``
+    (the loaded page to job dicts).  ``list_requests`` returns the job-list
+    requests to try before any learned endpoint or browser.  ``_open`` may navigate past a landing
+    page once the portal has loaded.  ``card_selectors`` lists the job cards
+    ``_jobs_from_dom`` looks for, in its fallback order; the page is scrolled
+    until they stop growing.
+    """
+    site_key = None
+    headers = HEADERS
+    card_selectors = ()
+
+    def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        jobs = self._scrape_direct(max_pages)
+        if jobs:
+            return jobs
+        endpoint = load_endpoint(self.site_key)
+        if endpoint:
+            try:
+                jobs = self._jobs_from_items(fetch_pages(endpoint, self.headers, max_pages))
+                if jobs:
+                    logger.info(f"{self.company_name}: API returned {len(jobs)} jobs")
+                    return jobs
+                logger.warning(f"{self.company_name}: API returned 0 jobs, falling back to browser")
+            except ListingUnchanged:
+                raise
+            except EndpointExpired as e:
+                logger.info(f"{self.company_name}: learned request refused ({str(e)}), re-learning it in the browser")
+                forget_endpoint(self.site_key)
+            except Exception as e:
+                logger.warning(f"{self.company_name}: API failed: {str(e)}, falling back to browser")
+        return self._scrape_via_browser(max_pages)
+
+    def _scrape_direct(self, max_pages):
+        for request in self.list_requests():
+            try:
+                endpoint, payload = probe_endpoint(request, self.headers)
+                if not endpoint:
+                    logger.info(f"{self.company_name}: no job list in {request['url'][:100]}")
+                    continue
+                items = items_at(payload, endpoint['path'])
+                if (endpoint.get('total') or 0) > len(items):
+                    items = fetch_pages(endpoint, self.headers, max_pages) or items
+                jobs = self._jobs_from_items(items)
+                if jobs:
+                    logger.info(f"{self.company_name}: job-list API returned {len(jobs)} jobs")
+                    return jobs
+            except ListingUnchanged:
+                raise
+            except Exception as e:
+                logger.info(f"{self.company_name}: job-list request {request['url'][:100]} failed: {str(e)}")
+        return []
+
+    def _scrape_via_browser(self, max_pages):
+        from core.browser import acquire_driver, release_driver
+        from core.network import NetworkCapture
+        from core.waits import wait_for_dom_stable, scroll_until_stable, SCROLL_PAGE_SIZE
+
+        driver = None
+        try:
+            driver = acquire_driver(capture=True)
+            capture = NetworkCapture(driver)
+            logger.info(f"{self.company_name}: loading {self.url}")
+            driver.get(self.url)
+            wait_for_dom_stable(driver, 12)
+            self._open(driver)
+
+            endpoint, payload = capture_job_list(capture)
+            if endpoint:
+                items = items_at(payload, endpoint['path'])
+                jobs = self._jobs_from_items(items)
+                if jobs:
+                    save_endpoint(self.site_key, endpoint)
+                    logger.info(f"{self.company_name}: learned {endpoint['method']} {endpoint['url'][:100]}")
+                    if (endpoint.get('total') or 0) > len(items):
+                        try:
+                            jobs = self._jobs_from_items(fetch_pages(endpoint, self.headers, max_pages)) or jobs
+                        except ListingUnchanged:
+                            raise
+                        except Exception as e:
+                            logger.warning(f"{self.company_name}: paging the learned endpoint failed: {str(e)}")
+                    logger.info(f"{self.company_name}: {len(jobs)} jobs")
+                    return jobs
+
+            scroll_until_stable(driver, self.card_selectors, max_items=max_pages * SCROLL_PAGE_SIZE)
+            jobs = self._jobs_from_dom(driver)
+            logger.info(f"{self.company_name}: {len(jobs)} jobs from the page")
+            return jobs
+        finally:
+            if driver:
+                release_driver(driver)
+
+    def list_requests(self):
+        return []
+
+    def _open(self, driver):
+        pass
+
+    @abstractmethod
+    def _jobs_from_items(self, items):
+        """Job dicts for the JSON items of a job list."""
+
+    @abstractmethod
+    def _jobs_from_dom(self, driver):
+        """Job dicts for the job list rendered in ``driver``."""
+
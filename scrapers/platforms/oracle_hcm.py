@@ -0,0 +1,170 @@
+"""
+Generic Oracle HCM Candidate Experience engine.
+
+Candidate Experience sites list jobs through one REST resource:
+
+    GET <host>/hcmRestApi/resources/latest/recruitingCEJobRequisitions
+        ?onlyData=true&expand=requisitionList.secondaryLocations,flexFieldsFacet.values
+        &finder=findReqs;siteNumber=CX_1,limit=..,offset=..,selectedLocationsFacet=..
+
+so a company only needs an entry in ``config.scraper.ORACLE_HCM_SITES``.  The
+careers UI asks for 25 requisitions a page; the engine asks for the largest
+page the finder accepts (stepping down if a tenant rejects it) and fetches
+the remaining pages concurrently with ``fetch_offset_pages``.
+
+``oracle_hcm_scraper(key)`` returns a zero-argument scraper class for the
+registry.
+"""
+from core.http_cache import check_listing
+from core.http_client import http_get
+from core.logging import setup_logger
+from core.pagination import fetch_offset_pages
+from config.scraper import MAX_PAGES_TO_SCRAPE, ORACLE_HCM_SITES
+from scrapers.platforms.common import generate_external_id
+
+logger = setup_logger('oracle_hcm_scraper')
+
+# Page sizes to try, largest first; the CX UI itself uses 25
+PAGE_SIZES = (200, 100, 25)
+# MAX_PAGES_TO_SCRAPE counts pages of this size, as the per-company scrapers did
+LEGACY_PAGE_SIZE = 25
+
+API_PATH = '/hcmRestApi/resources/latest/recruitingCEJobRequisitions'
+FACETS = 'LOCATIONS;WORK_LOCATIONS;WORKPLACE_TYPES;TITLES;CATEGORIES;ORGANIZATIONS;POSTING_DATES;FLEX_FIELDS'
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'application/json',
+}
+
+
+def _split_location(location_str):
+    """(city, state, country) from ``City, State, Country``."""
+    if not location_str:
+        return '', '', 'India'
+    parts = [p.strip() for p in location_str.split(',')]
+    city = parts[0] if len(parts) > 0 else ''
+    state = parts[1] if len(parts) > 1 else ''
+    country = parts[2] if len(parts) > 2 else ''
+    if not country and 'India' in location_str:
+        country = 'India'
+    return city, state, country
+
+
+def _remote_type(workplace_type):
+    workplace_type = (workplace_type or '').lower()
+    if 'remote' in workplace_type:
+        return 'Remote'
+    if 'hybrid' in workplace_type:
+        return 'Hybrid'
+    return 'On-site' if workplace_type else ''
+
+
+def _first_item(data):
+    items = data.get('items') or [{}]
+    return items[0]
+
+
+class OracleHCMScraper:
+    site_key = None
+
+    def __init__(self):
+        site = ORACLE_HCM_SITES[self.site_key]
+        self.site = site
+        self.company_name = site['company_name']
+        self.api_url = f"{site['host']}{API_PATH}"
+        self.site_number = site['site_number']
+        self.job_detail_base_url = site.get(
+            'job_url', f"{site['host']}/hcmUI/CandidateExperience/en/sites/{self.site_number}/job")
+        self.url = site.get('url', f"{site['host']}/hcmUI/CandidateExperience/en/sites/{self.site_number}/jobs")
+
+    def _finder(self, limit, offset):
+        terms = [f'findReqs;siteNumber={self.site_number}', f'facetsList={FACETS}', f'limit={limit}', f'offset={offset}']
+        if 'location_facet' in self.site:
+            terms.append('lastSelectedFacet=LOCATIONS')
+            if self.site['location_facet']:
+                terms.append(f"selectedLocationsFacet={self.site['location_facet']}")
+        if self.site.get('keyword'):
+            terms.append(f"keyword={self.site['keyword']}")
+        if self.site.get('sort_by'):
+            terms.append(f"sortBy={self.site['sort_by']}")
+        return ','.join(terms)
+
+    def _fetch_requisitions(self, page_size, max_items):
+        def fetch_page(offset):
+            params = {
+                'onlyData': 'true',
+                'expand': 'requisitionList.secondaryLocations,flexFieldsFacet.values',
+                'finder': self._finder(page_size, offset),
+            }
+            response = http_get(self.api_url, params=params, headers=HEADERS)
+            response.raise_for_status()
+            if not offset:
+                check_listing(response)
+            return response.json()
+
+        return fetch_offset_pages(
+            fetch_page, page_size,
+            items_of=lambda data: _first_item(data).get('requisitionList', []),
+            total_of=lambda data: _first_item(data).get('TotalJobsCount', 0),
+            max_items=max_items,
+            key=lambda req: req.get('Id'),
+        )
+
+    def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        max_items = max_pages * LEGACY_PAGE_SIZE
+        for page_size in PAGE_SIZES:
+            try:
+                requisitions = self._fetch_requisitions(min(page_size, max_items), max_items)
+                break
+            except Exception as e:
+                status = getattr(getattr(e, 'response', None), 'status_code', None)
+                if status != 400 or page_size == PAGE_SIZES[-1]:
+                    raise
+                logger.info(f"{self.company_name}: limit={page_size} rejected, retrying with a smaller page")
+        logger.info(f"{self.company_name}: fetched {len(requisitions)} requisitions")
+
+        jobs = [job for job in map(self._to_job, requisitions) if job]
+        logger.info(f"{self.company_name}: {len(jobs)} jobs")
+        return jobs
+
+    def _to_job(self, req):
+        job_id = req.get('Id', '')
+        title = req.get('Title', '')
+        if not title or not job_id:
+            return None
+
+        primary_location = req.get('PrimaryLocation', '')
+        city, state, country = _split_location(primary_location)
+
+        description = '\n\n'.join(part for part in (
+            req.get('ShortDescriptionStr') or '',
+            f"Qualifications: {req['ExternalQualificationsStr']}" if req.get('ExternalQualificationsStr') else '',
+            f"Responsibilities: {req['ExternalResponsibilitiesStr']}" if req.get('ExternalResponsibilitiesStr') else '',
+        ) if part)[:3000]
+
+        return {
+            'external_id': generate_external_id(str(job_id), self.company_name),
+            'company_name': self.company_name,
+            'title': title,
+            'description': description,
+            'location': primary_location,
+            'city': city,
+            'state': state,
+            'country': country if country else 'India',
+            'employment_type': req.get('WorkerType') or req.get('ContractType') or '',
+            'department': req.get('Department') or req.get('Organization') or '',
+            'apply_url': f"{self.job_detail_base_url}/{job_id}",
+            'posted_date': req.get('PostedDate') or '',
+            'job_function': req.get('JobFunction') or req.get('JobFamily') or '',
+            'experience_level': '',
+            'salary_range': '',
+            'remote_type': _remote_type(req.get('WorkplaceType')),
+            'status': 'active'
+        }
+
+
+def oracle_hcm_scraper(site_key):
+    """Scraper class for the ``ORACLE_HCM_SITES`` entry ``site_key``."""
+    name = ''.join(ch for ch in ORACLE_HCM_SITES[site_key]['company_name'].title() if ch.isalnum())
+    return type(f'{name}Scraper', (OracleHCMScraper,), {'site_key': site_key})
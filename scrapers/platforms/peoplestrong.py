@@ -0,0 +1,180 @@
+"""
+Generic PeopleStrong engine.
+
+PeopleStrong careers portals (``<subdomain>.peoplestrong.com/job/joblist``)
+are Angular SPAs that page through a JSON job-list call.  The engine posts
+that call itself over the shared HTTP client, paging on the server
+(``scrapers.platforms.learned``); the browser only learns the call for a
+portal that answers it differently.  A company only needs its subdomain in
+``config.scraper.PEOPLESTRONG_SITES``, plus an 'api' path if its listing
+API is not at ``JOB_LIST_API``.
+
+``peoplestrong_scraper(key)`` returns a zero-argument scraper class for the
+registry.
+"""
+import hashlib
+import json
+
+from core.logging import setup_logger
+from config.scraper import PEOPLESTRONG_SITES
+from scrapers.platforms.common import generate_external_id
+from scrapers.platforms.learned import LearnedEndpointScraper, field, text
+
+logger = setup_logger('peoplestrong_scraper')
+
+# The listing call the SPA makes, paged by page number
+JOB_LIST_API = '/job/joblist'
+PAGE_SIZE = 50
+
+TITLE_FIELDS = ('jobtitle', 'title', 'designation', 'jobname', 'position', 'name')
+ID_FIELDS = ('jobid', 'id', 'jobcode', 'requisitionid', 'jobreqid')
+URL_FIELDS = ('joburl', 'url', 'applyurl', 'jobdetailurl')
+LOCATION_FIELDS = ('location', 'joblocation', 'locationname', 'worklocation', 'city')
+DEPARTMENT_FIELDS = ('department', 'departmentname', 'functionalarea', 'function')
+EMPLOYMENT_FIELDS = ('employmenttype', 'jobtype', 'employeetype')
+EXPERIENCE_FIELDS = ('experience', 'experiencerange')
+POSTED_FIELDS = ('posteddate', 'postingdate', 'publishdate', 'createddate')
+
+EXTRACT_JOBS_JS = """
+    var results = [];
+    var seen = {};
+    function usable(href) {
+        return href && !href.includes('login') && !href.includes('sign-in') && !href.includes('javascript:');
+    }
+    function add(title, href, context, location) {
+        title = (title || '').trim().split('\\n')[0].trim();
+        if (title.length < 3 || title.length > 200 || seen[title + href]) return;
+        seen[title + href] = true;
+        var locEl = context ? context.querySelector('[class*="location"], [class*="Location"]') : null;
+        var deptEl = context ? context.querySelector('[class*="department"], [class*="Department"], [class*="category"]') : null;
+        var dateEl = context ? context.querySelector('[class*="date"], [class*="Date"]') : null;
+        results.push({
+            title: title, url: href,
+            location: location || (locEl ? locEl.innerText.trim() : ''),
+            department: deptEl ? deptEl.innerText.trim() : '',
+            date: dateEl ? dateEl.innerText.trim() : ''
+        });
+    }
+
+    // Job cards
+    var selectors = ['div.jobs-listing > *', 'div.job-card', 'div[class*="job-card"]', 'div[class*="jobCard"]',
+                     'div[class*="job-list"]', 'li[class*="job"]', 'div[class*="opening"]', 'div[class*="vacancy"]'];
+    for (var s = 0; s < selectors.length && results.length === 0; s++) {
+        var cards = document.querySelectorAll(selectors[s]);
+        for (var i = 0; i < cards.length; i++) {
+            var heading = cards[i].querySelector('[class*="job-title"], [class*="jobTitle"], h2, h3, h4, h5, a[href*="/job/"]');
+            var link = cards[i].querySelector('a[href*="/job/"], a[href*="jobdetail"], a');
+            var href = link && usable(link.href) ? link.href : '';
+            add(heading ? heading.innerText : (link ? link.innerText : ''), href, cards[i]);
+        }
+    }
+
+    // Job links
+    if (results.length === 0) {
+        var links = document.querySelectorAll('a[href*="/job/"], a[href*="jobdetail"], a[href*="job-detail"]');
+        for (var i = 0; i < links.length; i++) {
+            if (usable(links[i].href)) add(links[i].innerText, links[i].href, links[i].closest('div, li, tr'));
+        }
+    }
+
+    // Table rows
+    if (results.length === 0) {
+        var rows = document.querySelectorAll('table tr, div[role="row"]');
+        for (var i = 0; i < rows.length; i++) {
+            var cells = rows[i].querySelectorAll('td, div[role="cell"]');
+            if (cells.length < 2) continue;
+            var link = cells[0].querySelector('a');
+            add(cells[0].innerText, link ? link.href : '', null, cells[1].innerText.trim());
+        }
+    }
+
+    return results;
+"""
+
+
+class PeopleStrongScraper(LearnedEndpointScraper):
+    card_selectors = ['div.jobs-listing > *', 'div.job-card', 'div[class*="job-card"]', 'div[class*="jobCard"]',
+                      'div[class*="job-list"]', 'li[class*="job"]', 'div[class*="opening"]', 'div[class*="vacancy"]',
+                      'a[href*="/job/"], a[href*="jobdetail"], a[href*="job-detail"]', 'table tr, div[role="row"]']
+
+    def __init__(self):
+        site = PEOPLESTRONG_SITES[self.site_key]
+        self.company_name = site['company_name']
+        self.origin = f"https://{site['subdomain']}.peoplestrong.com"
+        self.url = f"{self.origin}{site.get('path', '/job/joblist')}"
+        self.api = f"{self.origin}{site.get('api', JOB_LIST_API)}"
+
+    def list_requests(self):
+        return [{'url': self.api, 'method': 'POST',
+                 'post_data': json.dumps({'pageNumber': 1, 'pageSize': PAGE_SIZE})}]
+
+    def _jobs_from_items(self, items):
+        jobs = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            title = text(field(item, TITLE_FIELDS))
+            job_id = text(field(item, ID_FIELDS))
+            if not title or not job_id:
+                continue
+            url = text(field(item, URL_FIELDS))
+            if url.startswith('/'):
+                url = f"{self.origin}{url}"
+            elif not url.startswith('http'):
+                url = f"{self.origin}/job/jobdetail/{job_id}"
+
+            experience = text(field(item, EXPERIENCE_FIELDS))
+            if not experience:
+                low = text(field(item, ('minexperience', 'minexp')))
+                high = text(field(item, ('maxexperience', 'maxexp')))
+                if low and high:
+                    experience = f"{low} - {high} Years"
+
+            department = text(field(item, DEPARTMENT_FIELDS))
+            jobs.append(self._to_job(
+                job_id, title, url, text(field(item, LOCATION_FIELDS)),
+                department=department,
+                employment_type=text(field(item, EMPLOYMENT_FIELDS)),
+                experience=experience,
+                posted_date=text(field(item, POSTED_FIELDS)),
+            ))
+        return jobs
+
+    def _jobs_from_dom(self, driver):
+        jobs = []
+        for row in driver.execute_script(EXTRACT_JOBS_JS) or []:
+            title = row.get('title', '')
+            url = row.get('url', '')
+            job_id = hashlib.md5((url or title).encode()).hexdigest()[:12]
+            jobs.append(self._to_job(job_id, title, url, row.get('location', ''),
+                                     department=row.get('department', ''), posted_date=row.get('date', '')))
+        return jobs
+
+    def _to_job(self, job_id, title, url, location, department='', employment_type='', experience='',
+                posted_date=''):
+        parts = [p.strip() for p in location.split(',')] if location else []
+        return {
+            'external_id': generate_external_id(job_id, self.company_name),
+            'company_name': self.company_name,
+            'title': title,
+            'description': '',
+            'location': location,
+            'city': parts[0] if len(parts) > 0 else '',
+            'state': parts[1] if len(parts) > 1 else '',
+            'country': 'India',
+            'employment_type': employment_type,
+            'department': department,
+            'apply_url': url or self.url,
+            'posted_date': posted_date,
+            'job_function': department,
+            'experience_level': experience,
+            'salary_range': '',
+            'remote_type': '',
+            'status': 'active'
+        }
+
+
+def peoplestrong_scraper(site_key):
+    """Scraper class for the ``PEOPLESTRONG_SITES`` entry ``site_key``."""
+    name = ''.join(ch for ch in PEOPLESTRONG_SITES[site_key]['company_name'].title() if ch.isalnum())
+    return type(f'{name}Scraper', (PeopleStrongScraper,), {'site_key': site_key, '__module__': __name__})
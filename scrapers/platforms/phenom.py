@@ -0,0 +1,252 @@
+"""
+Generic Phenom People engine.
+
+Phenom career sites (``<host>/<country>/<lang>/search-results``) embed the first
+results page in the HTML as ``phApp.ddo``.  Every page, totals included,
+comes from one search widget:
+
+    POST <host>/widgets   {"ddoKey": "refineSearch", "from": 0, "size": 50, "refNum": ..., ...}
+        -> {"refineSearch": {"totalHits": N, "data": {"jobs": [...]}}}
+
+so a company only needs an entry in ``config.scraper.PHENOM_SITES``.  The
+engine reads the tenant's ``refNum`` and locale from the search page and
+fetches every page of the widget concurrently with ``fetch_offset_pages``.
+If the widget call fails, the jobs embedded in the page are used.  When
+the page cannot be fetched over HTTP at all (bot protection), it is loaded
+in a pooled driver and the same widget is called from inside the page.
+
+``phenom_scraper(key)`` returns a zero-argument scraper class for the
+registry.
+"""
+import json
+import re
+from urllib.parse import urlsplit
+
+from core.http_cache import ListingUnchanged, check_listing
+from core.http_client import http_get, http_post
+from core.logging import setup_logger
+from core.pagination import fetch_offset_pages
+from config.scraper import MAX_PAGES_TO_SCRAPE, PHENOM_SITES
+from scrapers.platforms.common import generate_external_id, parse_location, is_india_location, html_to_text
+
+logger = setup_logger('phenom_scraper')
+
+PAGE_SIZE = 50
+# MAX_PAGES_TO_SCRAPE counts pages of the size the search UI shows
+LEGACY_PAGE_SIZE = 10
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+}
+
+_REF_NUM = re.compile(r'"refNum"\s*:\s*"([^"]+)"')
+_LOCALE = re.compile(r'"locale"\s*:\s*"([a-z]{2}_[a-z]+)"')
+_PAGE_ID = re.compile(r'"pageId"\s*:\s*"([^"]+)"')
+_DDO = re.compile(r'phApp\.ddo\s*=\s*')
+
+PH_APP_JS = """
+    if (!window.phApp) return null;
+    return {refNum: phApp.refNum || '', locale: phApp.locale || '', pageId: phApp.pageId || '', ddo: phApp.ddo || null};
+"""
+
+# arguments: url, body, callback
+WIDGETS_FETCH_JS = """
+    var done = arguments[arguments.length - 1];
+    fetch(arguments[0], {method: 'POST', credentials: 'include',
+                         headers: {'Content-Type': 'application/json'}, body: JSON.stringify(arguments[1])})
+        .then(function(r) { return r.json(); }).then(done).catch(function() { done(null); });
+"""
+
+
+def _search(payload):
+    return (payload or {}).get('refineSearch') or (payload or {}).get('eagerLoadRefineSearch') or {}
+
+
+def _jobs_of(payload):
+    return (_search(payload).get('data') or {}).get('jobs') or []
+
+
+def _total_of(payload):
+    return _search(payload).get('totalHits') or 0
+
+
+def _embedded_ddo(page):
+    """The ``phApp.ddo`` object embedded in a search page, or None."""
+    match = _DDO.search(page)
+    if not match:
+        return None
+    try:
+        ddo, _ = json.JSONDecoder().raw_decode(page, match.end())
+    except ValueError:
+        return None
+    return ddo if isinstance(ddo, dict) else None
+
+
+class PhenomScraper:
+    site_key = None
+
+    def __init__(self):
+        site = PHENOM_SITES[self.site_key]
+        self.site = site
+        self.company_name = site['company_name']
+        self.url = site['url']
+        parts = urlsplit(self.url)
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self.widgets_url = f"{self.origin}/widgets"
+        # /in/en/search-results -> job pages under /in/en/job/..., search locale en_in
+        segments = [s for s in parts.path.split('/') if s]
+        self.prefix = '/' + '/'.join(segments[:2]) if len(segments) >= 3 else ''
+        self.locale = f"{segments[1]}_{segments[0]}" if len(segments) >= 3 else 'en_global'
+
+    def _body(self, context, offset, size):
+        return {
+            'lang': context['locale'],
+            'deviceType': 'desktop',
+            'country': context['locale'].split('_')[-1],
+            'pageName': 'search-results',
+            'ddoKey': 'refineSearch',
+            'sortBy': '',
+            'subsearch': '',
+            'from': offset,
+            'jobs': True,
+            'counts': True,
+            'all_fields': ['category', 'country', 'state', 'city', 'type'],
+            'size': size,
+            'clearAll': False,
+            'jdsource': 'facets',
+            'isSliderEnable': False,
+            'pageId': context['page_id'],
+            'siteType': 'external',
+            'keywords': self.site.get('keywords', ''),
+            'global': True,
+            'selected_fields': self.site.get('selected_fields', {}),
+            'refNum': context['ref_num'],
+            'locationData': {},
+        }
+
+    def _context_from_html(self):
+        response = http_get(self.url, headers={**HEADERS, 'Accept': 'text/html,application/xhtml+xml'})
+        response.raise_for_status()
+        page = response.text
+        ref_num = _REF_NUM.search(page)
+        if not ref_num:
+            return None
+        locale = _LOCALE.search(page)
+        page_id = _PAGE_ID.search(page)
+        return {
+            'ref_num': ref_num.group(1),
+            'locale': locale.group(1) if locale else self.locale,
+            'page_id': page_id.group(1) if page_id else '',
+            'ddo': _embedded_ddo(page),
+        }
+
+    def _post_widgets(self, body):
+        # A read-only search: cached and revalidated like a GET
+        response = http_post(self.widgets_url, json=body, headers=HEADERS, cache=True)
+        response.raise_for_status()
+        check_listing(response)
+        return response.json()
+
+    def _fetch_postings(self, post, context, max_pages, workers=None):
+        kwargs = {'workers': workers} if workers else {}
+        return fetch_offset_pages(
+            lambda offset: post(self._body(context, offset, PAGE_SIZE)), PAGE_SIZE,
+            items_of=_jobs_of,
+            total_of=_total_of,
+            max_items=max_pages * LEGACY_PAGE_SIZE,
+            key=lambda job: job.get('jobSeqNo') or job.get('jobId'),
+            **kwargs,
+        )
+
+    def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        postings = []
+        try:
+            context = self._context_from_html()
+        except Exception as e:
+            logger.warning(f"{self.company_name}: search page failed: {str(e)}")
+            context = None
+
+        if context:
+            try:
+                postings = self._fetch_postings(self._post_widgets, context, max_pages)
+            except ListingUnchanged:
+                raise
+            except Exception as e:
+                logger.warning(f"{self.company_name}: widgets search failed: {str(e)}, using the embedded page")
+                postings = _jobs_of(context['ddo'])
+        if not postings:
+            logger.info(f"{self.company_name}: no search JSON over HTTP, loading the page in a browser")
+            postings = self._scrape_via_browser(max_pages)
+
+        jobs = [job for job in map(self._to_job, postings) if job]
+        logger.info(f"{self.company_name}: {len(jobs)} jobs")
+        return jobs
+
+    def _scrape_via_browser(self, max_pages):
+        from core.browser import acquire_driver, release_driver
+        from core.waits import wait_for_dom_stable
+
+        driver = acquire_driver()
+        try:
+            driver.get(self.url)
+            wait_for_dom_stable(driver, 10)
+            ph_app = driver.execute_script(PH_APP_JS)
+            if not ph_app or not ph_app.get('refNum'):
+                logger.warning(f"{self.company_name}: page has no phApp, not a Phenom site?")
+                return []
+            context = {
+                'ref_num': ph_app['refNum'],
+                'locale': ph_app.get('locale') or self.locale,
+                'page_id': ph_app.get('pageId') or '',
+            }
+            driver.set_script_timeout(30)
+            try:
+                # One driver, so the widget is called one page at a time
+                return self._fetch_postings(
+                    lambda body: driver.execute_async_script(WIDGETS_FETCH_JS, self.widgets_url, body),
+                    context, max_pages, workers=1)
+            except Exception as e:
+                logger.warning(f"{self.company_name}: in-page widgets search failed: {str(e)}")
+                return _jobs_of(ph_app.get('ddo'))
+        finally:
+            release_driver(driver)
+
+    def _to_job(self, posting):
+        title = (posting.get('title') or '').strip()
+        job_id = str(posting.get('jobSeqNo') or posting.get('jobId') or '')
+        if not title or not job_id:
+            return None
+
+        location = posting.get('location') or ', '.join(
+            p for p in (posting.get('city'), posting.get('state'), posting.get('country')) if p)
+        if self.site.get('india_only') and not is_india_location(location, posting.get('country')):
+            logger.debug(f"Filtered non-India job: {title} | {location}")
+            return None
+
+        location_parts = parse_location(location)
+        return {
+            'external_id': generate_external_id(job_id, self.company_name),
+            'company_name': self.company_name,
+            'title': title,
+            'description': html_to_text(posting.get('descriptionTeaser') or ''),
+            'location': location,
+            'city': posting.get('city') or location_parts['city'],
+            'state': posting.get('state') or location_parts['state'],
+            'country': posting.get('country') or location_parts['country'],
+            'employment_type': posting.get('type') or '',
+            'department': posting.get('category') or '',
+            'apply_url': f"{self.origin}{self.prefix}/job/{job_id}",
+            'posted_date': posting.get('postedDate') or '',
+            'job_function': '',
+            'experience_level': posting.get('experienceLevel') or '',
+            'salary_range': '',
+            'remote_type': '',
+            'status': 'active'
+        }
+
+
+def phenom_scraper(site_key):
+    """Scraper class for the ``PHENOM_SITES`` entry ``site_key``."""
+    name = ''.join(ch for ch in PHENOM_SITES[site_key]['company_name'].title() if ch.isalnum())
+    return type(f'{name}Scraper', (PhenomScraper,), {'site_key': site_key})
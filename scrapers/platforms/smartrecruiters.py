@@ -0,0 +1,140 @@
+"""
+Generic SmartRecruiters engine.
+
+SmartRecruiters career pages (``careers.smartrecruiters.com/<Company>``) are
+backed by the public Posting API:
+
+    GET https://api.smartrecruiters.com/v1/companies/<Company>/postings?country=in&offset=0&limit=100
+        -> {"totalFound": N, "content": [...]}
+    GET https://api.smartrecruiters.com/v1/companies/<Company>/postings/<id>   one posting (``jobAd``)
+
+so a company only needs its identifier in ``config.scraper.SMARTRECRUITERS_SITES``.
+The listing is paginated concurrently with ``fetch_offset_pages``; when
+details are enabled the detail calls are batched through ``fetch_concurrently``.
+
+``smartrecruiters_scraper(key)`` returns a zero-argument scraper class for the
+registry.
+"""
+from core.http_cache import check_listing
+from core.http_client import http_get
+from core.logging import setup_logger
+from core.pagination import fetch_offset_pages, fetch_concurrently
+from config.scraper import FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE, SMARTRECRUITERS_SITES
+from scrapers.platforms.common import generate_external_id, html_to_text
+
+logger = setup_logger('smartrecruiters_scraper')
+
+API_BASE = 'https://api.smartrecruiters.com/v1/companies'
+# The Posting API's largest page
+PAGE_SIZE = 100
+# MAX_PAGES_TO_SCRAPE counts pages of the size the careers page shows
+LEGACY_PAGE_SIZE = 10
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'application/json',
+}
+
+
+def _label(value):
+    return (value or {}).get('label', '') if isinstance(value, dict) else str(value or '')
+
+
+class SmartRecruitersScraper:
+    site_key = None
+
+    def __init__(self):
+        site = SMARTRECRUITERS_SITES[self.site_key]
+        self.site = site
+        self.company_name = site['company_name']
+        self.company_id = site['company_id']
+        self.api_url = f"{API_BASE}/{self.company_id}/postings"
+        self.url = site.get('url', f"https://careers.smartrecruiters.com/{self.company_id}")
+
+    def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        params = {'country': self.site['country']} if self.site.get('country') else {}
+
+        def fetch_page(offset):
+            response = http_get(self.api_url, params={**params, 'offset': offset, 'limit': PAGE_SIZE},
+                                headers=HEADERS)
+            response.raise_for_status()
+            if not offset:
+                check_listing(response)
+            return response.json()
+
+        postings = fetch_offset_pages(
+            fetch_page, PAGE_SIZE,
+            items_of=lambda data: data.get('content', []),
+            total_of=lambda data: data.get('totalFound', 0),
+            max_items=max_pages * LEGACY_PAGE_SIZE,
+            key=lambda posting: posting.get('id'),
+        )
+        logger.info(f"{self.company_name}: API returned {len(postings)} postings")
+
+        jobs, ids = [], []
+        for posting in postings:
+            try:
+                job = self._to_job(posting)
+            except Exception as e:
+                logger.error(f"Error processing posting: {str(e)}")
+                continue
+            if job:
+                jobs.append(job)
+                ids.append(posting['id'])
+
+        if self.site.get('fetch_details', FETCH_FULL_JOB_DETAILS):
+            details = fetch_concurrently(self._fetch_details, ids)
+            for job, detail in zip(jobs, details):
+                if detail:
+                    job.update(detail)
+
+        logger.info(f"{self.company_name}: {len(jobs)} jobs")
+        return jobs
+
+    def _to_job(self, posting):
+        title = (posting.get('name') or '').strip()
+        job_id = str(posting.get('id') or '')
+        if not title or not job_id:
+            return None
+
+        place = posting.get('location') or {}
+        city = place.get('city', '')
+        state = place.get('region', '')
+        country = (place.get('country') or '').upper()
+        location = place.get('fullLocation') or ', '.join(p for p in (city, state) if p)
+        remote_type = 'Remote' if place.get('remote') else ('Hybrid' if place.get('hybrid') else '')
+        return {
+            'external_id': generate_external_id(job_id, self.company_name),
+            'company_name': self.company_name,
+            'title': title,
+            'description': '',
+            'location': location,
+            'city': city,
+            'state': state,
+            'country': 'India' if country in ('', 'IN') else country,
+            'employment_type': _label(posting.get('typeOfEmployment')),
+            'department': _label(posting.get('department')),
+            'apply_url': f"https://jobs.smartrecruiters.com/{self.company_id}/{job_id}",
+            'posted_date': (posting.get('releasedDate') or '')[:10],
+            'job_function': _label(posting.get('function')),
+            'experience_level': _label(posting.get('experienceLevel')),
+            'salary_range': '',
+            'remote_type': remote_type,
+            'status': 'active'
+        }
+
+    def _fetch_details(self, posting_id):
+        """Description from a posting's ``jobAd`` sections."""
+        response = http_get(f"{self.api_url}/{posting_id}", headers=HEADERS)
+        response.raise_for_status()
+        sections = (response.json().get('jobAd') or {}).get('sections') or {}
+        parts = [(sections.get(name) or {}).get('text', '')
+                 for name in ('companyDescription', 'jobDescription', 'qualifications', 'additionalInformation')]
+        description = html_to_text('<br>'.join(p for p in parts if p))
+        return {'description': description} if description else None
+
+
+def smartrecruiters_scraper(site_key):
+    """Scraper class for the ``SMARTRECRUITERS_SITES`` entry ``site_key``."""
+    name = ''.join(ch for ch in SMARTRECRUITERS_SITES[site_key]['company_name'].title() if ch.isalnum())
+    return type(f'{name}Scraper', (SmartRecruitersScraper,), {'site_key': site_key})
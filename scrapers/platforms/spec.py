@@ -0,0 +1,337 @@
+"""
+Declarative scraper specs.
+
+A company whose scraper would only differ from others in its URL,
+selectors, pagination and field mapping is a YAML file in
+``scrapers/specs/`` instead of a module.  The file name is the scraper
+key.  A spec either names a platform engine:
+
+    company_name: Acme
+    platform: workday                 # any scrapers.platforms.fingerprint.PLATFORMS key
+    site: {tenant: acme, datacenter: wd1, site: AcmeCareers, india_only: true}
+
+(an engine that works from the careers URL alone, such as ``talentbrew``,
+takes just ``url``) or describes the rendered page for the generic browser
+engine:
+
+    company_name: Acme
+    url: https://jobs.acme.com/search-jobs/India
+    extends: talentbrew_dom           # merge scrapers/specs/_talentbrew_dom.yaml under this spec
+    wait_for: '#search-results-list li'
+    list:
+      item: '#search-results-list li'
+      fields:
+        title: h2
+        url: {selector: 'a[href*="/job/"]', attr: href}
+        location: .job-location
+    pagination: {type: next, selector: 'a.next'}   # none | next | url_param | scroll | load_more
+    job_id_pattern: '/(\\d+)$'        # regex on the job URL
+    location_parser: city_state       # city_state | common
+    india_only: false
+
+Files starting with ``_`` are templates for ``extends``.  ``load_specs``
+reads, validates and compiles every spec once per process.  The result
+maps scraper keys to scraper classes.  An invalid spec raises
+``SpecError`` when the registry loads, not halfway through a scrape.
+Generic specs extract each page with one ``execute_script`` call whose
+selectors are fixed at compile time.
+"""
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import yaml
+
+from core.logging import setup_logger
+from config.scraper import MAX_PAGES_TO_SCRAPE
+from scrapers.platforms.common import generate_external_id, parse_location, is_india_location
+
+logger = setup_logger('spec_scraper')
+
+SPEC_DIR = Path(__file__).resolve().parent.parent / 'specs'
+
+TOP_KEYS = {'company_name', 'url', 'extends', 'platform', 'site', 'wait_for', 'wait_timeout', 'list',
+            'pagination', 'job_id_pattern', 'location_parser', 'india_only', 'country'}
+FIELDS = {'title', 'url', 'job_id', 'location', 'department', 'employment_type', 'experience_level',
+          'posted_date', 'description'}
+PAGINATION_TYPES = {'none', 'next', 'url_param', 'scroll', 'load_more'}
+LOCATION_PARSERS = {'city_state', 'common'}
+
+# arguments: item selector, [[field, selector or '', attribute or ''], ...]
+EXTRACT_JS = """
+    var items = document.querySelectorAll(arguments[0]);
+    var fields = arguments[1];
+    var rows = [];
+    for (var i = 0; i < items.length; i++) {
+        var row = {};
+        for (var f = 0; f < fields.length; f++) {
+            var el = fields[f][1] ? items[i].querySelector(fields[f][1]) : items[i];
+            var attr = fields[f][2];
+            var value = '';
+            if (el && attr) {
+                value = (typeof el[attr] === 'string' ? el[attr] : el.getAttribute(attr)) || '';
+            } else if (el) {
+                value = el.innerText || el.textContent || '';
+            }
+            row[fields[f][0]] = value.trim();
+        }
+        rows.push(row);
+    }
+    return rows;
+"""
+
+# arguments: selector; true when an enabled element was clicked
+CLICK_JS = """
+    var el = document.querySelector(arguments[0]);
+    if (!el || el.disabled || el.getAttribute('aria-disabled') === 'true') return false;
+    el.scrollIntoView({block: 'center'});
+    el.click();
+    return true;
+"""
+
+
+class SpecError(ValueError):
+    pass
+
+
+def _merge(base, override):
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            value = _merge(merged[key], value)
+        merged[key] = value
+    return merged
+
+
+def _read(path):
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+    if not isinstance(data, dict):
+        raise SpecError(f"{path.name}: a spec must be a mapping")
+    return data
+
+
+def _resolve(spec, spec_dir, source, seen=()):
+    template = spec.get('extends')
+    if not template:
+        return spec
+    if template in seen:
+        raise SpecError(f"{source}: 'extends' loop through {template}")
+    path = spec_dir / f"_{template}.yaml"
+    if not path.exists():
+        raise SpecError(f"{source}: unknown template '{template}'")
+    base = _resolve(_read(path), spec_dir, path.name, seen + (template,))
+    return _merge({k: v for k, v in base.items() if k != 'extends'}, spec)
+
+
+def _field(source, name, value):
+    if isinstance(value, str):
+        return [name, value, '']
+    if isinstance(value, dict) and set(value) <= {'selector', 'attr'}:
+        return [name, value.get('selector') or '', value.get('attr') or '']
+    raise SpecError(f"{source}: field '{name}' must be a selector or {{selector, attr}}")
+
+
+def validate(key, spec, source=None):
+    """Normalised copy of ``spec``; raises SpecError when it cannot be compiled."""
+    from scrapers.platforms.fingerprint import PLATFORMS
+
+    source = source or key
+    unknown = set(spec) - TOP_KEYS
+    if unknown:
+        raise SpecError(f"{source}: unknown keys {sorted(unknown)}")
+    if not spec.get('company_name'):
+        raise SpecError(f"{source}: 'company_name' is required")
+
+    if 'platform' in spec:
+        if spec['platform'] not in PLATFORMS:
+            raise SpecError(f"{source}: unknown platform '{spec['platform']}' (one of {sorted(PLATFORMS)})")
+        site = spec.get('site', {})
+        if not isinstance(site, dict) or not (site or spec.get('url')):
+            raise SpecError(f"{source}: a platform spec needs a 'site' mapping or a 'url'")
+        return {'company_name': spec['company_name'], 'platform': spec['platform'],
+                'site': {'company_name': spec['company_name'], **site,
+                         **({'url': spec['url']} if spec.get('url') else {})}}
+
+    if not spec.get('url'):
+        raise SpecError(f"{source}: 'url' is required")
+    listing = spec.get('list') or {}
+    if not listing.get('item') or not isinstance(listing.get('fields'), dict):
+        raise SpecError(f"{source}: 'list' needs 'item' and 'fields'")
+    unknown = set(listing['fields']) - FIELDS
+    if unknown:
+        raise SpecError(f"{source}: unknown fields {sorted(unknown)}")
+    if 'title' not in listing['fields']:
+        raise SpecError(f"{source}: the 'title' field is required")
+
+    pagination = spec.get('pagination') or {'type': 'none'}
+    if pagination.get('type') not in PAGINATION_TYPES:
+        raise SpecError(f"{source}: pagination type must be one of {sorted(PAGINATION_TYPES)}")
+    if pagination['type'] in ('next', 'load_more') and not pagination.get('selector'):
+        raise SpecError(f"{source}: '{pagination['type']}' pagination needs a 'selector'")
+    if pagination['type'] == 'url_param' and not pagination.get('param'):
+        raise SpecError(f"{source}: 'url_param' pagination needs a 'param'")
+
+    parser = spec.get('location_parser', 'city_state')
+    if parser not in LOCATION_PARSERS:
+        raise SpecError(f"{source}: location_parser must be one of {sorted(LOCATION_PARSERS)}")
+    try:
+        job_id_pattern = re.compile(spec['job_id_pattern']) if spec.get('job_id_pattern') else None
+    except re.error as e:
+        raise SpecError(f"{source}: bad job_id_pattern: {e}")
+
+    return {
+        'company_name': spec['company_name'],
+        'url': spec['url'],
+        'wait_for': spec.get('wait_for') or listing['item'],
+        'wait_timeout': spec.get('wait_timeout', 15),
+        'item': listing['item'],
+        'fields': [_field(source, name, value) for name, value in listing['fields'].items()],
+        'pagination': pagination,
+        'job_id_pattern': job_id_pattern,
+        'location_parser': parser,
+        'india_only': bool(spec.get('india_only')),
+        'country': spec.get('country', 'India'),
+    }
+
+
+class SpecScraper:
+    """Browser scraper driven by a compiled spec (``spec`` class attribute)."""
+    spec = None
+
+    def __init__(self):
+        self.company_name = self.spec['company_name']
+        self.url = self.spec['url']
+
+    def _page_url(self, page):
+        pagination = self.spec['pagination']
+        value = pagination.get('start', 1) + (page - 1) * pagination.get('step', 1)
+        parts = urlsplit(self.url)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != pagination['param']]
+        return urlunsplit(parts._replace(query=urlencode(query + [(pagination['param'], value)])))
+
+    def _load(self, driver, url):
+        from core.waits import wait_for_selector, wait_for_dom_stable
+
+        driver.get(url)
+        if not wait_for_selector(driver, self.spec['wait_for'], self.spec['wait_timeout']):
+            wait_for_dom_stable(driver, 5)
+
+    def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        from core.browser import acquire_driver, release_driver
+        from core.waits import scroll_until_stable, page_signature, wait_for_page_change, SCROLL_PAGE_SIZE
+
+        spec = self.spec
+        pagination = spec['pagination']
+        kind = pagination['type']
+        rows = []
+        seen = set()
+
+        driver = acquire_driver()
+        try:
+            self._load(driver, self.url)
+            for page in range(1, max_pages + 1):
+                if kind == 'url_param' and page > 1:
+                    self._load(driver, self._page_url(page))
+                elif kind == 'scroll':
+                    scroll_until_stable(driver, spec['item'], max_items=max_pages * SCROLL_PAGE_SIZE)
+                elif kind == 'load_more':
+                    scroll_until_stable(driver, spec['item'], load_more_selector=pagination['selector'],
+                                        max_rounds=max_pages, max_items=max_pages * SCROLL_PAGE_SIZE)
+
+                new_rows = []
+                for row in driver.execute_script(EXTRACT_JS, spec['item'], spec['fields']) or []:
+                    key = row.get('url') or row.get('title')
+                    if row.get('title') and key not in seen:
+                        seen.add(key)
+                        new_rows.append(row)
+                logger.info(f"{self.company_name}: page {page}: {len(new_rows)} new rows")
+                if not new_rows:
+                    break
+                rows.extend(new_rows)
+
+                if kind in ('none', 'scroll', 'load_more') or page == max_pages:
+                    break
+                if kind == 'next':
+                    signature = page_signature(driver, spec['item'])
+                    if not driver.execute_script(CLICK_JS, pagination['selector']):
+                        break
+                    if not wait_for_page_change(driver, spec['item'], signature):
+                        break
+        finally:
+            release_driver(driver)
+
+        jobs = [job for job in map(self._to_job, rows) if job]
+        logger.info(f"{self.company_name}: {len(jobs)} jobs")
+        return jobs
+
+    def _to_job(self, row):
+        spec = self.spec
+        title = row['title'].split('\n')[0].strip()
+        url = row.get('url', '')
+        location = ' '.join(row.get('location', '').split())
+        if spec['india_only'] and not is_india_location(location, url):
+            logger.debug(f"Filtered non-India job: {title} | {location}")
+            return None
+
+        job_id = row.get('job_id', '')
+        if not job_id and url and spec['job_id_pattern']:
+            match = spec['job_id_pattern'].search(url.split('?')[0])
+            job_id = match.group(1) if match else ''
+        if not job_id:
+            job_id = hashlib.md5((url or title).encode()).hexdigest()[:12]
+
+        if spec['location_parser'] == 'common':
+            parts = parse_location(location, spec['country'])
+            city, state, country = parts['city'], parts['state'], parts['country']
+        else:
+            parts = [p.strip() for p in location.split(',')]
+            city = parts[0]
+            state = parts[1] if len(parts) > 1 else ''
+            country = spec['country']
+
+        return {
+            'external_id': generate_external_id(job_id, self.company_name),
+            'company_name': self.company_name,
+            'title': title,
+            'description': row.get('description', ''),
+            'location': location,
+            'city': city,
+            'state': state,
+            'country': country,
+            'employment_type': row.get('employment_type', ''),
+            'department': row.get('department', ''),
+            'apply_url': url or self.url,
+            'posted_date': row.get('posted_date', ''),
+            'job_function': '',
+            'experience_level': row.get('experience_level', ''),
+            'salary_range': '',
+            'remote_type': '',
+            'status': 'active'
+        }
+
+
+def compile_spec(key, spec):
+    """Scraper class for a validated spec."""
+    from scrapers.platforms.fingerprint import platform_scraper
+
+    if 'platform' in spec:
+        return platform_scraper(spec['platform'], spec['site'], key)
+    name = ''.join(ch for ch in spec['company_name'].title() if ch.isalnum())
+    return type(f'{name}Scraper', (SpecScraper,), {'spec': spec})
+
+
+@lru_cache(maxsize=None)
+def load_specs(spec_dir=SPEC_DIR):
+    """{scraper key: scraper class} for every spec in ``spec_dir``, compiled once per process."""
+    spec_dir = Path(spec_dir)
+    scrapers = {}
+    for path in sorted(spec_dir.glob('*.yaml')):
+        if path.name.startswith('_'):
+            continue
+        spec = validate(path.stem, _resolve(_read(path), spec_dir, path.name), path.name)
+        scrapers[path.stem] = compile_spec(path.stem, spec)
+    logger.info(f"Compiled {len(scrapers)} scraper specs from {spec_dir}")
+    return scrapers
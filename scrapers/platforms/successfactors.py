@@ -0,0 +1,273 @@
+"""
+Generic SuccessFactors Recruiting Marketing (RMK) engine.
+
+RMK career sites render their search results on the server, and every
+results page has its own URL:
+
+    GET <host>/search/?q=&locationsearch=India&startrow=25    results 26-50
+    GET <host>/go/<category>/<id>/25/                         the same for category pages
+
+so a company only needs its search URL in ``config.scraper.SUCCESSFACTORS_SITES``.
+The engine fetches page 1 and reads the total from the "1 - 25 of N" label.
+It fetches the remaining pages concurrently with ``fetch_offset_pages`` and
+parses the ``tr.data-row`` rows (or ``li.job-tile`` tiles) with lxml.  A
+regex parser for the row table is used when lxml is not installed.  When a
+tenant returns no results without JavaScript, the same page URLs are
+loaded one by one in a pooled driver and its page source is parsed the
+same way.
+
+``successfactors_scraper(key)`` returns a zero-argument scraper class for the
+registry.
+"""
+import hashlib
+import re
+from urllib.parse import urlsplit, urlunsplit
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+from core.http_cache import ListingUnchanged, check_listing
+from core.http_client import http_get
+from core.logging import setup_logger
+from core.pagination import fetch_offset_pages, fetch_concurrently
+from config.scraper import FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE, SUCCESSFACTORS_SITES
+from scrapers.platforms.common import generate_external_id, html_to_text
+
+logger = setup_logger('successfactors_scraper')
+
+# RMK's default results page; tenants configured for fewer are detected from page 1
+PAGE_SIZE = 25
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+DATA_ROW_XPATH = '//tr[contains(concat(" ", normalize-space(@class), " "), " data-row ")]'
+TILE_XPATH = '//li[contains(concat(" ", normalize-space(@class), " "), " job-tile ")]'
+LOCATION_TEST = 'contains(@class, "jobLocation") or contains(@id, "location-value")'
+DEPARTMENT_TEST = ('contains(@class, "jobDepartment") or contains(@class, "jobFacility") '
+                   'or contains(@id, "department-value")')
+DATE_TEST = 'contains(@class, "jobDate") or contains(@id, "date-value")'
+DESCRIPTION_XPATH = '//*[contains(@class, "jobdescription")] | //*[@itemprop="description"]'
+
+_TOTAL = re.compile(r'(\d+)\s*[-–]\s*(\d+)\s+of\s+(\d+)')
+_TAGS = re.compile(r'<[^>]+>')
+_ROW = re.compile(r'<tr[^>]*class="[^"]*data-row[^"]*"[^>]*>(.*?)</tr>', re.DOTALL)
+_TITLE = re.compile(r'class="[^"]*jobTitle[^"]*"[^>]*>.*?<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', re.DOTALL)
+
+
+def _cell(row_html, css_class):
+    match = re.search(rf'class="[^"]*{css_class}[^"]*"[^>]*>(.*?)</(?:td|div|span)', row_html, re.DOTALL)
+    return ' '.join(_TAGS.sub('', match.group(1)).split()) if match else ''
+
+
+def _parse_rows_regex(page):
+    rows = []
+    for row_html in _ROW.findall(page):
+        title_match = _TITLE.search(row_html)
+        if not title_match:
+            continue
+        rows.append({
+            'title': ' '.join(_TAGS.sub('', title_match.group(2)).split()),
+            'href': title_match.group(1).replace('&amp;', '&'),
+            'location': _cell(row_html, 'jobLocation'),
+            'department': _cell(row_html, 'jobDepartment') or _cell(row_html, 'jobFacility'),
+            'posted_date': _cell(row_html, 'jobDate'),
+        })
+    return rows
+
+
+def _first_text(node, test):
+    for element in node.xpath(f'.//*[{test}]'):
+        value = ' '.join(element.text_content().split())
+        if value:
+            return value
+    return ''
+
+
+def _parse_rows_lxml(page):
+    doc = lxml_html.fromstring(page)
+    rows = []
+    for node in doc.xpath(DATA_ROW_XPATH) or doc.xpath(TILE_XPATH):
+        links = node.xpath('.//a[contains(@class, "jobTitle-link")]') or node.xpath('.//a[contains(@href, "/job/")]')
+        if not links:
+            continue
+        rows.append({
+            'title': ' '.join(links[0].text_content().split()),
+            'href': links[0].get('href', ''),
+            'location': _first_text(node, LOCATION_TEST),
+            'department': _first_text(node, DEPARTMENT_TEST),
+            'posted_date': _first_text(node, DATE_TEST),
+        })
+    return rows
+
+
+def parse_rows(page):
+    """Job rows (title, href, location, department, posted_date) from a results page."""
+    if not page:
+        return []
+    return _parse_rows_lxml(page) if lxml_html is not None else _parse_rows_regex(page)
+
+
+def parse_total(page):
+    """N from the "1 - 25 of N" results label, or 0."""
+    match = _TOTAL.search(' '.join(_TAGS.sub(' ', page or '').split()))
+    return int(match.group(3)) if match else 0
+
+
+def _parse_location(location_str):
+    """(city, state, country) from RMK location text such as ``Pune, MH, IN`` or ``Mumbai - Worli, IN``."""
+    location_str = re.sub(r'\b\d{6}\b', '', location_str or '')
+    if ' - ' in location_str:
+        location_str = location_str.split(' - ')[0]
+    parts = [p.strip() for p in location_str.split(',') if p.strip()]
+    city = parts[0] if parts else ''
+    state = ''
+    country = 'India'
+    if len(parts) >= 3:
+        state, country = parts[1], parts[2]
+    elif len(parts) == 2 and parts[1].upper() not in ('IN', 'IND', 'INDIA'):
+        state = parts[1]
+    if country.upper() in ('IN', 'IND'):
+        country = 'India'
+    return city, state, country
+
+
+class SuccessFactorsScraper:
+    site_key = None
+
+    def __init__(self):
+        site = SUCCESSFACTORS_SITES[self.site_key]
+        self.site = site
+        self.company_name = site['company_name']
+        self.url = site['url']
+        self.page_size = site.get('page_size', PAGE_SIZE)
+        parts = urlsplit(self.url)
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+
+    def _page_url(self, startrow):
+        if not startrow:
+            return self.url
+        parts = urlsplit(self.url)
+        if '/go/' in parts.path:
+            # Category pages carry the offset as the last path segment
+            return urlunsplit(parts._replace(path=f"{parts.path.rstrip('/')}/{startrow}/"))
+        query = f"{parts.query}&startrow={startrow}" if parts.query else f"startrow={startrow}"
+        return urlunsplit(parts._replace(query=query))
+
+    def _fetch_html(self, url):
+        response = http_get(url, headers=HEADERS)
+        response.raise_for_status()
+        check_listing(response)
+        return response.text
+
+    def _fetch_rows(self, fetch_html, max_pages, workers=None):
+        kwargs = {'workers': workers} if workers else {}
+        return fetch_offset_pages(
+            lambda startrow: fetch_html(self._page_url(startrow)), self.page_size,
+            items_of=parse_rows,
+            total_of=parse_total,
+            max_items=max_pages * self.page_size,
+            key=lambda row: row['href'] or row['title'],
+            **kwargs,
+        )
+
+    def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        try:
+            rows = self._fetch_rows(self._fetch_html, max_pages)
+        except ListingUnchanged:
+            raise
+        except Exception as e:
+            logger.warning(f"{self.company_name}: HTTP fetch failed: {str(e)}")
+            rows = []
+        if not rows:
+            logger.info(f"{self.company_name}: no server-rendered results, loading the pages in a browser")
+            rows = self._scrape_via_browser(max_pages)
+
+        jobs = []
+        seen = set()
+        for row in rows:
+            job = self._to_job(row)
+            if job and job['external_id'] not in seen:
+                seen.add(job['external_id'])
+                jobs.append(job)
+
+        if jobs and lxml_html is not None and self.site.get('fetch_details', FETCH_FULL_JOB_DETAILS):
+            details = fetch_concurrently(self._fetch_details, [job['apply_url'] for job in jobs])
+            for job, detail in zip(jobs, details):
+                if detail:
+                    job.update(detail)
+
+        logger.info(f"{self.company_name}: {len(jobs)} jobs")
+        return jobs
+
+    def _scrape_via_browser(self, max_pages):
+        from core.browser import acquire_driver, release_driver
+        from core.waits import wait_for_dom_stable
+
+        def fetch_html(url):
+            driver.get(url)
+            wait_for_dom_stable(driver, 10)
+            return driver.page_source
+
+        driver = acquire_driver()
+        try:
+            # One driver, so pages are loaded one at a time
+            return self._fetch_rows(fetch_html, max_pages, workers=1)
+        finally:
+            release_driver(driver)
+
+    def _to_job(self, row):
+        title = row.get('title', '')
+        href = row.get('href', '')
+        if not title or not href:
+            return None
+        apply_url = href if href.startswith('http') else f"{self.origin}/{href.lstrip('/')}"
+
+        job_id = ''
+        if '/job/' in apply_url:
+            job_id = next((part for part in reversed(apply_url.split('?')[0].rstrip('/').split('/'))
+                           if part.isdigit()), '')
+        if not job_id:
+            job_id = hashlib.md5(apply_url.encode()).hexdigest()[:12]
+
+        location = row.get('location', '')
+        city, state, country = _parse_location(location)
+        return {
+            'external_id': generate_external_id(job_id, self.company_name),
+            'company_name': self.company_name,
+            'title': title,
+            'description': '',
+            'location': location,
+            'city': city,
+            'state': state,
+            'country': country,
+            'employment_type': '',
+            'department': row.get('department', ''),
+            'apply_url': apply_url,
+            'posted_date': row.get('posted_date', ''),
+            'job_function': '',
+            'experience_level': '',
+            'salary_range': '',
+            'remote_type': '',
+            'status': 'active'
+        }
+
+    def _fetch_details(self, apply_url):
+        """Description from a job page's ``jobdescription`` block."""
+        doc = lxml_html.fromstring(self._fetch_html(apply_url))
+        for element in doc.xpath(DESCRIPTION_XPATH):
+            description = html_to_text(lxml_html.tostring(element, encoding='unicode'))
+            if description:
+                return {'description': description}
+        return None
+
+
+def successfactors_scraper(site_key):
+    """Scraper class for the ``SUCCESSFACTORS_SITES`` entry ``site_key``."""
+    name = ''.join(ch for ch in SUCCESSFACTORS_SITES[site_key]['company_name'].title() if ch.isalnum())
+    return type(f'{name}Scraper', (SuccessFactorsScraper,), {'site_key': site_key})
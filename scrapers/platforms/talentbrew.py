@@ -0,0 +1,241 @@
+"""
+Generic TalentBrew (Radancy) engine.
+
+TalentBrew career sites (``<host>/search-jobs/India/<org>/2/1269750/...`` and
+``<host>/location/india-jobs/<org>/1269750/2``) render their results list
+from an AJAX endpoint that takes the page number and the location facet:
+
+    GET <host>/search-jobs/results?CurrentPage=2&RecordsPerPage=50&OrganizationIds=<org>
+        &FacetFilters[0].ID=1269750&FacetFilters[0].FacetType=2&...
+        -> {"results": "<section id=\"search-results\" data-total-results=\"N\"> ... </section>", ...}
+
+so a company only needs its search URL in ``config.scraper.TALENTBREW_SITES``
+(1269750 is the GeoNames id for India, facet type 2 a country).  The
+organization id is taken from the entry's 'org_id', else from the URL, else
+from the server-rendered search page (``find_org_id``), once per process.  Pages are
+fetched concurrently with ``fetch_offset_pages`` and the result rows parsed
+from the returned HTML.  If the endpoint fails, page 1 of the configured
+search URL, which is rendered on the server, is parsed instead.
+
+``talentbrew_scraper(key)`` returns a zero-argument scraper class for the
+registry.
+"""
+import hashlib
+import html
+import re
+from urllib.parse import urlsplit
+
+from core.http_cache import ListingUnchanged, check_listing
+from core.http_client import http_get
+from core.logging import setup_logger
+from core.pagination import fetch_offset_pages
+from config.scraper import MAX_PAGES_TO_SCRAPE, TALENTBREW_SITES
+from scrapers.platforms.common import generate_external_id, parse_location, is_india_location
+
+logger = setup_logger('talentbrew_scraper')
+
+PAGE_SIZE = 50
+# MAX_PAGES_TO_SCRAPE counts pages of the size the search page shows
+LEGACY_PAGE_SIZE = 15
+INDIA_LOCATION_ID = 1269750
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/javascript, */*; q=0.01',
+    'X-Requested-With': 'XMLHttpRequest',
+}
+
+_TAGS = re.compile(r'<[^>]+>')
+_JOB_LINK = re.compile(r'<a\b([^>]*\bhref="([^"]*/job/[^"]*)"[^>]*)>(.*?)</a>', re.DOTALL)
+_JOB_ID = re.compile(r'\bdata-job-id="([^"]+)"')
+_HEADING = re.compile(r'<h\d[^>]*>(.*?)</h\d>', re.DOTALL)
+_LOCATION = re.compile(r'class="[^"]*job-location[^"]*"[^>]*>(.*?)</', re.DOTALL)
+_DATE = re.compile(r'class="[^"]*job-date[^"]*"[^>]*>(.*?)</', re.DOTALL)
+_TOTAL = re.compile(r'\bdata-total-results="(\d+)"')
+_LANGUAGE = re.compile(r'^[a-z]{2}(-[a-z]{2})?$')
+_ORG_URL = re.compile(r'/(?:search-jobs/[^/]+|location/[\w-]+-jobs)/(\d+)/')
+_ORG_PAGE = re.compile(r'organization-?ids?["\']?\s*[:=]\s*["\']?(\d+)', re.IGNORECASE)
+# /job/<city>/<title>/<org>/<job id>
+_ORG_JOB_LINK = re.compile(r'href="[^"]*/job/[^"/]+/[^"/]+/(\d+)/\d+')
+
+
+def _clean(fragment):
+    return ' '.join(html.unescape(_TAGS.sub(' ', fragment or '')).split())
+
+
+def parse_results(page):
+    """Job rows (job_id, title, href, location, posted_date) from a results fragment or page."""
+    matches = list(_JOB_LINK.finditer(page or ''))
+    rows = []
+    for i, match in enumerate(matches):
+        attrs, href, inner = match.groups()
+        # A row runs from its job link to the next one
+        row_html = page[match.start():matches[i + 1].start() if i + 1 < len(matches) else len(page)]
+        heading = _HEADING.search(inner)
+        title = _clean(heading.group(1) if heading else inner)
+        if not title:
+            continue
+        job_id = _JOB_ID.search(attrs)
+        location = _LOCATION.search(row_html)
+        date = _DATE.search(row_html)
+        rows.append({
+            'job_id': job_id.group(1) if job_id else '',
+            'title': title,
+            'href': html.unescape(href),
+            'location': _clean(location.group(1)) if location else '',
+            'posted_date': _clean(date.group(1)) if date else '',
+        })
+    return rows
+
+
+def find_org_id(url, page=''):
+    """TalentBrew organization id in a search URL or search page, or None."""
+    match = (_ORG_URL.search(urlsplit(url).path) or _ORG_PAGE.search(page or '')
+             or _ORG_JOB_LINK.search(page or ''))
+    return int(match.group(1)) if match else None
+
+
+def parse_total(page):
+    match = _TOTAL.search(page or '')
+    return int(match.group(1)) if match else 0
+
+
+class TalentBrewScraper:
+    site_key = None
+
+    def __init__(self):
+        site = TALENTBREW_SITES[self.site_key]
+        self.site = site
+        self.company_name = site['company_name']
+        self.url = site['url']
+        parts = urlsplit(self.url)
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        # Multi-language sites serve the endpoint under their language prefix (/en/search-jobs/results)
+        first = parts.path.strip('/').split('/')[0]
+        prefix = f"/{first}" if _LANGUAGE.match(first) else ''
+        self.results_url = f"{self.origin}{prefix}/search-jobs/results"
+
+    def _params(self, page):
+        location_id = self.site.get('location_id', INDIA_LOCATION_ID)
+        return {
+            'ActiveFacetID': 0,
+            'CurrentPage': page,
+            'RecordsPerPage': PAGE_SIZE,
+            'Distance': 50,
+            'RadiusUnitType': 0,
+            'Keywords': self.site.get('keywords', ''),
+            'Location': '',
+            'ShowRadius': 'False',
+            'IsPagination': 'True' if page > 1 else 'False',
+            'CustomFacetName': '',
+            'FacetTerm': '',
+            'FacetType': 0,
+            'FacetFilters[0].ID': location_id,
+            'FacetFilters[0].FacetType': 2,
+            'FacetFilters[0].Count': 0,
+            'FacetFilters[0].Display': self.site.get('location', 'India'),
+            'FacetFilters[0].IsApplied': 'true',
+            'FacetFilters[0].FieldName': '',
+            'SearchResultsModuleName': 'Search Results',
+            'SearchFiltersModuleName': 'Search Filters',
+            'SortCriteria': 0,
+            'SortDirection': 0,
+            'SearchType': 1,
+            'OrganizationIds': self.site['org_id'],
+        }
+
+    def _fetch_results(self, offset):
+        response = http_get(self.results_url, params=self._params(offset // PAGE_SIZE + 1),
+                            headers={**HEADERS, 'Referer': self.url})
+        response.raise_for_status()
+        if not offset:
+            check_listing(response)
+        return response.json().get('results') or ''
+
+    def _search_page(self):
+        response = http_get(self.url, headers={**HEADERS, 'Accept': 'text/html,application/xhtml+xml'})
+        response.raise_for_status()
+        return response.text
+
+    def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        page = None
+        if not self.site.get('org_id'):
+            org_id = find_org_id(self.url)
+            if not org_id:
+                page = self._search_page()
+                org_id = find_org_id(self.url, page)
+            if org_id:
+                # Cached on the config entry for later scrapes in this process
+                self.site['org_id'] = org_id
+            else:
+                logger.warning(f"{self.company_name}: no organization id found, parsing the search page")
+
+        rows = []
+        if self.site.get('org_id'):
+            try:
+                rows = fetch_offset_pages(
+                    self._fetch_results, PAGE_SIZE,
+                    items_of=parse_results,
+                    total_of=parse_total,
+                    max_items=max_pages * LEGACY_PAGE_SIZE,
+                    key=lambda row: row['href'],
+                )
+            except ListingUnchanged:
+                raise
+            except Exception as e:
+                logger.warning(f"{self.company_name}: results endpoint failed: {str(e)}, parsing the search page")
+        if not rows:
+            rows = parse_results(page if page is not None else self._search_page())
+
+        jobs = []
+        seen = set()
+        for row in rows:
+            job = self._to_job(row)
+            if job and job['external_id'] not in seen:
+                seen.add(job['external_id'])
+                jobs.append(job)
+
+        logger.info(f"{self.company_name}: {len(jobs)} jobs")
+        return jobs
+
+    def _to_job(self, row):
+        title = row['title']
+        href = row['href']
+        apply_url = href if href.startswith('http') else f"{self.origin}/{href.lstrip('/')}"
+        location = row['location']
+        if self.site.get('india_only') and not is_india_location(location, href):
+            logger.debug(f"Filtered non-India job: {title} | {location}")
+            return None
+
+        # /job/<city>/<title>/<org>/<job id>
+        job_id = row['job_id'] or next(
+            (part for part in reversed(apply_url.split('?')[0].rstrip('/').split('/')) if part.isdigit()), '')
+        if not job_id:
+            job_id = hashlib.md5(apply_url.encode()).hexdigest()[:12]
+
+        location_parts = parse_location(location)
+        return {
+            'external_id': generate_external_id(job_id, self.company_name),
+            'company_name': self.company_name,
+            'title': title,
+            'description': '',
+            'location': location,
+            'city': location_parts['city'],
+            'state': location_parts['state'],
+            'country': location_parts['country'],
+            'employment_type': '',
+            'department': '',
+            'apply_url': apply_url,
+            'posted_date': row['posted_date'],
+            'job_function': '',
+            'experience_level': '',
+            'salary_range': '',
+            'remote_type': '',
+            'status': 'active'
+        }
+
+
+def talentbrew_scraper(site_key):
+    """Scraper class for the ``TALENTBREW_SITES`` entry ``site_key``."""
+    name = ''.join(ch for ch in TALENTBREW_SITES[site_key]['company_name'].title() if ch.isalnum())
+    return type(f'{name}Scraper', (TalentBrewScraper,), {'site_key': site_key})
@@ -0,0 +1,170 @@
+"""
+Generic Workday engine.
+
+Every Workday career site serves the same CXS JSON API:
+
+    POST /wday/cxs/<tenant>/<site>/jobs           listing (offset/limit, facets, searchText)
+    GET  /wday/cxs/<tenant>/<site><externalPath>  one posting (``jobPostingInfo``)
+
+so a company only needs an entry in ``config.scraper.WORKDAY_SITES``.  The
+listing is paginated concurrently with ``fetch_offset_pages``; when details
+are enabled the detail calls are batched through ``fetch_concurrently``.
+
+``workday_scraper(key)`` returns a zero-argument scraper class for the
+registry.
+"""
+import hashlib
+
+from core.http_cache import check_listing
+from core.http_client import http_get, http_post
+from core.logging import setup_logger
+from core.pagination import fetch_offset_pages, fetch_concurrently
+from config.scraper import FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE, WORKDAY_SITES
+from scrapers.platforms.common import generate_external_id, parse_location, is_india_location, html_to_text
+
+logger = setup_logger('workday_scraper')
+
+# The CXS API rejects pages larger than 20
+PAGE_SIZE = 20
+
+HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json',
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+}
+
+
+class WorkdayScraper:
+    site_key = None
+
+    def __init__(self):
+        site = WORKDAY_SITES[self.site_key]
+        self.site = site
+        self.company_name = site['company_name']
+        host = f"https://{site['tenant']}.{site['datacenter']}.myworkdayjobs.com"
+        self.api_base = f"{host}/wday/cxs/{site['tenant']}/{site['site']}"
+        self.api_url = f"{self.api_base}/jobs"
+        locale = f"/{site['locale']}" if site.get('locale') else ''
+        self.base_job_url = f"{host}{locale}/{site['site']}"
+        self.url = site.get('url', self.base_job_url)
+
+    def scrape(self, max_pages=MAX_PAGES_TO_SCRAPE):
+        payload = {
+            'appliedFacets': self.site.get('applied_facets', {}),
+            'searchText': self.site.get('search_text', ''),
+        }
+
+        def fetch_page(offset):
+            # A read-only search: cached and revalidated like a GET
+            response = http_post(self.api_url, json={**payload, 'limit': PAGE_SIZE, 'offset': offset},
+                                 headers=HEADERS, cache=True)
+            response.raise_for_status()
+            if not offset:
+                check_listing(response)
+            return response.json()
+
+        postings = fetch_offset_pages(
+            fetch_page, PAGE_SIZE,
+            items_of=lambda data: data.get('jobPostings', []),
+            total_of=lambda data: data.get('total', 0),
+            max_items=max_pages * PAGE_SIZE,
+            key=lambda posting: posting.get('externalPath') or posting.get('title'),
+        )
+        logger.info(f"{self.company_name}: API returned {len(postings)} postings")
+
+        jobs, paths = [], []
+        for posting in postings:
+            try:
+                job = self._to_job(posting)
+            except Exception as e:
+                logger.error(f"Error processing posting: {str(e)}")
+                continue
+            if job:
+                jobs.append(job)
+                paths.append(posting.get('externalPath', ''))
+
+        if self.site.get('fetch_details', FETCH_FULL_JOB_DETAILS):
+            details = fetch_concurrently(self._fetch_details, paths)
+            for job, detail in zip(jobs, details):
+                if detail:
+                    job.update(detail)
+
+        logger.info(f"{self.company_name}: {len(jobs)} jobs")
+        return jobs
+
+    def _to_job(self, posting):
+        title = posting.get('title', '')
+        if not title:
+            return None
+
+        external_path = posting.get('externalPath', '')
+        apply_url = f"{self.base_job_url}{external_path}" if external_path else self.url
+        location = posting.get('locationsText', '')
+        bullet_fields = [f for f in posting.get('bulletFields', []) if isinstance(f, str)]
+
+        if self.site.get('india_only') and not is_india_location(location, external_path):
+            logger.debug(f"Filtered non-India job: {title} | {location}")
+            return None
+
+        job_id = ''
+        prefix = self.site.get('bullet_id_prefix')
+        if prefix:
+            job_id = next((f for f in bullet_fields if f.startswith(prefix)), '')
+        if not job_id and external_path:
+            job_id = external_path.strip('/').split('/')[-1]
+        if not job_id:
+            job_id = f"{self.site_key}_{hashlib.md5(title.encode()).hexdigest()[:12]}"
+
+        remote_type = ''
+        employment_type = ''
+        for field in bullet_fields:
+            if 'On-site' in field or 'Remote' in field or 'Hybrid' in field:
+                remote_type = field
+            elif 'Full' in field or 'Part' in field or 'Contract' in field:
+                employment_type = field
+
+        location_parts = parse_location(location, self.site.get('default_country', 'India'))
+        if self.site.get('india_only'):
+            location_parts['country'] = 'India'
+
+        return {
+            'external_id': generate_external_id(job_id, self.company_name),
+            'company_name': self.company_name,
+            'title': title,
+            'description': '',
+            'location': location,
+            'city': location_parts['city'],
+            'state': location_parts['state'],
+            'country': location_parts['country'],
+            'employment_type': employment_type,
+            'department': '',
+            'apply_url': apply_url,
+            'posted_date': posting.get('postedOn', ''),
+            'job_function': '',
+            'experience_level': '',
+            'salary_range': '',
+            'remote_type': remote_type,
+            'status': 'active'
+        }
+
+    def _fetch_details(self, external_path):
+        """Description, type and location from a posting's detail JSON."""
+        if not external_path:
+            return None
+        response = http_get(f"{self.api_base}{external_path}", headers=HEADERS)
+        response.raise_for_status()
+        info = response.json().get('jobPostingInfo', {})
+        details = {'description': html_to_text(info.get('jobDescription', ''))}
+        if info.get('timeType'):
+            details['employment_type'] = info['timeType']
+        if info.get('remoteType'):
+            details['remote_type'] = info['remoteType']
+        if info.get('location') and not info.get('additionalLocations'):
+            details['location'] = info['location']
+        return details
+
+
+def workday_scraper(site_key):
+    """Scraper class for the ``WORKDAY_SITES`` entry ``site_key``."""
+    name = ''.join(ch for ch in WORKDAY_SITES[site_key]['company_name'].title() if ch.isalnum())
+    return type(f'{name}Scraper', (WorkdayScraper,), {'site_key': site_key})
@@ -1,57 +1,29 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, page_signature, wait_for_page_change, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('proctergamble_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _scrape_page looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    'li.jobs-list-item',
+    'a.au-target[href*="/job/"], a[href*="/en/job/"]',
+]
 
 class ProcterGambleScraper:
     def __init__(self):
         self.company_name = 'Procter & Gamble'
         self.url = 'https://www.pgcareers.com/search-jobs/India/403/1/2/6252001/19x9434/-2x2371/50/2'
     
-    def setup_driver(self):
-        """Set up Chrome driver with anti-detection options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            import os
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-    
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -64,9 +36,9 @@ class ProcterGambleScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
-            time.sleep(10)
+            wait_for_dom_stable(driver, 10)
 
             current_url = driver.current_url
             logger.info(f"Landed on: {current_url}")
@@ -79,36 +51,35 @@ class ProcterGambleScraper:
                 logger.info("Detected Phenom platform redirect, navigating to search-results")
                 # P&G Phenom search results page (shows all jobs)
                 driver.get('https://www.pgcareers.com/global/en/search-results')
-                time.sleep(12)
+                wait_for_dom_stable(driver, 12)
                 logger.info(f"Phenom search URL: {driver.current_url}")
 
                 # Try to use location filter to narrow to India
                 try:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     loc_input = driver.find_element(By.CSS_SELECTOR, '#gllocationInput')
                     loc_input.clear()
                     loc_input.send_keys('India')
-                    time.sleep(2)
+                    wait_for_dom_stable(driver, 2)
                     # Select India from dropdown if it appears
                     try:
                         india_option = driver.find_element(By.XPATH, '//span[contains(text(), "India")]')
                         india_option.click()
-                        time.sleep(5)
+                        wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 5)
                         logger.info("Selected India location filter")
                     except Exception:
                         # Press enter or click search button
                         from selenium.webdriver.common.keys import Keys
                         loc_input.send_keys(Keys.RETURN)
-                        time.sleep(5)
+                        wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 5)
                         logger.info("Submitted India location search")
                 except Exception as e:
                     logger.warning(f"Could not set location filter: {str(e)}")
 
                 # Scroll to trigger lazy loading of job cards
-                for _ in range(3):
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
+                scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
                 driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
+                wait_for_dom_stable(driver, 2)
 
             current_page = 1
 
@@ -121,10 +92,11 @@ class ProcterGambleScraper:
                 logger.info(f"Scraped {len(page_jobs)} jobs from page {current_page}")
 
                 if current_page < max_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(3)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 3)
 
                 current_page += 1
 
@@ -136,7 +108,7 @@ class ProcterGambleScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -146,7 +118,7 @@ class ProcterGambleScraper:
             next_page_num = current_page + 1
 
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             next_page_selectors = [
                 # NAS/Radancy pagination
@@ -183,7 +155,7 @@ class ProcterGambleScraper:
     def _scrape_page(self, driver):
         """Scrape jobs - tries NAS/Radancy first, then Phenom fallback"""
         jobs = []
-        time.sleep(2)
+        wait_for_dom_stable(driver, 2)
 
         # Strategy 1: NAS/Radancy JS extraction
         js_jobs = driver.execute_script("""
@@ -337,7 +309,6 @@ class ProcterGambleScraper:
             driver.switch_to.window(driver.window_handles[-1])
             
             driver.get(job_url)
-            time.sleep(3)
             
             try:
                 desc_selectors = [
@@ -345,6 +316,7 @@ class ProcterGambleScraper:
                     (By.XPATH, "//div[contains(@class, 'job-description')]"),
                     (By.CSS_SELECTOR, 'div.description'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
                 
                 for selector_type, selector_value in desc_selectors:
                     try:
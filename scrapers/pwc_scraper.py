@@ -1,60 +1,24 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 import json
 import re
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('pwc_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class PwCScraper:
     def __init__(self):
         self.company_name = 'PwC'
         self.url = 'https://www.pwc.in/careers/experienced-jobs.html'
 
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-            })
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-            })
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -73,7 +37,7 @@ class PwCScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # Strategy 1: Navigate to results page with country=India params
             # The form submits to results.html with wdcountry=IND|BGD and wdjobsite params
@@ -85,7 +49,7 @@ class PwCScraper:
             )
             logger.info(f"Navigating to results page: {results_url}")
             driver.get(results_url)
-            time.sleep(15)  # Wait for page and AJAX to load
+            wait_for_dom_stable(driver, 15)  # Wait for page and AJAX to load
 
             # Extract jsondata from page source
             page_source = driver.page_source
@@ -162,7 +126,7 @@ class PwCScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -249,14 +213,14 @@ class PwCScraper:
         try:
             logger.info("Loading search page to submit form")
             driver.get(self.url)
-            time.sleep(10)
+            wait_for_dom_stable(driver, 10)
 
             # Click "View all jobs" button
             try:
                 view_all = driver.find_element(By.CSS_SELECTOR, 'input[name="submit1"][value="View all jobs"]')
                 driver.execute_script('arguments[0].click()', view_all)
                 logger.info("Clicked 'View all jobs' button")
-                time.sleep(15)
+                wait_for_dom_stable(driver, 15)
             except Exception as e:
                 logger.warning(f"Could not click View all jobs: {str(e)}")
                 return jobs
@@ -328,7 +292,6 @@ class PwCScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
 
             try:
                 desc_selectors = [
@@ -336,6 +299,7 @@ class PwCScraper:
                     (By.XPATH, "//h2[contains(text(), 'Description')]/following-sibling::div"),
                     (By.CSS_SELECTOR, 'div.job-description'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
 
                 for selector_type, selector_value in desc_selectors:
                     try:
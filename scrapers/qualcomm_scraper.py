@@ -1,14 +1,9 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import json
 import time
-import os
-import stat
 from pathlib import Path
 
 try:
@@ -18,12 +13,12 @@ except ImportError:
 
 
 from core.logging import setup_logger
-from config.scraper import HEADLESS_MODE, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change
+from config.scraper import MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('qualcomm_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class QualcommScraper:
     def __init__(self):
         self.company_name = 'Qualcomm'
@@ -31,48 +26,6 @@ class QualcommScraper:
         self.api_url = 'https://qualcomm.wd5.myworkdayjobs.com/wday/cxs/qualcomm/External/jobs'
         self.base_job_url = 'https://qualcomm.wd5.myworkdayjobs.com/External'
 
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        driver_path = CHROMEDRIVER_PATH
-        if not os.path.exists(driver_path):
-            logger.warning(f"Fresh chromedriver not found at {driver_path}, trying system chromedriver")
-            from webdriver_manager.chrome import ChromeDriverManager
-            driver_path = ChromeDriverManager().install()
-            if 'chromedriver-mac-arm64' in driver_path and not driver_path.endswith('chromedriver'):
-                driver_dir = os.path.dirname(driver_path)
-                actual_driver = os.path.join(driver_dir, 'chromedriver')
-                if os.path.exists(actual_driver):
-                    driver_path = actual_driver
-
-        try:
-            current_permissions = os.stat(driver_path).st_mode
-            os.chmod(driver_path, current_permissions | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-        except Exception as e:
-            logger.warning(f"Could not set permissions on chromedriver: {str(e)}")
-
-        try:
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -87,7 +40,7 @@ class QualcommScraper:
         """
         driver = None
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Loading {self.url} to establish browser session")
 
             try:
@@ -122,7 +75,7 @@ class QualcommScraper:
                 page_loaded = True
             except Exception:
                 logger.warning("Timeout waiting for job listings, trying API anyway")
-                time.sleep(5)
+                wait_for_dom_stable(driver, 5)
 
             # Primary: Try in-browser API fetch
             api_jobs = self._try_browser_api(driver, max_pages)
@@ -151,7 +104,7 @@ class QualcommScraper:
             return []
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def _try_browser_api(self, driver, max_pages=MAX_PAGES_TO_SCRAPE):
@@ -371,10 +324,7 @@ class QualcommScraper:
             time.sleep(0.5)
 
             # Capture current state for change detection
-            old_first = driver.execute_script("""
-                var card = document.querySelector('li[data-automation-id="listItem"]');
-                return card ? card.innerText.substring(0, 50) : '';
-            """)
+            signature = page_signature(driver, 'li[data-automation-id="listItem"]')
 
             # Workday pagination selectors
             next_selectors = [
@@ -394,15 +344,7 @@ class QualcommScraper:
                     logger.info(f"Navigated to page {next_page_num}")
 
                     # Poll for content change
-                    for _ in range(25):
-                        time.sleep(0.2)
-                        new_first = driver.execute_script("""
-                            var card = document.querySelector('li[data-automation-id="listItem"]');
-                            return card ? card.innerText.substring(0, 50) : '';
-                        """)
-                        if new_first and new_first != old_first:
-                            break
-                    time.sleep(0.5)
+                    wait_for_page_change(driver, 'li[data-automation-id="listItem"]', signature, 5)
                     return True
                 except:
                     continue
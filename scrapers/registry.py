@@ -4,7 +4,7 @@ Scraper Registry - Maps company names to their scraper classes.
 from datetime import datetime
 
 from core.logging import setup_logger
-from config.scraper import LOGS_DIR
+from config.scraper import AUTO_ROUTE_PLATFORMS, COMPANIES, LOGS_DIR
 
 log_file = LOGS_DIR / f'registry_{datetime.now().strftime("%Y%m%d")}.log'
 logger = setup_logger('registry', log_file)
@@ -13,49 +13,33 @@ logger = setup_logger('registry', log_file)
 from scrapers.amazon_scraper import AmazonScraper
 from scrapers.aws_scraper import AWSScraper
 from scrapers.accenture_scraper import AccentureScraper
-from scrapers.jll_scraper import JLLScraper
 from scrapers.bain_scraper import BainScraper
-from scrapers.bcg_scraper import BCGScraper
 from scrapers.infosys_scraper import InfosysScraper
 from scrapers.loreal_scraper import LorealScraper
-from scrapers.mahindra_scraper import MahindraScraper
 from scrapers.marico_scraper import MaricoScraper
 from scrapers.meta_scraper import MetaScraper
 from scrapers.microsoft_scraper import MicrosoftScraper
-from scrapers.morganstanley_scraper import MorganStanleyScraper
-from scrapers.nestle_scraper import NestleScraper
-from scrapers.nvidia_scraper import NvidiaScraper
-from scrapers.samsung_scraper import SamsungScraper
 from scrapers.swiggy_scraper import SwiggyScraper
 from scrapers.tcs_scraper import TCSScraper
-from scrapers.tataconsumer_scraper import TataConsumerScraper
 from scrapers.techmahindra_scraper import TechMahindraScraper
 from scrapers.varunbeverages_scraper import VarunBeveragesScraper
-from scrapers.wipro_scraper import WiproScraper
 from scrapers.pepsico_scraper import PepsiCoScraper
 from scrapers.bookmyshow_scraper import BookMyShowScraper
-from scrapers.abbott_scraper import AbbottScraper
 
 # New scrapers - Tech Giants
 from scrapers.google_scraper import GoogleScraper
 from scrapers.ibm_scraper import IBMScraper
 from scrapers.apple_scraper import AppleScraper
-from scrapers.intel_scraper import IntelScraper
-from scrapers.dell_scraper import DellScraper
 from scrapers.cisco_scraper import CiscoScraper
 
 # New scrapers - Consulting & IT Services
-from scrapers.hcltech_scraper import HCLTechScraper
-from scrapers.cognizant_scraper import CognizantScraper
 from scrapers.capgemini_scraper import CapgeminiScraper
 from scrapers.deloitte_scraper import DeloitteScraper
-from scrapers.ey_scraper import EYScraper
 from scrapers.kpmg_scraper import KPMGScraper
 from scrapers.pwc_scraper import PwCScraper
 
 # New scrapers - Financial Services
 from scrapers.goldmansachs_scraper import GoldmanSachsScraper
-from scrapers.jpmorganchase_scraper import JPMorganChaseScraper
 from scrapers.citigroup_scraper import CitigroupScraper
 from scrapers.hdfcbank_scraper import HDFCBankScraper
 from scrapers.icicibank_scraper import ICICIBankScraper
@@ -101,71 +85,44 @@ from scrapers.mckinsey_scraper import McKinseyScraper
 from scrapers.parleagro_scraper import ParleAgroScraper
 from scrapers.zoho_scraper import ZohoScraper
 from scrapers.adityabirla_scraper import AdityaBirlaScraper
-from scrapers.adobe_scraper import AdobeScraper
 from scrapers.mondelez_scraper import MondelezScraper
 from scrapers.reckitt_scraper import ReckittScraper
-from scrapers.cocacola_scraper import CocaColaScraper
 from scrapers.statebankofindia_scraper import StateBankOfIndiaScraper
 from scrapers.tesla_scraper import TeslaScraper
 from scrapers.abbvie_scraper import AbbVieScraper
-from scrapers.americanexpress_scraper import AmericanExpressScraper
 from scrapers.angelone_scraper import AngelOneScraper
-from scrapers.att_scraper import ATTScraper
-from scrapers.boeing_scraper import BoeingScraper
 from scrapers.cipla_scraper import CiplaScraper
-from scrapers.cummins_scraper import CumminsScraper
 from scrapers.cyient_scraper import CyientScraper
 from scrapers.drreddys_scraper import DrReddysScraper
-from scrapers.royalenfield_scraper import RoyalEnfieldScraper
-from scrapers.elililly_scraper import EliLillyScraper
-from scrapers.exxonmobil_scraper import ExxonMobilScraper
 from scrapers.fedex_scraper import FedExScraper
 from scrapers.fortishealthcare_scraper import FortisHealthcareScraper
 from scrapers.herofincorp_scraper import HeroFinCorpScraper
 from scrapers.heromotocorp_scraper import HeroMotoCorpScraper
 from scrapers.hindalco_scraper import HindalcoScraper
-from scrapers.honeywell_scraper import HoneywellScraper
 from scrapers.hp_scraper import HPScraper
 from scrapers.iifl_scraper import IIFLScraper
 from scrapers.johnsonjohnson_scraper import JohnsonJohnsonScraper
 from scrapers.jswenergy_scraper import JSWEnergyScraper
 from scrapers.jubilantfoodworks_scraper import JubilantFoodWorksScraper
 from scrapers.kpittechnologies_scraper import KPITTechnologiesScraper
-from scrapers.lowes_scraper import LowesScraper
 from scrapers.marutisuzuki_scraper import MarutiSuzukiScraper
 from scrapers.maxlifeinsurance_scraper import MaxLifeInsuranceScraper
-from scrapers.metlife_scraper import MetLifeScraper
 from scrapers.muthootfinance_scraper import MuthootFinanceScraper
 from scrapers.netflix_scraper import NetflixScraper
-from scrapers.nike_scraper import NikeScraper
 from scrapers.oraclecorporation_scraper import OracleCorporationScraper
 from scrapers.persistentsystems_scraper import PersistentSystemsScraper
 from scrapers.pfizer_scraper import PfizerScraper
 from scrapers.piramalgroup_scraper import PiramalGroupScraper
 from scrapers.qualcomm_scraper import QualcommScraper
-from scrapers.salesforce_scraper import SalesforceScraper
 from scrapers.shoppersstop_scraper import ShoppersStopScraper
 from scrapers.starbucks_scraper import StarbucksScraper
 from scrapers.sunpharma_scraper import SunPharmaScraper
 
 # Batch 3 - New scrapers (25 more)
-from scrapers.airindia_scraper import AirIndiaScraper
-from scrapers.tataaig_scraper import TataAIGScraper
-from scrapers.tatainternational_scraper import TataInternationalScraper
-from scrapers.tataprojects_scraper import TataProjectsScraper
-from scrapers.trent_scraper import TrentScraper
-from scrapers.bajajelectricals_scraper import BajajElectricalsScraper
-from scrapers.olam_scraper import OlamScraper
 from scrapers.unitedbreweries_scraper import UnitedBreweriesScraper
-from scrapers.tatapower_scraper import TataPowerScraper
 from scrapers.natwestgroup_scraper import NatWestGroupScraper
 from scrapers.hitachi_scraper import HitachiScraper
-from scrapers.mckesson_scraper import McKessonScraper
-from scrapers.birlasoft_scraper import BirlasoftScraper
 from scrapers.coforge_scraper import CoforgeScraper
-from scrapers.dhl_scraper import DHLScraper
-from scrapers.ericsson_scraper import EricssonScraper
-from scrapers.vois_scraper import VOISScraper
 from scrapers.schneiderelectric_scraper import SchneiderElectricScraper
 from scrapers.siemens_scraper import SiemensScraper
 from scrapers.deutschebank_scraper import DeutscheBankScraper
@@ -179,18 +136,13 @@ from scrapers.novartis_scraper import NovartisScraper
 from scrapers.adanienergy_scraper import AdaniEnergyScraper
 from scrapers.adaniports_scraper import AdaniPortsScraper
 from scrapers.americantower_scraper import AmericanTowerScraper
-from scrapers.anz_scraper import ANZScraper
 from scrapers.axa_scraper import AXAScraper
 from scrapers.basf_scraper import BASFScraper
-from scrapers.bayer_scraper import BayerScraper
-from scrapers.disney_scraper import DisneyScraper
 from scrapers.emiratesgroup_scraper import EmiratesGroupScraper
 from scrapers.gsk_scraper import GSKScraper
 from scrapers.hyundai_scraper import HyundaiScraper
 from scrapers.ihg_scraper import IHGScraper
-from scrapers.intuit_scraper import IntuitScraper
 from scrapers.lenovo_scraper import LenovoScraper
-from scrapers.lgelectronics_scraper import LGElectronicsScraper
 from scrapers.mercedesbenz_scraper import MercedesBenzScraper
 from scrapers.munichre_scraper import MunichReScraper
 from scrapers.panasonic_scraper import PanasonicScraper
@@ -206,9 +158,7 @@ from scrapers.whirlpool_scraper import WhirlpoolScraper
 from scrapers.britannia_scraper import BritanniaScraper
 from scrapers.bmwgroup_scraper import BMWGroupScraper
 from scrapers.crompton_scraper import CromptonScraper
-from scrapers.diageo_scraper import DiageoScraper
 from scrapers.dlf_scraper import DLFScraper
-from scrapers.havells_scraper import HavellsScraper
 from scrapers.hdfclife_scraper import HDFCLifeScraper
 from scrapers.hal_scraper import HALScraper
 from scrapers.honda_scraper import HondaScraper
@@ -217,17 +167,11 @@ from scrapers.indusindbank_scraper import IndusIndBankScraper
 from scrapers.iocl_scraper import IOCLScraper
 from scrapers.kajaria_scraper import KajariaScraper
 from scrapers.kiaindia_scraper import KiaIndiaScraper
-from scrapers.mankindpharma_scraper import MankindPharmaScraper
-from scrapers.maxhealthcare_scraper import MaxHealthcareScraper
 from scrapers.ntpc_scraper import NTPCScraper
-from scrapers.nissan_scraper import NissanScraper
-from scrapers.oyo_scraper import OyoScraper
-from scrapers.pidilite_scraper import PidiliteScraper
 from scrapers.saintgobain_scraper import SaintGobainScraper
 from scrapers.siemensenergy_scraper import SiemensEnergyScraper
 from scrapers.tatacommunications_scraper import TataCommunicationsScraper
 from scrapers.toyotakirloskar_scraper import ToyotaKirloskarScraper
-from scrapers.yesbank_scraper import YesBankScraper
 
 # Batch 6 - New scrapers (25 more)
 from scrapers.byd_scraper import BYDScraper
@@ -235,14 +179,11 @@ from scrapers.glencore_scraper import GlencoreScraper
 from scrapers.hcc_scraper import HCCScraper
 from scrapers.jktyre_scraper import JKTyreScraper
 from scrapers.kalyanjewellers_scraper import KalyanJewellersScraper
-from scrapers.kirloskar_scraper import KirloskarScraper
-from scrapers.mitsubishi_scraper import MitsubishiScraper
 from scrapers.motilaloswal_scraper import MotilalOswalScraper
 from scrapers.navitasys_scraper import NavitasysScraper
 from scrapers.poonawallafincorp_scraper import PoonawallaFincorpScraper
 from scrapers.schaeffler_scraper import SchaefflerScraper
 from scrapers.sis_scraper import SISScraper
-from scrapers.sony_scraper import SonyScraper
 from scrapers.suzlon_scraper import SuzlonScraper
 from scrapers.swissre_scraper import SwissReScraper
 from scrapers.tataadmin_scraper import TataAdminScraper
@@ -256,64 +197,146 @@ from scrapers.visa_scraper import VisaScraper
 from scrapers.voltas_scraper import VoltasScraper
 from scrapers.volvo_scraper import VolvoScraper
 
-# Config-based scrapers (Workday platform)
-from scrapers.airbus_scraper import AirbusScraper
-from scrapers.shell_scraper import ShellScraper
-from scrapers.agilent_scraper import AgilentScraper
-from scrapers.cadence_scraper import CadenceScraper
-from scrapers.r1rcm_scraper import R1RcmScraper
-from scrapers.suncor_scraper import SuncorScraper
-
-# Config-based scrapers (Oracle HCM platform)
-from scrapers.zensar_scraper import ZensarTechnologiesScraper
-from scrapers.bergerpaints_scraper import BergerPaintsScraper
-from scrapers.blackbox_scraper import BlackBoxScraper
-from scrapers.croma_scraper import CromaScraper
-from scrapers.quesscorp_scraper import QuessCorpScraper
-from scrapers.tatacapital_scraper import TataCapitalScraper
-from scrapers.tatachemicals_scraper import TataChemicalsScraper
-from scrapers.tataplay_scraper import TataPlayScraper
+# Config-based scrapers (Workday platform, see WORKDAY_SITES in config/scraper.py)
+from scrapers.platforms.workday import workday_scraper
+AirbusScraper = workday_scraper('airbus')
+ShellScraper = workday_scraper('shell')
+AgilentScraper = workday_scraper('agilent')
+CadenceScraper = workday_scraper('cadence')
+R1RcmScraper = workday_scraper('r1rcm')
+SuncorScraper = workday_scraper('suncor')
+DiageoScraper = workday_scraper('diageo')
+NissanScraper = workday_scraper('nissan')
+NvidiaScraper = workday_scraper('nvidia')
+SamsungScraper = workday_scraper('samsung')
+SalesforceScraper = workday_scraper('salesforce')
+SonyScraper = workday_scraper('sony')
+JLLScraper = workday_scraper('jll')
+
+# Config-based scrapers (Oracle HCM platform, see ORACLE_HCM_SITES in config/scraper.py)
 from scrapers.hexaware_scraper import HexawareTechnologiesScraper
+from scrapers.platforms.oracle_hcm import oracle_hcm_scraper
+ZensarTechnologiesScraper = oracle_hcm_scraper('zensar')
+BergerPaintsScraper = oracle_hcm_scraper('bergerpaints')
+BlackBoxScraper = oracle_hcm_scraper('blackbox')
+CromaScraper = oracle_hcm_scraper('croma')
+QuessCorpScraper = oracle_hcm_scraper('quesscorp')
+TataCapitalScraper = oracle_hcm_scraper('tatacapital')
+TataChemicalsScraper = oracle_hcm_scraper('tatachemicals')
+TataPlayScraper = oracle_hcm_scraper('tataplay')
+HavellsScraper = oracle_hcm_scraper('havells')
+HoneywellScraper = oracle_hcm_scraper('honeywell')
+JPMorganChaseScraper = oracle_hcm_scraper('jpmorganchase')
+
+# Config-based scrapers (DarwinBox platform, see DARWINBOX_SITES in config/scraper.py)
+from scrapers.platforms.darwinbox import darwinbox_scraper
+VedantaScraper = darwinbox_scraper('vedanta')
+BrigadeGroupScraper = darwinbox_scraper('brigadegroup')
+AsahiGlassScraper = darwinbox_scraper('asahiglass')
+NivaBupaScraper = darwinbox_scraper('nivabupa')
+JindalSawScraper = darwinbox_scraper('jindalsaw')
+SkodaVWScraper = darwinbox_scraper('skodavw')
+PolycabScraper = darwinbox_scraper('polycab')
+GoDigitScraper = darwinbox_scraper('godigit')
+TVSMotorScraper = darwinbox_scraper('tvsmotor')
+JSWSteelScraper = darwinbox_scraper('jswsteel')
+GMMCOScraper = darwinbox_scraper('gmmco')
+PiramalFinanceScraper = darwinbox_scraper('piramalfinance')
+YesBankScraper = darwinbox_scraper('yesbank')
+
+# Config-based scrapers (PeopleStrong platform, see PEOPLESTRONG_SITES in config/scraper.py)
+from scrapers.platforms.peoplestrong import peoplestrong_scraper
+AmaraRajaScraper = peoplestrong_scraper('amararaja')
+BajajFinservScraper = peoplestrong_scraper('bajajfinserv')
+HdfcErgoScraper = peoplestrong_scraper('hdfcergo')
+RblBankScraper = peoplestrong_scraper('rblbank')
+StarHealthScraper = peoplestrong_scraper('starhealth')
+MaxHealthcareScraper = peoplestrong_scraper('maxhealthcare')
+PidiliteScraper = peoplestrong_scraper('pidilite')
+
+# Config-based scrapers (SuccessFactors career sites, see SUCCESSFACTORS_SITES in config/scraper.py)
+from scrapers.platforms.successfactors import successfactors_scraper
+NestleScraper = successfactors_scraper('nestle')
+WiproScraper = successfactors_scraper('wipro')
+TataConsumerScraper = successfactors_scraper('tataconsumer')
+MahindraScraper = successfactors_scraper('mahindra')
+AirIndiaScraper = successfactors_scraper('airindia')
+TataAIGScraper = successfactors_scraper('tataaig')
+TataInternationalScraper = successfactors_scraper('tatainternational')
+TataProjectsScraper = successfactors_scraper('tataprojects')
+TrentScraper = successfactors_scraper('trent')
+BajajElectricalsScraper = successfactors_scraper('bajajelectricals')
+OlamScraper = successfactors_scraper('olam')
+TataPowerScraper = successfactors_scraper('tatapower')
+ANZScraper = successfactors_scraper('anz')
+BirlasoftScraper = successfactors_scraper('birlasoft')
+MankindPharmaScraper = successfactors_scraper('mankindpharma')
+KirloskarScraper = successfactors_scraper('kirloskar')
+MitsubishiScraper = successfactors_scraper('mitsubishi')
+EYScraper = successfactors_scraper('ey')
+MetLifeScraper = successfactors_scraper('metlife')
+HCLTechScraper = successfactors_scraper('hcltech')
+SapScraper = successfactors_scraper('sap')
+
+# Config-based scrapers (Phenom People career sites, see PHENOM_SITES in config/scraper.py)
+from scrapers.platforms.phenom import phenom_scraper
+ABBScraper = phenom_scraper('abb')
+AbbottScraper = phenom_scraper('abbott')
+AdobeScraper = phenom_scraper('adobe')
+AllianzScraper = phenom_scraper('allianz')
+BCGScraper = phenom_scraper('bcg')
+CognizantScraper = phenom_scraper('cognizant')
+DHLScraper = phenom_scraper('dhl')
+EliLillyScraper = phenom_scraper('elililly')
+GEAerospaceScraper = phenom_scraper('geaerospace')
+NTTScraper = phenom_scraper('ntt')
+PhilipsScraper = phenom_scraper('philips')
+RoyalEnfieldScraper = phenom_scraper('royalenfield')
+TitanScraper = phenom_scraper('titan')
+TraneTechnologiesScraper = phenom_scraper('tranetechnologies')
+UnitedAirlinesScraper = phenom_scraper('unitedairlines')
+WarnerBrosScraper = phenom_scraper('warnerbros')
+
+# Config-based scrapers (Eightfold platform, see EIGHTFOLD_SITES in config/scraper.py)
+from scrapers.platforms.eightfold import eightfold_scraper
+MorganStanleyScraper = eightfold_scraper('morganstanley')
+LGElectronicsScraper = eightfold_scraper('lgelectronics')
+AmericanExpressScraper = eightfold_scraper('americanexpress')
+BayerScraper = eightfold_scraper('bayer')
+EricssonScraper = eightfold_scraper('ericsson')
+VOISScraper = eightfold_scraper('vois')
+
+# Config-based scrapers (SmartRecruiters platform, see SMARTRECRUITERS_SITES in config/scraper.py)
+from scrapers.platforms.smartrecruiters import smartrecruiters_scraper
+BoschScraper = smartrecruiters_scraper('bosch')
+OyoScraper = smartrecruiters_scraper('oyo')
 
-# Config-based scrapers (DarwinBox platform)
-from scrapers.vedanta_scraper import VedantaScraper
-from scrapers.brigadegroup_scraper import BrigadeGroupScraper
-from scrapers.asahiglass_scraper import AsahiGlassScraper
-from scrapers.nivabupa_scraper import NivaBupaScraper
-from scrapers.jindalsaw_scraper import JindalSawScraper
-from scrapers.skodavw_scraper import SkodaVWScraper
-from scrapers.polycab_scraper import PolycabScraper
-from scrapers.godigit_scraper import GoDigitScraper
-from scrapers.tvsmotor_scraper import TVSMotorScraper
-from scrapers.jswsteel_scraper import JSWSteelScraper
-from scrapers.gmmco_scraper import GMMCOScraper
-from scrapers.piramalfinance_scraper import PiramalFinanceScraper
-
-# Config-based scrapers (PeopleStrong platform)
-from scrapers.amararaja_scraper import AmaraRajaScraper
-from scrapers.bajajfinserv_scraper import BajajFinservScraper
-from scrapers.hdfcergo_scraper import HdfcErgoScraper
-from scrapers.rblbank_scraper import RblBankScraper
-from scrapers.starhealth_scraper import StarHealthScraper
+# Config-based scrapers (TalentBrew career sites, see TALENTBREW_SITES in config/scraper.py)
+from scrapers.platforms.talentbrew import talentbrew_scraper
+AstraZenecaScraper = talentbrew_scraper('astrazeneca')
+BarclaysScraper = talentbrew_scraper('barclays')
+McKessonScraper = talentbrew_scraper('mckesson')
+DisneyScraper = talentbrew_scraper('disney')
+IntuitScraper = talentbrew_scraper('intuit')
+
+# Spec-based scrapers (scrapers/specs/*.yaml, compiled by scrapers/platforms/spec.py)
+from scrapers.platforms.spec import load_specs
+SPEC_SCRAPERS = load_specs()
+ATTScraper = SPEC_SCRAPERS['att']
+BoeingScraper = SPEC_SCRAPERS['boeing']
+CocaColaScraper = SPEC_SCRAPERS['cocacola']
+CumminsScraper = SPEC_SCRAPERS['cummins']
+DellScraper = SPEC_SCRAPERS['dell']
+ExxonMobilScraper = SPEC_SCRAPERS['exxonmobil']
+IntelScraper = SPEC_SCRAPERS['intel']
+LowesScraper = SPEC_SCRAPERS['lowes']
+NikeScraper = SPEC_SCRAPERS['nike']
 
 # Config-based scrapers (Phenom/NAS/Radancy/Standard platforms)
 from scrapers.target_scraper import TargetScraper
-from scrapers.titan_scraper import TitanScraper
-from scrapers.geaerospace_scraper import GEAerospaceScraper
-from scrapers.abb_scraper import ABBScraper
-from scrapers.allianz_scraper import AllianzScraper
-from scrapers.warnerbros_scraper import WarnerBrosScraper
-from scrapers.philips_scraper import PhilipsScraper
-from scrapers.ntt_scraper import NTTScraper
-from scrapers.tranetechnologies_scraper import TraneTechnologiesScraper
-from scrapers.unitedairlines_scraper import UnitedAirlinesScraper
 from scrapers.wellsfargo_scraper import WellsFargoScraper
-from scrapers.astrazeneca_scraper import AstraZenecaScraper
-from scrapers.sap_scraper import SapScraper
-from scrapers.barclays_scraper import BarclaysScraper
 from scrapers.hilton_scraper import HiltonScraper
 from scrapers.marriott_scraper import MarriottScraper
-from scrapers.bosch_scraper import BoschScraper
 from scrapers.synchrony_scraper import SynchronyScraper
 
 
@@ -734,3 +757,86 @@ ALL_COMPANY_CHOICES = [
     'Philips', 'NTT', 'Trane Technologies', 'United Airlines',
     'Wells Fargo', 'AstraZeneca', 'SAP', 'Barclays', 'Hilton', 'Marriott', 'Bosch', 'Synchrony',
 ]
+
+
+def _company_config(company_name):
+    """(display name, COMPANIES entry) for ``company_name`` in any case, or (name, None)."""
+    return next(((name, config) for name, config in COMPANIES.items() if name.lower() == company_name.lower()),
+                (company_name, None))
+
+
+def has_scraper(company_name):
+    """True when ``resolve_scraper`` will return a scraper for ``company_name``.
+
+    A company with no registry class only has one if its careers URL
+    fingerprints as a platform; that may fetch the page once (then cached),
+    just as ``resolve_scraper`` would.
+    """
+    from scrapers.platforms.fingerprint import fingerprint
+
+    if company_name.lower() in SCRAPER_MAP:
+        return True
+    name, config = _company_config(company_name)
+    if not (AUTO_ROUTE_PLATFORMS and config and config.get('url')):
+        return False
+    return fingerprint(name, config['url'])[0] is not None
+
+
+def resolve_scraper(company_name, fetch=True):
+    """Scraper class for ``company_name``, preferring a platform engine over a browser scraper.
+
+    Companies mapped to a platform engine keep it.  Otherwise the careers URL
+    from ``COMPANIES`` is fingerprinted (once, then cached) and a matching
+    engine is used; the hand-written scraper in SCRAPER_MAP runs only when
+    no platform matches.  With ``fetch=False`` only cached fingerprints are
+    used.  Returns None for unknown companies.
+    """
+    from scrapers.platforms.fingerprint import ENGINE_CLASSES, cached_fingerprint, fingerprint, platform_scraper
+
+    scraper_class = SCRAPER_MAP.get(company_name.lower())
+    if scraper_class and issubclass(scraper_class, ENGINE_CLASSES):
+        return scraper_class
+
+    name, config = _company_config(company_name)
+    if AUTO_ROUTE_PLATFORMS and config and config.get('url'):
+        platform, site = (fingerprint if fetch else cached_fingerprint)(name, config['url'])
+        if platform:
+            # Location filtering is the company's call, not the platform's (older cache entries carry True)
+            site = {**site, 'india_only': bool(config.get('india_only'))}
+            site_key = config.get('scraper') or ''.join(ch for ch in name.lower() if ch.isalnum())
+            logger.info(f"{name}: routed to the {platform} engine")
+            return platform_scraper(platform, site, site_key)
+    return scraper_class
+
+
+def scraper_platform(company_name):
+    """Platform engine ``company_name`` runs on, 'spec' for spec scrapers or 'browser'.
+
+    Like ``resolve_scraper`` but never fetches: uncached careers URLs count as browser scrapers.
+    """
+    from scrapers.platforms.fingerprint import PLATFORMS, cached_platform
+    from scrapers.platforms.spec import SpecScraper
+
+    scraper_class = SCRAPER_MAP.get(company_name.lower())
+    if scraper_class:
+        platform = next((p for p, (_, _, engine) in PLATFORMS.items() if issubclass(scraper_class, engine)), None)
+        if platform:
+            return platform
+    name, config = _company_config(company_name)
+    if AUTO_ROUTE_PLATFORMS and config and config.get('url'):
+        platform = cached_platform(name, config['url'])
+        if platform:
+            return platform
+    if scraper_class and issubclass(scraper_class, SpecScraper):
+        return 'spec'
+    return 'browser'
+
+
+# Platform engines that work over plain HTTP; a browser is only their rare fallback
+HTTP_PLATFORMS = {'workday', 'oracle_hcm', 'eightfold', 'smartrecruiters', 'phenom', 'talentbrew', 'successfactors',
+                  'darwinbox', 'peoplestrong'}
+
+
+def execution_mode(company_name):
+    """'http' for companies on an HTTP-only platform engine, otherwise 'browser'."""
+    return 'http' if scraper_platform(company_name) in HTTP_PLATFORMS else 'browser'
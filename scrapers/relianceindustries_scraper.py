@@ -1,58 +1,22 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('relianceindustries_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 class RelianceIndustriesScraper:
     def __init__(self):
         self.company_name = 'Reliance Industries'
         self.url = 'https://careers.ril.com/search-jobs'
 
-    def setup_driver(self):
-        """Set up Chrome driver with anti-detection options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-            })
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-            })
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -72,12 +36,12 @@ class RelianceIndustriesScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # Strategy 1: Try the original URL first
             logger.info(f"Navigating to: {self.url}")
             driver.get(self.url)
-            time.sleep(12)
+            wait_for_dom_stable(driver, 12)
 
             # Check if we got a 404 or error page
             if self._check_if_error_page(driver):
@@ -86,7 +50,7 @@ class RelianceIndustriesScraper:
                 # Strategy 2: Navigate to the ASP.NET careers portal and search all jobs
                 logger.info("Navigating to careers.ril.com landing page")
                 driver.get('https://careers.ril.com/rilcareers/index.aspx')
-                time.sleep(12)
+                wait_for_dom_stable(driver, 12)
 
                 if self._check_if_error_page(driver):
                     logger.error("Reliance Industries careers portal is also returning errors")
@@ -97,7 +61,7 @@ class RelianceIndustriesScraper:
                     search_btn = driver.find_element(By.ID, 'head_Button1')
                     search_btn.click()
                     logger.info("Clicked Search button to view all openings")
-                    time.sleep(10)
+                    wait_for_dom_stable(driver, 10)
                 except Exception as e:
                     logger.error(f"Could not click search button: {str(e)}")
                     return jobs
@@ -118,10 +82,11 @@ class RelianceIndustriesScraper:
 
                 # Try to go to next page
                 if current_page < max_pages:
+                    signature = page_signature(driver, 'table tr')
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(5)
+                    wait_for_page_change(driver, 'table tr', signature, 13)
 
                 current_page += 1
 
@@ -133,7 +98,7 @@ class RelianceIndustriesScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -183,7 +148,6 @@ class RelianceIndustriesScraper:
 
             if next_clicked:
                 logger.info(f"Clicked ASP.NET Next button for page {next_page_num}")
-                time.sleep(8)
                 return True
 
             # Strategy 2: Use the page dropdown if available
@@ -207,7 +171,6 @@ class RelianceIndustriesScraper:
 
             if page_selected:
                 logger.info(f"Selected page {next_page_num} from dropdown")
-                time.sleep(8)
                 return True
 
             # Strategy 3: Try clicking links with page numbers
@@ -221,10 +184,9 @@ class RelianceIndustriesScraper:
                 try:
                     next_button = driver.find_element(selector_type, selector_value)
                     driver.execute_script("arguments[0].scrollIntoView();", next_button)
-                    time.sleep(1)
+                    wait_for_dom_stable(driver, 1)
                     next_button.click()
                     logger.info(f"Clicked next page link for page {next_page_num}")
-                    time.sleep(8)
                     return True
                 except:
                     continue
@@ -343,7 +305,6 @@ class RelianceIndustriesScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
 
             try:
                 desc_selectors = [
@@ -351,6 +312,7 @@ class RelianceIndustriesScraper:
                     (By.XPATH, "//div[contains(@class, 'job-description')]"),
                     (By.CSS_SELECTOR, 'div.description'),
                 ]
+                wait_for_selector(driver, desc_selectors, 3)
 
                 for selector_type, selector_value in desc_selectors:
                     try:
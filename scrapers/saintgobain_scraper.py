@@ -1,10 +1,7 @@
 # STATUS: BLOCKED - Cloudflare challenge on joinus.saint-gobain.com (tested 2026-02-22)
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 import re
@@ -13,11 +10,23 @@ from pathlib import Path
 
 
 from core.logging import setup_logger
+from core.browser import acquire_driver, adopt_driver, release_driver
+from core.supervisor import owner_switch
+from core.waits import wait_for_dom_stable, scroll_until_stable, page_signature, wait_for_page_change, wait_for_selector, SCROLL_PAGE_SIZE
 from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('saintgobain_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _extract_jobs looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    'a[href*="/en/ind/"], a[href*="/en/usa/"], a[href*="/en/fra/"], a[href*="/en/deu/"]',
+    'a[href*="/p/"]',
+    '[class*="job-card"], [class*="jobCard"], [class*="search-result"], [class*="searchResult"]',
+    '[class*="offer-card"], [class*="offerCard"], [class*="job-listing"], [class*="position-card"]',
+    'li[class*="job"], div[class*="job-item"], article[class*="job"], article[class*="offer"]',
+    'a[href*="/job/"], a[href*="/job-"], a[href*="/jobs/"], a[href*="/jb/"], a[href*="/position/"], a[href*="/vacancy/"], a[href*="/career/"], a[href*="/opening/"], a[href*="/requisition/"], a[href*="/annonce/"], a[href*="/offer/"]',
+    'table tbody tr, table tr.dataRow, table tr[class*="job"]',
+]
 
 
 class SaintGobainScraper:
@@ -29,35 +38,13 @@ class SaintGobainScraper:
         self._search_url = 'https://joinus.saint-gobain.com/en/search-offers?query=&country=ind'
 
     def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         # Extra anti-detection flags for Cloudflare
-        chrome_options.add_argument('--disable-web-security')
-        chrome_options.add_argument('--disable-features=IsolateOrigins,site-per-process')
-        chrome_options.add_argument('--disable-site-isolation-trials')
-        chrome_options.add_argument('--allow-running-insecure-content')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
+        return acquire_driver(arguments=[
+            '--disable-web-security',
+            '--disable-features=IsolateOrigins,site-per-process',
+            '--disable-site-isolation-trials',
+            '--allow-running-insecure-content',
+        ])
 
     def _setup_undetected_driver(self):
         """Try to use undetected_chromedriver for better Cloudflare bypass."""
@@ -72,7 +59,8 @@ class SaintGobainScraper:
             options.add_argument('--window-size=1920,1080')
             options.add_argument('--disable-web-security')
             options.add_argument('--disable-features=IsolateOrigins,site-per-process')
-            driver = uc.Chrome(options=options, use_subprocess=True)
+            options.add_argument(owner_switch())
+            driver = adopt_driver(uc.Chrome(options=options, use_subprocess=True))
             logger.info("Using undetected_chromedriver for Cloudflare bypass")
             return driver
         except ImportError:
@@ -98,16 +86,16 @@ class SaintGobainScraper:
                 # Cloudflare challenge indicators
                 if 'just a moment' in title or 'checking your browser' in body_text.lower():
                     logger.info(f"Cloudflare challenge active, waiting... ({int(time.time() - start)}s)")
-                    time.sleep(5)
+                    wait_for_dom_stable(driver, 5)
                     continue
                 # If we get past the challenge page
                 if 'saint-gobain' in title.lower() or 'join us' in title.lower() or len(body_text) > 200:
                     logger.info(f"Cloudflare challenge resolved after {int(time.time() - start)}s")
                     return True
             except Exception:
-                time.sleep(3)
-                continue
-            time.sleep(3)
+                # Mid-navigation while the challenge redirects; the wait below covers it
+                pass
+            wait_for_dom_stable(driver, 3)
         logger.warning(f"Cloudflare challenge did not resolve within {max_wait}s")
         return False
 
@@ -124,10 +112,7 @@ class SaintGobainScraper:
             except Exception as e:
                 logger.error(f"undetected_chromedriver scraping failed: {str(e)}")
             finally:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                release_driver(driver)
 
         # Strategy 2: Standard Selenium with enhanced anti-detection + retries
         for attempt in range(3):
@@ -143,13 +128,8 @@ class SaintGobainScraper:
                 logger.error(f"Attempt {attempt + 1} error: {str(e)}")
             finally:
                 if driver:
-                    try:
-                        driver.quit()
-                    except:
-                        pass
-            # Wait before retry
-            if attempt < 2:
-                time.sleep(10)
+                    release_driver(driver)
+            # No pause before a retry: the next attempt waits on the challenge and the job cards
 
         logger.info(f"Total jobs scraped: {len(all_jobs)}")
         return all_jobs
@@ -172,38 +152,35 @@ class SaintGobainScraper:
                 return []
 
         # Extra wait for SPA content to render
-        time.sleep(10)
+        wait_for_selector(driver, JOB_CARD_SELECTORS, 10)
 
         # Scroll to trigger lazy loading
-        for _ in range(5):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+        scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(3)
+        wait_for_dom_stable(driver, 3)
 
         for page in range(max_pages):
-            page_jobs = self._extract_jobs(driver)
+            page_jobs = self._extract_jobs(driver, max_pages=max_pages)
             if not page_jobs:
                 break
             all_jobs.extend(page_jobs)
             logger.info(f"Page {page + 1}: {len(page_jobs)} jobs (total: {len(all_jobs)})")
 
+            signature = page_signature(driver, JOB_CARD_SELECTORS)
             if not self._go_to_next_page(driver):
                 break
-            time.sleep(5)
+            wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 5)
 
         logger.info(f"Total jobs scraped: {len(all_jobs)}")
         return all_jobs
 
-    def _extract_jobs(self, driver):
+    def _extract_jobs(self, driver, max_pages=MAX_PAGES_TO_SCRAPE):
         jobs = []
 
         try:
-            for _ in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             js_jobs = driver.execute_script("""
                 var results = [];
@@ -378,7 +355,7 @@ class SaintGobainScraper:
     def _go_to_next_page(self, driver):
         try:
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             for sel_type, sel_val in [
                 (By.CSS_SELECTOR, 'a[aria-label="Next"]'),
@@ -1,9 +1,6 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 import os
@@ -11,12 +8,12 @@ from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('schaeffler_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 
 class SchaefflerScraper:
     def __init__(self):
@@ -24,32 +21,6 @@ class SchaefflerScraper:
         self.url = 'https://jobs.schaeffler.com/?locale=en_US'
         self.base_url = 'https://jobs.schaeffler.com'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -59,10 +30,10 @@ class SchaefflerScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
             driver.get(self.url)
-            time.sleep(5)
+            wait_for_dom_stable(driver, 5)
 
             # Accept cookies - Schaeffler has an "Accept All Cookies" button
             try:
@@ -76,14 +47,14 @@ class SchaefflerScraper:
                         }
                     }
                 """)
-                time.sleep(2)
+                wait_for_dom_stable(driver, 2)
             except:
                 pass
 
             # Wait for web components to hydrate (schaeffler-search, schaeffler-search-list, schaeffler-job-item)
             # These are Stencil.js web components with shadow DOM
             logger.info("Waiting for web components to load...")
-            time.sleep(15)
+            wait_for_dom_stable(driver, 15)
 
             # Schaeffler uses deeply nested shadow DOM:
             # document -> schaeffler-search.shadowRoot -> schaeffler-search-list.shadowRoot -> schaeffler-job-item[].shadowRoot
@@ -114,7 +85,7 @@ class SchaefflerScraper:
             logger.error(f"Error: {str(e)}")
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         return all_jobs
 
     def _extract_jobs(self, driver):
@@ -313,7 +284,7 @@ class SchaefflerScraper:
                 """)
                 if new_count > old_count:
                     logger.info(f"Load More: {old_count} -> {new_count} items")
-                    time.sleep(1)  # Brief settle
+                    wait_for_dom_stable(driver, 1)  # Brief settle
                     return True
 
             return False
@@ -1,58 +1,36 @@
 # STATUS: DEAD - starbucks.in/careers returns 404 (tested 2026-02-22)
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
-import os
 from datetime import datetime
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change, scroll_until_stable, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('starbucks_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _scrape_page looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    'div.job-tile',
+    'article.job-card',
+    'div[class*="job-card"]',
+    'div[class*="opening"]',
+    'div[class*="position"]',
+    'li[class*="job"]',
+    'div[class*="career"]',
+    'div[class*="vacancy"]',
+]
 
 class StarbucksScraper:
     def __init__(self):
         self.company_name = 'Starbucks'
         self.url = 'https://www.starbucks.in/careers'
 
-    def setup_driver(self):
-        """Set up Chrome driver with options"""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         """Generate stable external ID"""
         unique_string = f"{company}_{job_id}"
@@ -72,12 +50,12 @@ class StarbucksScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
 
             # Strategy 1: Try the main careers URL
             logger.info(f"Navigating to: {self.url}")
             driver.get(self.url)
-            time.sleep(12)
+            wait_for_dom_stable(driver, 12)
 
             # Check if we got a 404 page
             is_404 = self._check_if_404(driver)
@@ -96,7 +74,7 @@ class StarbucksScraper:
                     logger.info(f"Trying alternative URL: {alt_url}")
                     try:
                         driver.get(alt_url)
-                        time.sleep(8)
+                        wait_for_dom_stable(driver, 8)
                         if not self._check_if_404(driver):
                             logger.info(f"Found working careers page at: {alt_url}")
                             break
@@ -113,11 +91,9 @@ class StarbucksScraper:
 
             # If we reach here, we have a working page - try to extract jobs
             # Scroll to trigger lazy loading
-            for i in range(4):
-                driver.execute_script(f"window.scrollTo(0, document.body.scrollHeight * {(i + 1) / 4});")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             current_page = 1
 
@@ -130,10 +106,11 @@ class StarbucksScraper:
                 logger.info(f"Scraped {len(page_jobs)} jobs from page {current_page}")
 
                 if current_page < max_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(4)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 4)
 
                 current_page += 1
 
@@ -145,7 +122,7 @@ class StarbucksScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -168,7 +145,7 @@ class StarbucksScraper:
             next_page_num = current_page + 1
 
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             next_page_selectors = [
                 (By.XPATH, '//button[@aria-label="Next Page"]'),
@@ -200,7 +177,7 @@ class StarbucksScraper:
     def _scrape_page(self, driver):
         """Scrape jobs from current page using JavaScript-first extraction"""
         jobs = []
-        time.sleep(3)
+        wait_for_dom_stable(driver, 3)
 
         # Primary: JS-based extraction for any job-like content
         js_jobs = driver.execute_script("""
@@ -313,7 +290,6 @@ class StarbucksScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(4)
 
             try:
                 desc_selectors = [
@@ -322,6 +298,7 @@ class StarbucksScraper:
                     (By.XPATH, '//h2[contains(text(), "Description")]/following-sibling::div'),
                     (By.CSS_SELECTOR, 'div[id*="description"]'),
                 ]
+                wait_for_selector(driver, desc_selectors, 4)
 
                 for selector_type, selector_value in desc_selectors:
                     try:
@@ -353,7 +330,7 @@ class StarbucksScraper:
 
             driver.close()
             driver.switch_to.window(original_window)
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
         except Exception as e:
             logger.error(f"Error fetching job details: {str(e)}")
@@ -1,55 +1,24 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
-import os
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, wait_for_selector
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('swiggy_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 
 class SwiggyScraper:
     def __init__(self):
         self.company_name = 'Swiggy'
         self.url = 'https://careers.swiggy.com/#/careers?src=careers'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -59,7 +28,7 @@ class SwiggyScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             driver.get(self.url)
@@ -69,7 +38,7 @@ class SwiggyScraper:
                     EC.presence_of_element_located((By.TAG_NAME, 'iframe'))
                 )
             except:
-                time.sleep(5)  # Fallback if no iframe detected
+                wait_for_dom_stable(driver, 5)  # Fallback if no iframe detected
 
             # CRITICAL: Switch to the iframe containing the actual job listings
             # The jobs are inside an iframe from mynexthire.com
@@ -114,7 +83,7 @@ class SwiggyScraper:
 
             # Quick scroll inside iframe context to trigger lazy loading
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
 
@@ -126,7 +95,7 @@ class SwiggyScraper:
             if not all_jobs and iframe_switched:
                 logger.info("No jobs in iframe, switching back to main page")
                 driver.switch_to.default_content()
-                time.sleep(1)
+                wait_for_dom_stable(driver, 1)
                 jobs = self._scrape_page(driver, wait)
                 all_jobs.extend(jobs)
 
@@ -142,7 +111,7 @@ class SwiggyScraper:
                     driver.switch_to.default_content()
                 except:
                     pass
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def _scrape_page(self, driver, wait):
@@ -384,12 +353,12 @@ class SwiggyScraper:
             driver.execute_script("window.open('');")
             driver.switch_to.window(driver.window_handles[-1])
             driver.get(job_url)
-            time.sleep(3)
 
             desc_selectors = [
                 "[class*='job-description']", "[class*='description']",
                 "[class*='detail']", "main"
             ]
+            wait_for_selector(driver, desc_selectors, 3)
             for selector in desc_selectors:
                 try:
                     desc_elem = driver.find_element(By.CSS_SELECTOR, selector)
@@ -1,22 +1,18 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
-import os
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('synchrony_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 
 class SynchronyScraper:
     def __init__(self):
@@ -24,35 +20,6 @@ class SynchronyScraper:
         self.url = 'https://www.synchronycareers.com/job-search-results/?location=India&country=IN&radius=25'
         self.base_url = 'https://www.synchronycareers.com'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -62,7 +29,7 @@ class SynchronyScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
             driver.get(self.url)
 
@@ -72,11 +39,11 @@ class SynchronyScraper:
                     EC.presence_of_element_located((By.CSS_SELECTOR, 'div.search-results-table, a[href*="/job-detail/"]'))
                 )
             except:
-                time.sleep(5)
+                wait_for_dom_stable(driver, 5)
 
             # Quick scroll to trigger lazy loading
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
 
@@ -96,7 +63,7 @@ class SynchronyScraper:
             logger.error(f"Error: {str(e)}")
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         return all_jobs
 
     def _extract_jobs(self, driver):
@@ -238,10 +205,7 @@ class SynchronyScraper:
             time.sleep(0.5)
 
             # Get current first job link to detect page change
-            old_first = driver.execute_script("""
-                var link = document.querySelector('a[href*="/job-detail/"]');
-                return link ? link.href : '';
-            """)
+            signature = page_signature(driver, 'a[href*="/job-detail/"]')
 
             # Synchrony uses a pagination bar with page numbers and go-to-next button
             for sel_type, sel_val in [
@@ -258,15 +222,7 @@ class SynchronyScraper:
                     if btn.is_displayed():
                         driver.execute_script("arguments[0].click();", btn)
                         # Poll for page change instead of blind sleep
-                        for _ in range(20):  # max 4s wait
-                            time.sleep(0.2)
-                            new_first = driver.execute_script("""
-                                var link = document.querySelector('a[href*="/job-detail/"]');
-                                return link ? link.href : '';
-                            """)
-                            if new_first and new_first != old_first:
-                                break
-                        time.sleep(0.5)  # Brief settle
+                        wait_for_page_change(driver, 'a[href*="/job-detail/"]', signature, 4)
                         return True
                 except:
                     continue
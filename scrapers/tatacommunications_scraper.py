@@ -1,22 +1,27 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
 import re
 import os
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, page_signature, wait_for_page_change, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('tatacommunications_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _extract_jobs looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    '[class*="job-card"], [class*="jobCard"], [class*="job-listing"], [class*="position-card"]',
+    'li[data-ph-at-id="job-listing"], div[data-ph-at-id="job-listing"]',
+    '[class*="opening"], [class*="vacancy"]',
+    'flt-semantics, flt-semantics-container',
+    'a[href*="/job/"], a[href*="/job-"], a[href*="/jobs/"], a[href*="/position/"], a[href*="/vacancy/"], a[href*="/career/"], a[href*="/opening/"], a[href*="/requisition/"]',
+]
 
 
 class TataCommunicationsScraper:
@@ -25,32 +30,6 @@ class TataCommunicationsScraper:
         self.url = 'https://jobs.tatacommunications.com/'
         self.base_url = 'https://jobs.tatacommunications.com'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -60,12 +39,12 @@ class TataCommunicationsScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             # Flutter SPA needs extra time to initialize and render
             driver.get(self.url)
-            time.sleep(20)
+            wait_for_dom_stable(driver, 20)
 
             # Log page state for debugging
             try:
@@ -76,18 +55,16 @@ class TataCommunicationsScraper:
                 pass
 
             # Scroll extensively to trigger Flutter lazy loading
-            for _ in range(8):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
 
             # Try to navigate to a job listings view in the Flutter SPA
             # Flutter apps use hash routing (#/) - try clicking into "All Jobs" or "Search"
-            self._navigate_to_jobs(driver)
+            self._navigate_to_jobs(driver, max_pages=max_pages)
 
             # Extract jobs from current page
-            page_jobs = self._extract_jobs(driver)
+            page_jobs = self._extract_jobs(driver, max_pages=max_pages)
             if page_jobs:
                 all_jobs.extend(page_jobs)
                 logger.info(f"Found {len(page_jobs)} jobs")
@@ -95,10 +72,11 @@ class TataCommunicationsScraper:
             # Try pagination if we found jobs
             if all_jobs:
                 for page in range(1, max_pages):
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver):
                         break
-                    time.sleep(5)
-                    page_jobs = self._extract_jobs(driver)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 5)
+                    page_jobs = self._extract_jobs(driver, max_pages=max_pages)
                     if not page_jobs:
                         break
                     all_jobs.extend(page_jobs)
@@ -114,10 +92,10 @@ class TataCommunicationsScraper:
             logger.error(f"Error: {str(e)}")
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
         return all_jobs
 
-    def _navigate_to_jobs(self, driver):
+    def _navigate_to_jobs(self, driver, max_pages=MAX_PAGES_TO_SCRAPE):
         """Try to navigate to the jobs listing within the Flutter SPA."""
         try:
             # Try clicking elements that might lead to job listings
@@ -140,25 +118,21 @@ class TataCommunicationsScraper:
             """)
             if clicked:
                 logger.info("Clicked job listing navigation element")
-                time.sleep(8)
+                wait_for_selector(driver, JOB_CARD_SELECTORS, 8)
                 # Scroll again after navigation
-                for _ in range(5):
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
+                scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
                 driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
+                wait_for_dom_stable(driver, 2)
         except Exception as e:
             logger.debug(f"Navigation attempt: {str(e)}")
 
-    def _extract_jobs(self, driver):
+    def _extract_jobs(self, driver, max_pages=MAX_PAGES_TO_SCRAPE):
         jobs = []
 
         try:
-            for _ in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             js_jobs = driver.execute_script("""
                 var results = [];
@@ -489,7 +463,7 @@ class TataCommunicationsScraper:
     def _go_to_next_page(self, driver):
         try:
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             for sel_type, sel_val in [
                 (By.CSS_SELECTOR, 'a[aria-label="Next"]'),
@@ -1,23 +1,17 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
-from pathlib import Path
-import os
-import stat
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('tcs_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 
 class TCSScraper:
     def __init__(self):
@@ -26,51 +20,6 @@ class TCSScraper:
         # ibegin.tcs.com DNS is dead - use tcsapps.com as the working domain
         self.alt_url = 'https://ibegin.tcsapps.com/candidate/'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-
-        driver_path = CHROMEDRIVER_PATH
-        driver_path_obj = Path(driver_path)
-        if driver_path_obj.name != 'chromedriver':
-            parent = driver_path_obj.parent
-            actual_driver = parent / 'chromedriver'
-            if actual_driver.exists():
-                driver_path = str(actual_driver)
-            else:
-                for file in parent.rglob('chromedriver'):
-                    if file.is_file() and not file.name.endswith('.zip'):
-                        driver_path = str(file)
-                        break
-
-        try:
-            current_permissions = os.stat(driver_path).st_mode
-            os.chmod(driver_path, current_permissions | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-        except Exception as e:
-            logger.warning(f"Could not set permissions on chromedriver: {str(e)}")
-
-        try:
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -80,7 +29,7 @@ class TCSScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping")
 
             # Primary URL ibegin.tcs.com has DNS issues - try it first, then fall back
@@ -98,7 +47,7 @@ class TCSScraper:
                             ))
                         )
                     except:
-                        time.sleep(5)  # Fallback if no elements found yet
+                        wait_for_dom_stable(driver, 5)  # Fallback if no elements found yet
 
                     current_url = driver.current_url
                     title = driver.title
@@ -122,7 +71,7 @@ class TCSScraper:
 
             # Quick scroll to trigger lazy loading (content already loaded via WebDriverWait)
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
 
@@ -149,7 +98,7 @@ class TCSScraper:
                                 if 'job' in text or 'search' in text or 'career' in text:
                                     driver.execute_script("arguments[0].click();", elem)
                                     logger.info(f"Clicked job nav: {elem.text}")
-                                    time.sleep(3)
+                                    wait_for_dom_stable(driver, 3)
                                     break
                         except:
                             continue
@@ -167,7 +116,7 @@ class TCSScraper:
                 logger.info("Page content loaded with job elements")
             except Exception as e:
                 logger.warning(f"Timeout waiting for job elements: {str(e)}")
-                time.sleep(5)
+                wait_for_dom_stable(driver, 5)
 
             current_page = 1
             while current_page <= max_pages:
@@ -190,7 +139,7 @@ class TCSScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def _go_to_next_page(self, driver, current_page):
@@ -199,12 +148,9 @@ class TCSScraper:
             time.sleep(0.5)
 
             # Capture first card text BEFORE click for change detection
-            old_first = driver.execute_script("""
-                var cards = document.querySelectorAll(
-                    'div[class*="job"], div[class*="result"], a[href*="job"], [ng-repeat], div[class*="listing"]'
-                );
-                return cards.length > 0 ? cards[0].innerText.substring(0, 50) : '';
-            """)
+            signature = page_signature(
+                driver, 'div[class*="job"], div[class*="result"], a[href*="job"], [ng-repeat], div[class*="listing"]'
+            )
 
             next_selectors = [
                 (By.CSS_SELECTOR, 'a[aria-label="Next"]'),
@@ -225,17 +171,9 @@ class TCSScraper:
                     logger.info(f"Navigated to page {current_page + 1}")
 
                     # Poll for content change instead of blind sleep (max 5s)
-                    for _ in range(25):
-                        time.sleep(0.2)
-                        new_first = driver.execute_script("""
-                            var cards = document.querySelectorAll(
-                                'div[class*="job"], div[class*="result"], a[href*="job"], [ng-repeat], div[class*="listing"]'
-                            );
-                            return cards.length > 0 ? cards[0].innerText.substring(0, 50) : '';
-                        """)
-                        if new_first and new_first != old_first:
-                            break
-                    time.sleep(0.5)  # Brief settle after change detected
+                    wait_for_page_change(
+                        driver, 'div[class*="job"], div[class*="result"], a[href*="job"], [ng-repeat], div[class*="listing"]', signature, 5
+                    )
                     return True
                 except:
                     continue
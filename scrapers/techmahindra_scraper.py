@@ -1,50 +1,24 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from pathlib import Path
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('techmahindra_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 
 class TechMahindraScraper:
     def __init__(self):
         self.company_name = 'Tech Mahindra'
         self.url = 'https://careers.techmahindra.com/Currentopportunity.aspx#Advance'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -54,7 +28,7 @@ class TechMahindraScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
             driver.get(self.url)
             wait = WebDriverWait(driver, 10)
@@ -66,12 +40,12 @@ class TechMahindraScraper:
                 )))
                 logger.info("Page elements detected")
             except:
-                logger.warning("Timeout waiting for joblisting container, using fallback sleep")
-                time.sleep(5)
+                logger.warning("Timeout waiting for joblisting container, using fallback wait")
+                wait_for_dom_stable(driver, 5)
 
             # Quick scroll to trigger lazy loading
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
 
@@ -93,7 +67,7 @@ class TechMahindraScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
     def _go_to_next_page(self, driver, current_page):
         try:
@@ -101,10 +75,7 @@ class TechMahindraScraper:
             time.sleep(0.5)
 
             # Capture current state for change detection
-            old_first = driver.execute_script("""
-                var card = document.querySelector('div.joblisting div div, div.card-annimation-bar');
-                return card ? card.innerText.substring(0, 50) : '';
-            """)
+            signature = page_signature(driver, 'div.joblisting div div, div.card-annimation-bar')
 
             for sel_type, sel_val in [
                 (By.CSS_SELECTOR, 'a.next'), (By.XPATH, '//a[contains(text(), "Next")]'),
@@ -116,15 +87,7 @@ class TechMahindraScraper:
                     driver.execute_script("arguments[0].click();", btn)
 
                     # Poll for page change instead of blind sleep
-                    for _ in range(20):
-                        time.sleep(0.2)
-                        new_first = driver.execute_script("""
-                            var card = document.querySelector('div.joblisting div div, div.card-annimation-bar');
-                            return card ? card.innerText.substring(0, 50) : '';
-                        """)
-                        if new_first and new_first != old_first:
-                            break
-                    time.sleep(0.5)
+                    wait_for_page_change(driver, 'div.joblisting div div, div.card-annimation-bar', signature, 4)
                     return True
                 except:
                     continue
@@ -1,28 +1,32 @@
 # STATUS: BLOCKED - Akamai Bot Manager on tesla.com/careers (tested 2026-02-22)
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from datetime import datetime
-from pathlib import Path
-import os
-import stat
-
-try:
-    import requests
-except ImportError:
-    requests = None
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.http_client import http_get, http_post
+from core.waits import wait_for_dom_stable, scroll_until_stable, page_signature, wait_for_page_change, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('tesla_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job card locators _scrape_page tries, in order
+JOB_CARD_SELECTORS = [
+    "a[href*='/job/']",
+    "a[href*='/Detail/']",
+    "div[class*='listing']",
+    "li[class*='job']",
+    "li[class*='result']",
+    "div.item-block",
+    "a.item-block",
+    "a[href*='/careers/']",
+    "div[class*='job']",
+]
+
 
 class TeslaScraper:
     def __init__(self):
@@ -31,55 +35,23 @@ class TeslaScraper:
         self.url = 'https://www.tesla.com/careers/search/?country=IN'
 
     def setup_driver(self):
-        """Set up Chrome driver with maximum anti-detection for Akamai bypass."""
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        # Short UA in options, full UA via CDP (anti-detection pattern)
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--disable-infobars')
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--disable-popup-blocking')
-        chrome_options.add_argument('--ignore-certificate-errors')
-        # Extra stealth flags for Akamai bypass
-        chrome_options.add_argument('--disable-features=IsolateOrigins,site-per-process')
-        chrome_options.add_argument('--disable-site-isolation-trials')
-        chrome_options.add_argument('--disable-web-security')
-        chrome_options.add_argument('--disable-features=CrossSiteDocumentBlockingIfIsolating')
-        chrome_options.add_argument('--disable-features=CrossSiteDocumentBlockingAlways')
-        chrome_options.add_argument('--disable-renderer-backgrounding')
-        chrome_options.add_argument('--disable-backgrounding-occluded-windows')
-        chrome_options.add_argument('--disable-ipc-flooding-protection')
-        chrome_options.add_argument('--enable-features=NetworkService,NetworkServiceInProcess')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-automation', 'enable-logging'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-
-        driver_path = CHROMEDRIVER_PATH
-        driver_path_obj = Path(driver_path)
-        if driver_path_obj.name != 'chromedriver':
-            parent = driver_path_obj.parent
-            actual_driver = parent / 'chromedriver'
-            if actual_driver.exists():
-                driver_path = str(actual_driver)
-
-        try:
-            current_permissions = os.stat(driver_path).st_mode
-            os.chmod(driver_path, current_permissions | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-        except:
-            pass
-
-        try:
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.error(f"ChromeDriver setup failed: {str(e)}")
-            logger.info("Attempting fallback driver setup...")
-            driver = webdriver.Chrome(options=chrome_options)
+        """Lease a dedicated driver with maximum anti-detection for Akamai bypass."""
+        driver = acquire_driver(arguments=[
+            '--disable-infobars',
+            '--disable-extensions',
+            '--disable-popup-blocking',
+            '--ignore-certificate-errors',
+            # Extra stealth flags for Akamai bypass
+            '--disable-features=IsolateOrigins,site-per-process',
+            '--disable-site-isolation-trials',
+            '--disable-web-security',
+            '--disable-features=CrossSiteDocumentBlockingIfIsolating',
+            '--disable-features=CrossSiteDocumentBlockingAlways',
+            '--disable-renderer-backgrounding',
+            '--disable-backgrounding-occluded-windows',
+            '--disable-ipc-flooding-protection',
+            '--enable-features=NetworkService,NetworkServiceInProcess',
+        ])
 
         # Full UA via CDP for anti-detection
         driver.execute_cdp_cmd('Network.setUserAgentOverride', {
@@ -146,16 +118,15 @@ class TeslaScraper:
         driver = None
 
         # Primary method: Try Tesla's internal API directly
-        if requests is not None:
-            try:
-                api_jobs = self._scrape_via_api(max_pages)
-                if api_jobs:
-                    logger.info(f"API method returned {len(api_jobs)} jobs")
-                    return api_jobs
-                else:
-                    logger.warning("Tesla API returned 0 jobs, falling back to Selenium")
-            except Exception as e:
-                logger.warning(f"Tesla API failed: {str(e)}, falling back to Selenium")
+        try:
+            api_jobs = self._scrape_via_api(max_pages)
+            if api_jobs:
+                logger.info(f"API method returned {len(api_jobs)} jobs")
+                return api_jobs
+            else:
+                logger.warning("Tesla API returned 0 jobs, falling back to Selenium")
+        except Exception as e:
+            logger.warning(f"Tesla API failed: {str(e)}, falling back to Selenium")
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
@@ -168,7 +139,7 @@ class TeslaScraper:
                     logger.info(f"Loading Tesla careers (attempt {attempt + 1}/3)...")
                     driver.get(self.url)
                     # Long wait for Akamai JS challenge to resolve
-                    time.sleep(15)
+                    wait_for_dom_stable(driver, 15)
 
                     page_source = driver.page_source
                     title = driver.title
@@ -177,17 +148,17 @@ class TeslaScraper:
                     if 'Access Denied' in page_source:
                         logger.warning(f"Attempt {attempt + 1}: Akamai Access Denied")
                         if attempt < 2:
-                            time.sleep(10)
+                            wait_for_dom_stable(driver, 10)
                             continue
                     elif 'sec-if-cpt-container' in page_source and len(page_source) < 5000:
                         # Akamai JS challenge page - wait for it to resolve
                         logger.info(f"Attempt {attempt + 1}: Akamai challenge detected, waiting...")
-                        time.sleep(20)
+                        wait_for_dom_stable(driver, 20)
                         page_source = driver.page_source
                         if 'Access Denied' in page_source or len(page_source) < 5000:
                             logger.warning("Challenge did not resolve")
                             if attempt < 2:
-                                time.sleep(10)
+                                wait_for_dom_stable(driver, 10)
                                 continue
                         else:
                             page_loaded = True
@@ -200,9 +171,11 @@ class TeslaScraper:
 
                 except Exception as nav_err:
                     logger.warning(f"Navigation attempt {attempt + 1} failed: {str(nav_err)}")
-                    if attempt < 2:
-                        time.sleep(5)
-                    else:
+                    # A slow load can still render its job cards; navigate again only if they never show up
+                    if wait_for_selector(driver, JOB_CARD_SELECTORS, 10):
+                        page_loaded = True
+                        break
+                    if attempt == 2:
                         raise
 
             if not page_loaded:
@@ -214,14 +187,12 @@ class TeslaScraper:
                 return jobs
 
             # Wait for dynamic content
-            time.sleep(12)
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 12)
 
             # Scroll to trigger lazy loading
-            for _ in range(5):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Try to detect job listings
             short_wait = WebDriverWait(driver, 8)
@@ -243,10 +214,11 @@ class TeslaScraper:
                 logger.info(f"Scraped {len(page_jobs)} jobs from page {current_page}")
 
                 if current_page < max_pages:
+                    signature = page_signature(driver, JOB_CARD_SELECTORS)
                     if not self._go_to_next_page(driver, current_page):
                         logger.info("No more pages available")
                         break
-                    time.sleep(4)
+                    wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 4)
                 current_page += 1
 
             logger.info(f"Successfully scraped {len(jobs)} total jobs from {self.company_name}")
@@ -256,7 +228,7 @@ class TeslaScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -265,7 +237,7 @@ class TeslaScraper:
         try:
             next_page_num = current_page + 1
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             next_page_selectors = [
                 (By.XPATH, f'//button[text()="{next_page_num}"]'),
@@ -301,7 +273,7 @@ class TeslaScraper:
 
         try:
             logger.info("Extracting jobs via JavaScript...")
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
 
             # STRATEGY 1: JavaScript-first extraction for Tesla React SPA
             js_jobs = driver.execute_script("""
@@ -531,19 +503,7 @@ class TeslaScraper:
                 logger.info("JS extraction found nothing, trying selector-based approach...")
                 job_elements = []
 
-                selectors = [
-                    "a[href*='/job/']",
-                    "a[href*='/Detail/']",
-                    "div[class*='listing']",
-                    "li[class*='job']",
-                    "li[class*='result']",
-                    "div.item-block",
-                    "a.item-block",
-                    "a[href*='/careers/']",
-                    "div[class*='job']",
-                ]
-
-                for sel in selectors:
+                for sel in JOB_CARD_SELECTORS:
                     try:
                         elements = driver.find_elements(By.CSS_SELECTOR, sel)
                         if elements and len(elements) >= 2:
@@ -642,7 +602,6 @@ class TeslaScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(5)
 
             desc_selectors = [
                 (By.CSS_SELECTOR, 'div.job-description'),
@@ -650,6 +609,7 @@ class TeslaScraper:
                 (By.CSS_SELECTOR, 'div[class*="description"]'),
                 (By.XPATH, '//div[contains(@id, "description")]'),
             ]
+            wait_for_selector(driver, desc_selectors, 5)
 
             for selector_type, selector_value in desc_selectors:
                 try:
@@ -662,7 +622,7 @@ class TeslaScraper:
 
             driver.close()
             driver.switch_to.window(original_window)
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
         except Exception as e:
             logger.error(f"Error fetching job details: {str(e)}")
@@ -705,9 +665,9 @@ class TeslaScraper:
             try:
                 logger.info(f"Trying Tesla API: {api_url[:80]}...")
                 if method == 'GET':
-                    response = requests.get(api_url, headers=headers, timeout=30, allow_redirects=True)
+                    response = http_get(api_url, headers=headers, timeout=30, allow_redirects=True)
                 else:
-                    response = requests.post(api_url, headers=headers, json={}, timeout=30, allow_redirects=True)
+                    response = http_post(api_url, headers=headers, json={}, timeout=30, allow_redirects=True)
 
                 if response.status_code == 200:
                     try:
@@ -792,30 +752,27 @@ class TeslaScraper:
                 continue
 
         # Try Selenium-assisted API approach - use Selenium to get cookies, then hit API
+        driver = None
         try:
             logger.info("Trying Selenium-assisted API approach for Tesla")
             driver = self.setup_driver()
             driver.get('https://www.tesla.com/careers/search/?country=IN')
-            time.sleep(15)
+            wait_for_dom_stable(driver, 15)
 
             # Get cookies from browser
             selenium_cookies = driver.get_cookies()
             cookie_dict = {c['name']: c['value'] for c in selenium_cookies}
             logger.info(f"Got {len(cookie_dict)} cookies from Selenium")
 
-            # Try fetching the page JSON with these cookies
-            session = requests.Session()
-            for name, value in cookie_dict.items():
-                session.cookies.set(name, value)
-
-            # Try the main page URL with JSON accept header
+            # Try fetching the page JSON with these cookies, via the main page URL with a JSON accept header
             json_headers = headers.copy()
             json_headers['Accept'] = 'application/json, text/html'
 
             for api_url in ['https://www.tesla.com/careers/api/search?country=IN',
                            'https://www.tesla.com/cua-api/careers/search?country=IN']:
                 try:
-                    response = session.get(api_url, headers=json_headers, timeout=30)
+                    # Answered for this browser session only, so not cached
+                    response = http_get(api_url, headers=json_headers, cookies=cookie_dict, timeout=30, cache=False)
                     if response.status_code == 200:
                         try:
                             data = response.json()
@@ -856,16 +813,16 @@ class TeslaScraper:
                                         'remote_type': '', 'status': 'active'
                                     })
                                 if all_jobs:
-                                    driver.quit()
                                     return all_jobs
                         except:
                             pass
                 except:
                     continue
-
-            driver.quit()
         except Exception as e:
             logger.warning(f"Selenium-assisted API failed: {str(e)}")
+        finally:
+            if driver:
+                release_driver(driver)
 
         return all_jobs
 
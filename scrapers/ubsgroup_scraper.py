@@ -1,20 +1,31 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
-import os
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, page_signature, wait_for_page_change, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('ubsgroup_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job card locators _scrape_page tries, in order
+JOB_CARD_SELECTORS = [
+    "div.oracletaleaborot-accordion-row",
+    "div[class*='accordion-row']",
+    "div[class*='searchResultItem']",
+    "div[class*='requisition']",
+    "tr.dataRow",
+    "tr.data-row",
+    "table tbody tr",
+    "div[class*='job']",
+    "div[class*='card']",
+    "a[href*='requisition']",
+    "span.titlelink a",
+    "a.jobTitle-link",
+]
 
 
 class UBSGroupScraper:
@@ -22,33 +33,6 @@ class UBSGroupScraper:
         self.company_name = 'UBS Group'
         self.url = 'https://jobs.ubs.com/TGnewUI/Search/home/HomeWithPreLoad?partnerid=25008&siteid=5012&PageType=searchResults&SearchType=linkquery&LinkID=6017#keyWordSearch=&locationSearch=India'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -58,22 +42,20 @@ class UBSGroupScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             driver.get(self.url)
 
             # Wait 15s for Taleo NG to render
-            time.sleep(15)
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 15)
 
             logger.info(f"Current URL after load: {driver.current_url}")
 
             # Scroll to trigger lazy loading
-            for _ in range(3):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # Try pagination - scrape multiple pages
             page = 1
@@ -92,10 +74,11 @@ class UBSGroupScraper:
                     break
 
                 # Try to click next page
+                signature = page_signature(driver, JOB_CARD_SELECTORS)
                 if not self._go_to_next_page(driver):
                     break
                 page += 1
-                time.sleep(5)
+                wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 10)
 
             logger.info(f"Total jobs scraped: {len(all_jobs)}")
             return all_jobs
@@ -105,7 +88,7 @@ class UBSGroupScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def _go_to_next_page(self, driver):
@@ -131,7 +114,6 @@ class UBSGroupScraper:
                     next_btn = driver.find_element(By.CSS_SELECTOR, selector)
                     if next_btn.is_displayed() and next_btn.is_enabled():
                         next_btn.click()
-                        time.sleep(5)
                         return True
                 except:
                     continue
@@ -156,7 +138,6 @@ class UBSGroupScraper:
                 return false;
             """)
             if clicked:
-                time.sleep(5)
                 return True
 
             return False
@@ -431,23 +412,9 @@ class UBSGroupScraper:
             # --- Strategy 2: Selenium CSS selector-based extraction ---
             logger.info("JS extraction returned 0, trying Selenium selectors")
             job_elements = []
-            selectors = [
-                "div.oracletaleaborot-accordion-row",
-                "div[class*='accordion-row']",
-                "div[class*='searchResultItem']",
-                "div[class*='requisition']",
-                "tr.dataRow",
-                "tr.data-row",
-                "table tbody tr",
-                "div[class*='job']",
-                "div[class*='card']",
-                "a[href*='requisition']",
-                "span.titlelink a",
-                "a.jobTitle-link",
-            ]
 
             short_wait = WebDriverWait(driver, 5)
-            for selector in selectors:
+            for selector in JOB_CARD_SELECTORS:
                 try:
                     short_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
                     elements = driver.find_elements(By.CSS_SELECTOR, selector)
@@ -1,9 +1,6 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 from pathlib import Path
@@ -11,11 +8,19 @@ import os
 
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('unitedbreweries_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job cards as _scrape_page looks for them, in its fallback order
+JOB_CARD_SELECTORS = [
+    'span.jobTitle.hidden-phone a.jobTitle-link',
+    'a.jobTitle-link',
+    'table.searchResults tr',
+    'a[href*="/job/"]',
+]
 
 
 class UnitedBreweriesScraper:
@@ -31,32 +36,6 @@ class UnitedBreweriesScraper:
             'https://careers.theheinekencompany.com/India/go/India-Supply-Chain/8747301/',
         ]
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Auto-detect failed: {str(e)}, trying explicit path")
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-        })
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -100,7 +79,7 @@ class UnitedBreweriesScraper:
             logger.info("Clicked age gate submit button")
 
             # Wait for redirect to careers page
-            time.sleep(10)
+            wait_for_dom_stable(driver, 10)
 
             if 'agegate' not in driver.current_url.lower():
                 logger.info(f"Age gate bypassed, now at: {driver.current_url}")
@@ -119,12 +98,12 @@ class UnitedBreweriesScraper:
         seen_ids = set()
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping")
 
             # Step 1: Navigate to career page (will redirect to age gate)
             driver.get(self.url)
-            time.sleep(10)
+            wait_for_dom_stable(driver, 10)
 
             # Step 2: Handle age gate
             if 'agegate' in driver.current_url.lower():
@@ -137,7 +116,7 @@ class UnitedBreweriesScraper:
 
             # Step 3: Try the main search page first
             logger.info("Checking main India search page...")
-            time.sleep(3)
+            wait_for_dom_stable(driver, 3)
             page_jobs = self._scrape_page(driver, seen_ids)
             if page_jobs:
                 all_jobs.extend(page_jobs)
@@ -150,7 +129,7 @@ class UnitedBreweriesScraper:
                     try:
                         logger.info(f"Scraping department: {dept_url}")
                         driver.get(dept_url)
-                        time.sleep(8)
+                        wait_for_dom_stable(driver, 8)
 
                         # Handle age gate again if needed
                         if 'agegate' in driver.current_url.lower():
@@ -165,9 +144,10 @@ class UnitedBreweriesScraper:
                         # Paginate within department page
                         current_page = 1
                         while current_page < max_pages:
+                            signature = page_signature(driver, JOB_CARD_SELECTORS)
                             if not self._go_to_next_page(driver, current_page):
                                 break
-                            time.sleep(5)
+                            wait_for_page_change(driver, JOB_CARD_SELECTORS, signature, 5)
                             current_page += 1
                             page_jobs = self._scrape_page(driver, seen_ids)
                             if not page_jobs:
@@ -187,13 +167,13 @@ class UnitedBreweriesScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def _go_to_next_page(self, driver, current_page):
         try:
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             next_selectors = [
                 (By.CSS_SELECTOR, 'a.paginationItemLast'),
@@ -216,7 +196,7 @@ class UnitedBreweriesScraper:
                     if 'disabled' in btn_class:
                         continue
                     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                    time.sleep(1)
+                    wait_for_dom_stable(driver, 1)
                     driver.execute_script("arguments[0].click();", next_button)
                     logger.info(f"Navigated to page {current_page + 1}")
                     return True
@@ -246,9 +226,9 @@ class UnitedBreweriesScraper:
 
         try:
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
 
             js_jobs = driver.execute_script("""
                 var results = [];
@@ -1,20 +1,28 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
-import os
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, wait_for_selector, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('varroc_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# Job card locators _scrape_page tries, in order
+JOB_CARD_SELECTORS = [
+    "div.job-card",
+    "a[href*='/job-details']",
+    "div.job-listing",
+    "[class*='job-card']",
+    "[class*='job-listing']",
+    "a[href*='/careers/']",
+    "a[href*='/job/']",
+    ".card",
+    "article",
+]
 
 
 class VarrocScraper:
@@ -22,33 +30,6 @@ class VarrocScraper:
         self.company_name = 'Varroc'
         self.url = 'https://varroc.sensehq.com/careers'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -58,20 +39,18 @@ class VarrocScraper:
         all_jobs = []
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
 
             driver.get(self.url)
 
             # Wait 15s for SenseHQ React platform to render
-            time.sleep(15)
+            wait_for_selector(driver, JOB_CARD_SELECTORS, 15)
 
             # Scroll multiple times to trigger lazy loading
-            for _ in range(5):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            wait_for_dom_stable(driver, 2)
 
             # SenseHQ uses React + Emotion CSS-in-JS; scrape with JS
             jobs = self._scrape_page(driver)
@@ -85,7 +64,7 @@ class VarrocScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
                 logger.info("Browser closed")
 
     def _scrape_page(self, driver):
@@ -287,20 +266,9 @@ class VarrocScraper:
             # --- Strategy 2: Selenium CSS selector-based extraction ---
             logger.info("JS extraction returned 0, trying Selenium selectors")
             job_elements = []
-            selectors = [
-                "div.job-card",
-                "a[href*='/job-details']",
-                "div.job-listing",
-                "[class*='job-card']",
-                "[class*='job-listing']",
-                "a[href*='/careers/']",
-                "a[href*='/job/']",
-                ".card",
-                "article",
-            ]
 
             short_wait = WebDriverWait(driver, 5)
-            for selector in selectors:
+            for selector in JOB_CARD_SELECTORS:
                 try:
                     short_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
                     elements = driver.find_elements(By.CSS_SELECTOR, selector)
@@ -517,7 +485,6 @@ class VarrocScraper:
             driver.switch_to.window(driver.window_handles[-1])
 
             driver.get(job_url)
-            time.sleep(3)
 
             desc_selectors = [
                 ".job-description",
@@ -526,6 +493,7 @@ class VarrocScraper:
                 "[class*='detail']",
                 "main"
             ]
+            wait_for_selector(driver, desc_selectors, 3)
             for selector in desc_selectors:
                 try:
                     desc_elem = driver.find_element(By.CSS_SELECTOR, selector)
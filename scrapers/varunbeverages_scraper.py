@@ -1,27 +1,20 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
 import time
 import json
 from pathlib import Path
 
-try:
-    import requests
-except ImportError:
-    requests = None
-
-
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.http_cache import ListingUnchanged
+from core.waits import wait_for_dom_stable, page_signature, wait_for_page_change
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from scrapers.platforms.oracle_hcm import oracle_hcm_scraper
 
 logger = setup_logger('varunbeverages_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
-
 
 class VarunBeveragesScraper:
     def __init__(self):
@@ -29,30 +22,6 @@ class VarunBeveragesScraper:
         # Oracle HCM Cloud platform
         self.url = 'https://rjcorphcm-iacbiz.fa.ocs.oraclecloud.com/hcmUI/CandidateExperience/en/sites/CX_1/jobs?location=India&locationId=300000000489931&locationLevel=country&mode=location'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            service = Service(CHROMEDRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Service driver failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -62,19 +31,20 @@ class VarunBeveragesScraper:
         all_jobs = []
 
         # Try Oracle HCM REST API first (faster and more reliable)
-        if requests is not None:
-            try:
-                api_jobs = self._scrape_via_api(max_pages)
-                if api_jobs:
-                    logger.info(f"API method returned {len(api_jobs)} jobs")
-                    return api_jobs
-                else:
-                    logger.warning("API returned 0 jobs, falling back to Selenium")
-            except Exception as e:
-                logger.warning(f"API failed: {str(e)}, falling back to Selenium")
+        try:
+            api_jobs = self._scrape_via_api(max_pages)
+            if api_jobs:
+                logger.info(f"API method returned {len(api_jobs)} jobs")
+                return api_jobs
+            else:
+                logger.warning("API returned 0 jobs, falling back to Selenium")
+        except ListingUnchanged:
+            raise
+        except Exception as e:
+            logger.warning(f"API failed: {str(e)}, falling back to Selenium")
 
         try:
-            driver = self.setup_driver()
+            driver = acquire_driver()
             logger.info(f"Starting {self.company_name} scraping from {self.url}")
             driver.get(self.url)
 
@@ -85,8 +55,8 @@ class VarunBeveragesScraper:
                 )))
                 logger.info("Oracle HCM elements detected")
             except:
-                logger.warning("Timeout waiting for Oracle HCM listings, using fallback sleep")
-                time.sleep(5)
+                logger.warning("Timeout waiting for Oracle HCM listings, using fallback wait")
+                wait_for_dom_stable(driver, 5)
 
             short_wait = WebDriverWait(driver, 5)
 
@@ -118,28 +88,13 @@ class VarunBeveragesScraper:
                         time.sleep(0.5)
 
                         # Capture current state for change detection
-                        old_first = driver.execute_script("""
-                            var card = document.querySelector('span.job-tile__title, div.job-tile__header-container, div.job-list-item__content');
-                            return card ? card.innerText.substring(0, 50) : '';
-                        """)
-                        old_count = len(driver.find_elements(By.CSS_SELECTOR, 'span.job-tile__title'))
+                        signature = page_signature(driver, 'span.job-tile__title, div.job-tile__header-container, div.job-list-item__content')
 
                         driver.execute_script("arguments[0].click();", show_more)
                         logger.info(f"Clicked show more/next for page {page}")
 
                         # Poll for content change instead of blind sleep(5)
-                        for _ in range(20):
-                            time.sleep(0.2)
-                            new_count = len(driver.find_elements(By.CSS_SELECTOR, 'span.job-tile__title'))
-                            if new_count != old_count:
-                                break
-                            new_first = driver.execute_script("""
-                                var card = document.querySelector('span.job-tile__title, div.job-tile__header-container, div.job-list-item__content');
-                                return card ? card.innerText.substring(0, 50) : '';
-                            """)
-                            if new_first and new_first != old_first:
-                                break
-                        time.sleep(0.5)  # Brief settle after change detected
+                        wait_for_page_change(driver, 'span.job-tile__title, div.job-tile__header-container, div.job-list-item__content', signature, 4)
 
                         new_jobs = self._scrape_page(driver, short_wait)
                         # Only add jobs not already seen
@@ -161,7 +116,7 @@ class VarunBeveragesScraper:
             return all_jobs
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
     def _scrape_page(self, driver, wait):
         jobs = []
@@ -170,7 +125,7 @@ class VarunBeveragesScraper:
         try:
             # Quick scroll to trigger lazy loading
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_stable(driver, 1)
             driver.execute_script("window.scrollTo(0, 0);")
             time.sleep(0.5)
 
@@ -662,7 +617,7 @@ class VarunBeveragesScraper:
                     By.CSS_SELECTOR, ".job-description, [class*='description'], main"
                 )))
             except:
-                time.sleep(3)
+                wait_for_dom_stable(driver, 3)
 
             for sel in [".job-description", "[class*='description']", "main"]:
                 try:
@@ -687,97 +642,8 @@ class VarunBeveragesScraper:
         return details
 
     def _scrape_via_api(self, max_pages=MAX_PAGES_TO_SCRAPE):
-        """Try Oracle HCM REST API to fetch jobs directly."""
-        all_jobs = []
-        # Oracle HCM Cloud REST API endpoint pattern
-        base_url = 'https://rjcorphcm-iacbiz.fa.ocs.oraclecloud.com'
-        api_url = f'{base_url}/hcmRestApi/resources/latest/recruitingCEJobRequisitions'
-
-        headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-        }
-
-        # Try multiple API patterns for Oracle HCM
-        api_patterns = [
-            # Pattern 1: REST API
-            f'{base_url}/hcmRestApi/resources/latest/recruitingCEJobRequisitions?onlyData=true&expand=requisitionList.secondaryLocations,flexFieldsFacet.values&finder=findReqs;siteNumber=CX_1,facetsList=LOCATIONS%3BWORK_LOCATIONS%3BWORKPLACE_TYPES%3BTITLES%3BCATEGORIES%3BORGANIZATIONS%3BPOSTING_DATES%3BFLEX_FIELDS,limit=25,locationId=300000000489931,sortBy=POSTING_DATES_DESC',
-            # Pattern 2: Search API
-            f'{base_url}/hcmRestApi/resources/latest/recruitingCEJobRequisitions?onlyData=true&expand=requisitionList.secondaryLocations&finder=findReqs;siteNumber=CX_1,limit=25,locationId=300000000489931,sortBy=POSTING_DATES_DESC',
-            # Pattern 3: Simple listing
-            f'{base_url}/hcmRestApi/resources/latest/recruitingCEJobRequisitions?limit=25&onlyData=true&finder=findReqs;siteNumber=CX_1,locationId=300000000489931',
-        ]
-
-        for api_pattern in api_patterns:
-            try:
-                logger.info(f"Trying Oracle HCM API: {api_pattern[:100]}...")
-                response = requests.get(api_pattern, headers=headers, timeout=30)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get('items', [])
-                    if not items:
-                        # Try nested structure
-                        items = data.get('requisitionList', [])
-                    if not items:
-                        # Try another nested path
-                        for key in data:
-                            if isinstance(data[key], list) and len(data[key]) > 0:
-                                items = data[key]
-                                break
-
-                    if items:
-                        logger.info(f"API returned {len(items)} items")
-                        for item in items:
-                            try:
-                                title = item.get('Title', '') or item.get('title', '') or item.get('RequisitionTitle', '')
-                                if not title:
-                                    continue
-
-                                req_id = str(item.get('Id', '') or item.get('id', '') or item.get('RequisitionId', '') or item.get('RequisitionNumber', ''))
-                                location = item.get('PrimaryLocation', '') or item.get('primaryLocation', '') or item.get('Location', '')
-                                posted_date = item.get('PostedDate', '') or item.get('postedDate', '')
-
-                                job_url = f"{base_url}/hcmUI/CandidateExperience/en/sites/CX_1/job/{req_id}" if req_id else self.url
-
-                                job_id = req_id if req_id else hashlib.md5(title.encode()).hexdigest()[:12]
-
-                                job_data = {
-                                    'external_id': self.generate_external_id(job_id, self.company_name),
-                                    'company_name': self.company_name,
-                                    'title': title,
-                                    'apply_url': job_url,
-                                    'location': location,
-                                    'department': item.get('Organization', '') or item.get('Department', ''),
-                                    'employment_type': item.get('WorkerType', ''),
-                                    'description': '',
-                                    'posted_date': posted_date,
-                                    'city': '',
-                                    'state': '',
-                                    'country': 'India',
-                                    'job_function': item.get('Category', '') or item.get('JobCategory', ''),
-                                    'experience_level': '',
-                                    'salary_range': '',
-                                    'remote_type': item.get('WorkplaceType', ''),
-                                    'status': 'active'
-                                }
-                                job_data.update(self.parse_location(location))
-                                all_jobs.append(job_data)
-                                logger.info(f"API extracted: {title} | {location}")
-                            except Exception as e:
-                                logger.error(f"Error processing API item: {str(e)}")
-                                continue
-
-                        if all_jobs:
-                            return all_jobs
-                else:
-                    logger.warning(f"API returned status {response.status_code}")
-            except Exception as e:
-                logger.warning(f"API pattern failed: {str(e)}")
-                continue
-
-        return all_jobs
+        """Fetch jobs from the Oracle HCM Candidate Experience REST API."""
+        return oracle_hcm_scraper('varunbeverages')().scrape(max_pages)
 
     def parse_location(self, location_str):
         result = {'city': '', 'state': '', 'country': 'India'}
@@ -1,20 +1,40 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import hashlib
-import time
-import os
 from pathlib import Path
 
 from core.logging import setup_logger
-from config.scraper import SCRAPE_TIMEOUT, HEADLESS_MODE, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
+from core.browser import acquire_driver, release_driver
+from core.waits import wait_for_dom_stable, scroll_until_stable, SCROLL_PAGE_SIZE
+from config.scraper import SCRAPE_TIMEOUT, FETCH_FULL_JOB_DETAILS, MAX_PAGES_TO_SCRAPE
 
 logger = setup_logger('voltas_scraper')
 
-CHROMEDRIVER_PATH = '/Users/ivishalchaubey/.wdm/drivers/chromedriver/mac64/144.0.7559.133_fresh/chromedriver-mac-arm64/chromedriver'
+# TalentRecruit job card selectors _scrape_talentrecruit_direct tries, in order
+TALENTRECRUIT_CARD_SELECTORS = [
+    'div[class*="job"]',
+    'div[class*="opening"]',
+    'div[class*="position"]',
+    'div[class*="career"]',
+    'li[class*="job"]',
+    'tr[class*="job"]',
+    'a[class*="job"]',
+    'div.card',
+]
+
+# Job card locators _scrape_page_direct tries, in order
+JOB_CARD_SELECTORS = [
+    (By.CSS_SELECTOR, 'div[class*="job-card"]'),
+    (By.CSS_SELECTOR, 'div[class*="job-list"]'),
+    (By.CSS_SELECTOR, 'div[class*="opening"]'),
+    (By.CSS_SELECTOR, 'div[class*="position"]'),
+    (By.CSS_SELECTOR, 'div[class*="career"]'),
+    (By.CSS_SELECTOR, 'div[class*="role"]'),
+    (By.CSS_SELECTOR, 'li[class*="job"]'),
+    (By.CSS_SELECTOR, 'a[href*="talentrecruit"]'),
+    (By.TAG_NAME, 'article'),
+]
 
 
 class VoltasScraper:
@@ -22,33 +42,6 @@ class VoltasScraper:
         self.company_name = 'Voltas'
         self.url = 'https://voltas.talentrecruit.com/career-page'
 
-    def setup_driver(self):
-        chrome_options = Options()
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
-
-        try:
-            if os.path.exists(CHROMEDRIVER_PATH):
-                service = Service(CHROMEDRIVER_PATH)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            logger.warning(f"Primary driver setup failed: {str(e)}, trying fallback")
-            driver = webdriver.Chrome(options=chrome_options)
-
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'})
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
-
     def generate_external_id(self, job_id, company):
         unique_string = f"{company}_{job_id}"
         return hashlib.md5(unique_string.encode()).hexdigest()
@@ -59,11 +52,11 @@ class VoltasScraper:
 
         try:
             logger.info(f"Starting scrape for {self.company_name}")
-            driver = self.setup_driver()
+            driver = acquire_driver()
             driver.get(self.url)
 
             # Wait for page to load - TalentRecruit platform
-            time.sleep(15)
+            wait_for_dom_stable(driver, 15)
 
             logger.info(f"Current URL after load: {driver.current_url}")
 
@@ -78,11 +71,9 @@ class VoltasScraper:
             # Strategy 2: If no iframe jobs, try direct page scraping
             if not jobs:
                 logger.info("No iframe jobs found, trying direct page scraping")
-                for i in range(5):
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
+                scroll_until_stable(driver, JOB_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
                 driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
+                wait_for_dom_stable(driver, 2)
 
                 page_jobs = self._scrape_page_direct(driver, wait)
                 jobs.extend(page_jobs)
@@ -99,7 +90,7 @@ class VoltasScraper:
                         continue
                     try:
                         driver.get(alt_url)
-                        time.sleep(10)
+                        wait_for_dom_stable(driver, 10)
                         logger.info(f"Trying alt URL: {driver.current_url}")
 
                         iframe_jobs = self._scrape_via_iframe(driver, wait)
@@ -107,7 +98,7 @@ class VoltasScraper:
                             jobs.extend(iframe_jobs)
                             break
                         else:
-                            direct_jobs = self._scrape_talentrecruit_direct(driver, wait)
+                            direct_jobs = self._scrape_talentrecruit_direct(driver, wait, max_pages=max_pages)
                             if direct_jobs:
                                 jobs.extend(direct_jobs)
                                 break
@@ -122,7 +113,7 @@ class VoltasScraper:
 
         finally:
             if driver:
-                driver.quit()
+                release_driver(driver)
 
         return jobs
 
@@ -157,7 +148,7 @@ class VoltasScraper:
             driver.switch_to.frame(target_iframe)
             logger.info("Switched to iframe context")
 
-            time.sleep(5)
+            wait_for_dom_stable(driver, 5)
 
             jobs = self._scrape_iframe_content(driver, wait)
 
@@ -346,14 +337,12 @@ class VoltasScraper:
 
         return jobs
 
-    def _scrape_talentrecruit_direct(self, driver, wait):
+    def _scrape_talentrecruit_direct(self, driver, wait, max_pages=MAX_PAGES_TO_SCRAPE):
         jobs = []
 
-        for _ in range(3):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+        scroll_until_stable(driver, TALENTRECRUIT_CARD_SELECTORS, max_items=max_pages * SCROLL_PAGE_SIZE)
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
+        wait_for_dom_stable(driver, 1)
 
         # Check for iframes again
         iframes = driver.find_elements(By.TAG_NAME, 'iframe')
@@ -362,7 +351,7 @@ class VoltasScraper:
             for iframe in iframes:
                 try:
                     driver.switch_to.frame(iframe)
-                    time.sleep(3)
+                    wait_for_dom_stable(driver, 3)
                     iframe_jobs = self._scrape_iframe_content(driver, wait)
                     driver.switch_to.default_content()
                     if iframe_jobs:
@@ -378,19 +367,9 @@ class VoltasScraper:
         if jobs:
             return jobs
 
-        selectors = [
-            'div[class*="job"]',
-            'div[class*="opening"]',
-            'div[class*="position"]',
-            'div[class*="career"]',
-            'li[class*="job"]',
-            'tr[class*="job"]',
-            'a[class*="job"]',
-            'div.card',
-        ]
 
         job_elements = []
-        for selector in selectors:
+        for selector in TALENTRECRUIT_CARD_SELECTORS:
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 valid = [e for e in elements if e.text.strip() and len(e.text.strip()) > 5]
@@ -496,19 +475,8 @@ class VoltasScraper:
         jobs = []
 
         job_cards = []
-        selectors = [
-            (By.CSS_SELECTOR, 'div[class*="job-card"]'),
-            (By.CSS_SELECTOR, 'div[class*="job-list"]'),
-            (By.CSS_SELECTOR, 'div[class*="opening"]'),
-            (By.CSS_SELECTOR, 'div[class*="position"]'),
-            (By.CSS_SELECTOR, 'div[class*="career"]'),
-            (By.CSS_SELECTOR, 'div[class*="role"]'),
-            (By.CSS_SELECTOR, 'li[class*="job"]'),
-            (By.CSS_SELECTOR, 'a[href*="talentrecruit"]'),
-            (By.TAG_NAME, 'article'),
-        ]
 
-        for selector_type, selector_value in selectors:
+        for selector_type, selector_value in JOB_CARD_SELECTORS:
             try:
                 elements = driver.find_elements(selector_type, selector_value)
                 valid = [e for e in elements if e.text.strip() and len(e.text.strip()) > 5]
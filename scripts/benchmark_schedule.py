@@ -0,0 +1,80 @@
+"""
+Replay a recorded full run (logs/scrape_run_*.json, written by `run.py scrape`)
+under different submission orders and compare makespans.
+
+Each company takes the duration it actually took in that run:
+
+    list order, one pool  ALL_COMPANY_CHOICES order on the browser workers alone
+    list order            ALL_COMPANY_CHOICES order, browser and HTTP pools side by side
+    expected-first        longest expected first, from the estimates made before the run
+    actual-first          longest actual first (what perfect estimates would give)
+    lower bound           max(total work / workers, longest company) of the slower pool
+
+Usage: python scripts/benchmark_schedule.py [run.json] [--workers N] [--http-workers N]
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from apps.scraper_manager.scheduling import simulate
+
+LOGS_DIR = Path(__file__).resolve().parent.parent / 'logs'
+
+
+def benchmark(run):
+    durations = {r['company']: r['duration'] for r in run['results']}
+    expected = {r['company']: r['expected'] or 0.0 for r in run['results']}
+    companies = [c for c in run['companies'] if c in durations]
+    pools = {}
+    for mode, pool in run['pools'].items():
+        members = set(pool['order'])
+        pools[mode] = ([c for c in companies if c in members], pool['workers'])
+
+    def pooled(key):
+        # Pools run side by side: the run ends with the slower one
+        return max(simulate(sorted(members, key=key, reverse=True) if key else members, durations, workers)[0]
+                   for members, workers in pools.values())
+
+    def bound(members, workers):
+        return max(sum(durations[c] for c in members) / workers, max((durations[c] for c in members), default=0.0))
+
+    return [
+        ('list order, one pool', simulate(companies, durations, run['pools']['browser']['workers'])[0]),
+        ('list order', pooled(None)),
+        ('expected-first', pooled(expected.get)),
+        ('actual-first', pooled(durations.get)),
+        ('lower bound', max(bound(members, workers) for members, workers in pools.values())),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('run', nargs='?', help='Recorded run (default: newest logs/scrape_run_*.json)')
+    parser.add_argument('--workers', type=int, help='Browser workers to simulate (default: as recorded)')
+    parser.add_argument('--http-workers', type=int, help='HTTP workers to simulate (default: as recorded)')
+    args = parser.parse_args()
+
+    path = Path(args.run) if args.run else max(LOGS_DIR.glob('scrape_run_*.json'), default=None)
+    if not path:
+        print("No recorded run in logs/; run `python run.py scrape` first")
+        sys.exit(1)
+    with open(path) as f:
+        run = json.load(f)
+    for mode, override in (('browser', args.workers), ('http', args.http_workers)):
+        if override:
+            run['pools'][mode]['workers'] = override
+
+    print(f"{path.name}: {len(run['results'])} companies, "
+          + ', '.join(f"{len(pool['order'])} on {pool['workers']} {mode} workers" for mode, pool in run['pools'].items()))
+    print(f"  {'recorded':<22}{run['makespan']:>9.0f}s  (expected {run['expected_makespan']:.0f}s)")
+    rows = benchmark(run)
+    baseline = rows[0][1]
+    for name, makespan in rows:
+        print(f"  {name:<22}{makespan:>9.0f}s  {makespan / baseline:>6.0%} of list order, one pool")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Check that one host's rate limit holds across scrape workers.
+
+Starts worker processes with core.executor, as a scrape run does.  Every
+worker takes tokens and host slots for one URL through core.ratelimit, the
+way the HTTP client does.  The check fails if the workers together took
+more than the platform's burst plus rate in any window, or held more than
+HTTP_HOST_CONCURRENCY slots at once.  Nothing is sent over the network.
+
+Usage: python scripts/check_rate_limit.py [--workers N] [--threads N] [--requests N] [--url URL]
+"""
+import argparse
+import sys
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.executor import ScrapeExecutor
+from core.ratelimit import host_slot, platform_key, wait_for_slot
+from config.scraper import HTTP_HOST_CONCURRENCY, RATE_LIMIT_DEFAULT, RATE_LIMITS
+
+# Seconds each probe holds its host slot
+HOLD = 0.02
+
+
+def probe(company, url, requests):
+    stamps, slots = [], []
+    for _ in range(requests):
+        wait_for_slot(url)
+        stamps.append(time.time())
+        with host_slot(url, HTTP_HOST_CONCURRENCY, 10):
+            entered = time.time()
+            time.sleep(HOLD)
+            slots.append((entered, time.time()))
+    return {'company': company, 'success': True, 'jobs_count': 0, 'error': None, 'duration': 0,
+            'stamps': stamps, 'slots': slots}
+
+
+def busiest_window(stamps, window):
+    """Most stamps in any ``window``-second span."""
+    stamps = sorted(stamps)
+    return max((bisect_left(stamps, start + window) - i for i, start in enumerate(stamps)), default=0)
+
+
+def most_concurrent(spans):
+    events = sorted([(start, 1) for start, _ in spans] + [(end, -1) for _, end in spans])
+    held = peak = 0
+    for _, change in events:
+        held += change
+        peak = max(peak, held)
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4, help='Worker processes (default: 4)')
+    parser.add_argument('--threads', type=int, default=4, help='Threads per worker (default: 4)')
+    parser.add_argument('--requests', type=int, default=10, help='Requests per thread (default: 10)')
+    parser.add_argument('--url', default='https://wd3.myworkdayjobs.com/rate-limit-check')
+    args = parser.parse_args()
+
+    rate, burst = RATE_LIMITS.get(platform_key(args.url), RATE_LIMIT_DEFAULT)
+    executor = ScrapeExecutor(probe, args=(args.url, args.requests), max_workers=args.workers, threads=args.threads)
+    results = executor.map([f'probe-{i}' for i in range(args.workers * args.threads)])
+    failed = [r for r in results if not r['success']]
+    if failed:
+        print(f"{len(failed)} probes failed: {failed[0]['error']}")
+        sys.exit(1)
+
+    stamps = [stamp for r in results for stamp in r['stamps']]
+    spans = [span for r in results for span in r['slots']]
+    elapsed = max(stamps) - min(stamps)
+    print(f"{len(stamps)} requests to {platform_key(args.url)} from {args.workers} workers x {args.threads} threads "
+          f"in {elapsed:.1f}s ({(len(stamps) - burst) / max(elapsed, 1e-9):.1f}/s after the burst)")
+
+    ok = True
+    # One extra request of slack for sleeps that return late and bunch up the next stamps
+    for window in (1.0, 5.0, elapsed):
+        allowed = burst + rate * window + 1
+        taken = busiest_window(stamps, window)
+        print(f"  busiest {window:.0f}s window: {taken} requests (limit {burst} + {rate:g}/s = {allowed:.0f})")
+        ok &= taken <= allowed
+    held = most_concurrent(spans)
+    print(f"  most requests in flight: {held} (HTTP_HOST_CONCURRENCY {HTTP_HOST_CONCURRENCY})")
+    ok &= held <= HTTP_HOST_CONCURRENCY
+
+    print("OK" if ok else "FAILED: workers exceeded the configured limits")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+import pytest
+
+from core import admission
+from core.admission import AdmissionController
+
+
+class Signals:
+    """Manual clock, free memory and load for core.admission."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.free_mb = None
+        self.load = None
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def signals(monkeypatch):
+    fake = Signals()
+    monkeypatch.setattr(admission, 'time', SimpleNamespace(time=fake.time))
+    monkeypatch.setattr(admission, 'available_memory_mb', lambda: fake.free_mb)
+    monkeypatch.setattr(admission, '_load_per_cpu', lambda: fake.load)
+    return fake
+
+
+def run_interval(controller, signals, completed, saturated=True, browsers=0, page_load_seconds=None):
+    for _ in range(completed):
+        stats = {'page_loads': 1, 'page_load_seconds': page_load_seconds} if page_load_seconds else {}
+        controller.record(stats)
+    signals.now += controller.interval
+    return controller.update(saturated, browsers)
+
+
+def test_holds_the_limit_until_an_interval_has_passed(signals):
+    controller = AdmissionController(8, start=2, interval=30)
+    signals.now += 29
+    assert controller.update(saturated=True) == 2
+
+
+def test_ramps_up_one_at_a_time_while_saturated_and_stops_at_the_ceiling(signals):
+    changes = []
+    controller = AdmissionController(4, start=2, interval=30, on_change=changes.append)
+    assert [run_interval(controller, signals, completed=10) for _ in range(3)] == [3, 4, 4]
+    assert [entry['reason'] for entry in controller.history] == ['start', 'ramp', 'ramp']
+    assert len(changes) == 2
+
+
+def test_does_not_ramp_when_not_saturated(signals):
+    controller = AdmissionController(8, start=2, interval=30)
+    assert run_interval(controller, signals, completed=10, saturated=False) == 2
+
+
+def test_low_memory_sheds_a_quarter(signals):
+    controller = AdmissionController(16, start=12, interval=30)
+    signals.free_mb = admission.ADMISSION_MIN_FREE_MB - 1
+    assert run_interval(controller, signals, completed=10) == 9
+    assert controller.history[-1]['reason'] == 'memory'
+
+
+def test_high_load_and_leaked_browsers_shed_one(signals):
+    controller = AdmissionController(8, start=4, interval=30)
+    signals.load = admission.ADMISSION_MAX_LOAD + 1
+    assert run_interval(controller, signals, completed=10) == 3
+    signals.load = None
+    assert run_interval(controller, signals, completed=10, browsers=20) == 2
+    assert [entry['reason'] for entry in controller.history[1:]] == ['load', 'browsers']
+
+
+def test_slower_page_loads_shed_one(signals):
+    controller = AdmissionController(8, start=4, interval=30)
+    run_interval(controller, signals, completed=10, saturated=False, page_load_seconds=1.0)
+    slow = admission.ADMISSION_LATENCY_FACTOR * 1.5
+    assert run_interval(controller, signals, completed=10, saturated=False, page_load_seconds=slow) == 3
+    assert controller.history[-1]['reason'] == 'latency'
+
+
+def test_ramp_up_that_lowers_throughput_is_undone(signals):
+    controller = AdmissionController(8, start=2, interval=30)
+    assert run_interval(controller, signals, completed=10) == 3
+    assert run_interval(controller, signals, completed=5) == 2
+    assert controller.history[-1]['reason'] == 'throughput'
+
+
+def test_resize_lowers_the_limit_to_a_new_ceiling(signals):
+    changes = []
+    controller = AdmissionController(8, start=6, interval=30, on_change=changes.append)
+    controller.resize(10)
+    assert controller.limit == 6 and not changes
+    controller.resize(4)
+    assert controller.limit == 4
+    assert controller.history[-1]['reason'] == 'ceiling'
+    assert changes == [controller]
@@ -0,0 +1,168 @@
+import threading
+
+import pytest
+
+from apps.scraper_manager import dispatcher
+from apps.scraper_manager.dispatcher import ScrapeDispatcher, _deeper
+
+TIMEOUT = 5
+
+
+class FakeExecutor:
+    """Stands in for a worker pool: ``map`` waits for ``gate``, then scrapes the shared queue in order.
+
+    A company with an Event in ``hold`` stays running until that Event is set.
+    """
+
+    def __init__(self, threads=1):
+        self.controller = None
+        self.max_workers = 1
+        self.threads = threads
+        self.gate = threading.Event()
+        self.hold = {}
+        self.started = {}
+        self.scraped = []
+
+    def resize(self, max_workers):
+        self.max_workers = max_workers
+
+    def map(self, queue, on_result=None, cancel_event=None, args_for=None):
+        self.gate.wait(TIMEOUT)
+        while queue:
+            try:
+                company = queue.popleft()
+            except IndexError:
+                break
+            max_pages, = args_for(company)
+            self.started.setdefault(company, threading.Event()).set()
+            if company in self.hold:
+                self.hold[company].wait(TIMEOUT)
+            self.scraped.append((company, max_pages))
+            on_result({'company': company, 'success': True, 'jobs_count': 1, 'error': None,
+                       'duration': 0, 'max_pages': max_pages})
+
+
+class Tasks:
+    """Records ``update_task`` calls and each task's results."""
+
+    def __init__(self):
+        self.updates = []
+        self.results = {}
+
+    def update_task(self, task_id, **fields):
+        self.updates.append((task_id, fields))
+
+    def collector(self, task_id):
+        results = self.results.setdefault(task_id, [])
+        return lambda result: results.append((result['company'], result['max_pages']))
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    executors = {'browser': FakeExecutor(), 'http': FakeExecutor(threads=25)}
+    monkeypatch.setattr(dispatcher, 'ScrapeExecutor', lambda target, max_workers, timeout: executors['browser'])
+    monkeypatch.setattr(dispatcher, 'http_executor', lambda target, workers, timeout: executors['http'])
+    monkeypatch.setattr(dispatcher, 'browser_workers', lambda requested: requested)
+    monkeypatch.setattr(dispatcher, 'AUTO_SCALE', False)
+    return executors
+
+
+@pytest.fixture
+def tasks(monkeypatch):
+    recorder = Tasks()
+    monkeypatch.setattr(dispatcher, 'scraping_service', recorder)
+    return recorder
+
+
+def make_dispatcher():
+    return ScrapeDispatcher(target=None, max_browser_workers=8, max_http_workers=100)
+
+
+def submit(scrapes, tasks, task_id, pools, max_pages, workers=None):
+    return scrapes.submit(task_id, pools, max_pages, workers or {'browser': 2, 'http': 10},
+                          tasks.collector(task_id))
+
+
+def test_deeper_prefers_every_page():
+    assert _deeper(5, 10) == 10
+    assert _deeper(0, 10) == 0
+    assert _deeper(10, 0) == 0
+
+
+def test_queued_company_is_scraped_once_for_both_tasks_at_the_deeper_depth(pools, tasks):
+    scrapes = make_dispatcher()
+    first = submit(scrapes, tasks, 't1', {'browser': ['a', 'b']}, 5)
+    second = submit(scrapes, tasks, 't2', {'browser': ['b', 'c']}, 10)
+    pools['browser'].gate.set()
+
+    assert first.wait(TIMEOUT) and second.wait(TIMEOUT)
+    assert pools['browser'].scraped == [('a', 5), ('b', 10), ('c', 10)]
+    assert sorted(tasks.results['t1']) == [('a', 5), ('b', 10)]
+    assert sorted(tasks.results['t2']) == [('b', 10), ('c', 10)]
+    assert ('t2', {'coalesced': ['b']}) in tasks.updates
+
+
+def test_task_joining_a_running_scrape_takes_it_as_it_is(pools, tasks):
+    browser = pools['browser']
+    browser.hold['a'] = threading.Event()
+    browser.started['a'] = threading.Event()
+    scrapes = make_dispatcher()
+    first = submit(scrapes, tasks, 't1', {'browser': ['a']}, 5)
+    browser.gate.set()
+    assert browser.started['a'].wait(TIMEOUT)
+
+    second = submit(scrapes, tasks, 't2', {'browser': ['a']}, 0)
+    browser.hold['a'].set()
+
+    assert first.wait(TIMEOUT) and second.wait(TIMEOUT)
+    assert browser.scraped == [('a', 5)]
+    assert tasks.results['t1'] == tasks.results['t2'] == [('a', 5)]
+
+
+def test_pools_are_separate_queues(pools, tasks):
+    scrapes = make_dispatcher()
+    done = submit(scrapes, tasks, 't1', {'browser': ['amazon'], 'http': ['acme', 'globex']}, 3)
+    for executor in pools.values():
+        executor.gate.set()
+
+    assert done.wait(TIMEOUT)
+    assert pools['browser'].scraped == [('amazon', 3)]
+    assert pools['http'].scraped == [('acme', 3), ('globex', 3)]
+
+
+def test_release_drops_queued_companies_no_other_task_wants(pools, tasks):
+    scrapes = make_dispatcher()
+    first = submit(scrapes, tasks, 't1', {'browser': ['a', 'b']}, 5)
+    second = submit(scrapes, tasks, 't2', {'browser': ['b']}, 5)
+
+    assert scrapes.release('t1')
+    assert first.is_set()
+    assert not scrapes.release('t1')
+    pools['browser'].gate.set()
+
+    assert second.wait(TIMEOUT)
+    assert pools['browser'].scraped == [('b', 5)]
+    assert tasks.results['t1'] == []
+
+
+def test_empty_submission_is_done_at_once(pools, tasks):
+    scrapes = make_dispatcher()
+    assert submit(scrapes, tasks, 't1', {'browser': [], 'http': []}, 5).is_set()
+
+
+def test_pool_ceiling_is_the_largest_request_within_the_global_limit(pools, tasks):
+    scrapes = make_dispatcher()
+    browser, http = pools['browser'], pools['http']
+    # No tasks: the global limits
+    assert browser.max_workers == 8
+    assert http.max_workers == 4
+
+    submit(scrapes, tasks, 't1', {'browser': ['a']}, 5, {'browser': 3, 'http': 40})
+    assert (browser.max_workers, http.max_workers) == (3, 2)
+    submit(scrapes, tasks, 't2', {'browser': ['b']}, 5, {'browser': 20, 'http': 10})
+    assert (browser.max_workers, http.max_workers) == (8, 2)
+
+    scrapes.release('t2')
+    assert (browser.max_workers, http.max_workers) == (3, 2)
+    scrapes.release('t1')
+    assert (browser.max_workers, http.max_workers) == (8, 4)
@@ -0,0 +1,175 @@
+import contextvars
+import os
+
+import pytest
+import requests
+
+from core import http_cache, http_client
+from core.http_cache import (
+    HTTPCache, ListingUnchanged, cache_key, check_listing, get_cache_stats, reset_cache_stats,
+)
+
+URL = 'https://jobs.example.com/api/jobs'
+
+
+def make_response(status=200, body=b'', headers=None, url=URL):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    response.url = url
+    response.encoding = 'utf-8'
+    return response
+
+
+class FakeServer:
+    """Replaces ``http_client._send``: answers with ``body``/``etag`` and honours If-None-Match."""
+
+    def __init__(self, body=b'{"jobs": [1, 2]}', etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.sent = []
+
+    def __call__(self, method, url, retries, kwargs):
+        headers = dict(kwargs.get('headers') or {})
+        self.sent.append(headers)
+        if self.etag and headers.get('If-None-Match') == self.etag:
+            return make_response(304, url=url)
+        return make_response(200, self.body, {'ETag': self.etag, 'Content-Type': 'application/json'}, url)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    store = HTTPCache(tmp_path)
+    monkeypatch.setattr(http_client, 'get_cache', lambda: store)
+    monkeypatch.setattr(http_cache, '_ttl', lambda url: 0)
+    return store
+
+
+@pytest.fixture
+def server(monkeypatch):
+    fake = FakeServer()
+    monkeypatch.setattr(http_client, '_send', fake)
+    return fake
+
+
+def in_scrape(fn, check=False):
+    """Run ``fn`` in a fresh context with per-scrape stats, as the runners do."""
+    def run():
+        reset_cache_stats(check_listing=check)
+        return fn()
+    return contextvars.copy_context().run(run)
+
+
+def test_revalidates_with_etag_and_serves_304_from_disk(cache, server):
+    def scrape():
+        first = http_client.http_get(URL)
+        second = http_client.http_get(URL)
+        return first, second, get_cache_stats()
+
+    first, second, stats = in_scrape(scrape)
+    assert not getattr(first, 'from_cache', False)
+    assert 'If-None-Match' not in server.sent[0]
+    assert server.sent[1]['If-None-Match'] == '"v1"'
+    assert second.status_code == 200
+    assert second.from_cache is True
+    assert second.json() == {'jobs': [1, 2]}
+    assert stats == {'http_requests': 2, 'http_not_modified': 1, 'http_cache_hits': 0}
+
+
+def test_changed_response_replaces_the_cached_one(cache, server):
+    http_client.http_get(URL)
+    server.body, server.etag = b'{"jobs": [3]}', '"v2"'
+    changed = http_client.http_get(URL)
+    assert not getattr(changed, 'from_cache', False)
+    assert changed.json() == {'jobs': [3]}
+
+    again = http_client.http_get(URL)
+    assert server.sent[-1]['If-None-Match'] == '"v2"'
+    assert again.from_cache and again.json() == {'jobs': [3]}
+
+
+def test_fresh_entry_is_served_without_a_request(cache, server, monkeypatch):
+    monkeypatch.setattr(http_cache, '_ttl', lambda url: 600)
+
+    def scrape():
+        http_client.http_get(URL)
+        cached = http_client.http_get(URL)
+        return cached, get_cache_stats()
+
+    cached, stats = in_scrape(scrape)
+    assert len(server.sent) == 1
+    assert cached.from_cache
+    assert stats['http_cache_hits'] == 1
+
+
+def test_posts_bypass_the_cache_unless_asked(cache, server):
+    http_client.http_post(URL, json={'page': 1})
+    http_client.http_post(URL, json={'page': 1})
+    assert all('If-None-Match' not in headers for headers in server.sent)
+
+    http_client.http_post(URL, json={'page': 1}, cache=True)
+    response = http_client.http_post(URL, json={'page': 1}, cache=True)
+    assert server.sent[-1]['If-None-Match'] == '"v1"'
+    assert response.from_cache
+
+
+def test_responses_without_validators_are_not_stored(cache, server):
+    server.etag = None
+    http_client.http_get(URL)
+    http_client.http_get(URL)
+    assert server.sent == [{}, {}]
+    assert cache.lookup(cache_key('GET', URL)) is None
+
+
+def test_cache_key_separates_query_and_body():
+    assert cache_key('GET', URL) == cache_key('get', URL)
+    assert cache_key('GET', URL, params={'a': 1, 'b': 2}) == cache_key('GET', URL, params={'b': 2, 'a': 1})
+    assert cache_key('GET', URL, params={'a': 1}) != cache_key('GET', URL, params={'a': 2})
+    assert cache_key('POST', URL, json_body={'offset': 0}) != cache_key('POST', URL, json_body={'offset': 20})
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    store = HTTPCache(tmp_path)
+
+    def put(name):
+        key = cache_key('GET', f'{URL}/{name}')
+        store.store(key, make_response(200, b'x' * 1000, {'ETag': f'"{name}"'}, f'{URL}/{name}'))
+        return key
+
+    keys = {name: put(name) for name in 'abc'}
+    # Last used a, then b, then c; then a is read again
+    for stamp, name in enumerate('abc', start=1):
+        meta_path, _ = store._paths(keys[name])
+        os.utime(meta_path, (stamp, stamp))
+    assert store.lookup(keys['a'])
+
+    entry = store._entry_size(*store._paths(keys['a']))
+    store.max_bytes = int(entry * 3.5)
+    keys['d'] = put('d')
+
+    assert store.lookup(keys['b']) is None
+    for name in 'acd':
+        assert store.lookup(keys[name]), name
+    assert store._size <= store.max_bytes
+
+
+def test_check_listing_raises_only_for_a_cached_first_page():
+    cached = make_response(200, b'{}')
+    cached.from_cache = True
+    fresh = make_response(200, b'{}')
+
+    def first_page_cached():
+        with pytest.raises(ListingUnchanged):
+            check_listing(cached)
+        # Only the first page is checked
+        check_listing(cached)
+
+    def first_page_fresh():
+        check_listing(fresh)
+        check_listing(cached)
+
+    in_scrape(first_page_cached, check=True)
+    in_scrape(first_page_fresh, check=True)
+    # Not armed: the company has no stored jobs to keep
+    in_scrape(lambda: check_listing(cached), check=False)
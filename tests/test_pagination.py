@@ -0,0 +1,118 @@
+import threading
+
+import pytest
+
+from core.pagination import fetch_concurrently, fetch_offset_pages
+
+
+class FakeAPI:
+    """An offset/limit job API over ``total`` postings that returns at most ``cap`` per page."""
+
+    def __init__(self, total, cap=None, failing=(), report_total=True):
+        self.postings = [{'id': i} for i in range(total)]
+        self.cap = cap
+        self.failing = set(failing)
+        self.report_total = report_total
+        self.offsets = []
+        self._lock = threading.Lock()
+
+    def page(self, offset, limit):
+        with self._lock:
+            self.offsets.append(offset)
+        if offset in self.failing:
+            raise RuntimeError(f"page {offset} failed")
+        size = min(limit, self.cap) if self.cap else limit
+        return {
+            'items': self.postings[offset:offset + size],
+            'total': len(self.postings) if self.report_total else 0,
+        }
+
+    def fetch(self, page_size, **kwargs):
+        return fetch_offset_pages(
+            lambda offset: self.page(offset, page_size), page_size,
+            items_of=lambda data: data['items'],
+            total_of=lambda data: data['total'],
+            **kwargs,
+        )
+
+
+def ids(items):
+    return [item['id'] for item in items]
+
+
+def test_requests_every_offset_once_and_merges_in_order():
+    api = FakeAPI(45)
+    items = api.fetch(20, workers=3)
+    assert sorted(api.offsets) == [0, 20, 40]
+    assert ids(items) == list(range(45))
+
+
+def test_single_page_makes_one_request():
+    api = FakeAPI(12)
+    assert ids(api.fetch(20)) == list(range(12))
+    assert api.offsets == [0]
+
+
+def test_max_items_limits_offsets_and_result():
+    api = FakeAPI(200)
+    items = api.fetch(20, max_items=50)
+    assert sorted(api.offsets) == [0, 20, 40]
+    assert ids(items) == list(range(50))
+
+
+def test_server_page_cap_steps_by_what_it_returns():
+    api = FakeAPI(35, cap=10)
+    items = api.fetch(50)
+    assert sorted(api.offsets) == [0, 10, 20, 30]
+    assert ids(items) == list(range(35))
+
+
+def test_server_page_cap_respects_max_items():
+    api = FakeAPI(100, cap=10)
+    items = api.fetch(50, max_items=25)
+    assert sorted(api.offsets) == [0, 10, 20]
+    assert ids(items) == list(range(25))
+
+
+def test_duplicates_across_pages_are_dropped_by_key():
+    api = FakeAPI(30)
+    # A posting that moved up while we paged shows up on two pages
+    api.postings[20] = {'id': 19}
+    items = api.fetch(10, key=lambda item: item['id'])
+    assert ids(items) == list(range(20)) + list(range(21, 30))
+
+
+def test_later_page_failure_is_skipped():
+    api = FakeAPI(30, failing={10})
+    items = api.fetch(10)
+    assert ids(items) == list(range(10)) + list(range(20, 30))
+
+
+def test_first_page_failure_propagates():
+    api = FakeAPI(30, failing={0})
+    with pytest.raises(RuntimeError):
+        api.fetch(10)
+
+
+def test_without_total_pages_sequentially_until_a_short_page():
+    api = FakeAPI(45, report_total=False)
+    items = api.fetch(20)
+    assert api.offsets == [0, 20, 40]
+    assert ids(items) == list(range(45))
+
+
+def test_without_total_stops_at_max_items():
+    api = FakeAPI(500, report_total=False)
+    items = api.fetch(20, max_items=60)
+    assert api.offsets == [0, 20, 40]
+    assert ids(items) == list(range(60))
+
+
+def test_fetch_concurrently_keeps_order_and_turns_failures_into_none():
+    def fetch(n):
+        if n == 3:
+            raise ValueError(n)
+        return n * n
+
+    assert fetch_concurrently(fetch, range(6), workers=3) == [0, 1, 4, None, 16, 25]
+    assert fetch_concurrently(fetch, []) == []
@@ -0,0 +1,114 @@
+import pytest
+
+from core import ratelimit
+from core.ratelimit import HostSlots, RateLimiter, TokenBucket, platform_key
+
+
+class FakeTime:
+    """Stands in for the ``time`` module in core.ratelimit so the buckets run on a manual clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(ratelimit, 'time', fake)
+    return fake
+
+
+def test_burst_is_free_then_tokens_are_spaced_by_rate(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 0.5, 1.0]
+
+
+def test_reservations_queue_up_without_blocking(clock):
+    bucket = TokenBucket(rate=4, burst=1)
+    delays = [bucket.reserve() for _ in range(4)]
+    assert delays == [0, 0.25, 0.5, 0.75]
+    # Nobody slept, so the clock has not moved
+    assert clock.now == 1000.0
+
+
+def test_idle_bucket_banks_at_most_burst_tokens(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    for _ in range(5):
+        bucket.reserve()
+    clock.now += 60
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0, 0.5]
+
+
+def test_acquire_sleeps_for_its_reservation(clock):
+    bucket = TokenBucket(rate=10, burst=1)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.1)
+    assert clock.now == pytest.approx(1000.1)
+
+
+def test_pause_holds_callers_and_drops_banked_tokens(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    bucket.pause(5)
+    # After the pause tokens come at the steady rate, not as a burst
+    assert [bucket.reserve() for _ in range(3)] == [5, 5.5, 6.0]
+
+
+def test_shorter_pause_does_not_shorten_a_longer_one(clock):
+    bucket = TokenBucket(rate=1, burst=1)
+    bucket.pause(10)
+    bucket.pause(2)
+    assert bucket.reserve() == 10
+
+
+@pytest.mark.parametrize('url, key', [
+    ('https://wd3.myworkdayjobs.com/wday/cxs/acme/jobs', 'myworkdayjobs.com'),
+    ('https://acme.wd1.myworkdayjobs.com/en-US/External', 'myworkdayjobs.com'),
+    ('https://careers.acme.co.in/jobs', 'acme.co.in'),
+    ('https://acme.co.in/jobs', 'acme.co.in'),
+    ('https://example.com/', 'example.com'),
+    ('http://10.0.0.5:8000/jobs', '10.0.0.5'),
+])
+def test_platform_key(url, key):
+    assert platform_key(url) == key
+
+
+def test_limiter_shares_one_bucket_per_platform_with_overrides(clock):
+    limiter = RateLimiter(default=(5, 10), overrides={'myworkdayjobs.com': (1, 1)})
+    assert limiter.bucket('https://wd1.myworkdayjobs.com/a') is limiter.bucket('https://wd5.myworkdayjobs.com/b')
+    assert limiter.bucket('https://a.darwinbox.in/') is not limiter.bucket('https://wd1.myworkdayjobs.com/a')
+
+    assert limiter.reserve('https://wd1.myworkdayjobs.com/a') == 0
+    assert limiter.reserve('https://wd5.myworkdayjobs.com/b') == 1
+    assert limiter.reserve('https://a.darwinbox.in/') == 0
+
+
+def test_throttled_pauses_the_whole_platform(clock):
+    limiter = RateLimiter(default=(5, 10), overrides={})
+    limiter.throttled('https://wd1.myworkdayjobs.com/a', 30)
+    assert limiter.reserve('https://wd3.myworkdayjobs.com/b') == 30
+    assert limiter.reserve('https://example.com/') == 0
+
+
+def test_host_slots_limit_release_and_lapse(clock):
+    slots = HostSlots()
+    first = slots.try_acquire('api.example.com', 2, ttl=10)
+    second = slots.try_acquire('api.example.com', 2, ttl=10)
+    assert first and second and first != second
+    assert slots.try_acquire('api.example.com', 2, ttl=10) is None
+    # Other hosts have their own slots
+    assert slots.try_acquire('other.example.com', 2, ttl=10) is not None
+
+    slots.release('api.example.com', first)
+    third = slots.try_acquire('api.example.com', 2, ttl=10)
+    assert third is not None
+    assert slots.try_acquire('api.example.com', 2, ttl=10) is None
+
+    # A holder that never releases (a killed worker) loses its slot after ttl
+    clock.now += 10
+    assert slots.try_acquire('api.example.com', 2, ttl=10) is not None
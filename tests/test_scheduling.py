@@ -0,0 +1,84 @@
+from apps.scraper_manager import scheduling
+from apps.scraper_manager.scheduling import (
+    DEFAULT_ENGINE_ESTIMATE, DEFAULT_ESTIMATES, estimate_durations, plan, ramp_slots, simulate,
+)
+
+
+def test_plan_orders_longest_expected_first():
+    estimates = {'tcs': 20, 'amazon': 300, 'ibm': 240, 'infosys': 20, 'wipro': 60}
+    schedule = plan(list(estimates), 2, estimates)
+    assert schedule['order'] == ['amazon', 'ibm', 'wipro', 'tcs', 'infosys']
+
+
+def test_plan_equal_estimates_keep_list_order():
+    estimates = {'a': 10, 'b': 10, 'c': 10}
+    assert plan(['c', 'a', 'b'], 2, estimates)['order'] == ['c', 'a', 'b']
+
+
+def test_lpt_beats_list_order_when_the_slow_company_comes_last():
+    estimates = {'a': 10, 'b': 10, 'c': 10, 'd': 10, 'slow': 40}
+    schedule = plan(['a', 'b', 'c', 'd', 'slow'], 2, estimates)
+    # List order: the four short ones pair up (20s), then slow runs alone until 60s
+    assert schedule['list_makespan'] == 60
+    # Longest first: slow on one worker, the four short ones on the other
+    assert schedule['makespan'] == 40
+    assert schedule['expected'] == {company: float(seconds) for company, seconds in estimates.items()}
+
+
+def test_simulate_assigns_each_company_to_the_first_free_worker():
+    durations = {'a': 30, 'b': 10, 'c': 5, 'd': 20}
+    makespan, slots = simulate(['a', 'b', 'c', 'd'], durations, 2)
+    assert slots == {'a': (0, 30), 'b': (0, 10), 'c': (10, 15), 'd': (15, 35)}
+    assert makespan == 35
+    assert simulate([], durations, 2) == (0.0, {})
+
+
+def test_ramp_slots_open_one_worker_per_interval():
+    assert ramp_slots(3) == [0.0, 0.0, 0.0]
+    assert ramp_slots(5, ramp=(2, 30)) == [0.0, 0.0, 30.0, 60.0, 90.0]
+    # The start is clamped to between one worker and all of them
+    assert ramp_slots(2, ramp=(4, 30)) == [0.0, 0.0]
+    assert ramp_slots(3, ramp=(0, 30)) == [0.0, 30.0, 60.0]
+
+
+def test_ramped_pool_delays_later_workers():
+    durations = {'a': 100, 'b': 100}
+    makespan, slots = simulate(['a', 'b'], durations, 2, ramp=(1, 30))
+    assert slots == {'a': (0.0, 100.0), 'b': (30.0, 130.0)}
+    assert makespan == 130
+
+
+def test_estimates_use_history_then_platform_peers_then_defaults():
+    history = {'acme': [10, 30, 20], 'globex': [50], 'initech': [70], 'stale': []}
+    platforms = {'acme': 'workday', 'globex': 'workday', 'initech': 'workday',
+                 'umbrella': 'workday', 'hooli': 'browser', 'piedpiper': 'phenom', 'stale': 'spec'}
+    estimates = estimate_durations(['acme', 'umbrella', 'hooli', 'piedpiper', 'stale', 'unknown'],
+                                   history, platforms)
+    assert estimates == {
+        'acme': 20,
+        # Median of the Workday companies' own medians (20, 50, 70)
+        'umbrella': 50,
+        'hooli': DEFAULT_ESTIMATES['browser'],
+        'piedpiper': DEFAULT_ENGINE_ESTIMATE,
+        'stale': DEFAULT_ESTIMATES['spec'],
+        # No platform known: treated as a browser scraper
+        'unknown': DEFAULT_ESTIMATES['browser'],
+    }
+
+
+def test_plan_scrape_plans_each_pool_and_takes_the_slower(monkeypatch):
+    from apps.data_store import services as job_service
+    import scrapers.registry as registry
+
+    platforms = {'amazon': 'browser', 'ibm': 'browser', 'acme': 'workday', 'globex': 'workday'}
+    monkeypatch.setattr(job_service, 'get_run_durations',
+                        lambda: {'amazon': [300], 'ibm': [200], 'acme': [20], 'globex': [40]})
+    monkeypatch.setattr(registry, 'scraper_platform', platforms.get)
+    monkeypatch.setattr(scheduling, 'AUTO_SCALE', False)
+
+    schedule = scheduling.plan_scrape(['acme', 'ibm', 'globex', 'amazon'], browser_workers=1, http_workers=2)
+    assert schedule['pools']['browser']['order'] == ['amazon', 'ibm']
+    assert schedule['pools']['http']['order'] == ['globex', 'acme']
+    assert schedule['pools']['browser']['ramp'] is None
+    assert schedule['makespan'] == 500
+    assert schedule['pools']['http']['makespan'] == 40
@@ -0,0 +1,103 @@
+import pytest
+
+from scrapers.platforms.spec import SPEC_DIR, SpecError, SpecScraper, load_specs, validate
+
+GENERIC = {
+    'company_name': 'Acme',
+    'url': 'https://jobs.acme.com/search',
+    'list': {'item': 'li.job', 'fields': {'title': 'h2', 'url': {'selector': 'a', 'attr': 'href'}}},
+}
+
+
+def spec(**changes):
+    merged = {**GENERIC, **changes}
+    return {key: value for key, value in merged.items() if value is not None}
+
+
+@pytest.mark.parametrize('bad, message', [
+    (spec(colour='red'), "unknown keys ['colour']"),
+    (spec(company_name=None), "'company_name' is required"),
+    (spec(url=None), "'url' is required"),
+    (spec(list={'item': 'li.job'}), "'list' needs 'item' and 'fields'"),
+    (spec(list={'fields': {'title': 'h2'}}), "'list' needs 'item' and 'fields'"),
+    (spec(list={'item': 'li', 'fields': {'title': 'h2', 'salary': '.pay'}}), "unknown fields ['salary']"),
+    (spec(list={'item': 'li', 'fields': {'location': '.loc'}}), "the 'title' field is required"),
+    (spec(list={'item': 'li', 'fields': {'title': {'css': 'h2'}}}), "field 'title' must be a selector"),
+    (spec(pagination={'type': 'infinite'}), 'pagination type must be one of'),
+    (spec(pagination={'type': 'next'}), "'next' pagination needs a 'selector'"),
+    (spec(pagination={'type': 'load_more'}), "'load_more' pagination needs a 'selector'"),
+    (spec(pagination={'type': 'url_param'}), "'url_param' pagination needs a 'param'"),
+    (spec(location_parser='zip'), 'location_parser must be one of'),
+    (spec(job_id_pattern='(unclosed'), 'bad job_id_pattern'),
+    ({'company_name': 'Acme', 'platform': 'taleo', 'url': 'https://acme.taleo.net'}, "unknown platform 'taleo'"),
+    ({'company_name': 'Acme', 'platform': 'workday'}, "needs a 'site' mapping or a 'url'"),
+    ({'company_name': 'Acme', 'platform': 'workday', 'site': ['acme']}, "needs a 'site' mapping or a 'url'"),
+])
+def test_invalid_specs_raise_spec_error_naming_the_source(bad, message):
+    with pytest.raises(SpecError) as error:
+        validate('acme', bad, 'acme.yaml')
+    assert str(error.value).startswith('acme.yaml: ')
+    assert message in str(error.value)
+
+
+def test_generic_spec_is_normalised():
+    compiled = validate('acme', spec(job_id_pattern=r'/(\d+)$'))
+    assert compiled['wait_for'] == 'li.job'
+    assert compiled['fields'] == [['title', 'h2', ''], ['url', 'a', 'href']]
+    assert compiled['pagination'] == {'type': 'none'}
+    assert compiled['location_parser'] == 'city_state'
+    assert compiled['job_id_pattern'].search('/job/123').group(1) == '123'
+    assert compiled['country'] == 'India' and compiled['india_only'] is False
+
+
+def test_platform_spec_carries_company_name_and_url_into_the_site():
+    compiled = validate('acme', {'company_name': 'Acme', 'platform': 'talentbrew',
+                                 'url': 'https://jobs.acme.com/search-jobs/India'})
+    assert compiled == {'company_name': 'Acme', 'platform': 'talentbrew',
+                        'site': {'company_name': 'Acme', 'url': 'https://jobs.acme.com/search-jobs/India'}}
+
+
+def write(directory, name, text):
+    (directory / name).write_text(text)
+
+
+def test_extends_merges_the_template_under_the_spec(tmp_path):
+    write(tmp_path, '_base.yaml', "list:\n  item: li.job\n  fields: {title: h2, location: .loc}\n"
+                                  "pagination: {type: next, selector: a.next}\n")
+    write(tmp_path, 'acme.yaml', "company_name: Acme\nurl: https://jobs.acme.com\nextends: base\n"
+                                 "list:\n  fields: {title: h3}\n")
+    scrapers = load_specs(tmp_path)
+    assert set(scrapers) == {'acme'}
+    compiled = scrapers['acme'].spec
+    assert issubclass(scrapers['acme'], SpecScraper)
+    assert compiled['item'] == 'li.job'
+    assert compiled['fields'] == [['title', 'h3', ''], ['location', '.loc', '']]
+    assert compiled['pagination'] == {'type': 'next', 'selector': 'a.next'}
+
+
+def test_unknown_template_and_extends_loops_are_rejected(tmp_path):
+    missing = tmp_path / 'missing'
+    missing.mkdir()
+    write(missing, 'acme.yaml', "company_name: Acme\nurl: https://jobs.acme.com\nextends: nowhere\n")
+    with pytest.raises(SpecError, match="unknown template 'nowhere'"):
+        load_specs(missing)
+
+    loop = tmp_path / 'loop'
+    loop.mkdir()
+    write(loop, '_a.yaml', "extends: b\n")
+    write(loop, '_b.yaml', "extends: a\n")
+    write(loop, 'acme.yaml', "company_name: Acme\nurl: https://jobs.acme.com\nextends: a\n")
+    with pytest.raises(SpecError, match="'extends' loop"):
+        load_specs(loop)
+
+
+def test_non_mapping_file_is_rejected(tmp_path):
+    write(tmp_path, 'acme.yaml', "- just\n- a list\n")
+    with pytest.raises(SpecError, match='acme.yaml: a spec must be a mapping'):
+        load_specs(tmp_path)
+
+
+def test_shipped_specs_compile():
+    scrapers = load_specs(SPEC_DIR)
+    assert scrapers
+    assert all(not key.startswith('_') for key in scrapers)